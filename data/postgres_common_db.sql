@@ -680,3 +680,37 @@ INSERT INTO ramstk_condition VALUES (53,'Weather, Rain','environmental');
 INSERT INTO ramstk_condition VALUES (54,'Weather, Sleet','environmental');
 INSERT INTO ramstk_condition VALUES (55,'Weather, Snow','environmental');
 INSERT INTO ramstk_condition VALUES (56,'Weather, Wind','environmental');
+
+-- Create the ID sequences the ID allocator reserves blocks of IDs from; one for
+-- each integer primary key column, starting after the largest ID in the column.
+DO $$
+DECLARE
+    _column RECORD;
+BEGIN
+    FOR _column IN
+        SELECT kcu.table_name, kcu.column_name
+          FROM information_schema.table_constraints tc
+          JOIN information_schema.key_column_usage kcu
+            ON kcu.constraint_name = tc.constraint_name
+           AND kcu.table_schema = tc.table_schema
+          JOIN information_schema.columns c
+            ON c.table_schema = kcu.table_schema
+           AND c.table_name = kcu.table_name
+           AND c.column_name = kcu.column_name
+         WHERE tc.constraint_type = 'PRIMARY KEY'
+           AND tc.table_schema = 'public'
+           AND c.data_type IN ('smallint', 'integer', 'bigint')
+    LOOP
+        EXECUTE format(
+            'CREATE SEQUENCE IF NOT EXISTS %I MINVALUE 0 START WITH 0',
+            _column.table_name || '_' || _column.column_name || '_seq'
+        );
+        EXECUTE format(
+            'SELECT setval(%L, (SELECT COALESCE(MAX(%I), 0) FROM %I))',
+            _column.table_name || '_' || _column.column_name || '_seq',
+            _column.column_name,
+            _column.table_name
+        );
+    END LOOP;
+END;
+$$;
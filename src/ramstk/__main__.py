@@ -9,11 +9,12 @@
 
 
 # Standard Library Imports
+import json
 import os
 import shutil
 import sys
 from time import sleep
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Third Party Imports
 from pubsub import pub
@@ -83,6 +84,203 @@ from ramstk.utilities import file_exists
 from ramstk.views.gtk3 import Gtk, RAMSTKDesktop, _
 from ramstk.views.gtk3.widgets import RAMSTKDatabaseSelect
 
+# The global configuration lists loaded from the site database.  Each entry is the
+# name of the RAMSTKUserConfiguration() list, the record class to load the list
+# from, the values of the record fields selecting the records to load, the record
+# field to use as the list key, and the record fields to load into the list.
+SITE_LISTS: List[Tuple[str, Any, Dict[str, str], str, List[str]]] = [
+    (
+        "RAMSTK_ACTION_CATEGORY",
+        RAMSTKCategoryRecord,
+        {"category_type": "action"},
+        "category_id",
+        ["name", "description", "value"],
+    ),
+    (
+        "RAMSTK_ACTION_STATUS",
+        RAMSTKStatusRecord,
+        {"status_type": "action"},
+        "status_id",
+        ["name", "description"],
+    ),
+    (
+        "RAMSTK_AFFINITY_GROUPS",
+        RAMSTKGroupRecord,
+        {"group_type": "affinity"},
+        "group_id",
+        ["description"],
+    ),
+    (
+        "RAMSTK_CATEGORIES",
+        RAMSTKCategoryRecord,
+        {"category_type": "hardware"},
+        "category_id",
+        ["description"],
+    ),
+    (
+        "RAMSTK_DAMAGE_MODELS",
+        RAMSTKModelRecord,
+        {"model_type": "damage"},
+        "model_id",
+        ["description"],
+    ),
+    (
+        "RAMSTK_DETECTION_METHODS",
+        RAMSTKMethodRecord,
+        {"method_type": "detection"},
+        "method_id",
+        ["name", "description"],
+    ),
+    (
+        "RAMSTK_HAZARDS",
+        RAMSTKHazardsRecord,
+        {},
+        "hazard_id",
+        ["hazard_category", "hazard_subcategory"],
+    ),
+    (
+        "RAMSTK_INCIDENT_CATEGORY",
+        RAMSTKCategoryRecord,
+        {"category_type": "incident"},
+        "category_id",
+        ["name", "description", "value"],
+    ),
+    (
+        "RAMSTK_INCIDENT_STATUS",
+        RAMSTKStatusRecord,
+        {"status_type": "incident"},
+        "status_id",
+        ["name", "description"],
+    ),
+    (
+        "RAMSTK_INCIDENT_TYPE",
+        RAMSTKTypeRecord,
+        {"type_type": "incident"},
+        "type_id",
+        ["code", "description"],
+    ),
+    (
+        "RAMSTK_LOAD_HISTORY",
+        RAMSTKLoadHistoryRecord,
+        {},
+        "history_id",
+        ["description"],
+    ),
+    (
+        "RAMSTK_MANUFACTURERS",
+        RAMSTKManufacturerRecord,
+        {},
+        "manufacturer_id",
+        ["description", "location", "cage_code"],
+    ),
+    (
+        "RAMSTK_MEASURABLE_PARAMETERS",
+        RAMSTKMeasurementRecord,
+        {"measurement_type": "damage"},
+        "measurement_id",
+        ["code", "description"],
+    ),
+    (
+        "RAMSTK_MEASUREMENT_UNITS",
+        RAMSTKMeasurementRecord,
+        {"measurement_type": "unit"},
+        "measurement_id",
+        ["code", "description"],
+    ),
+    (
+        "RAMSTK_REQUIREMENT_TYPE",
+        RAMSTKTypeRecord,
+        {"type_type": "requirement"},
+        "type_id",
+        ["code", "description"],
+    ),
+    (
+        "RAMSTK_RPN_DETECTION",
+        RAMSTKRPNRecord,
+        {"rpn_type": "detection"},
+        "value",
+        ["name", "description"],
+    ),
+    (
+        "RAMSTK_RPN_OCCURRENCE",
+        RAMSTKRPNRecord,
+        {"rpn_type": "occurrence"},
+        "value",
+        ["name", "description"],
+    ),
+    (
+        "RAMSTK_RPN_SEVERITY",
+        RAMSTKRPNRecord,
+        {"rpn_type": "severity"},
+        "value",
+        ["name", "description"],
+    ),
+    (
+        "RAMSTK_SEVERITY",
+        RAMSTKCategoryRecord,
+        {"category_type": "risk"},
+        "category_id",
+        ["name", "description", "value"],
+    ),
+    (
+        "RAMSTK_STAKEHOLDERS",
+        RAMSTKStakeholdersRecord,
+        {},
+        "stakeholders_id",
+        ["stakeholder"],
+    ),
+    (
+        "RAMSTK_STRESS_LIMITS",
+        RAMSTKCategoryRecord,
+        {"category_type": "hardware"},
+        "category_id",
+        [
+            "harsh_ir_limit",
+            "mild_ir_limit",
+            "harsh_pr_limit",
+            "mild_pr_limit",
+            "harsh_vr_limit",
+            "mild_vr_limit",
+            "harsh_deltat_limit",
+            "mild_deltat_limit",
+            "harsh_maxt_limit",
+            "mild_maxt_limit",
+        ],
+    ),
+    (
+        "RAMSTK_USERS",
+        RAMSTKUserRecord,
+        {},
+        "user_id",
+        ["user_lname", "user_fname", "user_email", "user_phone", "user_group_id"],
+    ),
+    (
+        "RAMSTK_VALIDATION_TYPE",
+        RAMSTKTypeRecord,
+        {"type_type": "validation"},
+        "type_id",
+        ["code", "description"],
+    ),
+    (
+        "RAMSTK_WORKGROUPS",
+        RAMSTKGroupRecord,
+        {"group_type": "workgroup"},
+        "group_id",
+        ["description"],
+    ),
+]
+
+# The record fields used to load the hardware subcategories and failure modes.
+SITE_SUBCATEGORY_FIELDS: List[str] = ["category_id", "subcategory_id", "description"]
+SITE_FAILURE_MODE_FIELDS: List[str] = [
+    "category_id",
+    "subcategory_id",
+    "mode_id",
+    "description",
+    "mode_ratio",
+    "source",
+]
+
 
 def do_connect_to_site_db(conn_info) -> RAMSTKCommonDB:
     """Connect to the site (common) database.
@@ -295,6 +493,53 @@ def do_load_failure_modes(
     }
 
 
+def do_load_site_lists(
+    configuration: RAMSTKUserConfiguration,
+    database: BaseDatabase,
+    snapshot_file: str,
+) -> None:
+    """Load the global configuration lists from the site database.
+
+    Every record used by the lists is read with one query per site database table
+    and the lists are built from the records in memory.  The records are saved to
+    a snapshot file along with a checksum of the tables they were read from and
+    the fields read from each table.  The next time the lists are loaded, the
+    records are read from the snapshot file instead of the site database unless the
+    checksum or the fields have changed.
+
+    :param configuration: the RAMSTKUserConfiguration() to load the lists into.
+    :param database: the site database to load the lists from.
+    :param snapshot_file: the name, with full path, of the snapshot file.
+    :return: None
+    :rtype: None
+    """
+    _site = "{dialect}://{host}:{port}/{database}".format(**database.cxnargs)
+    _fields = {
+        _table: _table_fields
+        for _table, (dummy, _table_fields) in get_site_fields().items()
+    }
+    _checksum = database.get_checksum(list(_fields))
+
+    _tables = do_read_site_snapshot(snapshot_file, _site, _checksum, _fields)
+    if _tables is not None:
+        try:
+            do_set_site_lists(configuration, _tables)
+            return
+        except (KeyError, TypeError) as _error:
+            pub.sendMessage(
+                "do_log_warning_msg",
+                logger_name="WARNING",
+                message=f"Unable to use the site database snapshot {snapshot_file}: "
+                f"{_error}",
+            )
+
+    _tables = do_read_site_tables(database)
+    if _checksum:
+        do_write_site_snapshot(snapshot_file, _site, _checksum, _fields, _tables)
+
+    do_set_site_lists(configuration, _tables)
+
+
 def do_read_site_configuration() -> RAMSTKSiteConfiguration:
     """Create a site configuration instance.
 
@@ -344,6 +589,60 @@ def do_read_site_configuration() -> RAMSTKSiteConfiguration:
     return _configuration
 
 
+def do_read_site_snapshot(
+    snapshot_file: str, site: str, checksum: str, fields: Dict[str, List[str]]
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Read the site database records saved in a snapshot file.
+
+    :param snapshot_file: the name, with full path, of the snapshot file.
+    :param site: the URL of the site database the records must have come from.
+    :param checksum: the current checksum of the site database tables.
+    :param fields: the fields the records must contain from each site database
+        table.
+    :return: the list of records for each site database table or None if there is
+        no usable snapshot for the site database, checksum, and fields.
+    :rtype: dict
+    """
+    if not checksum or not file_exists(snapshot_file):
+        return None
+
+    try:
+        with open(snapshot_file, "r", encoding="utf-8") as _file:
+            _snapshot = json.load(_file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(_snapshot, dict)
+        or _snapshot.get("site") != site
+        or _snapshot.get("checksum") != checksum
+        or _snapshot.get("fields") != fields
+    ):
+        return None
+
+    return _snapshot.get("tables")
+
+
+def do_read_site_tables(database: BaseDatabase) -> Dict[str, List[Dict[str, Any]]]:
+    """Read the records used by the global configuration lists.
+
+    Each site database table is read with a single query.
+
+    :param database: the site database to read the records from.
+    :return: the list of records for each site database table.  Each record is a
+        dict containing the fields used by the configuration lists.
+    :rtype: dict
+    """
+    _tables: Dict[str, List[Dict[str, Any]]] = {}
+    for _table, (_record, _fields) in get_site_fields().items():
+        _tables[_table] = []
+        for _result in database.do_execute_query(select(_record)):
+            _attributes = _result.get_attributes()
+            _tables[_table].append({_field: _attributes[_field] for _field in _fields})
+
+    return _tables
+
+
 def do_read_user_configuration() -> Tuple[RAMSTKUserConfiguration, RAMSTKLogManager]:
     """Create a user configuration instance.
 
@@ -387,6 +686,108 @@ def do_read_user_configuration() -> Tuple[RAMSTKUserConfiguration, RAMSTKLogMana
     return _configuration, _logger
 
 
+def do_set_site_lists(
+    configuration: RAMSTKUserConfiguration,
+    tables: Dict[str, List[Dict[str, Any]]],
+) -> None:
+    """Build the global configuration lists from the site database records.
+
+    :param configuration: the RAMSTKUserConfiguration() to load the lists into.
+    :param tables: the list of records for each site database table.
+    :return: None
+    :rtype: None
+    :raise: KeyError if a table or record is missing a field used by the lists.
+    """
+    for _name, _record, _filter, _key, _fields in SITE_LISTS:
+        _list = getattr(configuration, _name)
+        for _row in tables[_record.__tablename__]:
+            if all(_row[_field] == _value for _field, _value in _filter.items()):
+                _list[_row[_key]] = tuple(_row[_field] for _field in _fields)
+
+    for _category_id in configuration.RAMSTK_CATEGORIES:
+        configuration.RAMSTK_FAILURE_MODES[_category_id] = {}
+        configuration.RAMSTK_SUBCATEGORIES[_category_id] = {}
+    for _row in tables[RAMSTKSubCategoryRecord.__tablename__]:
+        if _row["category_id"] in configuration.RAMSTK_SUBCATEGORIES:
+            configuration.RAMSTK_SUBCATEGORIES[_row["category_id"]][
+                _row["subcategory_id"]
+            ] = (_row["description"],)
+            configuration.RAMSTK_FAILURE_MODES[_row["category_id"]][
+                _row["subcategory_id"]
+            ] = {}
+    for _row in tables[RAMSTKFailureModeRecord.__tablename__]:
+        _modes = configuration.RAMSTK_FAILURE_MODES.get(_row["category_id"], {})
+        if _row["subcategory_id"] in _modes:
+            _modes[_row["subcategory_id"]][_row["mode_id"]] = [
+                _row["description"],
+                _row["mode_ratio"],
+                _row["source"],
+            ]
+
+
+def do_write_site_snapshot(
+    snapshot_file: str,
+    site: str,
+    checksum: str,
+    fields: Dict[str, List[str]],
+    tables: Dict[str, List[Dict[str, Any]]],
+) -> None:
+    """Save the site database records to a snapshot file.
+
+    :param snapshot_file: the name, with full path, of the snapshot file.
+    :param site: the URL of the site database the records came from.
+    :param checksum: the checksum of the site database tables.
+    :param fields: the fields read from each site database table.
+    :param tables: the list of records for each site database table.
+    :return: None
+    :rtype: None
+    """
+    try:
+        with open(snapshot_file, "w", encoding="utf-8") as _file:
+            json.dump(
+                {
+                    "site": site,
+                    "checksum": checksum,
+                    "fields": fields,
+                    "tables": tables,
+                },
+                _file,
+            )
+    except (OSError, TypeError) as _error:
+        pub.sendMessage(
+            "do_log_warning_msg",
+            logger_name="WARNING",
+            message=f"Unable to save the site database snapshot {snapshot_file}: "
+            f"{_error}",
+        )
+
+
+def get_site_fields() -> Dict[str, Tuple[Any, List[str]]]:
+    """Return the record fields used by the global configuration lists.
+
+    :return: the record class and the list of record fields used from each site
+        database table.
+    :rtype: dict
+    """
+    _site_fields: Dict[str, Tuple[Any, List[str]]] = {
+        RAMSTKSubCategoryRecord.__tablename__: (
+            RAMSTKSubCategoryRecord,
+            SITE_SUBCATEGORY_FIELDS,
+        ),
+        RAMSTKFailureModeRecord.__tablename__: (
+            RAMSTKFailureModeRecord,
+            SITE_FAILURE_MODE_FIELDS,
+        ),
+    }
+    for dummy, _record, _filter, _key, _fields in SITE_LISTS:
+        _table_fields = _site_fields.setdefault(_record.__tablename__, (_record, []))[1]
+        for _field in [*_filter, _key, *_fields]:
+            if _field not in _table_fields:
+                _table_fields.append(_field)
+
+    return _site_fields
+
+
 def the_one_ring() -> None:
     """Execute the main function for RAMSTK."""
     # See ISSUE #354
@@ -433,292 +834,10 @@ def the_one_ring() -> None:
         message="Loading global RAMSTK configuration variables.",
     )
 
-    do_load_configuration_list(
-        user_configuration.RAMSTK_ACTION_CATEGORY,
-        site_db,
-        select(RAMSTKCategoryRecord).where(
-            RAMSTKCategoryRecord.category_type == "action"
-        ),
-        "category_id",
-        [
-            "name",
-            "description",
-            "value",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_ACTION_STATUS,
+    do_load_site_lists(
+        user_configuration,
         site_db,
-        select(RAMSTKStatusRecord).where(RAMSTKStatusRecord.status_type == "action"),
-        "status_id",
-        [
-            "name",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_AFFINITY_GROUPS,
-        site_db,
-        select(RAMSTKGroupRecord).where(RAMSTKGroupRecord.group_type == "affinity"),
-        "group_id",
-        [
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_CATEGORIES,
-        site_db,
-        select(RAMSTKCategoryRecord).where(
-            RAMSTKCategoryRecord.category_type == "hardware"
-        ),
-        "category_id",
-        [
-            "description",
-        ],
-    )
-    for _category_id in user_configuration.RAMSTK_CATEGORIES:
-        user_configuration.RAMSTK_FAILURE_MODES[_category_id] = {}
-        user_configuration.RAMSTK_SUBCATEGORIES[_category_id] = {}
-        do_load_configuration_list(
-            user_configuration.RAMSTK_SUBCATEGORIES[_category_id],
-            site_db,
-            select(RAMSTKSubCategoryRecord).where(
-                RAMSTKSubCategoryRecord.category_id == _category_id
-            ),
-            "subcategory_id",
-            [
-                "description",
-            ],
-        )
-        for _subcategory_id in user_configuration.RAMSTK_SUBCATEGORIES[
-            _category_id
-        ].keys():
-            user_configuration.RAMSTK_FAILURE_MODES[_category_id][_subcategory_id] = (
-                do_load_failure_modes(
-                    site_db,
-                    _category_id,
-                    _subcategory_id,
-                )
-            )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_DAMAGE_MODELS,
-        site_db,
-        select(RAMSTKModelRecord).where(RAMSTKModelRecord.model_type == "damage"),
-        "model_id",
-        [
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_DETECTION_METHODS,
-        site_db,
-        select(RAMSTKMethodRecord).where(RAMSTKMethodRecord.method_type == "detection"),
-        "method_id",
-        [
-            "name",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_HAZARDS,
-        site_db,
-        select(RAMSTKHazardsRecord),
-        "hazard_id",
-        [
-            "hazard_category",
-            "hazard_subcategory",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_INCIDENT_CATEGORY,
-        site_db,
-        select(RAMSTKCategoryRecord).where(
-            RAMSTKCategoryRecord.category_type == "incident"
-        ),
-        "category_id",
-        [
-            "name",
-            "description",
-            "value",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_INCIDENT_STATUS,
-        site_db,
-        select(RAMSTKStatusRecord).where(RAMSTKStatusRecord.status_type == "incident"),
-        "status_id",
-        [
-            "name",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_INCIDENT_TYPE,
-        site_db,
-        select(RAMSTKTypeRecord).where(RAMSTKTypeRecord.type_type == "incident"),
-        "type_id",
-        [
-            "code",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_LOAD_HISTORY,
-        site_db,
-        select(RAMSTKLoadHistoryRecord),
-        "history_id",
-        [
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_MANUFACTURERS,
-        site_db,
-        select(RAMSTKManufacturerRecord),
-        "manufacturer_id",
-        [
-            "description",
-            "location",
-            "cage_code",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_MEASURABLE_PARAMETERS,
-        site_db,
-        select(RAMSTKMeasurementRecord).where(
-            RAMSTKMeasurementRecord.measurement_type == "damage"
-        ),
-        "measurement_id",
-        [
-            "code",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_MEASUREMENT_UNITS,
-        site_db,
-        select(RAMSTKMeasurementRecord).where(
-            RAMSTKMeasurementRecord.measurement_type == "unit"
-        ),
-        "measurement_id",
-        [
-            "code",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_REQUIREMENT_TYPE,
-        site_db,
-        select(RAMSTKTypeRecord).where(RAMSTKTypeRecord.type_type == "requirement"),
-        "type_id",
-        [
-            "code",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_RPN_DETECTION,
-        site_db,
-        select(RAMSTKRPNRecord).where(RAMSTKRPNRecord.rpn_type == "detection"),
-        "value",
-        [
-            "name",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_RPN_OCCURRENCE,
-        site_db,
-        select(RAMSTKRPNRecord).where(RAMSTKRPNRecord.rpn_type == "occurrence"),
-        "value",
-        [
-            "name",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_RPN_SEVERITY,
-        site_db,
-        select(RAMSTKRPNRecord).where(RAMSTKRPNRecord.rpn_type == "severity"),
-        "value",
-        [
-            "name",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_SEVERITY,
-        site_db,
-        select(RAMSTKCategoryRecord).where(
-            RAMSTKCategoryRecord.category_type == "risk"
-        ),
-        "category_id",
-        [
-            "name",
-            "description",
-            "value",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_STAKEHOLDERS,
-        site_db,
-        select(RAMSTKStakeholdersRecord),
-        "stakeholders_id",
-        [
-            "stakeholder",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_STRESS_LIMITS,
-        site_db,
-        select(RAMSTKCategoryRecord).where(
-            RAMSTKCategoryRecord.category_type == "hardware"
-        ),
-        "category_id",
-        [
-            "harsh_ir_limit",
-            "mild_ir_limit",
-            "harsh_pr_limit",
-            "mild_pr_limit",
-            "harsh_vr_limit",
-            "mild_vr_limit",
-            "harsh_deltat_limit",
-            "mild_deltat_limit",
-            "harsh_maxt_limit",
-            "mild_maxt_limit",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_USERS,
-        site_db,
-        select(RAMSTKUserRecord),
-        "user_id",
-        [
-            "user_lname",
-            "user_fname",
-            "user_email",
-            "user_phone",
-            "user_group_id",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_VALIDATION_TYPE,
-        site_db,
-        select(RAMSTKTypeRecord).where(RAMSTKTypeRecord.type_type == "validation"),
-        "type_id",
-        [
-            "code",
-            "description",
-        ],
-    )
-    do_load_configuration_list(
-        user_configuration.RAMSTK_WORKGROUPS,
-        site_db,
-        select(RAMSTKGroupRecord).where(RAMSTKGroupRecord.group_type == "workgroup"),
-        "group_id",
-        [
-            "description",
-        ],
+        f"{user_configuration.RAMSTK_CONF_DIR}/site_lists.json",
     )
 
     pub.sendMessage(
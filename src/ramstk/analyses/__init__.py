@@ -6,6 +6,7 @@ from . import (
     allocation,
     criticality,
     dormancy,
+    equation,
     fha,
     improvementfactor,
     similaritem,
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.equation.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""User-Defined Equation Module.
+
+User-defined equations are parsed and checked once, compiled, and kept in a least
+recently used cache keyed by the text of the equation.  Equations may only contain
+numbers, the variables allowed by the analysis, arithmetic operators, and the
+functions in FUNCTIONS so nothing else can be evaluated.  The functions are numpy
+functions, so an equation evaluated with arrays of variable values is evaluated
+for every item in the arrays at once.  Numbers are evaluated as numpy floats, so
+a result too large to represent is inf rather than an unbounded Python integer.
+
+Equations saved when they were evaluated with sympy may use other sympy functions
+and constants (e.g., atan, Min, or pi).  These equations are still checked the
+same way, then converted to numpy functions with sympy.lambdify().
+"""
+
+# Standard Library Imports
+import ast
+import functools
+import inspect
+from typing import Any, Callable, Dict, FrozenSet
+
+# Third Party Imports
+import numpy as np
+
+# The functions that may be used in a user-defined equation.
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "Abs": np.abs,
+    "abs": np.abs,
+    "cos": np.cos,
+    "exp": np.exp,
+    "log": np.log,
+    "log10": np.log10,
+    "sin": np.sin,
+    "sqrt": np.sqrt,
+    "tan": np.tan,
+}
+
+# The syntax tree nodes that may appear in a user-defined equation.
+_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Call,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+class _FloatConstants(ast.NodeTransformer):
+    """Replace the number constants in an equation with numpy floats."""
+
+    def visit_Constant(  # pylint: disable=invalid-name
+        self, node: ast.Constant
+    ) -> ast.AST:
+        """Wrap a number constant in a call to numpy.float64."""
+        return ast.copy_location(
+            ast.Call(
+                func=ast.Name(id="_float", ctx=ast.Load()),
+                args=[ast.Constant(value=float(node.value))],
+                keywords=[],
+            ),
+            node,
+        )
+
+
+class _SymbolConstants(ast.NodeTransformer):
+    """Replace the number constants in an equation with named numpy floats."""
+
+    def __init__(self) -> None:
+        """Initialize the dict of numbers keyed by the name that replaced them."""
+        self.numbers: Dict[str, np.float64] = {}
+
+    def visit_Constant(  # pylint: disable=invalid-name
+        self, node: ast.Constant
+    ) -> ast.AST:
+        """Replace a number constant with a name."""
+        _name = f"_number{len(self.numbers)}"
+        self.numbers[_name] = np.float64(node.value)
+
+        return ast.copy_location(ast.Name(id=_name, ctx=ast.Load()), node)
+
+
+def evaluate(equation: str, values: Dict[str, Any]) -> Any:
+    """Evaluate a user-defined equation.
+
+    :param equation: the text of the equation to evaluate.  An empty equation
+        evaluates to 0.0.
+    :param values: the value of each variable the equation may use, keyed by the
+        variable name.  The values may be numbers or numpy arrays.
+    :return: the value of the equation; a number or an array if any of the
+        values are arrays.
+    :raise: ValueError if the equation isn't valid or uses a variable that isn't
+        in values.
+    """
+    return get_compiled_equation(equation, frozenset(values))(
+        {
+            _key: np.float64(_value) if isinstance(_value, int) else _value
+            for _key, _value in values.items()
+        }
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def get_compiled_equation(
+    equation: str, variables: FrozenSet[str]
+) -> Callable[[Dict[str, Any]], Any]:
+    """Parse, check, and compile a user-defined equation.
+
+    The compiled equations are cached, so each equation is only parsed the first
+    time it's used with a set of variables.  As with sympy, ^ is treated as
+    exponentiation.
+
+    :param equation: the text of the equation to compile.
+    :param variables: the names of the variables the equation may use.
+    :return: a function that takes the dict of variable values and returns the
+        value of the equation.
+    :rtype: callable
+    :raise: ValueError if the equation isn't valid or uses a variable, function,
+        or operator that isn't allowed.
+    """
+    _text = equation.strip().replace("^", "**") or "0.0"
+    try:
+        _tree = ast.parse(_text, mode="eval")
+    except SyntaxError as _error:
+        raise ValueError(f"Invalid syntax in equation: {equation}") from _error
+
+    _use_sympy = False
+    for _node in ast.walk(_tree):
+        if not isinstance(_node, _NODES):
+            raise ValueError(
+                f"Invalid operation {type(_node).__name__} in equation: {equation}"
+            )
+        if isinstance(_node, ast.Constant) and (
+            isinstance(_node.value, bool) or not isinstance(_node.value, (int, float))
+        ):
+            raise ValueError(f"Invalid constant in equation: {equation}")
+        if isinstance(_node, ast.Call) and (
+            not isinstance(_node.func, ast.Name)
+            or _node.keywords
+            or (
+                _node.func.id not in FUNCTIONS
+                and not callable(_get_sympy_name(_node.func.id))
+            )
+        ):
+            raise ValueError(f"Invalid function call in equation: {equation}")
+        if (
+            isinstance(_node, ast.Name)
+            and _node.id not in variables
+            and _node.id not in FUNCTIONS
+        ):
+            if _get_sympy_name(_node.id) is None:
+                raise ValueError(
+                    f"Invalid variables found in equation {equation}: {_node.id}"
+                )
+            _use_sympy = True
+
+    if _use_sympy:
+        return _get_sympy_equation(_tree, variables)
+
+    _code = compile(
+        ast.fix_missing_locations(_FloatConstants().visit(_tree)),
+        "<equation>",
+        "eval",
+    )
+    _globals = {"__builtins__": {}, "_float": np.float64, **FUNCTIONS}
+
+    def _evaluate(values: Dict[str, Any]) -> Any:
+        """Evaluate the compiled equation."""
+        # Only the nodes checked above can be in the compiled equation.
+        return eval(_code, _globals, values)  # nosec B307 # pylint: disable=eval-used
+
+    return _evaluate
+
+
+def _get_sympy_equation(
+    tree: ast.Expression, variables: FrozenSet[str]
+) -> Callable[[Dict[str, Any]], Any]:
+    """Compile a checked equation that uses sympy functions or constants.
+
+    The numbers in the equation are passed to sympy as symbols and given their
+    values as numpy floats when the equation is evaluated, so sympy never has to
+    calculate with them.
+
+    :param tree: the syntax tree of the equation, already checked by
+        get_compiled_equation().
+    :param variables: the names of the variables the equation may use.
+    :return: a function that takes the dict of variable values and returns the
+        value of the equation.
+    :rtype: callable
+    :raise: ValueError if sympy can't convert the equation.
+    """
+    import sympy  # pylint: disable=import-outside-toplevel
+
+    _constants = _SymbolConstants()
+    _text = ast.unparse(_constants.visit(tree))
+    _variables = sorted(variables)
+    _symbols = {
+        _name: sympy.Symbol(_name) for _name in _variables + list(_constants.numbers)
+    }
+    try:
+        # The equation only contains numbers, operators, the variables, and sympy
+        # functions and constants, so sympify() can't evaluate anything else.
+        _function = sympy.lambdify(
+            list(_symbols.values()),
+            sympy.sympify(_text, locals=_symbols),
+            modules=[FUNCTIONS, "numpy"],
+        )
+    except (sympy.SympifyError, TypeError, ValueError) as _error:
+        raise ValueError(f"Invalid equation: {_text}") from _error
+
+    def _evaluate(values: Dict[str, Any]) -> Any:
+        """Evaluate the converted equation."""
+        return _function(
+            *[values[_name] for _name in _variables], *_constants.numbers.values()
+        )
+
+    return _evaluate
+
+
+def _get_sympy_name(name: str) -> Any:
+    """Return the sympy function or constant with the passed name.
+
+    Only sympy functions (e.g., atan or Min) and real constants (e.g., pi or E) are
+    returned so nothing else in sympy can be used in an equation.
+
+    :param name: the name used in the equation.
+    :return: the sympy function or constant or None if there isn't one.
+    """
+    import sympy  # pylint: disable=import-outside-toplevel
+
+    _object = None if name.startswith("_") else getattr(sympy, name, None)
+    if (
+        isinstance(_object, sympy.FunctionClass)
+        or (
+            inspect.isfunction(_object)
+            and _object.__module__.startswith("sympy.functions")
+        )
+        or (isinstance(_object, sympy.Basic) and _object.is_real)
+    ):
+        return _object
+
+    return None
@@ -10,10 +10,8 @@
 import re
 from typing import Any, Dict, List
 
-# Third Party Imports
-from sympy import SympifyError, symbols, sympify
-
 # RAMSTK Package Imports
+from ramstk.analyses import equation
 from ramstk.exceptions import OutOfRangeError
 
 PROBABILITY = {
@@ -78,7 +76,6 @@ def calculate_hri(probability: str, severity: str) -> int:
 
 
 def calculate_user_defined(fha: Dict[str, Any]) -> Dict[str, Any]:
-    # pylint: disable=too-many-locals
     """Calculate the user-defined hazards analysis.
 
     :param fha: the user-defined functional hazards assessment dict.  The
@@ -96,10 +93,6 @@ def calculate_user_defined(fha: Dict[str, Any]) -> Dict[str, Any]:
     :return: fha; the functional hazards assessment dict with updated results.
     :rtype: dict
     """
-    (uf1, uf2, uf3, ui1, ui2, ui3, res1, res2, res3, res4, res5) = symbols(
-        "uf1 uf2 uf3 ui1 ui2 ui3 res1 res2 res3 res4 res5"
-    )
-
     for _idx in range(1, 6):
         _equation_key = f"equation{_idx}"
         _equation = fha.get(_equation_key, "0.0")
@@ -111,24 +104,29 @@ def calculate_user_defined(fha: Dict[str, Any]) -> Dict[str, Any]:
             # Validate the equation if it's not empty.
             _do_validate_equation(_equation)
 
-        # Safely evaluate the equation using sympify
         try:
-            fha[f"res{_idx}"] = sympify(_equation).evalf(
-                subs={
-                    uf1: fha["uf1"],
-                    uf2: fha["uf2"],
-                    uf3: fha["uf3"],
-                    ui1: fha["ui1"],
-                    ui2: fha["ui2"],
-                    ui3: fha["ui3"],
-                    res1: fha["res1"],
-                    res2: fha["res2"],
-                    res3: fha["res3"],
-                    res4: fha["res4"],
-                    res5: fha["res5"],
-                }
+            fha[f"res{_idx}"] = float(
+                equation.evaluate(
+                    _equation,
+                    {
+                        _key: fha[_key]
+                        for _key in [
+                            "uf1",
+                            "uf2",
+                            "uf3",
+                            "ui1",
+                            "ui2",
+                            "ui3",
+                            "res1",
+                            "res2",
+                            "res3",
+                            "res4",
+                            "res5",
+                        ]
+                    },
+                )
             )
-        except SympifyError as exc:
+        except ValueError as exc:
             raise ValueError(f"Invalid syntax in equation{_idx}: {_equation}") from exc
 
     return fha
@@ -167,8 +165,8 @@ def set_user_defined_functions(
 ) -> Dict[str, Any]:
     """Set the user-defined functions for the user-defined calculations.
 
-    .. note:: by default we set the function equal to 0.0.  This prevents Sympy
-        errors resulting from empty strings.
+    .. note:: by default we set the function equal to 0.0.  This prevents errors
+        evaluating empty strings.
 
     :param fha: the functional hazard assessment dict.
     :param list functions: the list of functions; list items are str.
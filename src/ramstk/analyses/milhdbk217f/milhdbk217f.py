@@ -8,9 +8,12 @@
 """milhdbk217f Calculations Class."""
 
 # Standard Library Imports
-from typing import Callable, Dict, Optional, TypedDict, Union
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TypedDict, Union
 
 # Third Party Imports
+import numpy as np
 from pubsub import pub
 
 # RAMSTK Local Imports
@@ -29,11 +32,29 @@ from .models import (
     semiconductor,
     switch,
 )
+from .models.lookup import get_factor_array
+
+# The attributes used to select the MIL-HDBK-217F parts count base hazard rate and
+# quality factor.  No other attribute changes the parts count hazard rate.
+PART_COUNT_KEYS: Tuple[str, ...] = (
+    "category_id",
+    "subcategory_id",
+    "environment_active_id",
+    "quality_id",
+    "application_id",
+    "construction_id",
+    "family_id",
+    "n_elements",
+    "specification_id",
+    "technology_id",
+    "type_id",
+)
 
 
 # noinspection PyTypeChecker
 def do_predict_active_hazard_rate(
     attributes: Dict[str, Union[float, int, str]],
+    quiet: bool = False,
 ) -> float:
     """Calculate the active hazard rate for a hardware item.
 
@@ -46,6 +67,9 @@ def do_predict_active_hazard_rate(
         exceptions raised by or passed through this method.
 
     :param attributes: the hardware attributes dict for the component being calculated.
+    :param quiet: whether to skip broadcasting the results.  Callers calculating
+        many parts at once use this to write the results into the records
+        themselves.  Failures are broadcast either way.
     :return: the calculated active hazard rate.
     :rtype: float
     """
@@ -57,18 +81,19 @@ def do_predict_active_hazard_rate(
         elif attributes["hazard_rate_method_id"] == 2:
             attributes = _do_calculate_part_stress(attributes)
 
-        pub.sendMessage(
-            "succeed_predict_reliability",
-            attributes=attributes,
-        )
-        pub.sendMessage(
-            "request_set_all_milhdbk217f_attributes",
-            attributes=attributes,
-        )
-        pub.sendMessage(
-            "request_set_all_reliability_attributes",
-            attributes=attributes,
-        )
+        if not quiet:
+            pub.sendMessage(
+                "succeed_predict_reliability",
+                attributes=attributes,
+            )
+            pub.sendMessage(
+                "request_set_all_milhdbk217f_attributes",
+                attributes=attributes,
+            )
+            pub.sendMessage(
+                "request_set_all_reliability_attributes",
+                attributes=attributes,
+            )
     except (TypeError, ValueError) as err:
         _do_handle_prediction_failure(
             "reliability",
@@ -85,6 +110,114 @@ def do_predict_active_hazard_rate(
     return attributes["hazard_rate_active"]
 
 
+def do_predict_part_count_hazard_rates(
+    columns: Dict[str, Sequence[int]],
+) -> np.ndarray:
+    """Calculate the MIL-HDBK-217F parts count active hazard rate of many parts.
+
+    :param columns: the parts count attributes of the parts being calculated.  Each
+        key in PART_COUNT_KEYS is the name of a column holding the value of that
+        attribute for every part.  Missing columns are treated as all zeros.
+    :return: the array of active hazard rates, one per part.  The hazard rate is NaN
+        for a part with an invalid combination of attributes.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _lambda_b, _pi_q = get_part_count_factors(columns)
+
+    return _lambda_b * _pi_q
+
+
+def do_predict_part_stress_hazard_rates(
+    columns: Dict[str, Sequence[Any]],
+) -> Dict[str, np.ndarray]:
+    """Calculate the MIL-HDBK-217F parts stress active hazard rate of many parts.
+
+    Parts are grouped by category and subcategory.  Groups with an array model are
+    calculated with array math over the whole group; the other groups, and any part
+    an array model could not calculate, are calculated one part at a time exactly as
+    do_predict_active_hazard_rate() would.
+
+    :param columns: the hardware attributes of the parts being calculated.  Each key
+        is the name of an attribute and each value holds that attribute for every
+        part.
+    :return: the hardware attributes of the parts with updated values; every value
+        is a float array with one element per part.  The hazard rate is NaN for a
+        part that could not be calculated.
+    :rtype: dict
+    """
+    _columns = {_key: np.asarray(_values) for _key, _values in columns.items()}
+    _n_parts = len(_columns["category_id"])
+    _columns["hazard_rate_method_id"] = np.full(_n_parts, 2)
+
+    _results = {_key: _values.astype(float) for _key, _values in _columns.items()}
+    _unique_groups, _index = np.unique(
+        np.column_stack((_columns["category_id"], _columns["subcategory_id"])).reshape(
+            _n_parts, 2
+        ),
+        axis=0,
+        return_inverse=True,
+    )
+    for _group in range(len(_unique_groups)):
+        _rows = np.flatnonzero(_index.ravel() == _group)
+        _group_columns = {_key: _values[_rows] for _key, _values in _columns.items()}
+        try:
+            _group_results = _do_calculate_part_stress_array(dict(_group_columns))
+            _failed = ~np.isfinite(_group_results["hazard_rate_active"])
+        except (IndexError, KeyError, TypeError, ValueError, ZeroDivisionError):
+            _group_results = {}
+            _failed = np.ones(len(_rows), dtype=bool)
+
+        if np.any(_failed):
+            _row_results = _do_calculate_part_stress_rows(
+                {_key: _values[_failed] for _key, _values in _group_columns.items()}
+            )
+            for _key in set(_group_results) | set(_row_results):
+                _values = np.array(
+                    _group_results.get(_key, np.full(len(_rows), np.nan)),
+                    dtype=float,
+                )
+                _values[_failed] = _row_results.get(_key, np.nan)
+                _group_results[_key] = _values
+
+        for _key, _values in _group_results.items():
+            _results.setdefault(_key, np.full(_n_parts, np.nan))[_rows] = _values
+
+    return _results
+
+
+def get_part_count_factors(
+    columns: Dict[str, Sequence[int]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Retrieve the MIL-HDBK-217F parts count lambdaB and piQ of many parts.
+
+    Parts with the same parts count attributes share the same base hazard rate and
+    quality factor, so these are looked up once for each unique combination of
+    attributes and then broadcast to all the parts with that combination.
+
+    :param columns: the parts count attributes of the parts being calculated.  Each
+        key in PART_COUNT_KEYS is the name of a column holding the value of that
+        attribute for every part.  Missing columns are treated as all zeros.
+    :return: the arrays of base hazard rates (lambdaB) and quality factors (piQ), one
+        per part.  Both are NaN for a part with an invalid combination of attributes.
+    :rtype: tuple
+    """
+    _n_parts = len(columns["category_id"])
+    _keys = np.column_stack(
+        [
+            np.asarray(columns.get(_key, np.zeros(_n_parts)), dtype=np.int64)
+            for _key in PART_COUNT_KEYS
+        ]
+    ).reshape(_n_parts, len(PART_COUNT_KEYS))
+
+    _unique_keys, _index = np.unique(_keys, axis=0, return_inverse=True)
+    _factors = np.array(
+        [_get_part_count_factors(tuple(_key)) for _key in _unique_keys.tolist()],
+        dtype=float,
+    ).reshape(len(_unique_keys), 2)[_index.ravel()]
+
+    return _factors[:, 0], _factors[:, 1]
+
+
 # noinspection PyTypeChecker
 def _do_calculate_part_count(
     attributes: Dict[str, Union[float, int, str]],
@@ -149,6 +282,127 @@ def _do_calculate_part_stress(
     return _part_stress(attributes)
 
 
+def _do_calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the MIL-HDBK-217F parts stress active hazard rate of many parts.
+
+    This is the array counterpart of _do_calculate_part_stress().  Every part must
+    have the same category ID and subcategory ID.
+
+    :param columns: the hardware attribute arrays for the parts being calculated.
+    :return: the attribute arrays with updated values.
+    :rtype: dict
+    :raises: KeyError if there is no array model for the category ID.
+    """
+    _category_id = int(columns["category_id"][0])
+    _subcategory_id = int(columns["subcategory_id"][0])
+    _set_default_values_array, _lambda_b_array, _part_stress_array = _get_function(
+        {
+            1: (
+                integratedcircuit.set_default_values_array,
+                integratedcircuit.calculate_part_stress_lambda_b_array,
+                integratedcircuit.calculate_part_stress_array,
+            ),
+            2: (
+                semiconductor.set_default_values_array,
+                semiconductor.calculate_part_stress_lambda_b_array,
+                semiconductor.calculate_part_stress_array,
+            ),
+            3: (
+                resistor.set_default_values_array,
+                resistor.calculate_part_stress_lambda_b_array,
+                resistor.calculate_part_stress_array,
+            ),
+            4: (
+                capacitor.set_default_values_array,
+                capacitor.calculate_part_stress_lambda_b_array,
+                capacitor.calculate_part_stress_array,
+            ),
+        },
+        _category_id,
+        _subcategory_id,
+    )
+
+    # The environment and quality factors are table lookups, so use the same
+    # functions as a single part prediction.  Some quality factors also depend on
+    # the type ID.
+    _attributes = {
+        "category_id": _category_id,
+        "subcategory_id": _subcategory_id,
+        "hazard_rate_method_id": 2,
+    }
+    with np.errstate(all="ignore"):
+        columns = _set_default_values_array(columns)
+        columns["lambda_b"] = _lambda_b_array(columns)
+        columns["piE"], columns["piQ"] = get_factor_array(
+            lambda _environment_active_id, _quality_id, _type_id: (
+                _get_environment_factor(
+                    {**_attributes, "environment_active_id": _environment_active_id}
+                ),
+                _get_quality_factor(
+                    {**_attributes, "quality_id": _quality_id, "type_id": _type_id}
+                ),
+            ),
+            columns["environment_active_id"],
+            columns["quality_id"],
+            columns["type_id"],
+        ).T
+        columns["hazard_rate_active"] = (
+            columns["lambda_b"] * columns["piQ"] * columns["piE"]
+        )
+
+        return _part_stress_array(columns)
+
+
+def _do_calculate_part_stress_rows(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the MIL-HDBK-217F parts stress active hazard rate one part at a time.
+
+    :param columns: the hardware attribute arrays for the parts being calculated.
+    :return: the attribute arrays with updated values.  The hazard rate is NaN for a
+        part that could not be calculated.
+    :rtype: dict
+    """
+    _n_parts = len(columns["category_id"])
+    _results = {_key: _values.astype(float) for _key, _values in columns.items()}
+    for _row in range(_n_parts):
+        _attributes = {_key: _values[_row].item() for _key, _values in columns.items()}
+        try:
+            _attributes = _do_calculate_part_stress(_set_default_values(_attributes))
+        except (IndexError, KeyError, TypeError, ValueError, ZeroDivisionError):
+            _attributes = {"hazard_rate_active": np.nan}
+
+        for _key, _value in _attributes.items():
+            if isinstance(_value, (int, float)):
+                _results.setdefault(_key, np.full(_n_parts, np.nan))[_row] = _value
+
+    return _results
+
+
+@lru_cache(maxsize=None)
+def _get_part_count_factors(key: Tuple[int, ...]) -> Tuple[float, float]:
+    """Retrieve the parts count lambdaB and piQ for one combination of attributes.
+
+    Attributes not used by the parts count method are zero so the default values
+    can be set exactly as they are for a single part prediction.
+
+    :param key: the value of each attribute in PART_COUNT_KEYS.
+    :return: the base hazard rate (lambdaB) and the quality factor (piQ); both are
+        NaN if the combination of attributes is invalid.
+    :rtype: tuple
+    """
+    _attributes = defaultdict(float, zip(PART_COUNT_KEYS, key))
+    _attributes["hazard_rate_method_id"] = 1
+
+    try:
+        _attributes = _set_default_values(_attributes)
+        return _get_lambda_b(_attributes), _get_quality_factor(_attributes)
+    except (IndexError, KeyError, TypeError, ValueError):
+        return np.nan, np.nan
+
+
 def _do_handle_prediction_failure(
     error_type: str,
     attributes: Dict[str, Union[float, int, str]],
@@ -351,22 +605,26 @@ def _set_default_values(
     :return: the updated hardware attributes dict.
     :rtype: dict
     """
-    _default_values = {
-        1: integratedcircuit.set_default_values,
-        2: semiconductor.set_default_values,
-        3: resistor.set_default_values,
-        4: capacitor.set_default_values,
-        5: inductor.set_default_values,
-        6: relay.set_default_values,
-        7: switch.set_default_values,
-        8: connection.set_default_values,
-        9: meter.set_default_values,
-        10: {
-            1: crystal.set_default_values,
-            2: efilter.set_default_values,
-            3: fuse.set_default_values,
-            4: lamp.set_default_values,
+    _default_values = _get_function(
+        {
+            1: integratedcircuit.set_default_values,
+            2: semiconductor.set_default_values,
+            3: resistor.set_default_values,
+            4: capacitor.set_default_values,
+            5: inductor.set_default_values,
+            6: relay.set_default_values,
+            7: switch.set_default_values,
+            8: connection.set_default_values,
+            9: meter.set_default_values,
+            10: {
+                1: crystal.set_default_values,
+                2: efilter.set_default_values,
+                3: fuse.set_default_values,
+                4: lamp.set_default_values,
+            },
         },
-    }[attributes["category_id"]]
+        attributes["category_id"],
+        attributes["subcategory_id"],
+    )
 
     return _default_values(attributes)
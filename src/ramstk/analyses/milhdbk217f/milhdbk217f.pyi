@@ -1,5 +1,8 @@
 # Standard Library Imports
-from typing import Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+# Third Party Imports
+import numpy as np
 
 # RAMSTK Local Imports
 from .models import capacitor as capacitor
@@ -15,16 +18,36 @@ from .models import relay as relay
 from .models import resistor as resistor
 from .models import semiconductor as semiconductor
 from .models import switch as switch
+from .models.lookup import get_factor_array as get_factor_array
+
+PART_COUNT_KEYS: Tuple[str, ...]
 
 def do_predict_active_hazard_rate(
     attributes: Dict[str, Union[float, int, str]],
+    quiet: bool = False,
 ) -> float: ...
+def do_predict_part_count_hazard_rates(
+    columns: Dict[str, Sequence[int]],
+) -> np.ndarray: ...
+def do_predict_part_stress_hazard_rates(
+    columns: Dict[str, Sequence[Any]],
+) -> Dict[str, np.ndarray]: ...
+def get_part_count_factors(
+    columns: Dict[str, Sequence[int]],
+) -> Tuple[np.ndarray, np.ndarray]: ...
 def _do_calculate_part_count(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
 def _do_calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def _do_calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
+def _do_calculate_part_stress_rows(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
+def _get_part_count_factors(key: Tuple[int, ...]) -> Tuple[float, float]: ...
 def _do_handle_prediction_failure(
     error_type: str,
     attributes: Dict[str, Union[float, int, str]],
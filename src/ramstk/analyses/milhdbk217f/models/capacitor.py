@@ -11,6 +11,9 @@
 from math import exp
 from typing import Dict, Union
 
+# Third Party Imports
+import numpy as np
+
 # RAMSTK Package Imports
 from ramstk.constants.capacitor import (
     CAPACITANCE_FACTORS,
@@ -25,6 +28,9 @@ from ramstk.constants.capacitor import (
     REF_TEMPS,
 )
 
+# RAMSTK Local Imports
+from .lookup import get_factor_array
+
 
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
@@ -78,6 +84,51 @@ def calculate_part_stress(
         ) from exc
 
 
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the part stress active hazard rate for many capacitors.
+
+    This is the array counterpart of calculate_part_stress().  Every capacitor in
+    the batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the capacitors being
+        calculated.
+    :return: the hardware attribute arrays with updated values.
+    :rtype: dict
+    :raises: KeyError when the attribute arrays are missing one or more keys.
+    :raises: TypeError when passed a negative resistance or voltage.
+    :raises: ZeroDivisionError when passed both ac and DC voltages = 0.0.
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    _f0, _f1 = CAPACITANCE_FACTORS[_subcategory_id]
+    columns["piCV"] = _f0 * columns["capacitance"] ** _f1
+    columns["hazard_rate_active"] = columns["hazard_rate_active"] * columns["piCV"]
+
+    if _subcategory_id == 12:
+        columns["piSR"] = calculate_series_resistance_factor_array(
+            columns["resistance"],
+            columns["voltage_dc_operating"],
+            columns["voltage_ac_operating"],
+        )
+        columns["hazard_rate_active"] = columns["hazard_rate_active"] * columns["piSR"]
+    elif _subcategory_id == 13:
+        columns["piC"] = get_factor_array(
+            get_construction_factor, columns["construction_id"]
+        )
+        columns["hazard_rate_active"] = columns["hazard_rate_active"] * columns["piC"]
+    elif _subcategory_id == 19:
+        columns["piCF"] = get_factor_array(
+            get_configuration_factor, columns["configuration_id"]
+        )
+        columns["hazard_rate_active"] = (
+            columns["hazard_rate_active"] * columns["piCF"] / columns["piCV"]
+        )
+
+    return columns
+
+
 def calculate_capacitance_factor(
     subcategory_id: int,
     capacitance: float,
@@ -133,6 +184,37 @@ def calculate_part_stress_lambda_b(
         ) from exc
 
 
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Calculate the part stress base hazard rate (lambdaB) for many capacitors.
+
+    This is the array counterpart of calculate_part_stress_lambda_b().  Every
+    capacitor in the batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the capacitors being
+        calculated.
+    :return: the calculated part stress base hazard rates (lambdaB).
+    :rtype: :class:`numpy.ndarray`
+    :raises: KeyError when passed an invalid subcategory ID.
+    """
+    _temperature_active = columns["temperature_active"]
+    _voltage_ratio = columns["voltage_ratio"]
+
+    _ref_temp = get_factor_array(
+        lambda _temperature_rated_max: REF_TEMPS.get(
+            _temperature_rated_max, min(REF_TEMPS.values())
+        ),
+        columns["temperature_rated_max"],
+    )
+    _f0, _f1, _f2, _f3, _f4 = LAMBDA_B_FACTORS[int(columns["subcategory_id"][0])]
+    return (
+        _f0
+        * ((_voltage_ratio / _f1) ** _f2 + 1.0)
+        * np.exp(_f3 * ((_temperature_active + 273.0) / _ref_temp) ** _f4)
+    )
+
+
 def calculate_series_resistance_factor(
     resistance: float,
     voltage_dc_operating: float,
@@ -177,6 +259,43 @@ def calculate_series_resistance_factor(
     )
 
 
+def calculate_series_resistance_factor_array(
+    resistance: np.ndarray,
+    voltage_dc_operating: np.ndarray,
+    voltage_ac_operating: np.ndarray,
+) -> np.ndarray:
+    """Calculate the series resistance factor (piSR) for many capacitors.
+
+    This is the array counterpart of calculate_series_resistance_factor().
+
+    :param resistance: the capacitors' equivalent series resistances.
+    :param voltage_dc_operating: the capacitors' operating DC voltages.
+    :param voltage_ac_operating: the capacitors' operating ac voltages (ripple
+        voltages).
+    :return: the calculated series resistance factors (piSR).
+    :rtype: :class:`numpy.ndarray`
+    :raises: TypeError when passed a negative resistance or voltage.
+    :raises: ZeroDivisionError when passed both ac and DC voltages = 0.0.
+    """
+    if np.any(
+        (resistance < 0) | (voltage_dc_operating < 0) | (voltage_ac_operating < 0)
+    ):
+        raise TypeError(
+            "calculate_series_resistance_factor_array: Capacitor resistance and "
+            "voltage values must be non-negative numbers."
+        )
+    if np.any((voltage_dc_operating == 0) & (voltage_ac_operating == 0)):
+        raise ZeroDivisionError(
+            "calculate_series_resistance_factor_array: Capacitor ac voltage and DC "
+            "voltage cannot both be zero."
+        )
+
+    _ckt_resistance = resistance / (voltage_dc_operating + voltage_ac_operating)
+    return np.asarray([0.33, 0.27, 0.20, 0.13, 0.10, 0.066])[
+        np.searchsorted([0.1, 0.2, 0.4, 0.6, 0.8], _ckt_resistance)
+    ]
+
+
 def get_configuration_factor(
     configuration_id: int,
 ) -> float:
@@ -410,6 +529,58 @@ def set_default_values(
     return attributes
 
 
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Set the default value for various capacitor parameters of many capacitors.
+
+    This is the array counterpart of set_default_values().  Every capacitor in the
+    batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the capacitors being
+        calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+    _n_parts = len(columns["subcategory_id"])
+    _style_id = columns.get("style_id", np.ones(_n_parts, dtype=np.int64))
+
+    _capacitance = columns.get("capacitance", np.zeros(_n_parts)).astype(float)
+    _rows = _capacitance <= 0.0
+    if np.any(_rows):
+        _capacitance[_rows] = get_factor_array(
+            lambda _style: _set_default_capacitance(_subcategory_id, _style),
+            _style_id[_rows],
+        )
+    columns["capacitance"] = _capacitance
+
+    columns["piCV"] = np.where(
+        columns.get("piCV", np.zeros(_n_parts)) <= 0.0,
+        _set_default_capacitance_factor(_subcategory_id),
+        columns.get("piCV", np.zeros(_n_parts)),
+    )
+
+    _temperature_rated_max = columns.get(
+        "temperature_rated_max", np.zeros(_n_parts)
+    ).astype(float)
+    _rows = _temperature_rated_max <= 0.0
+    if np.any(_rows):
+        _temperature_rated_max[_rows] = get_factor_array(
+            lambda _style: _set_default_rated_temperature(_subcategory_id, _style),
+            _style_id[_rows],
+        )
+    columns["temperature_rated_max"] = _temperature_rated_max
+
+    columns["voltage_ratio"] = np.where(
+        columns.get("voltage_ratio", np.zeros(_n_parts)) <= 0.0,
+        0.5,
+        columns.get("voltage_ratio", np.zeros(_n_parts)),
+    )
+
+    return columns
+
+
 def _set_default_capacitance(
     subcategory_id: int,
     style_id: int,
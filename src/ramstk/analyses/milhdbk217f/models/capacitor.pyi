@@ -1,6 +1,9 @@
 # Standard Library Imports
 from typing import Any, Dict, List, Union
 
+# Third Party Imports
+import numpy as np
+
 PART_COUNT_LAMBDA_B: Dict[int, Dict[int, List[float]] | List[float]]
 PART_COUNT_PI_Q: List[float]
 PART_STRESS_PI_Q: Dict[int, List[float]]
@@ -15,6 +18,9 @@ LAMBDA_B_FACTORS: Dict[int, List[float]]
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_capacitance_factor(
     subcategory_id: int,
     capacitance: float,
@@ -22,11 +28,19 @@ def calculate_capacitance_factor(
 def calculate_part_stress_lambda_b(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float: ...
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray: ...
 def calculate_series_resistance_factor(
     resistance: float,
     voltage_dc_operating: float,
     voltage_ac_operating: float,
 ) -> float: ...
+def calculate_series_resistance_factor_array(
+    resistance: np.ndarray,
+    voltage_dc_operating: np.ndarray,
+    voltage_ac_operating: np.ndarray,
+) -> np.ndarray: ...
 def get_configuration_factor(
     configuration_id: int,
 ) -> float: ...
@@ -48,6 +62,9 @@ def get_part_stress_quality_factor(
 def set_default_values(
     **attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def _set_default_capacitance(
     subcategory_id: int,
     style_id: int,
@@ -12,6 +12,9 @@
 from math import exp, log
 from typing import Dict, Tuple, Union
 
+# Third Party Imports
+import numpy as np
+
 # RAMSTK Package Imports
 from ramstk.constants.integrated_circuit import (
     ACTIVATION_ENERGY,
@@ -24,6 +27,9 @@ from ramstk.constants.integrated_circuit import (
     PI_Q,
 )
 
+# RAMSTK Local Imports
+from .lookup import get_factor_array
+
 
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
@@ -83,7 +89,7 @@ def calculate_part_stress(
             )
             if attributes["subcategory_id"] == 6:
                 attributes["piECC"] = get_error_correction_factor(attributes["type_id"])
-                (_a_1, _a_2, _b_1, _b_2) = calculate_lambda_cyclic_factors(
+                _a_1, _a_2, _b_1, _b_2 = calculate_lambda_cyclic_factors(
                     attributes["n_cycles"],
                     attributes["construction_id"],
                     attributes["n_elements"],
@@ -164,6 +170,124 @@ def calculate_part_stress(
         ) from exc
 
 
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the part stress active hazard rate for many integrated circuits.
+
+    This is the array counterpart of calculate_part_stress().  Every integrated
+    circuit in the batch must have the same subcategory ID.  The hazard rate is NaN
+    for an integrated circuit calculate_part_stress() would raise an error for.
+
+    :param columns: the hardware attribute arrays for the integrated circuits being
+        calculated.
+    :return: the hardware attribute arrays with updated values.
+    :rtype: dict
+    :raises: KeyError when the attribute arrays are missing one or more keys.
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    columns["temperature_junction"] = calculate_junction_temperature(
+        columns["temperature_case"],
+        columns["power_operating"],
+        columns["theta_jc"],
+    )
+    columns["piT"] = calculate_temperature_factor_array(
+        _subcategory_id,
+        columns["family_id"],
+        columns["type_id"],
+        columns["temperature_junction"],
+    )
+    columns["piL"] = 0.01 * np.exp(5.35 - 0.35 * columns["years_in_production"])
+
+    if _subcategory_id in [1, 2, 3, 4, 5, 6, 7, 8, 9]:
+        # The die complexity and package factors only depend on discrete values,
+        # so look them up with the single part functions.
+        columns["C1"] = get_factor_array(
+            lambda _technology_id, _application_id, _n_elements: (
+                get_die_complexity_factor(
+                    _subcategory_id, _technology_id, _application_id, _n_elements
+                )
+            ),
+            columns["technology_id"],
+            columns["application_id"],
+            columns["n_elements"],
+        )
+        columns["C2"] = get_factor_array(
+            calculate_package_factor,
+            columns["package_id"],
+            columns["n_active_pins"],
+        )
+
+    if _subcategory_id in [1, 2, 3, 4]:
+        columns["hazard_rate_active"] = (
+            (columns["C1"] * columns["piT"] + columns["C2"] * columns["piE"])
+            * columns["piQ"]
+            * columns["piL"]
+        )
+    elif _subcategory_id in [5, 6, 7, 8]:
+        if _subcategory_id == 6:
+            columns["piECC"] = get_factor_array(
+                get_error_correction_factor, columns["type_id"]
+            )
+            _a_1, _a_2, _b_1, _b_2 = calculate_lambda_cyclic_factors_array(
+                columns["n_cycles"],
+                columns["construction_id"],
+                columns["n_elements"],
+                columns["temperature_junction"],
+            )
+            columns["lambda_cyc"] = (
+                _a_1 * _b_1 + (_a_2 * _b_2 / columns["piQ"])
+            ) * columns["piECC"]
+        else:
+            columns["lambda_cyc"] = np.zeros(len(columns["piQ"]))
+
+        columns["hazard_rate_active"] = (
+            (
+                columns["C1"] * columns["piT"]
+                + columns["C2"] * columns["piE"]
+                + columns["lambda_cyc"]
+            )
+            * columns["piQ"]
+            * columns["piL"]
+        )
+    elif _subcategory_id == 9:
+        columns["piA"] = get_factor_array(
+            get_application_factor, columns["type_id"], columns["application_id"]
+        )
+        columns["hazard_rate_active"] = (
+            (
+                columns["C1"] * columns["piT"] * columns["piA"]
+                + columns["C2"] * columns["piE"]
+            )
+            * columns["piQ"]
+            * columns["piL"]
+        )
+    elif _subcategory_id == 10:
+        columns["lambdaBD"] = np.where(columns["type_id"] == 1, 0.16, 0.24)
+        columns["lambdaBP"] = calculate_package_base_hazard_rate(
+            columns["n_active_pins"]
+        )
+        columns["lambdaEOS"] = (
+            -np.log(1.0 - 0.00057 * np.exp(-0.0002 * columns["voltage_esd"]))
+        ) / 0.00876
+        columns["piCD"] = (
+            (columns["area"] / 0.21) * (2.0 / columns["feature_size"]) ** 2.0 * 0.64
+        ) + 0.36
+        columns["piMFG"] = np.where(columns["manufacturing_id"] == 1, 0.55, 2.0)
+        columns["piPT"] = get_factor_array(
+            get_package_type_correction_factor, columns["package_id"]
+        )
+
+        columns["hazard_rate_active"] = (
+            columns["lambdaBD"] * columns["piMFG"] * columns["piT"] * columns["piCD"]
+            + columns["lambdaBP"] * columns["piE"] * columns["piQ"] * columns["piPT"]
+            + columns["lambdaEOS"]
+        )
+
+    return columns
+
+
 # noinspection PyUnusedLocal
 # pylint: disable=unused-argument
 def calculate_part_stress_lambda_b(
@@ -182,6 +306,23 @@ def calculate_part_stress_lambda_b(
     return 0.0
 
 
+# noinspection PyUnusedLocal
+# pylint: disable=unused-argument
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Calculate the part stress base hazard rate (lambdaB) for many parts.
+
+    This is the array counterpart of calculate_part_stress_lambda_b().
+
+    :param columns: the hardware attribute arrays for the integrated circuits being
+        calculated.
+    :return: an array of zeros, one per integrated circuit.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.zeros(len(columns["subcategory_id"]))
+
+
 def calculate_die_complexity_factor(
     area: float,
     feature_size: float,
@@ -280,6 +421,51 @@ def calculate_lambda_cyclic_factors(
     return _a_1, _a_2, _b_1, _b_2
 
 
+def calculate_lambda_cyclic_factors_array(
+    n_cycles: np.ndarray,
+    construction_id: np.ndarray,
+    n_elements: np.ndarray,
+    temperature_junction: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate the write cycle hazard rate A and B factors for many EEPROMs.
+
+    This is the array counterpart of calculate_lambda_cyclic_factors().
+
+    :param n_cycles: the EEPROMs' expected number of lifetime write cycles.
+    :param construction_id: the EEPROMs' construction type IDs.
+    :param n_elements: the EEPROMs' number of elements (bits).
+    :param temperature_junction: the EEPROMs' junction temperatures in C.
+    :return: (_a_1, _a_2, _b_1, _b_2); the calculated factors.
+    :rtype: tuple
+    """
+    _inverse_temperature = 1.0 / (temperature_junction + 273.0)
+
+    _a_1 = 6.817e-6 * n_cycles
+    _a_2 = np.where(
+        construction_id == 2,
+        np.where((300000 < n_cycles) & (n_cycles <= 400000), 1.1, 2.3),
+        0.0,
+    )
+    _b_1 = np.select(
+        [construction_id == 1, construction_id == 2],
+        [
+            ((n_elements / 16000.0) ** 0.5)
+            * np.exp((-0.15 / 8.63e-5) * (_inverse_temperature - (1.0 / 333.0))),
+            ((n_elements / 64000.0) ** 0.25)
+            * np.exp((0.1 / 8.63e-5) * (_inverse_temperature - (1.0 / 303.0))),
+        ],
+        0.0,
+    )
+    _b_2 = np.where(
+        construction_id == 2,
+        ((n_elements / 64000.0) ** 0.25)
+        * np.exp((-0.12 / 8.63e-5) * (_inverse_temperature - (1.0 / 303.0))),
+        0.0,
+    )
+
+    return _a_1, _a_2, _b_1, _b_2
+
+
 def calculate_package_base_hazard_rate(
     n_active_pins: int,
 ) -> float:
@@ -364,6 +550,44 @@ def calculate_temperature_factor(
         ) from exc
 
 
+def calculate_temperature_factor_array(
+    subcategory_id: int,
+    family_id: np.ndarray,
+    type_id: np.ndarray,
+    temperature_junction: np.ndarray,
+) -> np.ndarray:
+    """Calculate the temperature factor (piT) for many integrated circuits.
+
+    This is the array counterpart of calculate_temperature_factor().
+
+    :param subcategory_id: the subcategory ID shared by all the integrated circuits.
+    :param family_id: the integrated circuits' family IDs.
+    :param type_id: the integrated circuits' type IDs.
+    :param temperature_junction: the integrated circuits' junction temperatures in C.
+    :return: the calculated temperature factors (piT).
+    :rtype: :class:`numpy.ndarray`
+    :raises: KeyError when passed an invalid subcategory ID.
+    """
+    if subcategory_id == 2:
+        _ref_temp = 296.0
+        _ea = get_factor_array(
+            lambda _family_id: ACTIVATION_ENERGY[subcategory_id][_family_id - 1],
+            family_id,
+        )
+    elif subcategory_id == 9:
+        _ref_temp = 423.0
+        _ea = get_factor_array(
+            lambda _type_id: ACTIVATION_ENERGY[subcategory_id][_type_id - 1], type_id
+        )
+    else:
+        _ref_temp = 296.0
+        _ea = ACTIVATION_ENERGY[subcategory_id]
+
+    return 0.1 * np.exp(
+        (-_ea / 8.617e-5) * ((1.0 / (temperature_junction + 273)) - (1.0 / _ref_temp))
+    )
+
+
 def get_application_factor(
     type_id: int,
     application_id: int,
@@ -706,6 +930,45 @@ def set_default_values(
     return attributes
 
 
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Set the default value for various integrated circuit parameters of many parts.
+
+    This is the array counterpart of set_default_values().
+
+    :param columns: the hardware attribute arrays for the integrated circuits being
+        calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    """
+    columns["years_in_production"] = np.where(
+        columns["years_in_production"] <= 0.0, 2.0, columns["years_in_production"]
+    )
+    columns["package_id"] = np.where(
+        columns["package_id"] <= 0, 1, columns["package_id"]
+    )
+
+    # Environments without a default junction temperature use the case temperature.
+    _temperature_junction = get_factor_array(
+        lambda _environment_active_id: _set_default_junction_temperature(
+            0.0, np.nan, _environment_active_id
+        ),
+        columns["environment_active_id"],
+    )
+    columns["temperature_junction"] = np.where(
+        columns["temperature_junction"] > 0.0,
+        columns["temperature_junction"],
+        np.where(
+            np.isnan(_temperature_junction),
+            columns["temperature_case"],
+            _temperature_junction,
+        ),
+    )
+
+    return columns
+
+
 def _set_default_junction_temperature(
     temperature_junction: float,
     temperature_case: float,
@@ -1,6 +1,9 @@
 # Standard Library Imports
 from typing import Dict, List, Tuple, Union
 
+# Third Party Imports
+import numpy as np
+
 ACTIVATION_ENERGY: Dict[int, float | List[float]]
 C1: Dict[int, List[List[float]]]
 C2: Dict[int, List[float]]
@@ -13,9 +16,15 @@ PI_Q: List[float]
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_part_stress_lambda_b(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float: ...
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray: ...
 def calculate_die_complexity_factor(
     area: float,
     feature_size: float,
@@ -34,6 +43,12 @@ def calculate_lambda_cyclic_factors(
     n_elements: int,
     temperature_junction: float,
 ) -> Tuple[float, float, float, float]: ...
+def calculate_lambda_cyclic_factors_array(
+    n_cycles: np.ndarray,
+    construction_id: np.ndarray,
+    n_elements: np.ndarray,
+    temperature_junction: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: ...
 def calculate_package_base_hazard_rate(
     n_active_pins: int,
 ) -> float: ...
@@ -47,6 +62,12 @@ def calculate_temperature_factor(
     type_id: int,
     temperature_junction: float,
 ) -> float: ...
+def calculate_temperature_factor_array(
+    subcategory_id: int,
+    family_id: np.ndarray,
+    type_id: np.ndarray,
+    temperature_junction: np.ndarray,
+) -> np.ndarray: ...
 def get_application_factor(
     type_id: int,
     application_id: int,
@@ -81,6 +102,9 @@ def get_quality_factor(
 def set_default_values(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def _set_default_junction_temperature(
     temperature_junction: float,
     temperature_case: float,
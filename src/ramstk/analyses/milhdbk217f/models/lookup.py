@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.milhdbk217f.models.lookup.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""MIL-HDBK-217F Factor Lookup Module."""
+
+# Standard Library Imports
+from typing import Callable
+
+# Third Party Imports
+import numpy as np
+
+
+def get_factor_array(
+    func: Callable,
+    *keys: np.ndarray,
+) -> np.ndarray:
+    """Retrieve a tabulated factor for every part in a batch of parts.
+
+    Tabulated factors only depend on a handful of discrete keys (e.g., the
+    environment ID) so the factor is retrieved once for each unique combination of
+    keys and then broadcast to every part with that combination.
+
+    :param func: the function that retrieves the factor(s) for one combination of
+        keys.  It is passed one positional argument per key array.
+    :param keys: the arrays of key values, one value per part in each array.
+    :return: the array of factors, one row per part.  The factors are NaN for parts
+        with a combination of keys func rejects.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _keys = np.column_stack(keys)
+    _unique_keys, _index = np.unique(_keys, axis=0, return_inverse=True)
+
+    _factors = []
+    for _key in _unique_keys.tolist():
+        try:
+            _factors.append(func(*_key))
+        except (IndexError, KeyError, TypeError, ValueError):
+            _factors.append(None)
+
+    _shape = np.shape(next((_f for _f in _factors if _f is not None), np.nan))
+    return np.array(
+        [np.full(_shape, np.nan) if _f is None else _f for _f in _factors],
+        dtype=float,
+    )[_index.ravel()]
@@ -11,6 +11,9 @@
 from math import exp
 from typing import Dict, List, Tuple, Union
 
+# Third Party Imports
+import numpy as np
+
 # RAMSTK Package Imports
 from ramstk.constants.resistor import (
     PART_COUNT_LAMBDA_B,
@@ -19,11 +22,16 @@ from ramstk.constants.resistor import (
     PI_C,
     PI_E,
     PI_R,
+    PI_R_BREAKPOINTS,
     PI_V,
+    PI_V_BREAKPOINTS,
     REF_TEMPS,
     REF_TEMPS_FILM,
 )
 
+# RAMSTK Local Imports
+from .lookup import get_factor_array
+
 
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
@@ -99,6 +107,72 @@ def calculate_part_stress(
         ) from exc
 
 
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the part stress active hazard rate for many resistors.
+
+    This is the array counterpart of calculate_part_stress().  Every resistor in the
+    batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the resistors being calculated.
+    :return: the hardware attribute arrays with updated values.
+    :rtype: dict
+    :raises: KeyError when the attribute arrays are missing one or more keys.
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    columns["piR"] = get_resistance_factor_array(
+        _subcategory_id,
+        columns["specification_id"],
+        columns["family_id"],
+        columns["resistance"],
+    )
+    columns["temperature_case"] = (
+        columns["temperature_active"] + 55.0 * columns["power_ratio"]
+    )
+    columns["piT"] = np.exp(
+        -4056.0 * ((1.0 / (columns["temperature_case"] + 273.0)) - 1.0 / 298.0)
+    )
+
+    if _subcategory_id in [9, 10, 11, 12, 13, 14, 15]:
+        columns["piV"] = get_voltage_factor_array(
+            _subcategory_id,
+            columns["voltage_ratio"],
+        )
+        columns["piTAPS"] = (columns["n_elements"] ** 1.5 / 25.0) + 0.792
+
+    if _subcategory_id in [10, 12]:
+        columns["piC"] = get_factor_array(
+            lambda _construction_id: PI_C[_subcategory_id][_construction_id - 1],
+            columns["construction_id"],
+        )
+
+    if _subcategory_id == 4:
+        columns["hazard_rate_active"] = (
+            columns["hazard_rate_active"] * columns["piT"] * columns["n_elements"]
+        )
+    elif _subcategory_id in [9, 11, 13, 14, 15]:
+        columns["hazard_rate_active"] = (
+            columns["hazard_rate_active"]
+            * columns["piTAPS"]
+            * columns["piR"]
+            * columns["piV"]
+        )
+    elif _subcategory_id in [10, 12]:
+        columns["hazard_rate_active"] = (
+            columns["hazard_rate_active"]
+            * columns["piTAPS"]
+            * columns["piC"]
+            * columns["piR"]
+            * columns["piV"]
+        )
+    elif _subcategory_id != 8:
+        columns["hazard_rate_active"] = columns["hazard_rate_active"] * columns["piR"]
+
+    return columns
+
+
 # pylint: disable=too-many-locals
 def calculate_part_stress_lambda_b(
     attributes: Dict[str, Union[float, int, str]],
@@ -152,6 +226,51 @@ def calculate_part_stress_lambda_b(
         ) from exc
 
 
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Calculate the part stress base hazard rate (lambdaB) for many resistors.
+
+    This is the array counterpart of calculate_part_stress_lambda_b().  Every
+    resistor in the batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the resistors being calculated.
+    :return: the calculated part stress base hazard rates (lambdaB).
+    :rtype: :class:`numpy.ndarray`
+    :raises: IndexError when passed an invalid type ID.
+    :raises: KeyError when passed an invalid specification ID or subcategory ID.
+    """
+    _power_ratio = columns["power_ratio"]
+    _subcategory_id = int(columns["subcategory_id"][0])
+    _temperature_active = columns["temperature_active"]
+
+    if _subcategory_id == 4:
+        return np.full(len(_temperature_active), 0.00006)
+
+    if _subcategory_id == 8:
+        return get_factor_array(_get_type_factor, columns["type_id"])
+
+    if _subcategory_id == 2:
+        _factors = get_factor_array(
+            lambda _specification_id: np.hstack(
+                _get_film_factors_and_temp(_specification_id)
+            ),
+            columns["specification_id"],
+        ).T
+    else:
+        _factors = np.hstack(_get_factors_and_temp(_subcategory_id))
+
+    _f0, _f1, _f2, _f3, _f4, _f5, _ref_temp = _factors
+    return (
+        _f0
+        * np.exp(_f1 * ((_temperature_active + 273.0) / _ref_temp)) ** _f2
+        * np.exp(
+            ((_power_ratio / _f3) * ((_temperature_active + 273.0) / 273.0)) ** _f4
+        )
+        ** _f5
+    )
+
+
 def calculate_temperature_factor(
     temperature_active: float,
     power_ratio: float,
@@ -350,32 +469,14 @@ def get_resistance_factor(
     :raises: KeyError when passed an invalid subcategory ID.
     """
     _pi_r = 0.0
-    _dic_breakpoints = {
-        1: [1.0e5, 1.0e6, 1.0e7],
-        2: [1.0e5, 1.0e6, 1.0e7],
-        3: [100.0, 1.0e5, 1.0e6],
-        5: [1.0e4, 1.0e5, 1.0e6],
-        6: [
-            [500.0, 1.0e3, 5.0e3, 7.5e3, 1.0e4, 1.5e4, 2.0e4],
-            [100.0, 1.0e3, 1.0e4, 1.0e5, 1.5e5, 2.0e5],
-        ],
-        7: [500.0, 1.0e3, 5.0e3, 1.0e4, 2.0e4],
-        9: [2.0e3, 5.0e3],
-        10: [1.0e4, 2.0e4, 5.0e4, 1.0e5, 2.0e5],
-        11: [2.0e3, 5.0e3],
-        12: [2.0e3, 5.0e3],
-        13: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
-        14: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
-        15: [1.0e4, 5.0e4, 2.0e5, 1.0e6],
-    }
 
     try:
         if subcategory_id not in [4, 8]:
             _index = -1
             if subcategory_id == 6:
-                _breaks = _dic_breakpoints[subcategory_id][specification_id - 1]
+                _breaks = PI_R_BREAKPOINTS[subcategory_id][specification_id - 1]
             else:
-                _breaks = _dic_breakpoints[subcategory_id]
+                _breaks = PI_R_BREAKPOINTS[subcategory_id]
 
             for _index, _value in enumerate(_breaks):
                 _diff = _value - resistance
@@ -409,6 +510,56 @@ def get_resistance_factor(
         ) from exc
 
 
+def get_resistance_factor_array(
+    subcategory_id: int,
+    specification_id: np.ndarray,
+    family_id: np.ndarray,
+    resistance: np.ndarray,
+) -> np.ndarray:
+    """Retrieve the resistance factor (piR) for many resistors.
+
+    This is the array counterpart of get_resistance_factor().
+
+    :param subcategory_id: the subcategory ID shared by all the resistors.
+    :param specification_id: the resistors' governing specification IDs.
+    :param family_id: the resistors' family IDs.
+    :param resistance: the resistors' resistances in ohms.
+    :return: the selected resistance factors (piR).
+    :rtype: :class:`numpy.ndarray`
+    :raises: IndexError when passed an invalid family ID or specification ID.
+    :raises: KeyError when passed an invalid subcategory ID.
+    """
+    if subcategory_id in [4, 8]:
+        return np.zeros(len(resistance))
+
+    # The resistance factor is selected by the first breakpoint at or above the
+    # resistance; resistances above the last breakpoint use the last breakpoint.
+    if subcategory_id == 6:
+        _index = np.zeros(len(resistance), dtype=np.int64)
+        for _specification_id in np.unique(specification_id).tolist():
+            _rows = specification_id == _specification_id
+            _breaks = PI_R_BREAKPOINTS[subcategory_id][_specification_id - 1]
+            _index[_rows] = np.minimum(
+                np.searchsorted(_breaks, resistance[_rows]), len(_breaks) - 1
+            )
+    else:
+        _breaks = PI_R_BREAKPOINTS[subcategory_id]
+        _index = np.minimum(np.searchsorted(_breaks, resistance), len(_breaks) - 1)
+
+    if subcategory_id in {6, 7}:
+        # noinspection PyUnresolvedReferences
+        return get_factor_array(
+            lambda _specification_id, _family_id, _idx: PI_R[subcategory_id][
+                _specification_id - 1
+            ][_family_id - 1][_idx + 1],
+            specification_id,
+            family_id,
+            _index,
+        )
+
+    return np.asarray(PI_R[subcategory_id])[_index + 1]
+
+
 def get_voltage_factor(
     subcategory_id: int,
     voltage_ratio: float,
@@ -423,11 +574,7 @@ def get_voltage_factor(
     :raises: KeyError when passed an invalid subcategory ID.
     """
     _index = -1
-    _breaks = [0.0]
-    if subcategory_id in {9, 10, 11, 12}:
-        _breaks = [0.1, 0.2, 0.6, 0.7, 0.8, 0.9]
-    elif subcategory_id in {13, 14, 15}:
-        _breaks = [0.8, 0.9]
+    _breaks = PI_V_BREAKPOINTS.get(subcategory_id, [0.0])
 
     for _index, _value in enumerate(_breaks):
         _diff = _value - voltage_ratio
@@ -446,6 +593,27 @@ def get_voltage_factor(
         ) from exc
 
 
+def get_voltage_factor_array(
+    subcategory_id: int,
+    voltage_ratio: np.ndarray,
+) -> np.ndarray:
+    """Retrieve the voltage factor (piV) for many resistors.
+
+    This is the array counterpart of get_voltage_factor().
+
+    :param subcategory_id: the subcategory ID shared by all the resistors.
+    :param voltage_ratio: the resistors' ratios of voltages on each half of the
+        potentiometer.
+    :return: the selected voltage factors (piV).
+    :rtype: :class:`numpy.ndarray`
+    :raises: KeyError when passed an invalid subcategory ID.
+    """
+    _breaks = PI_V_BREAKPOINTS.get(subcategory_id, [0.0])
+    _index = np.minimum(np.searchsorted(_breaks, voltage_ratio), len(_breaks) - 1)
+
+    return np.asarray(PI_V[subcategory_id])[_index]
+
+
 def set_default_values(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]:
@@ -473,6 +641,44 @@ def set_default_values(
     return attributes
 
 
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Set the default value for various resistor parameters of many resistors.
+
+    This is the array counterpart of set_default_values().  Every resistor in the
+    batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the resistors being calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    columns["power_ratio"] = np.where(
+        columns["power_ratio"] <= 0.0, 0.5, columns["power_ratio"]
+    )
+    columns["resistance"] = np.where(
+        columns["resistance"] > 0.0,
+        columns["resistance"],
+        _set_default_resistance(0.0, _subcategory_id),
+    )
+    columns["n_elements"] = np.where(
+        columns["n_elements"] > 0,
+        columns["n_elements"],
+        _set_default_elements(0, _subcategory_id),
+    )
+
+    if _subcategory_id == 4:
+        columns["temperature_case"] = np.where(
+            columns["temperature_case"] <= 0.0,
+            columns["temperature_active"] + 28.0,
+            columns["temperature_case"],
+        )
+
+    return columns
+
+
 def _get_factors_and_temp(
     subcategory_id: int,
 ) -> Tuple[List[float], float]:
@@ -1,6 +1,9 @@
 # Standard Library Imports
 from typing import Dict, List, Tuple, Union
 
+# Third Party Imports
+import numpy as np
+
 PART_COUNT_LAMBDA_B: Dict[int, List[float]]
 PART_COUNT_PI_Q: List[float]
 PART_STRESS_PI_Q: Dict[int, List[float]]
@@ -14,9 +17,15 @@ REF_TEMPS_FILM: Dict[int, float]
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_part_stress_lambda_b(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float: ...
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray: ...
 def calculate_temperature_factor(
     temperature_active: float,
     power_ratio: float,
@@ -39,13 +48,26 @@ def get_resistance_factor(
     family_id: int,
     resistance: float,
 ) -> float: ...
+def get_resistance_factor_array(
+    subcategory_id: int,
+    specification_id: np.ndarray,
+    family_id: np.ndarray,
+    resistance: np.ndarray,
+) -> np.ndarray: ...
 def get_voltage_factor(
     subcategory_id: int,
     voltage_ratio: float,
 ) -> float: ...
+def get_voltage_factor_array(
+    subcategory_id: int,
+    voltage_ratio: np.ndarray,
+) -> np.ndarray: ...
 def set_default_values(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def _get_factors_and_temp(
     subcategory_id: int,
 ) -> Tuple[List[float], float]: ...
@@ -13,6 +13,9 @@
 from math import exp, log, sqrt
 from typing import Dict, List, Union
 
+# Third Party Imports
+import numpy as np
+
 # RAMSTK Package Imports
 from ramstk.constants.semiconductor import (
     CASE_TEMPERATURE,
@@ -31,6 +34,9 @@ from ramstk.constants.semiconductor import (
     THETA_JC,
 )
 
+# RAMSTK Local Imports
+from .lookup import get_factor_array
+
 
 # pylint: disable=too-many-locals
 def calculate_part_stress(
@@ -139,6 +145,87 @@ def calculate_part_stress(
         ) from exc
 
 
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the part stress active hazard rate for many semiconductors.
+
+    This is the array counterpart of calculate_part_stress().  Every semiconductor in
+    the batch must have the same subcategory ID.  The hazard rate is NaN for a
+    semiconductor calculate_part_stress() would raise an error for.
+
+    :param columns: the hardware attribute arrays for the semiconductors being
+        calculated.
+    :return: the hardware attribute arrays with updated values.
+    :rtype: dict
+    :raises: KeyError when the attribute arrays are missing one or more keys.
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    columns["temperature_junction"] = calculate_junction_temperature_array(
+        columns["environment_active_id"],
+        columns["package_id"],
+        columns["temperature_case"],
+        columns["theta_jc"],
+        columns["power_operating"],
+    )
+    columns["piT"] = calculate_temperature_factor_array(
+        _subcategory_id,
+        columns["type_id"],
+        columns["voltage_ratio"],
+        columns["temperature_junction"],
+    )
+    columns = calculate_power_rating_factor_array(columns)
+    columns["piC"] = get_factor_array(
+        lambda _construction_id: PI_C[_construction_id - 1],
+        columns["construction_id"],
+    )
+    columns["piM"] = get_factor_array(
+        lambda _matching_id: PI_M[_matching_id - 1],
+        columns["matching_id"],
+    )
+    columns["piI"] = columns["current_operating"] ** 0.68
+    columns["piP"] = 1.0 / (2.0 * (1.0 - columns["power_ratio"]))
+
+    # An invalid construction ID or matching ID or a power ratio of one is an error
+    # whether the subcategory uses the factor or not.
+    _hazard_rate = np.where(
+        np.isnan(columns["piC"]) | np.isnan(columns["piM"]) | np.isinf(columns["piP"]),
+        np.nan,
+        columns["hazard_rate_active"]
+        * columns["piT"]
+        * columns["piQ"]
+        * columns["piE"],
+    )
+
+    if _subcategory_id == 1:
+        columns = calculate_electrical_stress_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piS"] * columns["piC"]
+    elif _subcategory_id == 2:
+        columns = calculate_application_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piA"] * columns["piR"]
+    elif _subcategory_id == 3:
+        columns = calculate_application_factor_array(columns)
+        columns = calculate_electrical_stress_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piA"] * columns["piR"] * columns["piS"]
+    elif _subcategory_id == 4:
+        columns = calculate_application_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piA"]
+    elif _subcategory_id in [6, 10]:
+        columns = calculate_electrical_stress_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piR"] * columns["piS"]
+    elif _subcategory_id in [7, 8]:
+        columns = calculate_application_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piA"] * columns["piM"]
+    elif _subcategory_id == 13:
+        columns = calculate_application_factor_array(columns)
+        _hazard_rate = _hazard_rate * columns["piI"] * columns["piA"] * columns["piP"]
+
+    columns["hazard_rate_active"] = _hazard_rate
+
+    return columns
+
+
 def calculate_application_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]:
@@ -178,6 +265,66 @@ def calculate_application_factor(
         ) from exc
 
 
+def calculate_application_factor_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the application factor (piA) for many semiconductors.
+
+    This is the array counterpart of calculate_application_factor().  The
+    application factor is NaN for an invalid application ID or duty cycle.
+
+    :param columns: the hardware attribute arrays for the semiconductors being
+        calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    :raises: KeyError when passed a subcategory ID without an application factor.
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    if _subcategory_id in [7, 13]:
+        columns["application_id"] = np.where(
+            columns["application_id"] != 0, columns["application_id"], 2
+        )
+        columns["duty_cycle"] = np.where(
+            columns["duty_cycle"] != 0,
+            columns["duty_cycle"],
+            {7: 0.2, 13: 0.6}[_subcategory_id],
+        )
+        columns["piA"] = np.where(
+            columns["application_id"] == 1,
+            {7: 7.6, 13: 4.4}[_subcategory_id],
+            (
+                0.06 * (columns["duty_cycle"] / 100.0) + 0.4
+                if _subcategory_id == 7
+                else np.sqrt(columns["duty_cycle"] / 100.0)
+            ),
+        )
+    else:
+        # The remaining application factors only depend on the application ID and
+        # type ID, so look them up with the single part functions.
+        _function = {
+            2: _get_section_6_2_application_factor,
+            3: _get_section_6_3_application_factor,
+            4: _get_section_6_4_application_factor,
+            8: _get_section_6_8_application_factor,
+        }[_subcategory_id]
+
+        def _get_factors(application_id: int, type_id: int) -> List[float]:
+            """Return the default application ID and piA for one combination."""
+            _attributes = _function(
+                {"application_id": application_id, "type_id": type_id}
+            )
+            return [_attributes["application_id"], _attributes["piA"]]
+
+        columns["application_id"], columns["piA"] = get_factor_array(
+            _get_factors,
+            columns["application_id"],
+            columns["type_id"],
+        ).T
+
+    return columns
+
+
 def calculate_electrical_stress_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]:
@@ -209,6 +356,63 @@ def calculate_electrical_stress_factor(
         ) from exc
 
 
+def calculate_electrical_stress_factor_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the electrical stress factor (piS) for many semiconductors.
+
+    This is the array counterpart of calculate_electrical_stress_factor().  The
+    electrical stress factor is NaN for a type ID without a default voltage ratio.
+
+    :param columns: the hardware attribute arrays for the semiconductors being
+        calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    :raises: KeyError when passed a subcategory ID without an electrical stress
+        factor.
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+    _type_id = columns["type_id"]
+    _voltage_ratio = columns["voltage_ratio"]
+
+    if _subcategory_id == 1:
+        _voltage_ratio = np.where(
+            (_type_id < 5) & (_voltage_ratio == 0), 0.7, _voltage_ratio
+        )
+        columns["piS"] = np.where(
+            _type_id < 5,
+            np.where(_voltage_ratio <= 0.3, 0.054, _voltage_ratio**2.43),
+            1.0,
+        )
+    elif _subcategory_id == 3:
+        _voltage_ratio = np.where(
+            _voltage_ratio != 0,
+            _voltage_ratio,
+            get_factor_array(
+                lambda _type_id: {0: 0.0, 1: 0.5, 2: 0.8}[_type_id], _type_id
+            ),
+        )
+        columns["piS"] = 0.045 * np.exp(3.1 * _voltage_ratio)
+    elif _subcategory_id == 6:
+        _voltage_ratio = np.where(_voltage_ratio != 0, _voltage_ratio, 0.7)
+        columns["piS"] = 0.045 * np.exp(3.1 * _voltage_ratio)
+    elif _subcategory_id == 10:
+        columns["current_rated"] = np.where(
+            columns["current_rated"] != 0, columns["current_rated"], 1.0
+        )
+        _voltage_ratio = np.where(_voltage_ratio != 0, _voltage_ratio, 0.7)
+        columns["piS"] = np.where(_voltage_ratio <= 0.3, 0.1, _voltage_ratio**1.9)
+    else:
+        raise KeyError(
+            f"calculate_electrical_stress_factor_array: Invalid semiconductor "
+            f"subcategory ID {_subcategory_id}."
+        )
+
+    columns["voltage_ratio"] = _voltage_ratio
+
+    return columns
+
+
 def calculate_junction_temperature(
     environment_active_id: int,
     package_id: int,
@@ -251,6 +455,43 @@ def calculate_junction_temperature(
         ) from exc
 
 
+def calculate_junction_temperature_array(
+    environment_active_id: np.ndarray,
+    package_id: np.ndarray,
+    temperature_case: np.ndarray,
+    theta_jc: np.ndarray,
+    power_operating: np.ndarray,
+) -> np.ndarray:
+    """Calculate the junction temperature of many semiconductors.
+
+    This is the array counterpart of calculate_junction_temperature().  The junction
+    temperature is NaN where an invalid environment ID or package ID is needed.
+
+    :param environment_active_id: the semiconductors' environment IDs.
+    :param package_id: the semiconductors' package IDs.
+    :param temperature_case: the semiconductors' case temperatures.
+    :param theta_jc: the semiconductors' junction-case thermal resistances.
+    :param power_operating: the semiconductors' operating powers.
+    :return: the calculated junction temperatures.
+    :rtype: :class:`numpy.ndarray`
+    """
+    temperature_case = np.where(
+        temperature_case <= 0.0,
+        get_factor_array(
+            lambda _environment_active_id: CASE_TEMPERATURE[_environment_active_id - 1],
+            environment_active_id,
+        ),
+        temperature_case,
+    )
+    theta_jc = np.where(
+        theta_jc <= 0.0,
+        get_factor_array(lambda _package_id: THETA_JC[_package_id - 1], package_id),
+        theta_jc,
+    )
+
+    return temperature_case + theta_jc * power_operating
+
+
 def calculate_part_stress_lambda_b(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float:
@@ -337,6 +578,58 @@ def calculate_part_stress_lambda_b(
         ) from exc
 
 
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Calculate the part stress base hazard rate (lambdaB) for many semiconductors.
+
+    This is the array counterpart of calculate_part_stress_lambda_b().  Every
+    semiconductor in the batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the semiconductors being
+        calculated.
+    :return: the calculated part stress base hazard rates (lambdaB).
+    :rtype: :class:`numpy.ndarray`
+    """
+    _frequency_operating = columns["frequency_operating"]
+    _power_operating = columns["power_operating"]
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    if _subcategory_id == 7:
+        return 0.032 * np.exp(0.354 * _frequency_operating + 0.00558 * _power_operating)
+
+    if _subcategory_id == 8:
+        return np.where(
+            (1.0 < _frequency_operating)
+            & (_frequency_operating <= 10.0)
+            & (_power_operating < 0.1),
+            0.052,
+            0.0093 * np.exp(0.429 * _frequency_operating + 0.486 * _power_operating),
+        )
+
+    if _subcategory_id == 12:
+        return np.where(
+            np.isin(columns["application_id"], [1, 3]),
+            0.00043 * columns["n_elements"] + 0.000043,
+            0.00043 * columns["n_elements"],
+        )
+
+    # The other base hazard rates only depend on the type ID.
+    return get_factor_array(
+        lambda _type_id: calculate_part_stress_lambda_b(
+            {
+                "application_id": 0,
+                "frequency_operating": 0.0,
+                "n_elements": 0,
+                "power_operating": 0.0,
+                "subcategory_id": _subcategory_id,
+                "type_id": _type_id,
+            }
+        ),
+        columns["type_id"],
+    )
+
+
 def calculate_power_rating_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]:
@@ -377,6 +670,53 @@ def calculate_power_rating_factor(
         ) from exc
 
 
+def calculate_power_rating_factor_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Calculate the power rating factor (piR) for many semiconductors.
+
+    This is the array counterpart of calculate_power_rating_factor().  The power
+    rating factor is NaN for a type ID without a default rated power.
+
+    :param columns: the hardware attribute arrays for the semiconductors being
+        calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    """
+    _power_rated = columns["power_rated"]
+    _subcategory_id = int(columns["subcategory_id"][0])
+    _type_id = columns["type_id"]
+
+    if _subcategory_id == 2:
+        columns["power_rated"] = np.where(
+            (_type_id == 4) & (_power_rated == 0), 1000.0, _power_rated
+        )
+        columns["piR"] = np.where(
+            _type_id == 4, 0.326 * np.log(columns["power_rated"]) - 0.25, 1.0
+        )
+    elif _subcategory_id in [3, 6]:
+        columns["power_rated"] = np.where(
+            _power_rated != 0,
+            _power_rated,
+            (
+                get_factor_array(
+                    lambda _type_id: {0: 0.0, 1: 0.5, 2: 100.0}[_type_id], _type_id
+                )
+                if _subcategory_id == 3
+                else 0.5
+            ),
+        )
+        columns["piR"] = np.where(
+            columns["power_rated"] < 0.1, 0.43, columns["power_rated"] ** 0.37
+        )
+    elif _subcategory_id == 10:
+        columns["piR"] = columns["current_rated"] ** 0.4
+    else:
+        columns["piR"] = np.zeros(len(_power_rated))
+
+    return columns
+
+
 def calculate_temperature_factor(
     subcategory_id: int,
     type_id: int,
@@ -427,6 +767,43 @@ def calculate_temperature_factor(
         ) from exc
 
 
+def calculate_temperature_factor_array(
+    subcategory_id: int,
+    type_id: np.ndarray,
+    voltage_ratio: np.ndarray,
+    temperature_junction: np.ndarray,
+) -> np.ndarray:
+    """Calculate the temperature factor (piT) for many semiconductors.
+
+    This is the array counterpart of calculate_temperature_factor().
+
+    :param subcategory_id: the subcategory ID shared by all the semiconductors.
+    :param type_id: the semiconductors' type IDs.
+    :param voltage_ratio: the semiconductors' ratios of operating to rated voltage.
+    :param temperature_junction: the semiconductors' junction temperatures.
+    :return: the calculated temperature factors (piT).
+    :rtype: :class:`numpy.ndarray`
+    :raises: KeyError when passed an invalid subcategory ID.
+    """
+    if subcategory_id in {1, 2}:
+        _factors = get_factor_array(
+            lambda _type_id: PI_T_LIST[subcategory_id][_type_id - 1], type_id
+        )
+    elif subcategory_id == 7:
+        _factors = get_factor_array(lambda _type_id: PI_T_DICT[_type_id], type_id).T
+    else:
+        _factors = PI_T_SCALAR[subcategory_id]
+
+    if subcategory_id != 7:
+        return np.exp(-_factors * (1.0 / (temperature_junction + 273.0) - 1.0 / 298.0))
+
+    _f0, _f1, _f2 = _factors
+    _exp = np.exp(-_f0 * (1.0 / (temperature_junction + 273.0) - 1.0 / 298.0))
+    return np.where(
+        voltage_ratio <= 0.4, _f1 * _exp, _f2 * (voltage_ratio - 0.35) * _exp
+    )
+
+
 def get_environment_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float:
@@ -642,6 +1019,48 @@ def set_default_values(
     return attributes
 
 
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Set the default value for various semiconductor parameters of many parts.
+
+    This is the array counterpart of set_default_values().  Every semiconductor in
+    the batch must have the same subcategory ID.
+
+    :param columns: the hardware attribute arrays for the semiconductors being
+        calculated.
+    :return: the updated hardware attribute arrays.
+    :rtype: dict
+    """
+    _subcategory_id = int(columns["subcategory_id"][0])
+
+    if _subcategory_id in {4, 9}:
+        columns["type_id"] = np.where(columns["type_id"] <= 0, 1, columns["type_id"])
+
+    if _subcategory_id == 1:
+        columns["construction_id"] = np.where(
+            columns["construction_id"] <= 0, 1, columns["construction_id"]
+        )
+
+    for _key, _function in [
+        ("application_id", _set_default_application_id),
+        ("power_rated", _set_default_rated_power),
+        ("voltage_ratio", _set_default_voltage_ratio),
+    ]:
+        columns[_key] = np.where(
+            columns[_key] > 0,
+            columns[_key],
+            get_factor_array(
+                lambda _type_id, _function=_function: _function(
+                    0, _subcategory_id, _type_id
+                ),
+                columns["type_id"],
+            ).astype(columns[_key].dtype),
+        )
+
+    return columns
+
+
 def _get_section_6_1_electrical_stress_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]:
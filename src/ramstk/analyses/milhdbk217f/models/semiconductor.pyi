@@ -1,6 +1,9 @@
 # Standard Library Imports
 from typing import Dict, List, Union
 
+# Third Party Imports
+import numpy as np
+
 PART_COUNT_LAMBDA_B_DICT: Dict[int, Dict[int, List[float]]]
 PART_COUNT_LAMBDA_B_LIST: Dict[int, List[float]]
 PART_COUNT_PI_Q: Dict[int, List[float]]
@@ -19,12 +22,21 @@ PI_M: List[float]
 def calculate_part_stress(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_part_stress_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_application_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_application_factor_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_electrical_stress_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_electrical_stress_factor_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_junction_temperature(
     environment_active_id: int,
     package_id: int,
@@ -32,18 +44,37 @@ def calculate_junction_temperature(
     theta_jc: float,
     power_operating: float,
 ) -> float: ...
+def calculate_junction_temperature_array(
+    environment_active_id: np.ndarray,
+    package_id: np.ndarray,
+    temperature_case: np.ndarray,
+    theta_jc: np.ndarray,
+    power_operating: np.ndarray,
+) -> np.ndarray: ...
 def calculate_part_stress_lambda_b(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float: ...
+def calculate_part_stress_lambda_b_array(
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray: ...
 def calculate_power_rating_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def calculate_power_rating_factor_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def calculate_temperature_factor(
     subcategory_id: int,
     type_id: int,
     voltage_ratio: float,
     temperature_junction: float,
 ) -> float: ...
+def calculate_temperature_factor_array(
+    subcategory_id: int,
+    type_id: np.ndarray,
+    voltage_ratio: np.ndarray,
+    temperature_junction: np.ndarray,
+) -> np.ndarray: ...
 def get_environment_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> float: ...
@@ -59,6 +90,9 @@ def get_part_stress_quality_factor(
 def set_default_values(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
+def set_default_values_array(
+    columns: Dict[str, np.ndarray],
+) -> Dict[str, np.ndarray]: ...
 def _get_section_6_1_electrical_stress_factor(
     attributes: Dict[str, Union[float, int, str]],
 ) -> Dict[str, Union[float, int, str]]: ...
@@ -10,7 +10,10 @@
 from typing import Any, Dict, List, Tuple, Type
 
 # Third Party Imports
-from sympy import symbols, sympify
+import numpy as np
+
+# RAMSTK Package Imports
+from ramstk.analyses import equation
 
 ENVIRONMENT_FROM_TO: Dict[Tuple[int, int], float] = {
     (0, 0): 1.0,
@@ -122,6 +125,36 @@ TEMPERATURE_FROM_TO: Dict[Tuple[float, float], float] = {
     (70.0, 70.0): 1.0,
 }
 
+# The variables that may be used in the user-defined equations.
+USER_DEFINED_VARIABLES: List[str] = [
+    "hr",
+    "pi1",
+    "pi2",
+    "pi3",
+    "pi4",
+    "pi5",
+    "pi6",
+    "pi7",
+    "pi8",
+    "pi9",
+    "pi10",
+    "uf1",
+    "uf2",
+    "uf3",
+    "uf4",
+    "uf5",
+    "ui1",
+    "ui2",
+    "ui3",
+    "ui4",
+    "ui5",
+    "res1",
+    "res2",
+    "res3",
+    "res4",
+    "res5",
+]
+
 
 # noinspection PyTypeChecker
 def calculate_topic_633(
@@ -169,8 +202,7 @@ def calculate_topic_633(
     return _change_factor_1, _change_factor_2, _change_factor_3, _result_1
 
 
-# pylint: disable=too-many-locals
-def calculate_user_defined(sia: Dict[str, int | float | str]):
+def calculate_user_defined(sia: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate the user-defined similar item analysis.
 
     :param sia: the user-defined similar item assessment dict.  The
@@ -189,60 +221,51 @@ def calculate_user_defined(sia: Dict[str, int | float | str]):
 
     :return: sia; the similar item assessment dict with updated results.
     :rtype: dict
+    :raise: ValueError if one of the equations isn't valid.
     """
-    _symbol_list = [
-        "hr",
-        "pi1",
-        "pi2",
-        "pi3",
-        "pi4",
-        "pi5",
-        "pi6",
-        "pi7",
-        "pi8",
-        "pi9",
-        "pi10",
-        "uf1",
-        "uf2",
-        "uf3",
-        "uf4",
-        "uf5",
-        "ui1",
-        "ui2",
-        "ui3",
-        "ui4",
-        "ui5",
-        "res1",
-        "res2",
-        "res3",
-        "res4",
-        "res5",
-    ]
-    _symbols_dict = symbols(" ".join(_symbol_list))
-
-    for _idx in range(1, 6):
-        _equation_key = f"equation{_idx}"
-        _equation = str(sia.get(_equation_key, "0.0"))
-
-        # Validate the equation.
-        sia[_equation_key] = _do_validate_equation(_equation)
-
-        # Loop through each result field (res1, res2, ..., res5)
-        _result_key = f"res{_idx}"
-
-        if (
-            _equation_key in sia and sia[_equation_key]
-        ):  # Check if equation exists and is not empty
-            sia[_result_key] = sympify(sia[_equation_key]).evalf(
-                subs={
-                    _symbols_dict[j]: sia[_symbol_list[j]]
-                    for j in range(len(_symbol_list))
-                }
+    return calculate_user_defined_many([sia])[0]
+
+
+def calculate_user_defined_many(sias: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Calculate the user-defined similar item analysis for several items.
+
+    The items using the same five equations are calculated together; each
+    equation is evaluated once with arrays holding the values for all the items.
+    The equations are evaluated in order, so an equation may use the results of
+    the equations before it.
+
+    :param sias: the list of user-defined similar item assessment dicts.  See
+        calculate_user_defined() for the contents of each dict.
+    :return: sias; the list of similar item assessment dicts with updated results.
+    :rtype: list
+    :raise: ValueError if one of the equations isn't valid.
+    """
+    _groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for _sia in sias:
+        _equations = tuple(
+            _do_validate_equation(str(_sia.get(f"equation{_idx}", "0.0")))
+            for _idx in range(1, 6)
+        )
+        for _idx, _equation in enumerate(_equations, start=1):
+            _sia[f"equation{_idx}"] = _equation
+        _groups.setdefault(_equations, []).append(_sia)
+
+    for _equations, _group in _groups.items():
+        _values = {
+            _key: np.array([float(_sia.get(_key) or 0.0) for _sia in _group])
+            for _key in USER_DEFINED_VARIABLES
+        }
+        for _idx, _equation in enumerate(_equations, start=1):
+            _values[f"res{_idx}"] = np.broadcast_to(
+                np.asarray(equation.evaluate(_equation, _values), dtype=float),
+                len(_group),
             )
-        else:
-            sia[_result_key] = 0.0  # Default to 0.0 if equation is empty
 
-    return sia
+        for _row, _sia in enumerate(_group):
+            for _idx in range(1, 6):
+                _sia[f"res{_idx}"] = float(_values[f"res{_idx}"][_row])
+
+    return sias
 
 
 def set_user_defined_change_factors(
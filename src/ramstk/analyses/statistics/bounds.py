@@ -12,8 +12,6 @@ from typing import Callable, List, Tuple
 
 # Third Party Imports
 import numpy as np
-from numdifftools import Derivative
-from scipy import stats
 
 
 def do_calculate_beta_bounds(
@@ -36,6 +34,10 @@ def do_calculate_beta_bounds(
             f"Confidence level (alpha) must be between 0 and 100.  alpha: {alpha}"
         )
 
+    # Third Party Imports
+    # scipy.stats is slow to import, so it's deferred until it's needed.
+    from scipy import stats  # pylint: disable=import-outside-toplevel
+
     _z_norm = (
         stats.norm.ppf(1.0 - ((1.0 - alpha / 100.0) / 2.0))
         if alpha > 1.0
@@ -105,5 +107,8 @@ def do_calculate_fisher_information(
 
 def _partial_derivative(record, model, param_dict, param_name):
     """Calculate the partial derivative."""
+    # Third Party Imports
+    from numdifftools import Derivative  # pylint: disable=import-outside-toplevel
+
     _dfdx = Derivative(lambda p: model(record, **{**param_dict, param_name: p}))
     return _dfdx(1.0)
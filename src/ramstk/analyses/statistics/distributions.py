@@ -5,61 +5,70 @@
 #
 # All rights reserved.
 # Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
-"""Exponential Module."""
+"""Distribution Module.
+
+The hazard rate, MTBF, and survival function of each distribution are calculated
+with closed-form numpy expressions rather than scipy.stats.  The results match
+those from the scipy.stats distributions, including nan for invalid parameters,
+but without the overhead of scipy's argument checking.  Every function accepts
+numbers or numpy arrays; numbers return a float and arrays return an array.
+"""
 
 # Standard Library Imports
-from typing import Optional
+import math
+from typing import Callable, Dict, Optional, Tuple
 
 # Third Party Imports
-from scipy.stats import expon, lognorm, norm, weibull_min
+import numpy as np
+from numpy.typing import ArrayLike
+
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+_lgamma = np.frompyfunc(math.lgamma, 1, 1)
 
 
 def calculate_hazard_rate(
-    time: float,
-    location: float = 0.0,
-    scale: Optional[float] = None,
-    shape: Optional[float] = None,
+    time: ArrayLike,
+    location: ArrayLike = 0.0,
+    scale: Optional[ArrayLike] = None,
+    shape: Optional[ArrayLike] = None,
     dist_type: str = "exponential",
-) -> float:
-    """Calculate the hazard rate for a given distribution."""
-    if time <= 0.0:
-        return 0.0
-
-    # Exponential distribution doesn't use the `shape` parameter.
-    if dist_type == "exponential":
-        return 1.0 / expon.mean(loc=location, scale=scale)
-
-    # Lognormal distribution uses `shape`, `location`, and `scale`.
-    elif dist_type == "lognormal":
-        return lognorm.pdf(time, shape, loc=location, scale=scale) / lognorm.cdf(
-            time, shape, loc=location, scale=scale
-        )
+) -> ArrayLike:
+    """Calculate the hazard rate for a given distribution.
 
-    # Normal distribution uses 'scale' and 'location'.
-    elif dist_type == "normal":
-        return norm.pdf(time, loc=location, scale=scale) / norm.sf(
-            time, loc=location, scale=scale
-        )
+    :param time: the time at which to calculate the hazard rate.
+    :param location: the location parameter.
+    :param scale: the scale parameter.
+    :param shape: the shape parameter.
+    :param dist_type: the type of distribution.
+    :return: the hazard rate at time; zero where time isn't positive.
+    :rtype: float or array
+    :raise: ValueError if passed an unsupported distribution type.
+    """
+    try:
+        _kernel = _HAZARD_RATE[dist_type]
+    except KeyError as _error:
+        raise ValueError(f"Unsupported distribution: {dist_type}") from _error
 
-    # Weibull distribution uses `shape`, `location`, and `scale`.
-    elif dist_type == "weibull":
-        return (
-            0.0
-            if time <= 0.0
-            else weibull_min.pdf(time, shape, loc=location, scale=scale)
-            / weibull_min.cdf(time, shape, loc=location, scale=scale)
+    with np.errstate(all="ignore"):
+        _time = np.asarray(time, dtype=float)
+        return _get_value(
+            np.where(
+                _time <= 0.0,
+                0.0,
+                _kernel(_time, *_get_parameters(location, scale, shape)),
+            )
         )
 
-    else:
-        raise ValueError(f"Unsupported distribution: {dist_type}")
-
 
 def calculate_mtbf(
-    shape: float = None,
-    location: float = 0.0,
-    scale: float = 1.0,
+    shape: Optional[ArrayLike] = None,
+    location: ArrayLike = 0.0,
+    scale: ArrayLike = 1.0,
     dist_type: str = "exponential",
-) -> float:
+) -> ArrayLike:
     """Calculate the MTBF for a given distribution.
 
     :param shape: the shape parameter.
@@ -67,27 +76,25 @@ def calculate_mtbf(
     :param scale: the scale (MTBF) parameter.
     :param dist_type: the type of distribution.
     :return: the MTBF value.
-    :rtype: float
+    :rtype: float or array
+    :raise: ValueError if passed an unsupported distribution type.
     """
-    if dist_type == "exponential":
-        return expon.mean(loc=location, scale=scale)
-    elif dist_type == "lognormal":
-        return lognorm.mean(shape, loc=location, scale=scale)
-    elif dist_type == "normal":
-        return norm.mean(loc=location, scale=scale)
-    elif dist_type == "weibull":
-        return weibull_min.mean(shape, loc=location, scale=scale)
-    else:
-        raise ValueError(f"Unsupported distribution type: {dist_type}")
+    try:
+        _kernel = _MTBF[dist_type]
+    except KeyError as _error:
+        raise ValueError(f"Unsupported distribution type: {dist_type}") from _error
+
+    with np.errstate(all="ignore"):
+        return _get_value(_kernel(*_get_parameters(location, scale, shape)))
 
 
 def calculate_survival(
-    shape: float = None,
-    time: float = 0.0,
-    location: float = 0.0,
-    scale: float = 1.0,
+    shape: Optional[ArrayLike] = None,
+    time: ArrayLike = 0.0,
+    location: ArrayLike = 0.0,
+    scale: ArrayLike = 1.0,
     dist_type: str = "exponential",
-) -> float:
+) -> ArrayLike:
     """Calculate the survival function at time T for a given distribution.
 
     :param shape: the shape parameter.
@@ -96,15 +103,217 @@ def calculate_survival(
     :param scale: the scale parameter.
     :param dist_type: the type of distribution.
     :return: the survival function value at time T.
-    :rtype: float
+    :rtype: float or array
+    :raise: ValueError if passed an unsupported distribution type.
     """
-    if dist_type == "exponential":
-        return expon.sf(time, loc=location, scale=scale)
-    elif dist_type == "lognormal":
-        return lognorm.sf(time, shape, loc=location, scale=scale)
-    elif dist_type == "normal":
-        return norm.sf(time, location, scale)
-    elif dist_type == "weibull":
-        return weibull_min.sf(time, shape, loc=location, scale=scale)
-    else:
-        raise ValueError(f"Unsupported distribution type: {dist_type}")
+    try:
+        _kernel = _SURVIVAL[dist_type]
+    except KeyError as _error:
+        raise ValueError(f"Unsupported distribution type: {dist_type}") from _error
+
+    with np.errstate(all="ignore"):
+        return _get_value(
+            _kernel(
+                np.asarray(time, dtype=float),
+                *_get_parameters(location, scale, shape),
+            )
+        )
+
+
+def _get_parameters(
+    location: ArrayLike, scale: ArrayLike, shape: ArrayLike
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert the distribution parameters to float arrays.
+
+    :param location: the location parameter.
+    :param scale: the scale parameter.
+    :param shape: the shape parameter; None if the distribution has no shape.
+    :return: (location, scale, shape); the parameters as float arrays.
+    :rtype: tuple
+    """
+    return (
+        np.asarray(location, dtype=float),
+        np.asarray(scale, dtype=float),
+        np.asarray(np.nan if shape is None else shape, dtype=float),
+    )
+
+
+def _get_normal_sf(z: np.ndarray) -> np.ndarray:
+    """Calculate the standard normal survival function.
+
+    :param z: the standardized values.
+    :return: the probability a standard normal variate exceeds each value.
+    :rtype: array
+    """
+    return 0.5 * np.asarray(_erfc(z / _SQRT_2), dtype=float)
+
+
+def _get_value(value: np.ndarray) -> ArrayLike:
+    """Return a float for a zero-dimension array and the array otherwise."""
+    return float(value) if np.ndim(value) == 0 else value
+
+
+# The kernels of each function share a signature, so some ignore the shape.
+# pylint: disable=unused-argument
+def _exponential_hazard_rate(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the exponential hazard rate; the inverse of the mean."""
+    return 1.0 / _exponential_mtbf(location, scale, shape)
+
+
+def _exponential_mtbf(
+    location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the exponential mean."""
+    return np.where(scale > 0.0, location + scale, np.nan)
+
+
+def _exponential_survival(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the exponential survival function."""
+    _x = (time - location) / scale
+
+    return np.where(scale > 0.0, np.where(_x < 0.0, 1.0, np.exp(-_x)), np.nan)
+
+
+def _lognormal_hazard_rate(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the lognormal hazard rate; the pdf divided by the cdf."""
+    _valid = (scale > 0.0) & (shape > 0.0)
+    _scale = np.where(_valid, scale, 1.0)
+    _shape = np.where(_valid, shape, 1.0)
+    _x = (time - location) / _scale
+    _x_pos = np.where(_x > 0.0, _x, 1.0)
+    _z = np.log(_x_pos) / _shape
+
+    _pdf = np.where(
+        _x > 0.0,
+        np.exp(-0.5 * _z**2) / (_shape * _x_pos * _SQRT_2PI * _scale),
+        0.0,
+    )
+    _cdf = np.where(_x > 0.0, _get_normal_sf(-_z), 0.0)
+
+    return np.where(_valid, _pdf / _cdf, np.nan)
+
+
+def _lognormal_mtbf(
+    location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the lognormal mean."""
+    return np.where(
+        (scale > 0.0) & (shape > 0.0),
+        location + scale * np.exp(0.5 * shape**2),
+        np.nan,
+    )
+
+
+def _lognormal_survival(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the lognormal survival function."""
+    _valid = (scale > 0.0) & (shape > 0.0)
+    _x = (time - location) / np.where(_valid, scale, 1.0)
+    _z = np.log(np.where(_x > 0.0, _x, 1.0)) / np.where(_valid, shape, 1.0)
+
+    return np.where(_valid, np.where(_x > 0.0, _get_normal_sf(_z), 1.0), np.nan)
+
+
+def _normal_hazard_rate(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the normal hazard rate; the pdf divided by the survival function."""
+    _z = (time - location) / scale
+
+    return np.where(
+        scale > 0.0,
+        np.exp(-0.5 * _z**2) / (_SQRT_2PI * scale) / _get_normal_sf(_z),
+        np.nan,
+    )
+
+
+def _normal_mtbf(
+    location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the normal mean."""
+    return np.where(scale > 0.0, location, np.nan)
+
+
+def _normal_survival(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the normal survival function."""
+    return np.where(scale > 0.0, _get_normal_sf((time - location) / scale), np.nan)
+
+
+def _weibull_hazard_rate(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the Weibull hazard rate; the pdf divided by the cdf."""
+    _valid = (scale > 0.0) & (shape > 0.0)
+    _scale = np.where(_valid, scale, 1.0)
+    _shape = np.where(_valid, shape, 1.0)
+    _x = (time - location) / _scale
+    _x_pos = np.where(_x > 0.0, _x, 0.0)
+    _x_c = _x_pos**_shape
+
+    _pdf = np.where(
+        _x >= 0.0,
+        _shape / _scale * _x_pos ** (_shape - 1.0) * np.exp(-_x_c),
+        0.0,
+    )
+    _cdf = np.where(_x > 0.0, -np.expm1(-_x_c), 0.0)
+
+    return np.where(_valid, _pdf / _cdf, np.nan)
+
+
+def _weibull_mtbf(
+    location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the Weibull mean."""
+    _valid = (scale > 0.0) & (shape > 0.0)
+    _gamma = np.exp(
+        np.asarray(_lgamma(1.0 + 1.0 / np.where(_valid, shape, 1.0)), dtype=float)
+    )
+
+    return np.where(_valid, location + scale * _gamma, np.nan)
+
+
+def _weibull_survival(
+    time: np.ndarray, location: np.ndarray, scale: np.ndarray, shape: np.ndarray
+) -> np.ndarray:
+    """Calculate the Weibull survival function."""
+    _valid = (scale > 0.0) & (shape > 0.0)
+    _x = (time - location) / np.where(_valid, scale, 1.0)
+
+    return np.where(
+        _valid,
+        np.where(
+            _x > 0.0,
+            np.exp(-(np.where(_x > 0.0, _x, 0.0) ** np.where(_valid, shape, 1.0))),
+            1.0,
+        ),
+        np.nan,
+    )
+
+
+_HAZARD_RATE: Dict[str, Callable[..., np.ndarray]] = {
+    "exponential": _exponential_hazard_rate,
+    "lognormal": _lognormal_hazard_rate,
+    "normal": _normal_hazard_rate,
+    "weibull": _weibull_hazard_rate,
+}
+_MTBF: Dict[str, Callable[..., np.ndarray]] = {
+    "exponential": _exponential_mtbf,
+    "lognormal": _lognormal_mtbf,
+    "normal": _normal_mtbf,
+    "weibull": _weibull_mtbf,
+}
+_SURVIVAL: Dict[str, Callable[..., np.ndarray]] = {
+    "exponential": _exponential_survival,
+    "lognormal": _lognormal_survival,
+    "normal": _normal_survival,
+    "weibull": _weibull_survival,
+}
@@ -26,10 +26,10 @@ def get_hazard_rate(
     and, optionally, a location parameter.
 
         >>> get_hazard_rate(0.9663, 4, scale=33.65)
-        0.6610467490673426
+        0.661046749067342
 
         >>> get_hazard_rate(0.9663, 4, location=1.85, scale=33.65)
-        1.5117773383839221
+        1.5117773383839201
 
         >>> get_hazard_rate(0, 4, scale=33.65)
         nan
@@ -92,10 +92,10 @@ def get_survival(
     estimate of the survival function at time.
 
         >>> get_survival(0.9663, 5.0, scale=33.65)
-        0.9757561
+        0.8619238010289526
 
         >>> get_survival(0.9663, 5.0, location=1.85, scale=33.65)
-        0.9928813
+        0.9106372057961907
 
     :param scale: the point estimate of the scale parameter.
     :param time: the time at which to calculate the survival function.
@@ -27,10 +27,10 @@ def get_hazard_rate(location: float, scale: float, time: float) -> float:
         0.013878975045885079
 
         >>> get_hazard_rate(0.0, 10.0, 85.0)
-        0.8614595320165236
+        0.8614595320165142
 
         >>> get_hazard_rate(100.0, 0.0, 85.0)
-        0.0
+        nan
 
     :param location: the value of the location (mu) parameter.
     :param scale: the value of the scale (sigma) parameter.
@@ -81,10 +81,10 @@ def get_survival(
         0.9331927987311419
 
         >>> get_survival(0.0, 10.0, 85.0)
-        9.47953482220325e-18
+        9.479534822203355e-18
 
         >>> get_survival(100.0, 0.0, 85.0)
-        0.9928813
+        nan
 
     :param location: the point estimate of the location parameter.
     :param scale: the point estimate of the scale parameter.
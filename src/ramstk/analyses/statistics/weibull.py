@@ -26,7 +26,7 @@ def get_hazard_rate(
     and, optionally, a location parameter.
 
         >>> get_hazard_rate(2.5, 525.0, 105.0)
-        0.02359719987177253
+        0.023597199871772535
 
         >>> get_hazard_rate(2.5, 525.0, 105.0, location=18.5)
         0.028742792496007755
@@ -35,7 +35,7 @@ def get_hazard_rate(
         nan
 
         >>> get_hazard_rate(2.5, 0.0, 105.0)
-        0.0
+        nan
 
         >>> get_hazard_rate(2.5, 525.0, 0.0)
         0.0
@@ -65,10 +65,10 @@ def get_mtbf(shape: float, scale: float, location: float = 0.0) -> float:
     """Calculate the MTBF given a shape (sigma) and scale (mu) parameter.
 
         >>> get_mtbf(2.5, 525.0)
-        465.8135041891145
+        465.8135041891147
 
         >>> get_mtbf(2.5, 525.0, location=18.5)
-        484.3135041891145
+        484.3135041891147
 
         >>> get_mtbf(0.0, 525.0)
         nan
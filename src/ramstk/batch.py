@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       ramstk.batch.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""The headless batch calculation program for RAMSTK program databases.
+
+Each program database is opened, the records for one revision are loaded, the
+selected analyses are run over every record in the revision, and the results are
+written back to the database in a single commit.  The time taken by each stage is
+printed for each database.  Each database is processed in its own worker process
+because the table models communicate through PyPubSub, which is global to the
+process, so several databases are calculated in parallel by running several
+workers.  Nothing in this module imports the GTK views so it runs on machines
+without a display.
+"""
+
+# Standard Library Imports
+import argparse
+import multiprocessing
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+# Third Party Imports
+from pubsub import pub
+
+# RAMSTK Package Imports
+from ramstk.configuration import RAMSTKUserConfiguration
+from ramstk.models.db import RAMSTKProgramDB
+from ramstk.models.dbtables import (
+    RAMSTKAllocationTable,
+    RAMSTKDesignElectricTable,
+    RAMSTKDesignMechanicTable,
+    RAMSTKHardwareTable,
+    RAMSTKHazardTable,
+    RAMSTKMILHDBK217FTable,
+    RAMSTKNSWCTable,
+    RAMSTKReliabilityTable,
+    RAMSTKSimilarItemTable,
+    RAMSTKValidationTable,
+)
+from ramstk.models.dbviews import RAMSTKHardwareBoMView
+
+# The analyses that can be run, in the order they're run.  The hardware analysis
+# is first because the other analyses use the hardware hazard rates.
+ANALYSES: List[str] = [
+    "hardware",
+    "allocation",
+    "similar_item",
+    "hazards",
+    "validation",
+]
+
+# The tables each analysis needs loaded.
+ANALYSIS_TABLES: Dict[str, Dict[str, Any]] = {
+    "hardware": {
+        "hardware": RAMSTKHardwareTable,
+        "design_electric": RAMSTKDesignElectricTable,
+        "design_mechanic": RAMSTKDesignMechanicTable,
+        "milhdbk217f": RAMSTKMILHDBK217FTable,
+        "nswc": RAMSTKNSWCTable,
+        "reliability": RAMSTKReliabilityTable,
+    },
+    "allocation": {
+        "allocation": RAMSTKAllocationTable,
+    },
+    "similar_item": {
+        "similar_item": RAMSTKSimilarItemTable,
+    },
+    "hazards": {
+        "hazards": RAMSTKHazardTable,
+    },
+    "validation": {
+        "validation": RAMSTKValidationTable,
+    },
+}
+
+
+def do_calculate_allocation(program_db: RAMSTKProgramDB) -> None:
+    """Calculate the reliability goals and allocations for every hardware item.
+
+    The tree is walked from the top down so each item's goal is allocated to its
+    children before the children's goals are allocated to their own children.
+    Each item is allocated using the allocation method selected for it.
+
+    :param program_db: the RAMSTKProgramDB() with the allocation table loaded.
+    :return: None
+    :rtype: None
+    """
+    _table: RAMSTKAllocationTable = program_db.tables["allocation"]  # type: ignore
+    _dic_method: Dict[int, Callable[[int], None]] = {
+        1: _table.do_calculate_equal_allocation,
+        2: lambda node_id: _table.do_calculate_agree_allocation(
+            node_id,
+            _table.tree.get_node(node_id).data["allocation"].duty_cycle,
+        ),
+        3: _table.do_calculate_arinc_allocation,
+        4: _table.do_calculate_foo_allocation,
+    }
+
+    for _node_id in list(_table.tree.expand_tree())[1:]:
+        _method = _dic_method.get(
+            _table.tree.get_node(_node_id).data["allocation"].allocation_method_id
+        )
+
+        try:
+            _table.do_calculate_allocation_goals(_node_id)
+            if _method is not None and _table.tree.children(_node_id):
+                _method(_node_id)
+        except ZeroDivisionError:
+            pub.sendMessage(
+                "do_log_warning_msg",
+                logger_name="WARNING",
+                message=(
+                    f"Failed to calculate the reliability allocation for hardware ID "
+                    f"{_node_id}.  One or more of the goals or hazard rates is zero."
+                ),
+            )
+
+
+def do_calculate_hardware(program_db: RAMSTKProgramDB) -> None:
+    """Calculate the metrics for every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the hardware BoM view loaded.
+    :return: None
+    :rtype: None
+    """
+    _view: RAMSTKHardwareBoMView = program_db.dic_views["hardwarebom"]  # type: ignore
+
+    for _node in _view.tree.children(_view.tree.root):
+        _view.do_calculate_hardware(_node.identifier)
+
+
+def do_calculate_hazards(program_db: RAMSTKProgramDB) -> None:
+    """Calculate the hazard risk indices for every hazard.
+
+    :param program_db: the RAMSTKProgramDB() with the hazards table loaded.
+    :return: None
+    :rtype: None
+    """
+    _table: RAMSTKHazardTable = program_db.tables["hazards"]  # type: ignore
+
+    for _node in _table.tree.all_nodes()[1:]:
+        _table.do_calculate_fha(_node.identifier)
+
+
+def do_calculate_similar_item(program_db: RAMSTKProgramDB) -> None:
+    """Calculate the similar item hazard rates for every hardware item.
+
+    :param program_db: the RAMSTKProgramDB() with the similar item table loaded.
+    :return: None
+    :rtype: None
+    """
+    _table: RAMSTKSimilarItemTable = program_db.tables["similar_item"]  # type: ignore
+
+    _table.do_calculate_similar_items(
+        [_node.identifier for _node in _table.tree.all_nodes()[1:]]
+    )
+
+
+def do_calculate_validation(program_db: RAMSTKProgramDB) -> None:
+    """Calculate every validation task and the validation plan.
+
+    :param program_db: the RAMSTKProgramDB() with the validation table loaded.
+    :return: None
+    :rtype: None
+    """
+    _table: RAMSTKValidationTable = program_db.tables["validation"]  # type: ignore
+
+    if _table.tree.depth() > 0:
+        pub.sendMessage("request_calculate_all_validation_tasks")
+        _table.do_calculate_plan()
+
+
+def do_initialize_program_db(
+    analyses: List[str],
+    hr_multiplier: float = 1.0,
+    stress_limits: Optional[Dict[str, Dict[str, float]]] = None,
+) -> RAMSTKProgramDB:
+    """Create a program database model with the tables the analyses need.
+
+    :param analyses: the names of the analyses to run.
+    :param hr_multiplier: the hazard rate multiplier to use for hardware.
+    :param stress_limits: the electrical stress limits to use for hardware.
+    :return: _program_db; the RAMSTKProgramDB() with the tables created.
+    :rtype: :class:`ramstk.models.db.RAMSTKProgramDB`
+    """
+    _program_db = RAMSTKProgramDB()
+
+    for _analysis in analyses:
+        for _table, _class in ANALYSIS_TABLES[_analysis].items():
+            _program_db.tables[_table] = _class()
+
+    if "hardware" in analyses:
+        _kwargs: Dict[str, Any] = {"hr_multiplier": hr_multiplier}
+        if stress_limits:
+            _kwargs["stress_limits"] = stress_limits
+        _program_db.dic_views["hardwarebom"] = RAMSTKHardwareBoMView(**_kwargs)
+
+    return _program_db
+
+
+def do_run_batch(
+    database: Dict[str, str],
+    analyses: List[str],
+    revision_id: int = 1,
+    hr_multiplier: float = 1.0,
+    stress_limits: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, Any]:
+    """Run the analyses for one revision in one program database.
+
+    The table models subscribe to PyPubSub messages so this should only be called
+    once in a process unless the previous program database has been disconnected
+    and garbage collected.
+
+    :param database: the connection information for the program database.
+    :param analyses: the names of the analyses to run.
+    :param revision_id: the ID of the revision to calculate.
+    :param hr_multiplier: the hazard rate multiplier to use for hardware.
+    :param stress_limits: the electrical stress limits to use for hardware.
+    :return: the number of seconds taken by each stage, keyed by the stage name,
+        and the number of records written to each table, keyed by "changed".
+    :rtype: dict
+    :raise: DataAccessError if the program database can't be opened or saved.
+    """
+    _dic_calculate: Dict[str, Callable[[RAMSTKProgramDB], None]] = {
+        "allocation": do_calculate_allocation,
+        "hardware": do_calculate_hardware,
+        "hazards": do_calculate_hazards,
+        "similar_item": do_calculate_similar_item,
+        "validation": do_calculate_validation,
+    }
+    _analyses = [_analysis for _analysis in ANALYSES if _analysis in analyses]
+    _results: Dict[str, Any] = {}
+
+    _start = time.perf_counter()
+    _program_db = do_initialize_program_db(_analyses, hr_multiplier, stress_limits)
+    _program_db.do_connect(database)
+    try:
+        for _table in _program_db.tables.values():
+            if hasattr(_table, "do_connect"):
+                _table.do_connect(_program_db)  # type: ignore
+        pub.sendMessage("selected_revision", attributes={"revision_id": revision_id})
+        _results["load"] = time.perf_counter() - _start
+
+        for _analysis in _analyses:
+            _start = time.perf_counter()
+            _dic_calculate[_analysis](_program_db)
+            _results[_analysis] = time.perf_counter() - _start
+
+        _start = time.perf_counter()
+        _results["changed"] = _program_db.do_update_dirty()
+        _results["save"] = time.perf_counter() - _start
+    finally:
+        _program_db.do_disconnect()
+
+    return _results
+
+
+def do_run_batches(
+    databases: List[Dict[str, str]],
+    analyses: List[str],
+    revision_id: int = 1,
+    jobs: int = 1,
+    hr_multiplier: float = 1.0,
+    stress_limits: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, Any]:
+    """Run the analyses for one revision in several program databases.
+
+    Each program database is calculated in a fresh worker process and up to jobs
+    program databases are calculated at the same time.  The results for each
+    program database are printed as soon as it's finished.
+
+    :param databases: the connection information for each program database.
+    :param analyses: the names of the analyses to run.
+    :param revision_id: the ID of the revision to calculate.
+    :param jobs: the number of worker processes to use.
+    :param hr_multiplier: the hazard rate multiplier to use for hardware.
+    :param stress_limits: the electrical stress limits to use for hardware.
+    :return: the results returned by do_run_batch() for each program database or
+        the exception raised while calculating it, keyed by the database name.
+    :rtype: dict
+    """
+    _results: Dict[str, Any] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as _executor:
+        _futures: Dict[Future, str] = {
+            _executor.submit(
+                _do_run_batch_worker,
+                _database,
+                analyses,
+                revision_id,
+                hr_multiplier,
+                stress_limits,
+            ): _database["database"]
+            for _database in databases
+        }
+        for _future in as_completed(_futures):
+            _database = _futures[_future]
+            try:
+                _results[_database] = _future.result()
+                print(get_batch_summary(_database, _results[_database]))
+            except Exception as _error:  # pylint: disable=broad-except
+                _results[_database] = _error
+                print(f"{_database}: failed; {_error}", file=sys.stderr)
+
+    return _results
+
+
+def get_batch_summary(database: str, results: Dict[str, Any]) -> str:
+    """Return the one line summary of the results for a program database.
+
+    :param database: the name of the program database.
+    :param results: the results returned by do_run_batch().
+    :return: the name of the database followed by the time taken by each stage
+        and the number of records written.
+    :rtype: str
+    """
+    _stages = ", ".join(
+        f"{_stage} {_seconds:.2f} s"
+        for _stage, _seconds in results.items()
+        if _stage != "changed"
+    )
+    _changed = sum(results.get("changed", {}).values())
+
+    return f"{database}: {_stages} ({_changed} records written)"
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the command line argument parser for the batch program.
+
+    :return: the ArgumentParser() for the batch program.
+    :rtype: :class:`argparse.ArgumentParser`
+    """
+    _parser = argparse.ArgumentParser(
+        prog="ramstk-batch",
+        description=(
+            "Run RAMSTK analyses on one or more program databases without the GUI.  "
+            "Connection options not given on the command line are read from the "
+            "RAMSTK user configuration file."
+        ),
+    )
+    _parser.add_argument(
+        "databases",
+        nargs="+",
+        help="the names of the program databases (or SQLite files) to calculate.",
+    )
+    _parser.add_argument(
+        "-a",
+        "--analyses",
+        nargs="+",
+        choices=ANALYSES,
+        default=ANALYSES,
+        help="the analyses to run (default: all of them).",
+    )
+    _parser.add_argument(
+        "-r",
+        "--revision",
+        type=int,
+        default=1,
+        help="the ID of the revision to calculate (default: 1).",
+    )
+    _parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="the number of databases to calculate in parallel (default: 1).",
+    )
+    _parser.add_argument("--dialect", choices=["postgres", "sqlite"])
+    _parser.add_argument("--host")
+    _parser.add_argument("--port")
+    _parser.add_argument("--user")
+    _parser.add_argument("--password")
+
+    return _parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Execute the batch calculation program.
+
+    :param argv: the command line arguments; defaults to sys.argv.
+    :return: the exit status; 0 if every program database was calculated.
+    :rtype: int
+    """
+    _args = get_parser().parse_args(argv)
+
+    _configuration = RAMSTKUserConfiguration()
+    _configuration.set_user_directories()
+    _configuration.get_user_configuration()
+
+    _connection = dict(_configuration.RAMSTK_PROG_INFO)
+    for _key in ["dialect", "host", "port", "user", "password"]:
+        if getattr(_args, _key) is not None:
+            _connection[_key] = getattr(_args, _key)
+
+    _start = time.perf_counter()
+    _results = do_run_batches(
+        [{**_connection, "database": _database} for _database in _args.databases],
+        _args.analyses,
+        revision_id=_args.revision,
+        jobs=_args.jobs,
+        hr_multiplier=_configuration.RAMSTK_HR_MULTIPLIER,
+        stress_limits=_configuration.RAMSTK_STRESS_LIMITS,
+    )
+    _n_failed = sum(isinstance(_result, Exception) for _result in _results.values())
+
+    print(
+        f"Calculated {len(_results) - _n_failed} of {len(_results)} program "
+        f"databases in {time.perf_counter() - _start:.2f} s."
+    )
+
+    return 1 if _n_failed else 0
+
+
+def _do_run_batch_worker(
+    database: Dict[str, str],
+    analyses: List[str],
+    revision_id: int,
+    hr_multiplier: float,
+    stress_limits: Optional[Dict[str, Dict[str, float]]],
+) -> Dict[str, Any]:
+    """Run do_run_batch() in a worker process.
+
+    Worker processes may be reused for more than one program database, so every
+    PyPubSub subscription left over from the previous program database is removed
+    first.
+
+    :param database: the connection information for the program database.
+    :param analyses: the names of the analyses to run.
+    :param revision_id: the ID of the revision to calculate.
+    :param hr_multiplier: the hazard rate multiplier to use for hardware.
+    :param stress_limits: the electrical stress limits to use for hardware.
+    :return: the results returned by do_run_batch().
+    :rtype: dict
+    """
+    pub.unsubAll()
+
+    return do_run_batch(database, analyses, revision_id, hr_multiplier, stress_limits)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# Standard Library Imports
+import argparse
+from typing import Any, Dict, List, Optional
+
+# RAMSTK Package Imports
+from ramstk.configuration import RAMSTKUserConfiguration as RAMSTKUserConfiguration
+from ramstk.models.db import RAMSTKProgramDB as RAMSTKProgramDB
+from ramstk.models.dbtables import RAMSTKAllocationTable as RAMSTKAllocationTable
+from ramstk.models.dbtables import (
+    RAMSTKDesignElectricTable as RAMSTKDesignElectricTable,
+)
+from ramstk.models.dbtables import (
+    RAMSTKDesignMechanicTable as RAMSTKDesignMechanicTable,
+)
+from ramstk.models.dbtables import RAMSTKHardwareTable as RAMSTKHardwareTable
+from ramstk.models.dbtables import RAMSTKHazardTable as RAMSTKHazardTable
+from ramstk.models.dbtables import RAMSTKMILHDBK217FTable as RAMSTKMILHDBK217FTable
+from ramstk.models.dbtables import RAMSTKNSWCTable as RAMSTKNSWCTable
+from ramstk.models.dbtables import RAMSTKReliabilityTable as RAMSTKReliabilityTable
+from ramstk.models.dbtables import RAMSTKSimilarItemTable as RAMSTKSimilarItemTable
+from ramstk.models.dbtables import RAMSTKValidationTable as RAMSTKValidationTable
+from ramstk.models.dbviews import RAMSTKHardwareBoMView as RAMSTKHardwareBoMView
+
+ANALYSES: List[str]
+ANALYSIS_TABLES: Dict[str, Dict[str, Any]]
+
+def do_calculate_allocation(program_db: RAMSTKProgramDB) -> None: ...
+def do_calculate_hardware(program_db: RAMSTKProgramDB) -> None: ...
+def do_calculate_hazards(program_db: RAMSTKProgramDB) -> None: ...
+def do_calculate_similar_item(program_db: RAMSTKProgramDB) -> None: ...
+def do_calculate_validation(program_db: RAMSTKProgramDB) -> None: ...
+def do_initialize_program_db(
+    analyses: List[str],
+    hr_multiplier: float = ...,
+    stress_limits: Optional[Dict[str, Dict[str, float]]] = ...,
+) -> RAMSTKProgramDB: ...
+def do_run_batch(
+    database: Dict[str, str],
+    analyses: List[str],
+    revision_id: int = ...,
+    hr_multiplier: float = ...,
+    stress_limits: Optional[Dict[str, Dict[str, float]]] = ...,
+) -> Dict[str, Any]: ...
+def do_run_batches(
+    databases: List[Dict[str, str]],
+    analyses: List[str],
+    revision_id: int = ...,
+    jobs: int = ...,
+    hr_multiplier: float = ...,
+    stress_limits: Optional[Dict[str, Dict[str, float]]] = ...,
+) -> Dict[str, Any]: ...
+def get_batch_summary(database: str, results: Dict[str, Any]) -> str: ...
+def get_parser() -> argparse.ArgumentParser: ...
+def main(argv: Optional[List[str]] = ...) -> int: ...
+def _do_run_batch_worker(
+    database: Dict[str, str],
+    analyses: List[str],
+    revision_id: int,
+    hr_multiplier: float,
+    stress_limits: Optional[Dict[str, Dict[str, float]]],
+) -> Dict[str, Any]: ...
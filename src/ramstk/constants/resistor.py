@@ -661,6 +661,24 @@ PI_R: Dict[int, List[float] | List[List[float]]] = {
     14: [1.0, 1.1, 1.2, 1.4, 1.8],
     15: [1.0, 1.1, 1.2, 1.4, 1.8],
 }
+PI_R_BREAKPOINTS: Dict[int, List[float] | List[List[float]]] = {
+    1: [1.0e5, 1.0e6, 1.0e7],
+    2: [1.0e5, 1.0e6, 1.0e7],
+    3: [100.0, 1.0e5, 1.0e6],
+    5: [1.0e4, 1.0e5, 1.0e6],
+    6: [
+        [500.0, 1.0e3, 5.0e3, 7.5e3, 1.0e4, 1.5e4, 2.0e4],
+        [100.0, 1.0e3, 1.0e4, 1.0e5, 1.5e5, 2.0e5],
+    ],
+    7: [500.0, 1.0e3, 5.0e3, 1.0e4, 2.0e4],
+    9: [2.0e3, 5.0e3],
+    10: [1.0e4, 2.0e4, 5.0e4, 1.0e5, 2.0e5],
+    11: [2.0e3, 5.0e3],
+    12: [2.0e3, 5.0e3],
+    13: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
+    14: [5.0e4, 1.0e5, 2.0e5, 5.0e5],
+    15: [1.0e4, 5.0e4, 2.0e5, 1.0e6],
+}
 PI_V: Dict[int, List[float]] = {
     9: [1.1, 1.05, 1.0, 1.1, 1.22, 1.4, 2.0],
     10: [1.1, 1.05, 1.0, 1.1, 1.22, 1.4, 2.0],
@@ -670,6 +688,15 @@ PI_V: Dict[int, List[float]] = {
     14: [1.0, 1.05, 1.2],
     15: [1.0, 1.05, 1.2],
 }
+PI_V_BREAKPOINTS: Dict[int, List[float]] = {
+    9: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    10: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    11: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    12: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    13: [0.8, 0.9],
+    14: [0.8, 0.9],
+    15: [0.8, 0.9],
+}
 REF_TEMPS: Dict[int, float] = {
     1: 343.0,
     3: 298.0,
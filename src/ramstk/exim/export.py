@@ -8,42 +8,112 @@
 
 
 # Standard Library Imports
-import contextlib
+import csv
 import os
-from typing import Dict, Union
+from datetime import date
+from typing import Any, Dict, Iterator, List, Union
 
 # Third Party Imports
-import pandas as pd
+from pubsub import pub
+from treelib import Node, Tree
+
+try:
+    # Third Party Imports
+    # noinspection PyPackageRequirements
+    import pyarrow as pa  # type: ignore
+
+    # noinspection PyPackageRequirements
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pa = None
+    pq = None
+
+
+def _do_write_arrow_rows(writer: Any, rows: List[Dict[str, Any]]) -> None:
+    """Write a chunk of records to a Parquet file.
+
+    :param writer: the pyarrow ParquetWriter() for the file.
+    :param rows: the list of record attribute dicts to write.
+    :return: None
+    :rtype: None
+    """
+    writer.write_table(pa.Table.from_pylist(rows, schema=writer.schema))
+
+
+def _get_arrow_schema(record: Any, attributes: List[str]) -> Any:
+    """Return the Arrow schema for a table of records.
+
+    The type of each column is the type of the attribute's default value.  The
+    only attributes without a default value are the record IDs, which are integers.
+
+    :param record: the record class the table contains.
+    :param attributes: the names of the record attributes in the table.
+    :return: the pyarrow Schema() for the table.
+    :rtype: :class:`pyarrow.Schema`
+    """
+    _types = {
+        bool: pa.bool_(),
+        bytes: pa.binary(),
+        date: pa.date32(),
+        float: pa.float64(),
+        int: pa.int64(),
+        str: pa.string(),
+    }
+
+    return pa.schema(
+        [
+            (
+                _attribute,
+                _types.get(type(record.__defaults__.get(_attribute, 0)), pa.string()),
+            )
+            for _attribute in attributes
+        ]
+    )
 
-# noinspection PyPackageRequirements
-from openpyxl import Workbook
 
-# noinspection PyPackageRequirements
-from openpyxl.utils.dataframe import dataframe_to_rows
-from pubsub import pub
-from treelib import Tree
+def _get_data_nodes(tree: Tree) -> Iterator[Node]:
+    """Return the nodes in a data manager tree that carry records.
+
+    :param tree: the data manager tree to retrieve nodes from.
+    :return: a generator of the nodes with records.
+    :rtype: generator
+    """
+    return (_node for _node in tree.all_nodes_itr() if isinstance(_node.data, dict))
 
 
 class Export:
-    """Contains the methods for exporting data from a program database."""
+    """Contains the methods for exporting data from a program database.
+
+    By default, each record is written to one column with the ID of the record's
+    tree node in the header row and the attribute names in the first column.  This
+    requires every record in the module to be in memory before the first row is
+    written.
+
+    When row_per_record is True, each record is instead written to one row with
+    the ID of the record's tree node in the first column and the attribute names
+    in the header row.  The rows are created one at a time from the module tree as
+    they're written, so only one row is held in memory at a time no matter how
+    large the module is.  This is the layout Import reads.  Parquet files are
+    always written one row per record.
+    """
 
     def __init__(self) -> None:
         """Initialize an Export module instance."""
         # Initialize private dictionary attributes.
-        self._dic_output_data: Dict[
-            str, Dict[int, Dict[str, Union[bool, float, int, str]]]
-        ] = {}
+        self._dic_output_data: Dict[str, Tree] = {}
 
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._df_output_data: pd.DataFrame = pd.DataFrame()
+        self._df_output_data: Any = None
 
         # Initialize public dictionary attributes.
 
         # Initialize public list attributes.
 
         # Initialize public scalar attributes.
+        self.chunk_size: int = 5000
+        self.row_per_record: bool = False
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self._do_load_data, "succeed_get_allocation_tree")
@@ -78,12 +148,17 @@ class Export:
                 self._do_export_to_excel_legacy(_module, file_name)
         elif _file_type in [".xlsx", ".xlsm"]:
             self._do_export_to_excel(modules, file_name)
+        elif _file_type == ".parquet":
+            self._do_export_to_parquet(modules, file_name)
         else:
             self._do_export_to_delimited_text(file_name, separator=" ")
 
     def _do_export_to_delimited_text(self, file_name: str, separator: str) -> None:
         """Export RAMSTK project data to a delimited text file.
 
+        Each module is written to a separate file in a directory with the same name
+        as the export file.
+
         :param file_name: the name of the file to export data.
         :param separator: the field delimiter to use.
         :return: None
@@ -94,85 +169,185 @@ class Export:
         if not os.path.isdir(_file):
             os.makedirs(f"{_file}")
 
-        for (
-            _module,
-            _data,
-        ) in self._dic_output_data.items():
-            self._df_output_data = pd.DataFrame(_data)
-
-            self._df_output_data.to_csv(
-                f"{_file}/{_module}{_extension}", sep=separator, index=True
-            )
+        for _module in self._dic_output_data:
+            if self.row_per_record:
+                with open(
+                    f"{_file}/{_module}{_extension}", "w", encoding="utf-8", newline=""
+                ) as _text_file:
+                    csv.writer(_text_file, delimiter=separator).writerows(
+                        self._do_make_rows(_module)
+                    )
+            else:
+                self._df_output_data = self._get_output_frame(_module)
+                self._df_output_data.to_csv(
+                    f"{_file}/{_module}{_extension}", sep=separator, index=True
+                )
 
     # pylint: disable=abstract-class-instantiated
     def _do_export_to_excel_legacy(self, module: str, file_name: str) -> None:
         """Export RAMSTK project data to an Excel file.
 
+        Legacy Excel files are limited to 65,536 rows so the module is always
+        written from a pandas DataFrame() rather than streamed.
+
         :param module: the RAMSTK work flow module to export.
         :param file_name: the name of the file to export data.
         :return: None
         :rtype: None
         """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         _file, dummy = os.path.splitext(file_name)
 
-        for (
-            dummy,
-            _data,
-        ) in self._dic_output_data.items():
-            self._df_output_data = pd.DataFrame(_data)
+        if self.row_per_record:
+            _rows = self._do_make_rows(module)
+            _header = next(_rows)
+            self._df_output_data = pd.DataFrame(_rows, columns=_header).set_index(
+                _header[0]
+            )
+        else:
+            self._df_output_data = self._get_output_frame(module)
 
-            # xlwt can't write each module to a separate sheet, so we'll
-            # have to make a separate workbook for each work stream module.
-            _writer = pd.ExcelWriter(f"{_file}_{module}.xls")
-            self._df_output_data.to_excel(_writer, f"{module}", index=True)
-            _writer.save()
-            _writer.close()
+        # xlwt can't write each module to a separate sheet, so we'll
+        # have to make a separate workbook for each work stream module.
+        _writer = pd.ExcelWriter(f"{_file}_{module}.xls")
+        self._df_output_data.to_excel(_writer, f"{module}", index=True)
+        _writer.save()
+        _writer.close()
 
-    # pylint: disable=abstract-class-instantiated
     def _do_export_to_excel(self, modules: Dict[str, bool], file_name: str) -> None:
         """Export RAMSTK project data to an Excel file.
 
-        :param module: the RAMSTK work flow module to export.
+        Each module is written to a separate worksheet.  When writing one row per
+        record, the worksheets are write-only so each row is written to the file as
+        soon as it's appended.
+
+        :param modules: dict of RAMSTK modules to export.
         :param file_name: the name of the file to export data.
         :return: None
         :rtype: None
         """
-        _workbook = Workbook()
+        # pylint: disable=import-outside-toplevel
+        # Third Party Imports
+        # noinspection PyPackageRequirements
+        from openpyxl import Workbook
+
+        # noinspection PyPackageRequirements
+        from openpyxl.utils.dataframe import dataframe_to_rows
+
+        _workbook = Workbook(write_only=self.row_per_record)
+        if not self.row_per_record:
+            # It's a hack!  openpyxl creates a worksheet 'Sheet' by default.  We don't
+            # need this worksheet, so remove it.
+            _workbook.remove(_workbook["Sheet"])
 
         for _module, _request in modules.items():
             if _request:
-                self._df_output_data = pd.DataFrame(self._dic_output_data[_module])
                 _worksheet = _workbook.create_sheet(title=f"{_module}")
-
-                for _row in dataframe_to_rows(
-                    self._df_output_data,
-                    index=True,
-                    header=True,
-                ):
+                if self.row_per_record:
+                    _rows = self._do_make_rows(_module)
+                else:
+                    self._df_output_data = self._get_output_frame(_module)
+                    _rows = dataframe_to_rows(
+                        self._df_output_data,
+                        index=True,
+                        header=True,
+                    )
+                for _row in _rows:
                     _worksheet.append(_row)
 
-        # It's a hack!  openpyxl creates a worksheet 'Sheet' by default.  We don't
-        # need this worksheet, so remove it.
-        _workbook.remove(_workbook["Sheet"])
         _workbook.save(file_name)
 
+    def _do_export_to_parquet(self, modules: Dict[str, bool], file_name: str) -> None:
+        """Export RAMSTK project data to Parquet files.
+
+        Each type of record is written to a separate Parquet file, named for the
+        record's database table, in a directory with the same name as the export
+        file.  For example, the hardware module is written to hardware.parquet,
+        reliability.parquet, design_electric.parquet, and so on.  The records are
+        written chunk_size at a time.  Exporting to Parquet files requires the
+        optional pyarrow package.
+
+        :param modules: dict of RAMSTK modules to export.
+        :param file_name: the name of the file to export data.
+        :return: None
+        :rtype: None
+        """
+        if pq is None:
+            pub.sendMessage(
+                "do_log_error_msg",
+                logger_name="ERROR",
+                message=(
+                    "_do_export_to_parquet: Exporting to Parquet files requires the "
+                    "pyarrow package."
+                ),
+            )
+            return
+
+        _file, dummy = os.path.splitext(file_name)
+
+        if not os.path.isdir(_file):
+            os.makedirs(f"{_file}")
+
+        for _module, _request in modules.items():
+            if _request:
+                self._do_write_parquet_tables(_module, _file)
+
     def _do_load_data(self, tree: Tree) -> None:
-        """Load the attribute data into a Pandas DataFrame.
+        """Keep the data manager tree for a module to export.
 
         :param tree: the data manager tree for the module to export.
         :return: None
         :rtype: None
         """
-        _module = tree.get_node(0).tag.lower()
-        self._dic_output_data[_module] = {}
-
-        for _node in tree.all_nodes()[1:]:
-            with contextlib.suppress(KeyError, TypeError):
-                self._dic_output_data[_module][_node.identifier] = {}
-                for _model in _node.data:
-                    self._dic_output_data[_module][_node.identifier].update(
-                        _node.data[_model].get_attributes()
-                    )
+        self._dic_output_data[tree.get_node(0).tag.lower()] = tree
+
+    def _do_make_rows(self, module: str) -> Iterator[List[Any]]:
+        """Create the rows to export for a module one at a time.
+
+        The first row is the header.  It contains every attribute name used by any
+        of the module's records; attributes are only looked up for the first record
+        of each type to build it.  Each following row contains the node ID and the
+        attribute values for one node in the module's tree.  The number of rows
+        created so far is broadcast every chunk_size rows and after the last row.
+
+        :param module: the RAMSTK work flow module to export.
+        :return: a generator of rows, starting with the header row.
+        :rtype: generator
+        """
+        _tree = self._dic_output_data.get(module, Tree())
+
+        _header: Dict[str, None] = {}
+        _record_types = set()
+        for _node in _get_data_nodes(_tree):
+            for _record in _node.data.values():
+                if type(_record) not in _record_types:
+                    _record_types.add(type(_record))
+                    _header.update(dict.fromkeys(_record.get_attributes()))
+
+        yield [""] + list(_header)
+
+        _n_rows = 0
+        for _node in _get_data_nodes(_tree):
+            _attributes = {}
+            for _record in _node.data.values():
+                _attributes.update(_record.get_attributes())
+            yield [_node.identifier] + [_attributes.get(_key) for _key in _header]
+
+            _n_rows += 1
+            if _n_rows % self.chunk_size == 0:
+                pub.sendMessage(
+                    "succeed_export_chunk",
+                    module=module,
+                    n_rows=_n_rows,
+                )
+
+        pub.sendMessage(
+            "succeed_export_chunk",
+            module=module,
+            n_rows=_n_rows,
+        )
 
     def _do_request_data_trees(self, modules: Dict[str, bool], file_name: str) -> None:
         """Request RAMSTK module data trees.
@@ -188,3 +363,74 @@ class Export:
                 pub.sendMessage(f"request_get_{_module}_tree")
 
         self._do_export(modules, file_name)
+
+    def _do_write_parquet_tables(self, module: str, directory: str) -> None:
+        """Write each type of record in a module to its own Parquet file.
+
+        :param module: the RAMSTK work flow module to export.
+        :param directory: the directory to write the Parquet files to.
+        :return: None
+        :rtype: None
+        """
+        _writers: Dict[Any, Any] = {}
+        _rows: Dict[Any, List[Dict[str, Any]]] = {}
+
+        _n_rows = 0
+        try:
+            for _node in _get_data_nodes(self._dic_output_data.get(module, Tree())):
+                for _record in _node.data.values():
+                    _attributes = _record.get_attributes()
+                    if type(_record) not in _writers:
+                        _writers[type(_record)] = pq.ParquetWriter(
+                            f"{directory}/"
+                            f"{_record.__tablename__.replace('ramstk_', '', 1)}"
+                            f".parquet",
+                            _get_arrow_schema(type(_record), list(_attributes)),
+                        )
+                        _rows[type(_record)] = []
+                    _rows[type(_record)].append(_attributes)
+                    if len(_rows[type(_record)]) == self.chunk_size:
+                        _do_write_arrow_rows(
+                            _writers[type(_record)], _rows[type(_record)]
+                        )
+                        _rows[type(_record)] = []
+
+                _n_rows += 1
+                if _n_rows % self.chunk_size == 0:
+                    pub.sendMessage(
+                        "succeed_export_chunk",
+                        module=module,
+                        n_rows=_n_rows,
+                    )
+
+            for _record, _record_rows in _rows.items():
+                if _record_rows:
+                    _do_write_arrow_rows(_writers[_record], _record_rows)
+        finally:
+            for _writer in _writers.values():
+                _writer.close()
+
+        pub.sendMessage(
+            "succeed_export_chunk",
+            module=module,
+            n_rows=_n_rows,
+        )
+
+    def _get_output_frame(self, module: str) -> Any:
+        """Create a pandas DataFrame() with one column for each record in a module.
+
+        :param module: the RAMSTK work flow module to export.
+        :return: the DataFrame() of attribute values indexed by attribute name with
+            the node ID of each record as the column name.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        _data: Dict[int, Dict[str, Union[bool, float, int, str]]] = {}
+        for _node in _get_data_nodes(self._dic_output_data.get(module, Tree())):
+            _data[_node.identifier] = {}
+            for _record in _node.data.values():
+                _data[_node.identifier].update(_record.get_attributes())
+
+        return pd.DataFrame(_data)
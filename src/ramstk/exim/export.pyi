@@ -1,21 +1,31 @@
 # Standard Library Imports
-from typing import Dict, Union
+from typing import Any, Dict, Iterator, List
 
 # Third Party Imports
-import pandas as pd
+from treelib import Node as Node
 from treelib import Tree as Tree
 
+def _do_write_arrow_rows(writer: Any, rows: List[Dict[str, Any]]) -> None: ...
+def _get_arrow_schema(record: Any, attributes: List[str]) -> Any: ...
+def _get_data_nodes(tree: Tree) -> Iterator[Node]: ...
+
 class Export:
-    _dic_output_data: Dict[str, Dict[int, Dict[str, Union[bool, float, int, str]]]] = (
-        ...
-    )
-    _df_output_data: pd.DataFrame = ...
+    _dic_output_data: Dict[str, Tree] = ...
+    _df_output_data: Any
+    chunk_size: int
+    row_per_record: bool
     def __init__(self) -> None: ...
     def _do_export(self, modules: Dict[str, bool], file_name: str) -> None: ...
     def _do_export_to_delimited_text(self, file_name: str, separator: str) -> None: ...
     def _do_export_to_excel_legacy(self, module: str, file_name: str) -> None: ...
     def _do_export_to_excel(self, modules: Dict[str, bool], file_name: str) -> None: ...
+    def _do_export_to_parquet(
+        self, modules: Dict[str, bool], file_name: str
+    ) -> None: ...
     def _do_load_data(self, tree: Tree) -> None: ...
+    def _do_make_rows(self, module: str) -> Iterator[List[Any]]: ...
     def _do_request_data_trees(
         self, modules: Dict[str, bool], file_name: str
     ) -> None: ...
+    def _do_write_parquet_tables(self, module: str, directory: str) -> None: ...
+    def _get_output_frame(self, module: str) -> Any: ...
@@ -11,7 +11,7 @@ import inspect
 import math
 from collections import OrderedDict
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 # Third Party Imports
 # noinspection PyPackageRequirements
@@ -23,6 +23,7 @@ import pandas as pd
 # noinspection PyPackageRequirements
 from dateutil import parser
 from pubsub import pub
+from sqlalchemy import select
 
 # RAMSTK Package Imports
 from ramstk.exceptions import DataAccessError
@@ -41,6 +42,13 @@ from ramstk.models.dbrecords import (
     RAMSTKValidationRecord,
 )
 
+try:
+    # Third Party Imports
+    # noinspection PyPackageRequirements
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pq = None
+
 
 def _do_replace_nan(value: Any, default: Any) -> Any:
     """Check for NaN values and replace any with the default value.
@@ -92,6 +100,47 @@ def _get_input_value(
     return _value
 
 
+def _get_input_column(
+    mapper: Dict[str, Any], df_chunk: pd.DataFrame, field: str, default: Any
+) -> List[Any]:
+    """Retrieve the input values for a field from a chunk of the Pandas dataframe.
+
+    This is the column-wise equivalent of _get_input_value().  Missing values are
+    replaced with the default value and every value is converted to the type of the
+    default value.  Numbers that can't be converted are also replaced with the
+    default value, as are dates that can't be parsed.
+
+    :param mapper: the field mapping dict to use as the Rosetta stone.
+    :param df_chunk: the chunk of the pandas DataFrame containing the input data.
+    :param field: the name of the RAMSTK database field to retrieve the data for.
+    :param default: the default value to assign to the field.
+    :return: the list of values for the field, one for each row in the chunk.
+    :rtype: list
+    """
+    try:
+        _column = df_chunk[mapper[field]]
+    except KeyError:
+        return [default] * len(df_chunk)
+
+    if isinstance(default, date):
+        # Dates are parsed once for each unique value rather than once per row.
+        _dates = {}
+        for _value in _column.dropna().unique():
+            try:
+                _dates[_value] = parser.parse(str(_value)).date()
+            except (OverflowError, ValueError):
+                _dates[_value] = default
+        _column = _column.map(_dates)
+    elif isinstance(default, (float, int)):
+        _column = pd.to_numeric(_column, errors="coerce")
+
+    _column = _column.where(_column.notna(), default)
+    if isinstance(default, (float, int, str)):
+        _column = _column.astype(type(default))
+
+    return _column.tolist()
+
+
 class Import:
     """Contains the methods for importing data to a program database."""
 
@@ -326,6 +375,332 @@ class Import:
         ),
     }
 
+    # The ID and parent ID attributes checked before each RAMSTK module is imported.
+    # The attributes belong to the first record created for the module.
+    _dic_import_keys: Dict[str, Tuple[str, str]] = {
+        "Function": ("function_id", "parent_id"),
+        "Hardware": ("hardware_id", "parent_id"),
+        "Requirement": ("requirement_id", "parent_id"),
+        "Validation": ("validation_id", ""),
+    }
+
+    # The records created from each row of the input file for each RAMSTK module.
+    # The fields for each record are grouped by the field map they're read from and
+    # are (record attribute, format field, default value) tuples.
+    _dic_import_records = {
+        "Function": [
+            (
+                RAMSTKFunctionRecord,
+                {
+                    "Function": [
+                        ("revision_id", "Revision ID", 1),
+                        ("function_id", "Function ID", 1),
+                        ("function_code", "Function Code", ""),
+                        ("level", "Level", 0),
+                        ("name", "Function Name", ""),
+                        ("parent_id", "Parent", 1),
+                        ("remarks", "Remarks", ""),
+                        ("safety_critical", "Safety Critical", 0),
+                        ("type_id", "Type", 0),
+                    ],
+                },
+            ),
+        ],
+        "Hardware": [
+            (
+                RAMSTKHardwareRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                        ("alt_part_number", "Alternate Part Number", ""),
+                        ("cage_code", "CAGE Code", ""),
+                        ("category_id", "Category ID", 0),
+                        ("comp_ref_des", "Composite Ref. Des.", ""),
+                        ("cost", "Cost", 0.0),
+                        ("cost_type_id", "Cost Type", 0),
+                        ("description", "Description", ""),
+                        ("duty_cycle", "Duty Cycle", 100.0),
+                        ("figure_number", "Figure Number", ""),
+                        ("lcn", "LCN", ""),
+                        ("level", "Level", 0),
+                        ("manufacturer_id", "Manufacturer", 0),
+                        ("mission_time", "Mission Time", 24.0),
+                        ("name", "Name", ""),
+                        ("nsn", "NSN", ""),
+                        ("page_number", "Page Number", ""),
+                        ("parent_id", "Parent Assembly", 1),
+                        ("part", "Part", 0),
+                        ("part_number", "Part Number", ""),
+                        ("quantity", "Quantity", 1),
+                        ("ref_des", "Reference Designator", ""),
+                        ("remarks", "Remarks", ""),
+                        ("repairable", "Repairable", 1),
+                        ("specification_number", "Specification", ""),
+                        ("subcategory_id", "Subcategory ID", 0),
+                        ("tagged_part", "Tagged Part", 0),
+                        ("year_of_manufacture", "Year of Manufacture", 1900),
+                    ],
+                },
+            ),
+            (
+                RAMSTKAllocationRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                        ("parent_id", "Parent Assembly", 1),
+                    ],
+                },
+            ),
+            (
+                RAMSTKSimilarItemRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                        ("parent_id", "Parent Assembly", 1),
+                    ],
+                },
+            ),
+            (
+                RAMSTKDesignElectricRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                    ],
+                    "Design Electric": [
+                        ("application_id", "Application ID", 0),
+                        ("area", "Area", 0.0),
+                        ("capacitance", "Capacitance", 0.000001),
+                        ("configuration_id", "Configuration ID", 0),
+                        ("construction_id", "Construction ID", 0),
+                        ("contact_form_id", "Contact Form ID", 0),
+                        ("contact_gauge", "Contact Gauge", 20),
+                        ("contact_rating_id", "Contact Rating ID", 0),
+                        ("current_operating", "Current Operating", 0.0),
+                        ("current_rated", "Current Rated", 0.0),
+                        ("current_ratio", "Current Ratio", 0.0),
+                        ("environment_active_id", "Environment Active ID", 0),
+                        ("environment_dormant_id", "Environment Dormant ID", 0),
+                        ("family_id", "Family ID", 0),
+                        ("feature_size", "Feature Size", 1.0),
+                        ("frequency_operating", "Frequency Operating", 0.0),
+                        ("insert_id", "Insert ID", 0),
+                        ("insulation_id", "Insulation ID", 0),
+                        ("manufacturing_id", "Manufacturing ID", 0),
+                        ("matching_id", "Matching ID", 0),
+                        ("n_active_pins", "N Active Pins", 0),
+                        ("n_circuit_planes", "N Circuit Planes", 1),
+                        ("n_cycles", "N Cycles", 0),
+                        ("n_elements", "N Elements", 0),
+                        ("n_hand_soldered", "N Hand Soldered", 0),
+                        ("n_wave_soldered", "N Wave Soldered", 0),
+                        ("operating_life", "Operating Life", 0.0),
+                        ("overstress", "Overstress", 0),
+                        ("package_id", "Package ID", 0),
+                        ("power_operating", "Power Operating", 0.0),
+                        ("power_rated", "Power Rated", 0.0),
+                        ("power_ratio", "Power Ratio", 0.0),
+                        ("reason", "Reason", ""),
+                        ("resistance", "Resistance", 0.0),
+                        ("specification_id", "Specification ID", 0),
+                        ("technology_id", "Technology ID", 0),
+                        ("temperature_active", "Temperature, Active", 30.0),
+                        ("temperature_case", "Temperature, Case", 0.0),
+                        ("temperature_dormant", "Temperature, Dormant", 25.0),
+                        ("temperature_hot_spot", "Temperature, Hot Spot", 0.0),
+                        ("temperature_junction", "Temperature, Junction", 0.0),
+                        ("temperature_knee", "Temperature, Knee", 25.0),
+                        ("temperature_rated_max", "Temperature, Rated Max", 0.0),
+                        ("temperature_rated_min", "Temperature, Rated Min", 0.0),
+                        ("temperature_rise", "Temperature Rise", 0.0),
+                        ("theta_jc", "Theta JC", 0.0),
+                        ("type_id", "Type ID", 0),
+                        ("voltage_ac_operating", "Voltage, AC Operating", 0.0),
+                        ("voltage_dc_operating", "Voltage, DC Operating", 0.0),
+                        ("voltage_esd", "Voltage ESD", 0.0),
+                        ("voltage_rated", "Voltage, Rated", 0.0),
+                        ("voltage_ratio", "Voltage Ratio", 0.0),
+                        ("weight", "Weight", 1.0),
+                        ("years_in_production", "Years in Production", 2),
+                    ],
+                },
+            ),
+            (
+                RAMSTKMilHdbk217FRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                    ]
+                },
+            ),
+            (
+                RAMSTKDesignMechanicRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                    ],
+                    "Design Mechanic": [
+                        ("altitude_operating", "Altitude, Operating", 0.0),
+                        ("application_id", "Application ID", 0),
+                        ("balance_id", "Balance ID", 0),
+                        ("clearance", "Clearance", 0.0),
+                        ("casing_id", "Casing ID", 0),
+                        ("contact_pressure", "Contact Pressure", 0.0),
+                        ("deflection", "Deflection", 0.0),
+                        ("diameter_coil", "Diameter, Coil", 0.0),
+                        ("diameter_inner", "Diameter, Inner", 0.0),
+                        ("diameter_outer", "Diameter, Outer", 0.0),
+                        ("diameter_wire", "Diameter, Wire", 0.0),
+                        ("filter_size", "Filter Size", 0.0),
+                        ("flow_design", "Flow, Design", 0.0),
+                        ("flow_operating", "Flow, Operating", 0.0),
+                        ("frequency_operating", "Frequency, Operating", 0.0),
+                        ("friction", "Friction", 0.0),
+                        ("impact_id", "Impact ID", 0),
+                        ("leakage_allowable", "Allowable Leakage", 0.0),
+                        ("length", "Length", 0.0),
+                        ("length_compressed", "Length, Compressed", 0.0),
+                        ("length_relaxed", "Length, Relaxed", 0.0),
+                        ("load_design", "Design Load", 0.0),
+                        ("load_id", "Load ID", 0),
+                        ("load_operating", "Operating Load", 0.0),
+                        ("lubrication_id", "Lubrication ID", 0),
+                        ("manufacturing_id", "Manufacturing ID", 0),
+                        ("material_id", "Material ID", 0),
+                        ("meyer_hardness", "Meyer Hardness", 0.0),
+                        ("misalignment_angle", "Misalignment Angle", 0.0),
+                        ("n_ten", "N Ten", 0),
+                        ("n_cycles", "N Cycles", 0),
+                        ("n_elements", "N Elements", 0),
+                        ("offset", "Offset", 0.0),
+                        ("particle_size", "Particle Size", 0.0),
+                        ("pressure_contact", "Contact Pressure", 0.0),
+                        ("pressure_delta", "Differential Pressure", 0.0),
+                        ("pressure_downstream", "Downstream Pressure", 0.0),
+                        ("pressure_rated", "Rated Pressure", 0.0),
+                        ("pressure_upstream", "Upstream Pressure", 0.0),
+                        ("rpm_design", "Design RPM", 0.0),
+                        ("rpm_operating", "Operating RPM", 0.0),
+                        ("service_id", "Service ID", 0),
+                        ("spring_index", "Spring Index", 0.0),
+                        ("surface_finish", "Surface Finish", 0.0),
+                        ("technology_id", "Technology ID", 0),
+                        ("thickness", "Thickness", 0.0),
+                        ("torque_id", "Torque ID", 0),
+                        ("type_id", "Type ID", 0),
+                        ("viscosity_design", "Design Viscosity", 0.0),
+                        ("viscosity_dynamic", "Dynamic Viscosity", 0.0),
+                        ("water_per_cent", "% Water", 0.0),
+                        ("width_minimum", "Minimum Width", 0.0),
+                    ],
+                },
+            ),
+            (
+                RAMSTKNSWCRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                    ]
+                },
+            ),
+            (
+                RAMSTKReliabilityRecord,
+                {
+                    "Hardware": [
+                        ("revision_id", "Revision ID", 1),
+                        ("hardware_id", "Hardware ID", 1),
+                    ],
+                    "Reliability": [
+                        ("add_adj_factor", "Additive Adjustment Factor", 0.0),
+                        ("failure_distribution_id", "Failure Distribution ID", 0),
+                        ("hazard_rate_method_id", "Failure Rate Method ID", 0),
+                        ("hazard_rate_model", "Failure Rate Model", ""),
+                        ("hazard_rate_specified", "Specified Failure Rate", 0.0),
+                        ("hazard_rate_type_id", "Failure Rate Type ID", 0),
+                        ("location_parameter", "Location Parameter", 0.0),
+                        ("mtbf_specified", "Specified MTBF", 0.0),
+                        ("mult_adj_factor", "Multiplicative Adjustment Factor", 1.0),
+                        ("quality_id", "Quality ID", 0),
+                        ("reliability_goal", "Reliability Goal", 100.0),
+                        (
+                            "reliability_goal_measure_id",
+                            "Reliability Goal Measure ID",
+                            0,
+                        ),
+                        ("scale_parameter", "Scale Parameter", 0.0),
+                        ("shape_parameter", "Shape Parameter", 0.0),
+                        ("survival_analysis_id", "Survival Analysis ID", 0),
+                    ],
+                },
+            ),
+        ],
+        "Requirement": [
+            (
+                RAMSTKRequirementRecord,
+                {
+                    "Requirement": [
+                        ("revision_id", "Revision ID", 1),
+                        ("requirement_id", "Requirement ID", 1),
+                        ("derived", "Derived?", 0),
+                        ("description", "Requirement", ""),
+                        ("figure_number", "Figure Number", ""),
+                        ("owner", "Owner", 0),
+                        ("page_number", "Page Number", ""),
+                        ("parent_id", "Parent ID", 1),
+                        ("priority", "Priority", 1),
+                        ("requirement_code", "Requirement Code", ""),
+                        ("specification", "Specification", ""),
+                        ("requirement_type", "Requirement Type", 0),
+                        ("validated", "Validated?", 0),
+                        ("validated_date", "Validated Date", date.today()),
+                    ],
+                },
+            ),
+        ],
+        "Validation": [
+            (
+                RAMSTKValidationRecord,
+                {
+                    "Validation": [
+                        ("revision_id", "Revision ID", 1),
+                        ("validation_id", "Validation ID", 1),
+                        ("acceptable_maximum", "Acceptable Maximum", 0.0),
+                        ("acceptable_mean", "Acceptable Mean", 0.0),
+                        ("acceptable_minimum", "Acceptable Minimum", 0.0),
+                        ("acceptable_variance", "Acceptable Variance", 0.0),
+                        ("confidence", "s-Confidence", 75.0),
+                        ("cost_average", "Average Task Cost", 0.0),
+                        ("cost_maximum", "Maximum Task Cost", 0.0),
+                        ("cost_minimum", "Minimum Task Cost", 0.0),
+                        ("date_start", "Start Date", date.today()),
+                        ("date_end", "End Date", date.today()),
+                        ("description", "Task Description", ""),
+                        ("measurement_unit", "Unit of Measure", 0),
+                        ("name", "Name", ""),
+                        ("status", "Task Status", 0.0),
+                        ("task_type", "Task Type", 0),
+                        ("task_specification", "Task Specification", ""),
+                        ("time_average", "Average Task Time", 0.0),
+                        ("time_maximum", "Maximum Task Time", 0.0),
+                        ("time_minimum", "Minimum Task Time", 0.0),
+                    ],
+                },
+            ),
+        ],
+    }
+
+    # The pandas read_csv() options for each type of delimited input file.
+    _dic_read_options: Dict[str, Dict[str, Any]] = {
+        "csv": {"sep": ";", "na_values": [""], "parse_dates": True},
+        "text": {"sep": " ", "na_values": [""], "parse_dates": True},
+    }
+
     def __init__(self) -> None:
         """Initialize an ImportProject module instance."""
         # Initialize private dictionary attributes.
@@ -335,12 +710,15 @@ class Import:
         # Initialize private scalar attributes.
         self._dao: BaseDatabase = BaseDatabase()
         self._df_input_data: pd.DataFrame = pd.DataFrame({})
+        self._file_name: str = ""
+        self._file_type: str = ""
 
         # Initialize public dictionary attributes.
 
         # Initialize public list attributes.
 
         # Initialize public scalar attributes.
+        self.chunk_size: int = 5000
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self._do_connect, "succeed_connect_program_database")
@@ -360,49 +738,41 @@ class Import:
     def _do_import(self, module: str) -> None:
         """Insert a new entity to the RAMSTK db with values from external file.
 
+        The IDs and parent IDs in the input file are checked first and nothing is
+        written if any are invalid.  The input file is then read chunk_size rows at
+        a time.  Each chunk is mapped to the RAMSTK database fields one column at a
+        time and the resulting records are written to the database in bulk; with
+        COPY on PostgreSQL databases and with INSERT otherwise.  Nothing is
+        committed until every chunk has been written.
+
         :param module: the name of the RAMSTK module to import.
         :return: None
         :rtype: None
         """
-        _entities = []
-
-        # pylint: disable=unused-variable
-        for __, _row in self._df_input_data.iterrows():
-            if module == "Function":
-                _entity = self._do_insert_function(_row)
-                _entities.append(_entity)
-            elif module == "Hardware":
-                _entity = self._do_insert_hardware(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_allocation(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_similar_item(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_electric(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_mil_hdbk_f(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_mechanic(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_nswc(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_reliability(_row)
-                _entities.append(_entity)
-            elif module == "Requirement":
-                _entity = self._do_insert_requirement(_row)
-                _entities.append(_entity)
-            elif module == "Validation":
-                _entity = self._do_insert_validation(_row)
-                _entities.append(_entity)
-
+        _method_name: str = inspect.currentframe().f_code.co_name  # type: ignore
         try:
-            self._dao.do_insert_many(_entities)  # type: ignore
+            _errors = self._do_validate_keys(module)
+            if _errors:
+                pub.sendMessage(
+                    "fail_import_module",
+                    error_message=(
+                        f"{_method_name}: Found {len(_errors)} key violation(s) in "
+                        f"the {module} import file; no records were imported.\n"
+                        + "\n".join(_errors)
+                    ),
+                )
+                return
+
+            _batches = self._do_make_batches(module)
+            if self._dao.cxnargs["dialect"] == "postgres":
+                self._dao.do_copy_batches(_batches)  # type: ignore
+            else:
+                self._dao.do_insert_batches(_batches)  # type: ignore
             pub.sendMessage(
                 "succeed_import_module",
                 module=module,
             )
         except (AttributeError, DataAccessError):
-            _method_name: str = inspect.currentframe().f_code.co_name  # type: ignore
             _error_msg: str = (
                 f"{_method_name}: There was a problem importing {module} records.  "
                 f"This is usually caused by key violations; check the ID and/or parent "
@@ -413,487 +783,54 @@ class Import:
                 error_message=_error_msg,
             )
 
-    def _do_insert_allocation(self, row: pd.Series) -> RAMSTKAllocationRecord:
-        """Insert a new Allocation record to the RAMSTK database.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _allocation; an instance of the RAMSTKAllocationRecord database
-            table record.
-        :rtype: :class:`ramstk.models.programdb.RAMSTKAllocationRecord`
-        """
-        _allocation = RAMSTKAllocationRecord()
-        _map = self._dic_field_map["Hardware"]
-
-        _allocation.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _allocation.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-        _allocation.parent_id = _get_input_value(_map, row, "Parent Assembly", 1)
-
-        return _allocation
-
-    def _do_insert_design_electric(self, row: pd.Series) -> RAMSTKDesignElectricRecord:
-        """Insert a new Design Electric entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMMSTKDesignElectric`
-        """
-        _design_electric = RAMSTKDesignElectricRecord()
-
-        _map = self._dic_field_map["Hardware"]
-
-        _design_electric.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        _map = self._dic_field_map["Design Electric"]
-        _design_electric.set_attributes(
-            {
-                "application_id": _get_input_value(_map, row, "Application ID", 0),
-                "area": _get_input_value(_map, row, "Area", 0.0),
-                "capacitance": _get_input_value(_map, row, "Capacitance", 0.000001),
-                "configuration_id": _get_input_value(_map, row, "Configuration ID", 0),
-                "construction_id": _get_input_value(_map, row, "Construction ID", 0),
-                "contact_form_id": _get_input_value(_map, row, "Contact Form ID", 0),
-                "contact_gauge": _get_input_value(_map, row, "Contact Gauge", 20),
-                "contact_rating_id": _get_input_value(
-                    _map, row, "Contact Rating ID", 0
-                ),
-                "current_operating": _get_input_value(
-                    _map, row, "Current Operating", 0.0
-                ),
-                "current_rated": _get_input_value(_map, row, "Current Rated", 0.0),
-                "current_ratio": _get_input_value(_map, row, "Current Ratio", 0.0),
-                "environment_active_id": _get_input_value(
-                    _map, row, "Environment Active ID", 0
-                ),
-                "environment_dormant_id": _get_input_value(
-                    _map, row, "Environment Dormant ID", 0
-                ),
-                "family_id": _get_input_value(_map, row, "Family ID", 0),
-                "feature_size": _get_input_value(_map, row, "Feature Size", 1.0),
-                "frequency_operating": _get_input_value(
-                    _map, row, "Frequency Operating", 0.0
-                ),
-                "insert_id": _get_input_value(_map, row, "Insert ID", 0),
-                "insulation_id": _get_input_value(_map, row, "Insulation ID", 0),
-                "manufacturing_id": _get_input_value(_map, row, "Manufacturing ID", 0),
-                "matching_id": _get_input_value(_map, row, "Matching ID", 0),
-                "n_active_pins": _get_input_value(_map, row, "N Active Pins", 0),
-                "n_circuit_planes": _get_input_value(_map, row, "N Circuit Planes", 1),
-                "n_cycles": _get_input_value(_map, row, "N Cycles", 0),
-                "n_elements": _get_input_value(_map, row, "N Elements", 0),
-                "n_hand_soldered": _get_input_value(_map, row, "N Hand Soldered", 0),
-                "n_wave_soldered": _get_input_value(_map, row, "N Wave Soldered", 0),
-                "operating_life": _get_input_value(_map, row, "Operating Life", 0.0),
-                "overstress": _get_input_value(_map, row, "Overstress", 0),
-                "package_id": _get_input_value(_map, row, "Package ID", 0),
-                "power_operating": _get_input_value(_map, row, "Power Operating", 0.0),
-                "power_rated": _get_input_value(_map, row, "Power Rated", 0.0),
-                "power_ratio": _get_input_value(_map, row, "Power Ratio", 0.0),
-                "reason": _get_input_value(_map, row, "Reason", ""),
-                "resistance": _get_input_value(_map, row, "Resistance", 0.0),
-                "specification_id": _get_input_value(_map, row, "Specification ID", 0),
-                "technology_id": _get_input_value(_map, row, "Technology ID", 0),
-                "temperature_active": _get_input_value(
-                    _map, row, "Temperature, Active", 30.0
-                ),
-                "temperature_case": _get_input_value(
-                    _map, row, "Temperature, Case", 0.0
-                ),
-                "temperature_dormant": _get_input_value(
-                    _map, row, "Temperature, Dormant", 25.0
-                ),
-                "temperature_hot_spot": _get_input_value(
-                    _map, row, "Temperature, Hot Spot", 0.0
-                ),
-                "temperature_junction": _get_input_value(
-                    _map, row, "Temperature, Junction", 0.0
-                ),
-                "temperature_knee": _get_input_value(
-                    _map, row, "Temperature, Knee", 25.0
-                ),
-                "temperature_rated_max": _get_input_value(
-                    _map, row, "Temperature, Rated Max", 0.0
-                ),
-                "temperature_rated_min": _get_input_value(
-                    _map, row, "Temperature, Rated Min", 0.0
-                ),
-                "temperature_rise": _get_input_value(
-                    _map, row, "Temperature Rise", 0.0
-                ),
-                "theta_jc": _get_input_value(_map, row, "Theta JC", 0.0),
-                "type_id": _get_input_value(_map, row, "Type ID", 0),
-                "voltage_ac_operating": _get_input_value(
-                    _map, row, "Voltage, AC Operating", 0.0
-                ),
-                "voltage_dc_operating": _get_input_value(
-                    _map, row, "Voltage, DC Operating", 0.0
-                ),
-                "voltage_esd": _get_input_value(_map, row, "Voltage ESD", 0.0),
-                "voltage_rated": _get_input_value(_map, row, "Voltage, Rated", 0.0),
-                "voltage_ratio": _get_input_value(_map, row, "Voltage Ratio", 0.0),
-                "weight": _get_input_value(_map, row, "Weight", 1.0),
-                "years_in_production": _get_input_value(
-                    _map, row, "Years in Production", 2
-                ),
-            }
-        )
-
-        return _design_electric
-
-    def _do_insert_design_mechanic(self, row: pd.Series) -> RAMSTKDesignMechanicRecord:
-        """Insert a new Design Mechanic entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMMSTKDesignMechanic`
-        """
-        _design_mechanic = RAMSTKDesignMechanicRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _design_mechanic.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        _map = self._dic_field_map["Design Mechanic"]
-        _design_mechanic.set_attributes(
-            {
-                "altitude_operating": _get_input_value(
-                    _map, row, "Altitude, Operating", 0.0
-                ),
-                "application_id": _get_input_value(_map, row, "Application ID", 0),
-                "balance_id": _get_input_value(_map, row, "Balance ID", 0),
-                "clearance": _get_input_value(_map, row, "Clearance", 0.0),
-                "casing_id": _get_input_value(_map, row, "Casing ID", 0),
-                "contact_pressure": _get_input_value(
-                    _map, row, "Contact Pressure", 0.0
-                ),
-                "deflection": _get_input_value(_map, row, "Deflection", 0.0),
-                "diameter_coil": _get_input_value(_map, row, "Diameter, Coil", 0.0),
-                "diameter_inner": _get_input_value(_map, row, "Diameter, Inner", 0.0),
-                "diameter_outer": _get_input_value(_map, row, "Diameter, Outer", 0.0),
-                "diameter_wire": _get_input_value(_map, row, "Diameter, Wire", 0.0),
-                "filter_size": _get_input_value(_map, row, "Filter Size", 0.0),
-                "flow_design": _get_input_value(_map, row, "Flow, Design", 0.0),
-                "flow_operating": _get_input_value(_map, row, "Flow, Operating", 0.0),
-                "frequency_operating": _get_input_value(
-                    _map, row, "Frequency, Operating", 0.0
-                ),
-                "friction": _get_input_value(_map, row, "Friction", 0.0),
-                "impact_id": _get_input_value(_map, row, "Impact ID", 0),
-                "leakage_allowable": _get_input_value(
-                    _map, row, "Allowable Leakage", 0.0
-                ),
-                "length": _get_input_value(_map, row, "Length", 0.0),
-                "length_compressed": _get_input_value(
-                    _map, row, "Length, Compressed", 0.0
-                ),
-                "length_relaxed": _get_input_value(_map, row, "Length, Relaxed", 0.0),
-                "load_design": _get_input_value(_map, row, "Design Load", 0.0),
-                "load_id": _get_input_value(_map, row, "Load ID", 0),
-                "load_operating": _get_input_value(_map, row, "Operating Load", 0.0),
-                "lubrication_id": _get_input_value(_map, row, "Lubrication ID", 0),
-                "manufacturing_id": _get_input_value(_map, row, "Manufacturing ID", 0),
-                "material_id": _get_input_value(_map, row, "Material ID", 0),
-                "meyer_hardness": _get_input_value(_map, row, "Meyer Hardness", 0.0),
-                "misalignment_angle": _get_input_value(
-                    _map, row, "Misalignment Angle", 0.0
-                ),
-                "n_ten": _get_input_value(_map, row, "N Ten", 0),
-                "n_cycles": _get_input_value(_map, row, "N Cycles", 0.0),
-                "n_elements": _get_input_value(_map, row, "N Elements", 0),
-                "offset": _get_input_value(_map, row, "Offset", 0.0),
-                "particle_size": _get_input_value(_map, row, "Particle Size", 0.0),
-                "pressure_contact": _get_input_value(
-                    _map, row, "Contact Pressure", 0.0
-                ),
-                "pressure_delta": _get_input_value(
-                    _map, row, "Differential Pressure", 0.0
-                ),
-                "pressure_downstream": _get_input_value(
-                    _map, row, "Downstream Pressure", 0.0
-                ),
-                "pressure_rated": _get_input_value(_map, row, "Rated Pressure", 0.0),
-                "pressure_upstream": _get_input_value(
-                    _map, row, "Upstream Pressure", 0.0
-                ),
-                "rpm_design": _get_input_value(_map, row, "Design RPM", 0.0),
-                "rpm_operating": _get_input_value(_map, row, "Operating RPM", 0.0),
-                "service_id": _get_input_value(_map, row, "Service ID", 0),
-                "spring_index": _get_input_value(_map, row, "Spring Index", 0),
-                "surface_finish": _get_input_value(_map, row, "Surface Finish", 0.0),
-                "technology_id": _get_input_value(_map, row, "Technology ID", 0),
-                "thickness": _get_input_value(_map, row, "Thickness", 0.0),
-                "torque_id": _get_input_value(_map, row, "Torque ID", 0),
-                "type_id": _get_input_value(_map, row, "Type ID", 0),
-                "viscosity_design": _get_input_value(
-                    _map, row, "Design Viscosity", 0.0
-                ),
-                "viscosity_dynamic": _get_input_value(
-                    _map, row, "Dynamic Viscosity", 0.0
-                ),
-                "water_per_cent": _get_input_value(_map, row, "% Water", 0.0),
-                "width_minimum": _get_input_value(_map, row, "Minimum Width", 0.0),
-            }
-        )
-
-        return _design_mechanic
-
-    def _do_insert_function(self, row: pd.Series) -> RAMSTKFunctionRecord:
-        """Insert a new Function entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramskfunction.RAMSTKFunction`
-        """
-        _function = RAMSTKFunctionRecord()
-        _map = self._dic_field_map["Function"]
-
-        _function.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _function.function_id = _get_input_value(_map, row, "Function ID", 1)
-        _function.function_code = _get_input_value(_map, row, "Function Code", "")
-        _function.level = _get_input_value(_map, row, "Level", 0)
-        _function.name = _get_input_value(_map, row, "Function Name", "")
-        _function.parent_id = _get_input_value(_map, row, "Parent", 1)
-        _function.remarks = _get_input_value(_map, row, "Remarks", "")
-        _function.safety_critical = _get_input_value(_map, row, "Safety Critical", 0)
-        _function.type_id = _get_input_value(_map, row, "Type", "")
-
-        return _function
-
-    def _do_insert_hardware(self, row: pd.Series) -> RAMSTKHardwareRecord:
-        """Insert a new Hardware entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramstkhardware.RAMSTKHardware`
-        """
-        _hardware = RAMSTKHardwareRecord()
-        _map = self._dic_field_map["Hardware"]
-
-        _hardware.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _hardware.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-        _hardware.alt_part_number = _get_input_value(
-            _map, row, "Alternate Part Number", ""
-        )
-        _hardware.cage_code = _get_input_value(_map, row, "CAGE Code", "")
-        _hardware.category_id = _get_input_value(_map, row, "Category ID", 0)
-        _hardware.comp_ref_des = _get_input_value(_map, row, "Composite Ref. Des.", "")
-        _hardware.cost = _get_input_value(_map, row, "Cost", 0.0)
-        _hardware.cost_type_id = _get_input_value(_map, row, "Cost Type", 0)
-        _hardware.description = _get_input_value(_map, row, "Description", "")
-        _hardware.duty_cycle = _get_input_value(_map, row, "Duty Cycle", 100.0)
-        _hardware.figure_number = _get_input_value(_map, row, "Figure Number", "")
-        _hardware.lcn = _get_input_value(_map, row, "LCN", "")
-        _hardware.level = _get_input_value(_map, row, "Level", 0)
-        _hardware.manufacturer_id = _get_input_value(_map, row, "Manufacturer", 0)
-        _hardware.mission_time = _get_input_value(_map, row, "Mission Time", 24.0)
-        _hardware.name = _get_input_value(_map, row, "Name", "")
-        _hardware.nsn = _get_input_value(_map, row, "NSN", "")
-        _hardware.page_number = _get_input_value(_map, row, "Page Number", "")
-        _hardware.parent_id = _get_input_value(_map, row, "Parent Assembly", 1)
-        _hardware.part = _get_input_value(_map, row, "Part", 0)
-        _hardware.part_number = _get_input_value(_map, row, "Part Number", "")
-        _hardware.quantity = _get_input_value(_map, row, "Quantity", 1)
-        _hardware.ref_des = _get_input_value(_map, row, "Reference Designator", "")
-        _hardware.remarks = _get_input_value(_map, row, "Remarks", "")
-        _hardware.repairable = _get_input_value(_map, row, "Repairable", 1)
-        _hardware.specification_number = _get_input_value(
-            _map, row, "Specification", ""
-        )
-        _hardware.subcategory_id = _get_input_value(_map, row, "Subcategory ID", 0)
-        _hardware.tagged_part = _get_input_value(_map, row, "Tagged Part", 0)
-        _hardware.year_of_manufacture = _get_input_value(
-            _map, row, "Year of Manufacture", 1900
-        )
-
-        return _hardware
+    def _do_make_batches(
+        self, module: str
+    ) -> Iterator[List[Tuple[Any, List[Dict[str, Any]]]]]:
+        """Map each chunk of the input file to a batch of records.
 
-    def _do_insert_mil_hdbk_f(self, row: pd.Series) -> RAMSTKMilHdbk217FRecord:
-        """Insert a new MIL-HDBK-217F entity to the RAMSTK db.
+        A batch is a list of (record class, record attributes) pairs, one pair for
+        each type of record created for the module.  The number of rows imported so
+        far is broadcast after the database has consumed each batch.
 
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKMilHdbkF`
-        """
-        _mil_hdbk_f = RAMSTKMilHdbk217FRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _mil_hdbk_f.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        return _mil_hdbk_f
-
-    def _do_insert_nswc(self, row: pd.Series) -> RAMSTKNSWCRecord:
-        """Insert a new NSWC entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.nswc.RAMSTKNSWCRecord`
-        """
-        _nswc = RAMSTKNSWCRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _nswc.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        return _nswc
-
-    def _do_insert_reliability(self, row: pd.Series) -> RAMSTKReliabilityRecord:
-        """Insert a new Reliability entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKReliability`
-        """
-        _reliability = RAMSTKReliabilityRecord()
-
-        _map = self._dic_field_map["Hardware"]
-        _reliability.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-
-        _map = self._dic_field_map["Reliability"]
-        _reliability.add_adj_factor = _get_input_value(
-            _map, row, "Additive Adjustment Factor", 0.0
-        )
-        _reliability.failure_distribution_id = _get_input_value(
-            _map, row, "Failure Distribution ID", 0
-        )
-        _reliability.hazard_rate_method_id = _get_input_value(
-            _map, row, "Failure Rate Method ID", 0
-        )
-        _reliability.hazard_rate_model = _get_input_value(
-            _map, row, "Failure Rate Model", ""
-        )
-        _reliability.hazard_rate_specified = _get_input_value(
-            _map, row, "Specified Failure Rate", 0.0
-        )
-        _reliability.hazard_rate_type_id = _get_input_value(
-            _map, row, "Failure Rate Type ID", 0
-        )
-        _reliability.location_parameter = _get_input_value(
-            _map, row, "Location Parameter", 0.0
-        )
-        _reliability.mtbf_specified = _get_input_value(_map, row, "Specified MTBF", 0.0)
-        _reliability.mult_adj_factor = _get_input_value(
-            _map, row, "Multiplicative Adjustment Factor", 1.0
-        )
-        _reliability.quality_id = _get_input_value(_map, row, "Quality ID", 0)
-        _reliability.reliability_goal = _get_input_value(
-            _map, row, "Reliability Goal", 100.0
-        )
-        _reliability.reliability_goal_measure_id = _get_input_value(
-            _map, row, "Reliability Goal Measure ID", 0
-        )
-        _reliability.scale_parameter = _get_input_value(
-            _map, row, "Scale Parameter", 0.0
-        )
-        _reliability.shape_parameter = _get_input_value(
-            _map, row, "Shape Parameter", 0.0
-        )
-        _reliability.survival_analysis_id = _get_input_value(
-            _map, row, "Survival Analysis ID", 0
-        )
-
-        return _reliability
-
-    def _do_insert_requirement(self, row: pd.Series) -> RAMSTKRequirementRecord:
-        """Insert a new Requirement entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKRequirement`
-        """
-        _requirement = RAMSTKRequirementRecord()
-        _map = self._dic_field_map["Requirement"]
-
-        _requirement.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _requirement.requirement_id = _get_input_value(_map, row, "Requirement ID", 1)
-        _requirement.derived = _get_input_value(_map, row, "Derived?", 0)
-        _requirement.description = _get_input_value(_map, row, "Requirement", "")
-        _requirement.figure_number = _get_input_value(_map, row, "Figure Number", "")
-        _requirement.owner = _get_input_value(_map, row, "Owner", "")
-        _requirement.page_number = _get_input_value(_map, row, "Page Number", "")
-        _requirement.parent_id = _get_input_value(_map, row, "Parent ID", 1)
-        _requirement.priority = _get_input_value(_map, row, "Priority", 1)
-        _requirement.requirement_code = _get_input_value(
-            _map, row, "Requirement Code", ""
-        )
-        _requirement.specification = _get_input_value(_map, row, "Specification", "")
-        _requirement.requirement_type = _get_input_value(
-            _map, row, "Requirement Type", ""
-        )
-        _requirement.validated = _get_input_value(_map, row, "Validated?", 0)
-        _requirement.validated_date = _get_input_value(
-            _map, row, "Validated Date", date.today()
-        )
-
-        return _requirement
-
-    def _do_insert_similar_item(self, row: pd.Series) -> RAMSTKSimilarItemRecord:
-        """Insert a new Similar Item record to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _similar_item; an instance of the RAMSTKSimilarItem database
-            table record.
-        :rtype: :class:`ramstk.models.programdb.RAMSTKSimilarItem`
+        :param module: the name of the RAMSTK module to import.
+        :return: a generator of record batches, one batch per chunk of input data.
+        :rtype: generator
         """
-        _similar_item = RAMSTKSimilarItemRecord()
-        _map = self._dic_field_map["Hardware"]
-
-        _similar_item.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _similar_item.hardware_id = _get_input_value(_map, row, "Hardware ID", 1)
-        _similar_item.parent_id = _get_input_value(_map, row, "Parent Assembly", 1)
-
-        return _similar_item
-
-    def _do_insert_validation(self, row: pd.Series) -> RAMSTKValidationRecord:
-        """Insert a new Validation entity to the RAMSTK db.
+        _n_rows = 0
+        for _chunk in self._do_read_chunks():
+            yield [
+                (_record, self._do_map_chunk(_chunk, _fields))
+                for _record, _fields in self._dic_import_records.get(module, [])
+            ]
+            _n_rows += len(_chunk)
+            pub.sendMessage(
+                "succeed_import_chunk",
+                module=module,
+                n_rows=_n_rows,
+            )
 
-        :param row: the row from the pandas DataFrame containing the input data.
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKValidation.RAMSTKValidation`
+    def _do_map_chunk(
+        self,
+        chunk: pd.DataFrame,
+        fields: Dict[str, List[Tuple[str, str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Map a chunk of input data to the attributes of one type of record.
+
+        :param chunk: the chunk of input data to map.
+        :param fields: the (attribute, format field, default) tuples for each field
+            map used by the record.
+        :return: the list of attribute dicts, one for each row in the chunk.
+        :rtype: list
         """
-        _validation = RAMSTKValidationRecord()
-        _map = self._dic_field_map["Validation"]
+        _attributes = []
+        _columns = []
+        for _module, _fields in fields.items():
+            _map = self._dic_field_map[_module]
+            for _attribute, _field, _default in _fields:
+                _attributes.append(_attribute)
+                _columns.append(_get_input_column(_map, chunk, _field, _default))
 
-        _validation.revision_id = _get_input_value(_map, row, "Revision ID", 1)
-        _validation.validation_id = _get_input_value(_map, row, "Validation ID", 1)
-        _validation.acceptable_maximum = _get_input_value(
-            _map, row, "Acceptable Maximum", 0.0
-        )
-        _validation.acceptable_mean = _get_input_value(
-            _map, row, "Acceptable Mean", 0.0
-        )
-        _validation.acceptable_minimum = _get_input_value(
-            _map, row, "Acceptable Minimum", 0.0
-        )
-        _validation.acceptable_variance = _get_input_value(
-            _map, row, "Acceptable Variance", 0.0
-        )
-        _validation.confidence = _get_input_value(_map, row, "s-Confidence", 75.0)
-        _validation.cost_average = _get_input_value(_map, row, "Average Task Cost", 0.0)
-        _validation.cost_maximum = _get_input_value(_map, row, "Maximum Task Cost", 0.0)
-        _validation.cost_minimum = _get_input_value(_map, row, "Minimum Task Cost", 0.0)
-        _validation.date_start = _get_input_value(_map, row, "Start Date", date.today())
-        _validation.date_end = _get_input_value(_map, row, "End Date", date.today())
-        _validation.description = _get_input_value(_map, row, "Task Description", "")
-        _validation.measurement_unit = _get_input_value(
-            _map, row, "Unit of Measure", ""
-        )
-        _validation.name = _get_input_value(_map, row, "Name", "")
-        _validation.status = _get_input_value(_map, row, "Task Status", 0.0)
-        _validation.task_type = _get_input_value(_map, row, "Task Type", "")
-        _validation.task_specification = _get_input_value(
-            _map, row, "Task Specification", ""
-        )
-        _validation.time_average = _get_input_value(_map, row, "Average Task Time", 0.0)
-        _validation.time_maximum = _get_input_value(_map, row, "Maximum Task Time", 0.0)
-        _validation.time_minimum = _get_input_value(_map, row, "Minimum Task Time", 0.0)
-
-        return _validation
+        return [dict(zip(_attributes, _values)) for _values in zip(*_columns)]
 
     def _do_map_to_field(
         self, module: str, import_field: str, format_field: str
@@ -909,6 +846,39 @@ class Import:
         """
         self._dic_field_map[module][format_field] = import_field
 
+    def _do_read_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the input file chunk_size rows at a time.
+
+        Excel workbooks can't be read in pieces, so the worksheet is read once and
+        then sliced into chunks.  The input data that has already been read is used
+        when there is no input file.
+
+        :return: a generator of pandas DataFrame() chunks.
+        :rtype: generator
+        """
+        if self._file_type in ["csv", "text"]:
+            yield from pd.read_csv(
+                self._file_name,
+                chunksize=self.chunk_size,
+                **self._dic_read_options[self._file_type],
+            )
+            return
+
+        if self._file_type == "parquet":
+            for _batch in pq.ParquetFile(self._file_name).iter_batches(
+                batch_size=self.chunk_size
+            ):
+                yield _batch.to_pandas()
+            return
+
+        if self._file_type == "excel":
+            _data = pd.read_excel(self._file_name)
+        else:
+            _data = self._df_input_data
+
+        for _start in range(0, len(_data), self.chunk_size):
+            yield _data.iloc[_start : _start + self.chunk_size]
+
     def _do_read_db_fields(self, module: str) -> None:
         """Return the database field names in a list.
 
@@ -924,29 +894,123 @@ class Import:
         )
 
     def _do_read_file(self, file_type: str, file_name: str) -> None:
-        """Read contents of input file into a pandas DataFrame().
+        """Read the first chunk of the input file into a pandas DataFrame().
+
+        Only the first chunk_size rows are read here; they're enough to map the
+        input file columns to the RAMSTK fields.  The entire file is read, one
+        chunk at a time, when it's imported.
 
         :param file_type: the type of file to import from.  Supported files
             types are:
                 - CSV (using a semi-colon (;) delimiter)
+                - Text (using a space delimiter)
                 - Excel
+                - Parquet (requires the optional pyarrow package)
         :param file_name: the name, with full path, of the file to export
             the RAMSTK Program database data to.
         :return: None
         :rtype: None
         """
-        if file_type == "csv":
-            self._df_input_data = pd.read_csv(
-                file_name, sep=";", na_values=[""], parse_dates=True
-            )
-        elif file_type == "text":
+        if file_type in self._dic_read_options:
             self._df_input_data = pd.read_csv(
-                file_name, sep=" ", na_values=[""], parse_dates=True
+                file_name,
+                nrows=self.chunk_size,
+                **self._dic_read_options[file_type],
             )
         elif file_type == "excel":
-            self._df_input_data = pd.read_excel(file_name)
+            self._df_input_data = pd.read_excel(file_name, nrows=self.chunk_size)
+        elif file_type == "parquet" and pq is None:
+            pub.sendMessage(
+                "do_log_error_msg",
+                logger_name="ERROR",
+                message=(
+                    "_do_read_file: Importing Parquet files requires the pyarrow "
+                    "package."
+                ),
+            )
+            return
+        elif file_type == "parquet":
+            _parquet_file = pq.ParquetFile(file_name)
+            self._df_input_data = next(
+                _parquet_file.iter_batches(batch_size=self.chunk_size),
+                _parquet_file.schema_arrow.empty_table(),
+            ).to_pandas()
+
+        if file_type in ["csv", "excel", "parquet", "text"]:
+            self._file_name = file_name
+            self._file_type = file_type
 
         pub.sendMessage(
             "succeed_read_import_file",
             import_fields=list(self._df_input_data.axes[1].tolist()[1:]),
         )
+
+    def _do_validate_keys(self, module: str) -> List[str]:
+        """Check the ID and parent ID in every row of the input file.
+
+        The IDs are checked against each other and against the IDs already in every
+        table the module's records are written to; the parent IDs are checked against
+        the IDs in the import file and the module's own table.  A parent ID
+        of zero is always valid; it's used for top-level records.  Only the ID and
+        parent ID of each row are kept in memory and every check is a set lookup, so
+        the entire input file is checked in a single pass.
+
+        :param module: the name of the RAMSTK module to import.
+        :return: the list of problems found, one for each problem with each row.
+            Rows are numbered as in a spreadsheet, with the header in row 1.
+        :rtype: list
+        """
+        if module not in self._dic_import_keys:
+            return []
+
+        _record, _fields = self._dic_import_records[module][0]
+        _map = self._dic_field_map[module]
+        _spec = {
+            _attribute: (_field, _default)
+            for _attribute, _field, _default in _fields[module]
+        }
+        _id_attribute, _parent_attribute = self._dic_import_keys[module]
+        _id_field, _id_default = _spec[_id_attribute]
+        _parent_field, _parent_default = _spec.get(_parent_attribute, ("", 0))
+
+        _ids: List[Any] = []
+        _parent_ids: List[Any] = []
+        for _chunk in self._do_read_chunks():
+            _ids.extend(_get_input_column(_map, _chunk, _id_field, _id_default))
+            _parent_ids.extend(
+                _get_input_column(_map, _chunk, _parent_field, _parent_default)
+            )
+
+        # An ID clashes if it's already used in any of the tables the module's
+        # records are written to, but parents must be in the first table.
+        _known_ids = set(
+            self._dao.do_execute_query(select(getattr(_record, _id_attribute)))
+        )
+        _existing_ids = _known_ids.union(
+            *(
+                self._dao.do_execute_query(select(getattr(_table, _id_attribute)))
+                for _table, __ in self._dic_import_records[module][1:]
+            )
+        )
+        _known_ids.update(_ids, [0])
+
+        _seen_ids: Set[Any] = set()
+        _errors = []
+        for _row, (_id, _parent_id) in enumerate(zip(_ids, _parent_ids), start=2):
+            if _id in _seen_ids:
+                _errors.append(
+                    f"Row {_row}: {_id_field} {_id} is used more than once in the "
+                    f"import file."
+                )
+            elif _id in _existing_ids:
+                _errors.append(
+                    f"Row {_row}: {_id_field} {_id} already exists in the database."
+                )
+            if _parent_id not in _known_ids:
+                _errors.append(
+                    f"Row {_row}: {_parent_field} {_parent_id} is not a {_id_field} "
+                    f"in the import file or the database."
+                )
+            _seen_ids.add(_id)
+
+        return _errors
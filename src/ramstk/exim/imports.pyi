@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Tuple
 
 # Third Party Imports
 import pandas as pd
@@ -27,31 +27,35 @@ def _do_replace_nan(value: Any, default: Any) -> Any: ...
 def _get_input_value(
     mapper: Dict[str, Any], df_row: pd.Series, field: str, default: Any
 ) -> Any: ...
+def _get_input_column(
+    mapper: Dict[str, Any], df_chunk: pd.DataFrame, field: str, default: Any
+) -> List[Any]: ...
 
 class Import:
     _dic_field_map: Any
+    _dic_import_keys: Dict[str, Tuple[str, str]]
+    _dic_import_records: Dict[
+        str, List[Tuple[Any, Dict[str, List[Tuple[str, str, Any]]]]]
+    ]
+    _dic_read_options: Dict[str, Dict[str, Any]]
     _dao: Any
     _df_input_data: Any
+    _file_name: str
+    _file_type: str
+    chunk_size: int
     def __init__(self) -> None: ...
     def _do_connect(self, dao: BaseDatabase) -> None: ...
     def _do_import(self, module: str) -> None: ...
-    def _do_insert_allocation(self, row: pd.Series) -> RAMSTKAllocationRecord: ...
-    def _do_insert_design_electric(
-        self, row: pd.Series
-    ) -> RAMSTKDesignElectricRecord: ...
-    def _do_insert_design_mechanic(
-        self, row: pd.Series
-    ) -> RAMSTKDesignMechanicRecord: ...
-    def _do_insert_function(self, row: pd.Series) -> RAMSTKFunctionRecord: ...
-    def _do_insert_hardware(self, row: pd.Series) -> RAMSTKHardwareRecord: ...
-    def _do_insert_mil_hdbk_f(self, row: pd.Series) -> RAMSTKMilHdbk217FRecord: ...
-    def _do_insert_nswc(self, row: pd.Series) -> RAMSTKNSWCRecord: ...
-    def _do_insert_reliability(self, row: pd.Series) -> RAMSTKReliabilityRecord: ...
-    def _do_insert_requirement(self, row: pd.Series) -> RAMSTKRequirementRecord: ...
-    def _do_insert_similar_item(self, row: pd.Series) -> RAMSTKSimilarItemRecord: ...
-    def _do_insert_validation(self, row: pd.Series) -> RAMSTKValidationRecord: ...
+    def _do_make_batches(
+        self, module: str
+    ) -> Iterator[List[Tuple[Any, List[Dict[str, Any]]]]]: ...
+    def _do_map_chunk(
+        self, chunk: pd.DataFrame, fields: Dict[str, List[Tuple[str, str, Any]]]
+    ) -> List[Dict[str, Any]]: ...
     def _do_map_to_field(
         self, module: str, import_field: str, format_field: str
     ) -> None: ...
+    def _do_read_chunks(self) -> Iterator[pd.DataFrame]: ...
     def _do_read_db_fields(self, module: str) -> None: ...
     def _do_read_file(self, file_type: str, file_name: str) -> None: ...
+    def _do_validate_keys(self, module: str) -> List[str]: ...
@@ -8,15 +8,18 @@
 
 # Standard Library Imports
 import contextlib
+import io
+import os
 import sqlite3
-from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
 
 # Third Party Imports
 import psycopg2  # type: ignore
 from psycopg2 import sql  # type: ignore
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from pubsub import pub
-from sqlalchemy import Row, create_engine, exc
+from sqlalchemy import Row, create_engine, exc, insert
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.engine import Engine  # type: ignore
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import query, scoped_session, sessionmaker  # type: ignore
@@ -132,6 +135,30 @@ def do_open_session(database: str) -> Tuple[Engine, scoped_session]:
     )
 
 
+def _get_copy_line(values: Iterable[Any]) -> str:
+    """Format a row of values as a line of PostgreSQL COPY text format.
+
+    :param values: the values in the row.
+    :return: the tab-delimited, newline-terminated line for the row.
+    :rtype: str
+    """
+    return (
+        "\t".join(
+            (
+                "\\N"
+                if _value is None
+                else str(_value)
+                .replace("\\", "\\\\")
+                .replace("\t", "\\t")
+                .replace("\n", "\\n")
+                .replace("\r", "\\r")
+            )
+            for _value in values
+        )
+        + "\n"
+    )
+
+
 # noinspection PyUnresolvedReferences
 class BaseDatabase:
     """The Base Database model."""
@@ -143,6 +170,8 @@ class BaseDatabase:
     _system_databases = ["postgres", "template0", "template1"]
 
     # Define private class scalar attributes.
+    # The number of IDs reserved from a PostgreSQL ID sequence at a time.
+    _id_block_size = 100
 
     # Define public class dict attributes.
 
@@ -158,6 +187,11 @@ class BaseDatabase:
     def __init__(self) -> None:
         """Initialize an instance of the Base database model."""
         # Initialize private dictionary instance attributes.
+        # The last ID of the block reserved from the PostgreSQL ID sequence for each
+        # (table, ID column).
+        self._dic_id_blocks: Dict[Tuple[str, str], int] = {}
+        # The last ID handed out for each (table, ID column) by the ID allocator.
+        self._dic_last_ids: Dict[Tuple[str, str], int] = {}
 
         # Initialize private list instance attributes.
 
@@ -281,11 +315,67 @@ class BaseDatabase:
 
             # Attempt to open the session using the constructed database connection
             self.engine, self.session = self.get_database_session(self.cxnargs)
+            self._dic_id_blocks.clear()
+            self._dic_last_ids.clear()
 
         except OperationalError as _error:
             _context_msg = f"{str(_error.orig).capitalize()}: {self.cxnargs}"
             self.do_handle_db_error(_error, _context_msg)
 
+    def do_copy_batches(
+        self, batches: Iterable[List[Tuple[Any, List[Dict[str, Any]]]]]
+    ) -> None:
+        """Add batches of new records to a PostgreSQL database with COPY.
+
+        Each batch is a list of (record class, record attributes) pairs, the same
+        as do_insert_batches().  The rows for each table are streamed to the server
+        with a single COPY statement per batch, which is much faster than INSERT
+        statements for large batches.  The first record class in each batch is
+        copied straight into its table.  The others are copied into a temporary
+        staging table and then inserted from there, updating any rows that already
+        exist; these are the rows the database's insert triggers create for the
+        first table (e.g., the ramstk_reliability row for each new ramstk_hardware
+        row).  Once every batch has been written, the ID sequences for the tables are
+        moved past the largest ID copied.  Nothing is committed until every batch
+        has been written.  If the database rejects any row, the entire transaction
+        is rolled back.
+
+        :param batches: the iterable of record batches to add to the RAMSTK
+            database.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if any batch could not be added.
+        """
+        _n_batches = 0
+        _tables: Dict[str, List[str]] = {}
+        try:
+            _cursor = self.session.connection().connection.cursor()
+            for _n_batches, _batch in enumerate(batches, start=1):
+                for _index, (_record, _attributes) in enumerate(_batch):
+                    if _attributes:
+                        self._do_copy_rows(_cursor, _record, _attributes, _index > 0)
+                        _tables[_record.__tablename__] = [
+                            _column.name
+                            for _column in _record.__table__.primary_key.columns
+                        ]
+            self._do_fix_id_sequences(_cursor, _tables)
+            self.session.commit()
+        except psycopg2.Error as _error:
+            _context_message = (
+                f"Database error while copying record batch {_n_batches}; no records "
+                f"were added. Error details"
+            )
+            self.do_handle_db_error(_error, _context_message)
+        except Exception:
+            with contextlib.suppress(AttributeError):
+                self.session.rollback()
+            raise
+
+        for _table, _columns in _tables.items():
+            for _column in _columns:
+                self._dic_id_blocks.pop((_table, _column), None)
+                self._dic_last_ids.pop((_table, _column), None)
+
     def do_create_database(
         self,
         database: Dict[str, str],
@@ -351,6 +441,8 @@ class BaseDatabase:
         # noinspection PyTypeChecker
         self.session = None  # type: ignore
         self.database = ""
+        self._dic_id_blocks.clear()
+        self._dic_last_ids.clear()
 
     def do_execute_query(
         self, query_: str, session: scoped_session = None
@@ -415,15 +507,140 @@ class BaseDatabase:
                 _context_message,
             )
 
-    def do_insert_many(self, records: List[object]) -> None:
-        """Add a group of new records to a database table.
+    def do_insert_batches(
+        self, batches: Iterable[List[Tuple[Any, List[Dict[str, Any]]]]]
+    ) -> None:
+        """Add batches of new records to the database in a single transaction.
+
+        Each batch is a list of (record class, record attributes) pairs.  The
+        attributes for each record class are written with a single bulk INSERT
+        statement so no record objects are created.  Batches are consumed one at a
+        time, so batches produced by a generator never have to all be in memory at
+        once.  Nothing is committed until every batch has been written.  If the
+        database rejects any record, the entire transaction is rolled back.
+
+        :param batches: the iterable of record batches to add to the RAMSTK
+            database.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if any batch could not be added.
+        """
+        _n_batches = 0
+        try:
+            for _n_batches, _batch in enumerate(batches, start=1):
+                for _record, _attributes in _batch:
+                    if _attributes:
+                        self.session.execute(insert(_record), _attributes)
+            self.session.commit()
+        except (
+            exc.DataError,
+            exc.IntegrityError,
+            exc.InternalError,
+            exc.StatementError,
+        ) as _error:
+            _context_message = (
+                f"Database error while adding record batch {_n_batches}; no records "
+                f"were added. Error details"
+            )
+            self.do_handle_db_error(getattr(_error, "orig", _error), _context_message)
+        except Exception:
+            with contextlib.suppress(AttributeError):
+                self.session.rollback()
+            raise
+
+    def do_insert_many(self, records: List[object], chunk_size: int = 0) -> None:
+        """Add a group of new records to the database in a single transaction.
+
+        The records are added to the session and flushed chunk_size records at a
+        time so SQLAlchemy can batch the INSERT statements for each table.  Nothing
+        is committed until every chunk has been flushed.  If the database rejects any
+        record, the entire transaction is rolled back and the error message
+        identifies the offending record.
 
         :param list records: the list of objects to add to the RAMSTK database.
+        :param chunk_size: the number of records to flush at a time.  The default
+            of zero flushes all the records at once.
         :return: None
         :rtype: None
+        :raise: DataAccessError if any record could not be added.
         """
-        for _record in records:
-            self.do_insert(_record)
+        _chunk_size = chunk_size if chunk_size > 0 else max(len(records), 1)
+
+        try:
+            for _start in range(0, len(records), _chunk_size):
+                self.session.add_all(records[_start : _start + _chunk_size])
+                self.session.flush()
+            self.session.commit()
+        except (
+            FlushError,
+            exc.DataError,
+            exc.IntegrityError,
+            exc.InternalError,
+            exc.StatementError,
+        ) as _error:
+            self.session.rollback()
+            _context_message = (
+                f"Database error while adding {len(records)} records; no records "
+                f"were added. Error details"
+            )
+            self.do_handle_db_error(
+                self._do_find_bad_record(records) or getattr(_error, "orig", _error),
+                _context_message,
+            )
+
+    def do_release_ids(
+        self, table: str, id_column: str, last_id: int, count: int = 1
+    ) -> None:
+        """Return an unused block of IDs to the ID allocator.
+
+        The block is only returned if no IDs have been reserved for the table since
+        it was reserved; otherwise the IDs are simply never used.
+
+        :param table: the name of the table the IDs were reserved in.
+        :param id_column: the name of the ID column the IDs were reserved for.
+        :param last_id: the value do_reserve_ids() returned for the block.
+        :param count: the number of IDs in the block.
+        :return: None
+        :rtype: None
+        """
+        _key = (table, self._get_id_column_name(id_column))
+        if self._dic_last_ids.get(_key) == last_id + count:
+            self._dic_last_ids[_key] = last_id
+
+    def do_reserve_ids(self, table: str, id_column: str, count: int = 1) -> int:
+        """Reserve a block of IDs for new records in a table.
+
+        IDs are handed out by an in-process allocator seeded from the database the
+        first time a table is used after connecting, so reserving IDs does not
+        query the table.  On PostgreSQL the allocator hands out IDs from a block
+        reserved from the table's ID sequence and only goes back to the server
+        when the block is used up, so other clients writing to the same database
+        are never given the same IDs.
+
+        :param table: the name of the table to reserve the IDs in.
+        :param id_column: the name of the ID column to reserve the IDs for.
+        :param count: the number of IDs to reserve.
+        :return: the last ID in use before the block; the reserved IDs are this
+            value + 1 through this value + count.
+        :rtype: int
+        :raise: DataAccessError if the IDs could not be reserved.
+        """
+        _key = (table, self._get_id_column_name(id_column))
+        _last_id = self.get_last_allocated_id(table, id_column)
+
+        if (
+            self.cxnargs["dialect"] == "postgres"
+            and _last_id + count > self._dic_id_blocks.get(_key, 0)
+        ):
+            _block_size = max(count, self._id_block_size)
+            _last_id = self._do_reserve_postgres_ids(
+                table, _key[1], _last_id, _block_size
+            )
+            self._dic_id_blocks[_key] = _last_id + _block_size
+
+        self._dic_last_ids[_key] = _last_id + count
+
+        return _last_id
 
     def do_select_all(self, table, **kwargs) -> query.Query:
         """Select all records from the RAMSTK database for table.
@@ -487,6 +704,66 @@ class BaseDatabase:
                 _context_message,
             )
 
+    def do_update_dirty(self) -> Dict[str, int]:
+        """Write every record with pending changes to the database in one commit.
+
+        SQLAlchemy's unit of work only issues UPDATE statements for records whose
+        attribute values actually changed, so the cost of the commit scales with the
+        number of edits rather than the number of records loaded in the session.
+
+        :return: the number of changed records written to each database table.
+        :rtype: dict
+        :raise: DataAccessError if the pending changes could not be committed.
+        """
+        _changed: Dict[str, int] = {}
+        for _record in self.session.dirty:
+            if self.session.is_modified(_record):
+                _table = getattr(_record, "__tablename__", "")
+                _changed[_table] = _changed.get(_table, 0) + 1
+
+        self.do_update()
+
+        return _changed
+
+    def get_checksum(self, tables: List[str]) -> str:
+        """Retrieve a checksum of the contents of one or more tables.
+
+        The checksum changes whenever any record in any of the tables is added,
+        deleted, or changed so it can be used to tell whether data read from the
+        tables earlier is still current.  On PostgreSQL the checksum is an MD5 hash
+        of every row calculated by the server with a single query.  SQLite
+        databases are local files, so the size and modification time of the file
+        are used instead and the database isn't queried at all.
+
+        :param tables: the names of the tables to calculate the checksum for.
+        :return: the checksum or an empty string if it can't be calculated.
+        :rtype: str
+        :raise: DataAccessError if the checksum query fails.
+        """
+        if self.cxnargs["dialect"] == "sqlite":
+            try:
+                _stat = os.stat(self.cxnargs["database"])
+            except OSError:
+                return ""
+            return f"{_stat.st_size}:{_stat.st_mtime_ns}"
+
+        _sql_statement = (
+            "SELECT md5(string_agg(_checksum, '' ORDER BY _index)) FROM ("
+            + " UNION ALL ".join(
+                f"SELECT {_index} AS _index, md5(COALESCE(string_agg(_row::text, "
+                f"',' ORDER BY _row::text), '')) AS _checksum FROM {_table} _row"
+                for _index, _table in enumerate(tables)
+            )
+            + ") AS _checksums"
+        )
+
+        try:
+            return self.session.execute(text(_sql_statement)).scalar_one() or ""
+        except (AttributeError, SQLAlchemyError) as _error:
+            self.do_handle_db_error(_error, "Error calculating the table checksum: ")
+
+        return ""
+
     def get_database_list(self, database: Dict[str, str]) -> List:
         """Retrieve the list of program databases available to RAMSTK.
 
@@ -523,6 +800,23 @@ class BaseDatabase:
         _connection_url = self.do_build_database_url(database)
         return do_open_session(_connection_url)
 
+    def get_last_allocated_id(self, table: str, id_column: str) -> int:
+        """Retrieve the last ID handed out by the ID allocator.
+
+        The allocator is seeded with get_last_id() the first time a table is used
+        after connecting; later calls do not query the database.
+
+        :param table: the name of the table to get the last allocated ID for.
+        :param id_column: the name of the ID column to get the last allocated ID for.
+        :return: the last ID handed out for the table.
+        :rtype: int
+        """
+        _key = (table, self._get_id_column_name(id_column))
+        if _key not in self._dic_last_ids:
+            self._dic_last_ids[_key] = self.get_last_id(table, _key[1])
+
+        return self._dic_last_ids[_key]
+
     def get_last_id(self, table: str, id_column: str) -> Any:
         """Retrieve the last used value of the ID column.
 
@@ -536,9 +830,7 @@ class BaseDatabase:
         :raise: :class:`sqlalchemy.exc.OperationalError` if passed an unknown
             table or unknown column name.
         """
-        # Ensure the ID column name starts with "fld_".
-        if not id_column.startswith("fld_"):
-            id_column = f"fld_{id_column}"
+        id_column = self._get_id_column_name(id_column)
 
         # Construct the SQL statement to retrieve the last ID.
         _sql_statement = (
@@ -552,6 +844,7 @@ class BaseDatabase:
             _last_id = self.session.execute(text(_sql_statement)).first()
             return _last_id[0] if _last_id else 0
         except (
+            AttributeError,
             exc.ProgrammingError,
             TypeError,
         ) as _error:
@@ -561,6 +854,214 @@ class BaseDatabase:
                 _context_message,
             )
 
+    @staticmethod
+    def _do_copy_rows(
+        cursor: Any, record: Any, attributes: List[Dict[str, Any]], upsert: bool
+    ) -> None:
+        """Stream rows of record attributes into a table with COPY.
+
+        :param cursor: the psycopg2 cursor to copy the rows with.
+        :param record: the record class the rows are for.
+        :param attributes: the list of attribute dicts, one for each row.
+        :param upsert: whether to update the rows that already exist in the table
+            instead of failing.
+        :return: None
+        :rtype: None
+        """
+        _table = record.__tablename__
+        _keys = list(attributes[0])
+        _mapper = sa_inspect(record)
+        _columns = [_mapper.columns[_key].name for _key in _keys]
+        _primary_key = [_column.name for _column in record.__table__.primary_key]
+
+        _buffer = io.StringIO()
+        _buffer.writelines(
+            _get_copy_line(_row.get(_key) for _key in _keys) for _row in attributes
+        )
+        _buffer.seek(0)
+
+        if not upsert:
+            cursor.copy_expert(
+                sql.SQL("COPY {} ({}) FROM STDIN").format(
+                    sql.Identifier(_table),
+                    sql.SQL(", ").join(map(sql.Identifier, _columns)),
+                ),
+                _buffer,
+            )
+            return
+
+        _stage = f"_stage_{_table}"
+        _updates = [_column for _column in _columns if _column not in _primary_key]
+        _sql_values = {
+            "table": sql.Identifier(_table),
+            "stage": sql.Identifier(_stage),
+            "columns": sql.SQL(", ").join(map(sql.Identifier, _columns)),
+            "updates": sql.SQL(", ").join(
+                sql.SQL("{0} = {1}.{0}").format(
+                    sql.Identifier(_column), sql.Identifier(_stage)
+                )
+                for _column in _updates
+            ),
+            "match": sql.SQL(" AND ").join(
+                sql.SQL("{0}.{2} = {1}.{2}").format(
+                    sql.Identifier(_table),
+                    sql.Identifier(_stage),
+                    sql.Identifier(_column),
+                )
+                for _column in _primary_key
+            ),
+        }
+
+        cursor.execute(
+            sql.SQL(
+                "CREATE TEMPORARY TABLE IF NOT EXISTS {stage} ON COMMIT DROP AS "
+                "SELECT {columns} FROM {table} WITH NO DATA"
+            ).format(**_sql_values)
+        )
+        cursor.copy_expert(
+            sql.SQL("COPY {stage} ({columns}) FROM STDIN").format(**_sql_values),
+            _buffer,
+        )
+        if _updates:
+            cursor.execute(
+                sql.SQL(
+                    "UPDATE {table} SET {updates} FROM {stage} WHERE {match}"
+                ).format(**_sql_values)
+            )
+        cursor.execute(
+            sql.SQL(
+                "INSERT INTO {table} ({columns}) SELECT {columns} FROM {stage} "
+                "WHERE NOT EXISTS (SELECT 1 FROM {table} WHERE {match}); "
+                "TRUNCATE {stage}"
+            ).format(**_sql_values)
+        )
+
+    @staticmethod
+    def _do_fix_id_sequences(cursor: Any, tables: Dict[str, List[str]]) -> None:
+        """Move the ID sequences for tables past the largest ID in each table.
+
+        The sequences are created with the database; any that don't exist are
+        skipped.
+
+        :param cursor: the psycopg2 cursor to update the sequences with.
+        :param tables: the names of the ID columns for each table.
+        :return: None
+        :rtype: None
+        """
+        for _table, _columns in tables.items():
+            for _column in _columns:
+                _sequence = f"{_table}_{_column}_seq"
+                cursor.execute("SELECT to_regclass(%s)", (_sequence,))
+                if cursor.fetchone()[0] is None:
+                    continue
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))", (_sequence,)
+                )
+                cursor.execute(
+                    sql.SQL(
+                        "SELECT setval({sequence}, GREATEST(last_value, (SELECT "
+                        "COALESCE(MAX({column}), 0) FROM {table}))) FROM {relation}"
+                    ).format(
+                        sequence=sql.Literal(_sequence),
+                        column=sql.Identifier(_column),
+                        table=sql.Identifier(_table),
+                        relation=sql.Identifier(_sequence),
+                    )
+                )
+
+    def _do_find_bad_record(self, records: List[object]) -> str:
+        """Find the first record in a failed bulk insert the database rejects.
+
+        The records are replayed one at a time in a new transaction which is always
+        rolled back, so nothing is written to the database.
+
+        :param list records: the list of objects that failed to insert.
+        :return: a description of the first rejected record and the reason it was
+            rejected or an empty string if every record was accepted.
+        :rtype: str
+        """
+        _index = 0
+        _record: object = None
+        try:
+            for _index, _record in enumerate(records):
+                self.session.add(_record)
+                self.session.flush()
+        except (
+            FlushError,
+            exc.DataError,
+            exc.IntegrityError,
+            exc.InternalError,
+            exc.StatementError,
+        ) as _error:
+            _primary_key = sa_inspect(_record).mapper.primary_key_from_instance(_record)
+            return (
+                f"record {_index} ({getattr(_record, '__tablename__', '')} ID "
+                f"{', '.join(str(_key) for _key in _primary_key)}): "
+                f"{getattr(_error, 'orig', _error)}"
+            )
+        finally:
+            self.session.rollback()
+
+        return ""
+
+    def _do_reserve_postgres_ids(
+        self, table: str, id_column: str, last_id: int, count: int
+    ) -> int:
+        """Reserve a block of IDs from the PostgreSQL sequence for an ID column.
+
+        The block is reserved under an advisory lock so no other client can be
+        given an ID in it.  The block always starts after last_id so IDs already in
+        the table are never given out again.  Databases created before the ID
+        sequences were added to the schema don't have them, so a missing sequence
+        is created the first time IDs are reserved for the column.
+
+        :param table: the name of the table to reserve the IDs in.
+        :param id_column: the name of the ID column to reserve the IDs for.
+        :param last_id: the last ID known to be in use in the table.
+        :param count: the number of IDs to reserve.
+        :return: the last ID in use before the block.
+        :rtype: int
+        :raise: DataAccessError if the IDs could not be reserved.
+        """
+        _sequence = f"{table}_{id_column}_seq"
+        try:
+            with self.engine.begin() as _connection:  # type: ignore
+                _connection.execute(
+                    text("SELECT pg_advisory_xact_lock(hashtext(:sequence))"),
+                    {"sequence": _sequence},
+                )
+                _connection.execute(
+                    text(
+                        "CREATE SEQUENCE IF NOT EXISTS "
+                        f"{_connection.dialect.identifier_preparer.quote(_sequence)}"
+                    )
+                )
+                _block_end = _connection.execute(
+                    text(
+                        "SELECT setval(:sequence, GREATEST(nextval(:sequence), "
+                        ":last_id + 1) + :count - 1)"
+                    ),
+                    {
+                        "sequence": _sequence,
+                        "last_id": last_id,
+                        "count": count,
+                    },
+                ).scalar_one()
+        except SQLAlchemyError as _error:
+            self.do_handle_db_error(_error, f"Error reserving IDs in {table}: ")
+
+        return _block_end - count
+
+    @staticmethod
+    def _get_id_column_name(id_column: str) -> str:
+        """Ensure the ID column name starts with "fld_".
+
+        :param id_column: the name of the ID column.
+        :return: the name of the ID column as it appears in the database.
+        :rtype: str
+        """
+        return id_column if id_column.startswith("fld_") else f"fld_{id_column}"
+
     @staticmethod
     def _get_user_input(fields: Dict[str, str]) -> Dict[str, str]:
         """Get user input for any user record.
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict, List, Sequence, TextIO, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, TextIO, Tuple
 
 # Third Party Imports
 from _typeshed import Incomplete
@@ -15,6 +15,7 @@ from ramstk.exceptions import DataAccessError as DataAccessError
 def do_create_postgres_db(database: Dict[str, str], sql_file: TextIO) -> None: ...
 def do_create_sqlite3_db(database: Dict[str, str], sql_file: TextIO) -> None: ...
 def do_open_session(database: str) -> Tuple[Engine, scoped_session]: ...
+def _get_copy_line(values: Iterable[Any]) -> str: ...
 
 class BaseDatabase:
     sqlstatements: Dict[str, str]
@@ -31,6 +32,9 @@ class BaseDatabase:
         user_group_id: int = 1,
     ) -> None: ...
     def do_connect(self, database: Dict[str, str]) -> None: ...
+    def do_copy_batches(
+        self, batches: Iterable[List[Tuple[Any, List[Dict[str, Any]]]]]
+    ) -> None: ...
     def do_create_database(self, database: Dict[str, str], sql_file: str) -> None: ...
     def do_delete(self, item: object) -> None: ...
     def do_disconnect(self) -> None: ...
@@ -38,10 +42,32 @@ class BaseDatabase:
         self, query_: Select, session: scoped_session = None
     ) -> Sequence[Row[tuple[Any, ...] | Any]] | Any: ...
     def do_insert(self, record: object) -> None: ...
-    def do_insert_many(self, records: List[object]) -> None: ...
+    def do_insert_batches(
+        self, batches: Iterable[List[Tuple[Any, List[Dict[str, Any]]]]]
+    ) -> None: ...
+    def do_insert_many(self, records: List[object], chunk_size: int = ...) -> None: ...
+    def do_release_ids(
+        self, table: str, id_column: str, last_id: int, count: int = ...
+    ) -> None: ...
+    def do_reserve_ids(self, table: str, id_column: str, count: int = ...) -> int: ...
     def do_select_all(self, table, **kwargs) -> query.Query: ...
     def do_update(self, record: object = ...) -> None: ...
+    def do_update_dirty(self) -> Dict[str, int]: ...
+    def get_checksum(self, tables: List[str]) -> str: ...
     def get_database_list(self, database: Dict[str, str]) -> List: ...
+    def get_last_allocated_id(self, table: str, id_column: str) -> int: ...
     def get_last_id(self, table: str, id_column: str) -> Any: ...
     @staticmethod
+    def _do_copy_rows(
+        cursor: Any, record: Any, attributes: List[Dict[str, Any]], upsert: bool
+    ) -> None: ...
+    @staticmethod
+    def _do_fix_id_sequences(cursor: Any, tables: Dict[str, List[str]]) -> None: ...
+    def _do_find_bad_record(self, records: List[object]) -> str: ...
+    def _do_reserve_postgres_ids(
+        self, table: str, id_column: str, last_id: int, count: int
+    ) -> int: ...
+    @staticmethod
+    def _get_id_column_name(id_column: str) -> str: ...
+    @staticmethod
     def _get_user_input(fields: Dict[str, str]) -> Dict[str, str]: ...
@@ -7,6 +7,7 @@
 """The RAMSTK common database model."""
 
 # Standard Library Imports
+import contextlib
 import gettext
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Union
@@ -14,6 +15,9 @@ from typing import Dict, List, Union
 # Third Party Imports
 from pubsub import pub
 
+# RAMSTK Package Imports
+from ramstk.exceptions import DataAccessError
+
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKSiteInfoRecord, RAMSTKUserRecord
 from .basedatabase import BaseDatabase
@@ -41,6 +45,7 @@ class RAMSTKCommonDB(BaseDatabase):
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self._do_create_database, "request_create_common")
+        pub.subscribe(self.do_save_site, "request_save_project")
 
     def _do_add_administrator(self) -> None:
         """Add a new administrator to the RAMSTK pool."""
@@ -78,6 +83,18 @@ class RAMSTKCommonDB(BaseDatabase):
 
         self.do_disconnect()
 
+    def do_save_site(self) -> None:
+        """Save any pending changes to the RAMSTK Common database.
+
+        Failures are already logged by do_handle_db_error() and there is nothing to
+        save when the database isn't connected.
+
+        :return: None
+        :rtype: None
+        """
+        with contextlib.suppress(AttributeError, DataAccessError):
+            self.do_update_dirty()
+
     def _do_load_site_info(self, license_file: str) -> None:
         """Load the Site Information table.
 
@@ -22,4 +22,5 @@ class RAMSTKCommonDB(BaseDatabase):
     def _do_create_database(
         self, database: Dict[str, str], sql_file: str, license_file: str
     ) -> None: ...
+    def do_save_site(self) -> None: ...
     def _do_load_site_info(self, license_file: str) -> None: ...
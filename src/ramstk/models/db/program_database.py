@@ -91,6 +91,7 @@ class RAMSTKProgramDB(BaseDatabase):
         pub.subscribe(self.do_open_program, "succeed_create_program_database")
         pub.subscribe(self.do_close_program, "request_close_program")
         pub.subscribe(self.do_save_program, "request_update_program")
+        pub.subscribe(self.do_save_program, "request_save_project")
 
     def _do_create_database(
         self,
@@ -142,16 +143,26 @@ class RAMSTKProgramDB(BaseDatabase):
                 ),
             )
 
-    @staticmethod
-    def do_save_program() -> None:
+    def do_save_program(self) -> None:
         """Save the open RAMSTK Program database.
 
+        The pending changes in every table are written in a single transaction and
+        only the records that actually changed are updated.  One
+        succeed_update_program message reports the number of records written to
+        each table.
+
         :return: None
         :rtype: None
         """
-        pub.sendMessage("request_update_all_revision")
-        pub.sendMessage("request_update_all_function")
-        pub.sendMessage("request_update_all_requirement")
-        pub.sendMessage("request_update_all_stakeholder")
-        pub.sendMessage("request_update_all_hardware")
-        pub.sendMessage("request_update_all_validation")
+        try:
+            _changed = self.do_update_dirty()
+            pub.sendMessage("succeed_update_program", changed=_changed)
+        except AttributeError:
+            pub.sendMessage(
+                "fail_update_program",
+                error_message=(
+                    "Not currently connected to a database.  Nothing to save."
+                ),
+            )
+        except DataAccessError as _error:
+            pub.sendMessage("fail_update_program", error_message=_error.msg)
@@ -17,5 +17,4 @@ class RAMSTKProgramDB(BaseDatabase):
     def _do_create_database(self, database: Dict[str, str], sql_file: str) -> None: ...
     def do_open_program(self, database: Dict[str, str]) -> None: ...
     def do_close_program(self) -> None: ...
-    @staticmethod
-    def do_save_program() -> None: ...
+    def do_save_program(self) -> None: ...
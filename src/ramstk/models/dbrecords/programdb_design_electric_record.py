@@ -9,6 +9,7 @@
 """RAMSTKDesignElectric Record Model."""
 
 # Standard Library Imports
+import gettext
 from typing import Dict, List, Union
 
 # Third Party Imports
@@ -18,12 +19,13 @@ from sqlalchemy import Column, Float, ForeignKey, Integer, String
 # RAMSTK Package Imports
 from ramstk.analyses import stress
 from ramstk.analyses.derating import derating
-from ramstk.views.gtk3 import _
 
 # RAMSTK Local Imports
 from .. import RAMSTK_BASE
 from .baserecord import RAMSTKBaseRecord
 
+_ = gettext.gettext
+
 
 # pylint: disable=R0902
 class RAMSTKDesignElectricRecord(RAMSTK_BASE, RAMSTKBaseRecord):  # type: ignore
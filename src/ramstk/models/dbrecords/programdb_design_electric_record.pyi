@@ -1,15 +1,17 @@
 # Standard Library Imports
+import gettext
 from typing import Any, Dict, List, Union
 
 # RAMSTK Package Imports
 from ramstk.analyses import stress as stress
 from ramstk.analyses.derating import derating as derating
-from ramstk.views.gtk3 import _ as _
 
 # RAMSTK Local Imports
 from .. import RAMSTK_BASE as RAMSTK_BASE
 from .baserecord import RAMSTKBaseRecord as RAMSTKBaseRecord
 
+_ = gettext.gettext
+
 class RAMSTKDesignElectricRecord(RAMSTK_BASE, RAMSTKBaseRecord):
     __defaults__: Dict[str, Union[float, int, str]]
     __tablename__: str
@@ -10,7 +10,7 @@
 
 # Standard Library Imports
 from math import exp
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 # Third Party Imports
 from sqlalchemy import Column, Float, ForeignKey, Integer, String
@@ -18,7 +18,7 @@ from sqlalchemy import Column, Float, ForeignKey, Integer, String
 # RAMSTK Package Imports
 from ramstk.analyses import dormancy
 from ramstk.analyses.milhdbk217f import milhdbk217f
-from ramstk.analyses.statistics import exponential, lognormal, normal, weibull
+from ramstk.analyses.statistics import distributions, exponential
 
 # RAMSTK Local Imports
 from .. import RAMSTK_BASE
@@ -331,11 +331,47 @@ class RAMSTKReliabilityRecord(RAMSTK_BASE, RAMSTKBaseRecord):  # type: ignore
             "survival_analysis_id": self.survival_analysis_id,
         }
 
+    def get_distribution_inputs(self, time: float) -> Dict[str, Union[float, str]]:
+        """Get the inputs to calculate the hazard rate from the failure distribution.
+
+        The one-parameter exponential, two-parameter lognormal, and two-parameter
+        Weibull ignore the location parameter.  The exponential hazard rate is
+        constant so it's always calculated at time 1.0.
+
+        :param time: the time at which to calculate the hazard rate.
+        :return: the keyword arguments for distributions.calculate_hazard_rate().
+        :rtype: dict
+        :raise: KeyError if the failure distribution ID is unknown.
+        """
+        _dist_type = {
+            1: "exponential",
+            2: "exponential",
+            3: "lognormal",
+            4: "lognormal",
+            5: "normal",
+            6: "weibull",
+            7: "weibull",
+        }[self.failure_distribution_id]
+
+        return {
+            "time": 1.0 if _dist_type == "exponential" else time,
+            "location": (
+                0.0
+                if self.failure_distribution_id in [1, 3, 6]
+                else self.location_parameter
+            ),
+            "scale": self.scale_parameter,
+            "shape": self.shape_parameter,
+            "dist_type": _dist_type,
+        }
+
     def do_calculate_hazard_rate_active(
         self,
         multiplier: float,
         attributes: Dict[str, Union[float, int, str]],
         time: float = 1.0,
+        hazard_rate_predicted: Optional[float] = None,
+        hazard_rate_distribution: Optional[float] = None,
     ) -> None:
         """Calculate the active hazard rate.
 
@@ -346,58 +382,31 @@ class RAMSTKReliabilityRecord(RAMSTK_BASE, RAMSTKBaseRecord):  # type: ignore
             associated with the selected record.
         :param time: the time at which to calculate the hazard rate.  Applicable to
             non-EXP hazard functions.
+        :param hazard_rate_predicted: the MIL-HDBK-217F predicted hazard rate if it
+            has already been calculated.  The prediction is skipped when this is
+            passed.
+        :param hazard_rate_distribution: the failure distribution hazard rate if it
+            has already been calculated.  The calculation is skipped when this is
+            passed.
         :return: _hazard_rate_active; the active hazard rate.
         :rtype: float
         """
         self.hazard_rate_active = 0.0
 
-        if self.hazard_rate_type_id == 1:
+        if self.hazard_rate_type_id == 1 and hazard_rate_predicted is not None:
+            self.hazard_rate_active = hazard_rate_predicted
+        elif self.hazard_rate_type_id == 1:
             self.do_predict_active_hazard_rate(attributes)
         elif self.hazard_rate_type_id == 2:
             self.hazard_rate_active = self.hazard_rate_specified
         elif self.hazard_rate_type_id == 3:
             self.hazard_rate_active = exponential.get_hazard_rate(self.mtbf_specified)
+        elif self.hazard_rate_type_id == 4 and hazard_rate_distribution is not None:
+            self.hazard_rate_active = hazard_rate_distribution
         elif self.hazard_rate_type_id == 4:
-            _function = {
-                1: exponential.get_hazard_rate(
-                    self.scale_parameter,
-                    location=0.0,
-                ),
-                2: exponential.get_hazard_rate(
-                    self.scale_parameter,
-                    location=self.location_parameter,
-                ),
-                3: lognormal.get_hazard_rate(
-                    self.shape_parameter,
-                    time,
-                    location=0.0,
-                    scale=self.scale_parameter,
-                ),
-                4: lognormal.get_hazard_rate(
-                    self.shape_parameter,
-                    time,
-                    location=self.location_parameter,
-                    scale=self.scale_parameter,
-                ),
-                5: normal.get_hazard_rate(
-                    self.location_parameter,
-                    self.scale_parameter,
-                    time,
-                ),
-                6: weibull.get_hazard_rate(
-                    self.shape_parameter,
-                    self.scale_parameter,
-                    time,
-                    location=0.0,
-                ),
-                7: weibull.get_hazard_rate(
-                    self.shape_parameter,
-                    self.scale_parameter,
-                    time,
-                    location=self.location_parameter,
-                ),
-            }[self.failure_distribution_id]
-            self.hazard_rate_active = _function
+            self.hazard_rate_active = distributions.calculate_hazard_rate(
+                **self.get_distribution_inputs(time)
+            )
 
         self.hazard_rate_active = (
             (self.hazard_rate_active + self.add_adj_factor)
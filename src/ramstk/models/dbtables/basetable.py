@@ -6,9 +6,9 @@
 # Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Metaclass for the database table models."""
 
-
 # Standard Library Imports
 import contextlib
+import gettext
 from datetime import date
 from typing import Any, Callable, Dict, List, Tuple, Type, Union
 
@@ -21,7 +21,8 @@ from treelib.exceptions import NodeIDAbsentError
 from ramstk.exceptions import DataAccessError
 from ramstk.models.db import BaseDatabase
 from ramstk.utilities import do_subscribe_to_messages
-from ramstk.views.gtk3 import _
+
+_ = gettext.gettext
 
 
 def do_clear_tree(tree: treelib.Tree) -> treelib.Tree:
@@ -126,10 +127,10 @@ class RAMSTKBaseTable:
         """
         try:
             self._do_delete_database_record(node_id)
-            self._do_update_last_id()
             self._do_remove_tree_node(node_id)
             pub.sendMessage(
                 f"succeed_delete_{self._tag}",
+                node_id=node_id,
                 tree=self.tree,
             )
         except (AttributeError, DataAccessError, NodeIDAbsentError):
@@ -189,6 +190,7 @@ class RAMSTKBaseTable:
             self._do_insert_record_in_tree(_record)
             pub.sendMessage(
                 f"succeed_insert_{self._tag}",
+                node_id=self.last_id,
                 tree=self.tree,
             )
         except DataAccessError as _error:
@@ -271,13 +273,7 @@ class RAMSTKBaseTable:
         """
         _key, _value = self._do_extract_key_and_value(package)
 
-        _attributes = self._do_get_record_attributes(node_id)
-
-        if _key in _attributes:
-            _attributes[_key] = _value
-            self._do_update_record_attributes(node_id, _attributes)
-
-        self.do_get_tree()
+        self.do_set_attributes_many(node_id=node_id, package={_key: _value})
 
     def do_set_attributes_all(
         self, attributes: Dict[str, Union[float, int, str]]
@@ -288,11 +284,67 @@ class RAMSTKBaseTable:
         :return: None
         :rtype: None
         """
-        for _key in attributes:
-            self.do_set_attributes(
-                node_id=attributes[self.pkey],  # type: ignore
-                package={_key: attributes[_key]},
+        self.do_set_attributes_many(
+            node_id=attributes[self.pkey],  # type: ignore
+            package=attributes,
+        )
+
+    def do_set_attributes_many(
+        self, node_id: int, package: Dict[str, Union[float, int, str]]
+    ) -> None:
+        """Set several attributes of the record associated with node ID at once.
+
+        The ID columns in the package are ignored.  Keys in the package that are not
+        attributes of the record, and a node ID without a record, are reported with a
+        do_log_debug_msg message.  The remaining attributes are applied in a single
+        call to the record so the record is never left partially updated.  A single
+        succeed_set_<module>_attributes message carrying the changed keys is sent
+        followed by a single succeed_get_<module>_tree message.
+
+        :param node_id: the ID of the record in the RAMSTK Program database table whose
+            attributes are to be set.
+        :param package: the key:value pairs of the attributes to set.
+        :return: None
+        :rtype: None
+        """
+        _attributes = self._do_get_record_attributes(node_id)
+
+        _unknown = [_key for _key in package if _key not in _attributes]
+        if not _attributes:
+            pub.sendMessage(
+                "do_log_debug_msg",
+                logger_name="DEBUG",
+                message=_(
+                    f"Attempted to set attributes of non-existent "
+                    f"{self._tag.replace('_', ' ')} with "
+                    f"{self._tag.replace('_', ' ')} ID {node_id}."
+                ),
             )
+        elif _unknown:
+            pub.sendMessage(
+                "do_log_debug_msg",
+                logger_name="DEBUG",
+                message=_(
+                    f"Unknown attribute(s) {', '.join(_unknown)} not set for "
+                    f"{self._tag.replace('_', ' ')} ID {node_id}."
+                ),
+            )
+
+        _changes = {
+            _key: _value
+            for _key, _value in package.items()
+            if _key in _attributes and _key not in self._lst_id_columns
+        }
+
+        if _changes:
+            self._do_update_record_attributes(node_id, _changes)
+            pub.sendMessage(
+                f"succeed_set_{self._tag}_attributes",
+                node_id=node_id,
+                keys=list(_changes),
+            )
+
+        self.do_get_tree()
 
     def do_set_tree(self, tree: treelib.Tree) -> None:
         """Set the MODULE treelib Tree().
@@ -360,19 +412,39 @@ class RAMSTKBaseTable:
 
         pub.sendMessage("request_set_cursor_active")
 
-    # noinspection PyUnresolvedReferences
-    # pylint: disable=no-value-for-parameter
     def do_update_all(self) -> None:
         """Update all MODULE data table records in the RAMSTK Program database.
 
+        The records are already attached to the database session, so all pending
+        changes are written with a single commit and only the records that actually
+        changed are updated.
+
         :return: None
         :rtype: None
         """
-        for _node in self.tree.all_nodes():
-            self.do_update(_node.identifier)  # type: ignore
+        try:
+            self.dao.do_update()
+            pub.sendMessage(f"succeed_update_all_{self._tag}")
+        except AttributeError:
+            pub.sendMessage(
+                "do_log_debug_msg",
+                logger_name="DEBUG",
+                message=_(
+                    f"Not currently connected to a database.  No "
+                    f"{self._tag.replace('_', ' ')} records were saved."
+                ),
+            )
+        except DataAccessError:
+            pub.sendMessage(
+                "do_log_debug_msg",
+                logger_name="DEBUG",
+                message=_(
+                    f"The value for one or more attributes for one or more "
+                    f"{self._tag.replace('_', ' ')} records was the wrong type."
+                ),
+            )
 
         pub.sendMessage("request_set_cursor_active")
-        pub.sendMessage(f"succeed_update_all_{self._tag}")
 
     def _do_add_record_to_tree(self, _record: object, _parent_id: int) -> None:
         """Add a record to the tree."""
@@ -386,11 +458,18 @@ class RAMSTKBaseTable:
     def _do_create_new_record(
         self, attributes: Dict[str, Union[date, float, int, str]]
     ) -> object:
-        """Create a new record object."""
-        _record = self.do_get_new_record(attributes)
-        for _id in self._lst_id_columns:
-            attributes.pop(_id)
-        _record.set_attributes(attributes)  # type: ignore
+        """Create a new record object using the next ID reserved for the table."""
+        self.last_id = self.dao.do_reserve_ids(self._db_tablename, self._db_id_colname)
+        try:
+            _record = self.do_get_new_record(attributes)
+            for _id in self._lst_id_columns:
+                attributes.pop(_id)
+            _record.set_attributes(attributes)  # type: ignore
+        except Exception:
+            self.dao.do_release_ids(
+                self._db_tablename, self._db_id_colname, self.last_id
+            )
+            raise
         return _record
 
     def _do_extract_key_and_value(
@@ -437,8 +516,14 @@ class RAMSTKBaseTable:
 
     def _do_insert_record_in_database(self, _record: object) -> None:
         """Insert a new record into the database."""
-        self.dao.do_insert(_record)
-        self.last_id = self.dao.get_last_id(self._db_tablename, self._db_id_colname)
+        try:
+            self.dao.do_insert(_record)
+        except DataAccessError:
+            self.dao.do_release_ids(
+                self._db_tablename, self._db_id_colname, self.last_id
+            )
+            raise
+        self.last_id += 1
 
     def _do_insert_record_in_tree(self, record: object) -> None:
         """Insert a new record into the tree structure."""
@@ -505,13 +590,14 @@ class RAMSTKBaseTable:
                 f"succeed_calculate_{self._tag}": self.do_set_tree,
                 f"request_update_{self._tag}": self.do_update,
                 f"request_update_all_{self._tag}": self.do_update_all,
-                "request_save_project": self.do_update_all,
             }
         )
 
     def _do_update_last_id(self) -> None:
-        """Update the last ID."""
-        self.last_id = self.dao.get_last_id(self._db_tablename, self._db_id_colname)
+        """Update the last ID from the ID allocator."""
+        self.last_id = self.dao.get_last_allocated_id(
+            self._db_tablename, self._db_id_colname
+        )
 
     def _do_update_record_attributes(
         self, node_id: int, attributes: Dict[str, Union[float, int, str]]
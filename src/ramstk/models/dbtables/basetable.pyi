@@ -1,4 +1,5 @@
 # Standard Library Imports
+import gettext
 from datetime import date
 from typing import Any, Callable, Dict, List, Union
 
@@ -8,7 +9,8 @@ import treelib
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase as BaseDatabase
 from ramstk.exceptions import DataAccessError as DataAccessError
-from ramstk.views.gtk3 import _ as _
+
+_ = gettext.gettext
 
 def do_clear_tree(tree: treelib.Tree) -> treelib.Tree: ...
 
@@ -47,6 +49,9 @@ class RAMSTKBaseTable:
     def do_set_attributes_all(
         self, attributes: Dict[str, Union[date, float, int, str]]
     ) -> None: ...
+    def do_set_attributes_many(
+        self, node_id: int, package: Dict[str, Union[date, float, int, str]]
+    ) -> None: ...
     def do_set_tree(self, tree: treelib.Tree) -> None: ...
     def do_update(self, node_id: int) -> None: ...
     def do_update_all(self) -> None: ...
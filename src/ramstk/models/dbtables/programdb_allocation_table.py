@@ -357,13 +357,15 @@ class RAMSTKAllocationTable(RAMSTKBaseTable):
 
         return _cum_weight
 
-    def _do_update_tree(self, tree: treelib.Tree) -> None:
+    # pylint: disable=unused-argument
+    def _do_update_tree(self, node_id: int, tree: treelib.Tree) -> None:
         """Update the Allocation tree for the newly added or removed Hardware.
 
         Allocation records are added by triggers in the database when a new Hardware
         item is added.  This method simply adds a new node to the Allocation tree with a
         blank record.
 
+        :param node_id: the ID of the Hardware item just added or deleted.
         :param tree: the updated Hardware tree with the new node or missing the node
             just deleted.
         :return: None
@@ -36,4 +36,4 @@ class RAMSTKAllocationTable(RAMSTKBaseTable):
     def do_calculate_foo_allocation(self, node_id: int) -> None: ...
     def _do_calculate_agree_total_elements(self, node_id: int) -> Tuple[int, int]: ...
     def _do_calculate_foo_cumulative_weight(self, node_id: int) -> int: ...
-    def _do_update_tree(self, tree: treelib.Tree) -> None: ...
+    def _do_update_tree(self, node_id: int, tree: treelib.Tree) -> None: ...
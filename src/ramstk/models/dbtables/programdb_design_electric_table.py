@@ -17,7 +17,7 @@ from pubsub import pub
 
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKDesignElectricRecord
-from .basetable import RAMSTKBaseTable, do_clear_tree
+from .basetable import RAMSTKBaseTable
 
 
 class RAMSTKDesignElectricTable(RAMSTKBaseTable):
@@ -87,34 +87,55 @@ class RAMSTKDesignElectricTable(RAMSTKBaseTable):
 
         return _new_record
 
-    def _do_update_tree(self, tree: treelib.Tree) -> None:
+    def _do_update_tree(self, node_id: int, tree: treelib.Tree) -> None:
         """Update the Design Electric tree for the newly added or removed Hardware.
 
         Design Electric records are added by triggers in the database when a new
-        Hardware item is added.  This method simply adds a new node to the Design
-        Electric tree with a blank record.
+        Hardware part is added.  This method simply adds a new node to the Design
+        Electric tree with a blank record.  The node for a deleted Hardware part is
+        removed, as are the nodes for the parts below a deleted Hardware assembly.
 
+        :param node_id: the ID of the Hardware item just added or deleted.
         :param tree: the updated Hardware tree with the new node or missing the node
             just deleted.
         :return: None
         :rtype: None
         """
-        do_clear_tree(self.tree)
-        for _node in tree.all_nodes()[1:]:
-            if _node.data["hardware"].part:
+        if tree.contains(node_id):
+            if self.tree.contains(node_id):
+                # The record created by the database trigger was already loaded.
+                return
+
+            _hardware = tree.get_node(node_id).data["hardware"]
+            if _hardware.part:
                 _attributes = {
-                    "revision_id": _node.data["hardware"].revision_id,
-                    "hardware_id": _node.data["hardware"].hardware_id,
+                    "revision_id": _hardware.revision_id,
+                    "hardware_id": _hardware.hardware_id,
                 }
                 _record = self.do_get_new_record(_attributes)
                 self.tree.create_node(
                     tag=self._tag,
-                    identifier=_node.data["hardware"].hardware_id,
+                    identifier=_hardware.hardware_id,
                     parent=0,
                     data={self._tag: _record},
                 )
 
                 pub.sendMessage(
                     f"succeed_insert_{self._tag}",
+                    node_id=node_id,
                     tree=self.tree,
                 )
+        else:
+            if self.tree.contains(node_id):
+                self.tree.remove_node(node_id)
+            else:
+                # Only parts have a node, so an assembly was deleted along with all
+                # the parts below it.
+                for _hardware_id in set(self.tree.nodes) - set(tree.nodes):
+                    self.tree.remove_node(_hardware_id)
+
+            pub.sendMessage(
+                f"succeed_delete_{self._tag}",
+                node_id=node_id,
+                tree=self.tree,
+            )
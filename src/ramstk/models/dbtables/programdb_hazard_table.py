@@ -114,40 +114,26 @@ class RAMSTKHazardTable(RAMSTKBaseTable):
         _record = self.tree.get_node(node_id).data[self._tag]
         _attributes = _record.get_attributes()
 
-        _result = fha.calculate_hri(
-            _attributes["assembly_probability"],
-            _attributes["assembly_severity"],
-        )
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"assembly_hri": _result},
-        )
-
-        _result = fha.calculate_hri(
-            _attributes["system_probability"],
-            _attributes["system_severity"],
-        )
-        self.do_set_attributes(
+        self.do_set_attributes_many(
             node_id=node_id,
-            package={"system_hri": _result},
-        )
-
-        _result = fha.calculate_hri(
-            _attributes["assembly_probability_f"],
-            _attributes["assembly_severity_f"],
-        )
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"assembly_hri_f": _result},
-        )
-
-        _result = fha.calculate_hri(
-            _attributes["system_probability_f"],
-            _attributes["system_severity_f"],
-        )
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"system_hri_f": _result},
+            package={
+                "assembly_hri": fha.calculate_hri(
+                    _attributes["assembly_probability"],
+                    _attributes["assembly_severity"],
+                ),
+                "system_hri": fha.calculate_hri(
+                    _attributes["system_probability"],
+                    _attributes["system_severity"],
+                ),
+                "assembly_hri_f": fha.calculate_hri(
+                    _attributes["assembly_probability_f"],
+                    _attributes["assembly_severity_f"],
+                ),
+                "system_hri_f": fha.calculate_hri(
+                    _attributes["system_probability_f"],
+                    _attributes["system_severity_f"],
+                ),
+            },
         )
 
     def _do_calculate_user_defined(self, node_id: int) -> None:
@@ -226,23 +212,9 @@ class RAMSTKHazardTable(RAMSTKBaseTable):
 
         _fha = fha.calculate_user_defined(_fha)
 
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"result_1": float(_fha["res1"])},
-        )
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"result_2": float(_fha["res2"])},
-        )
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"result_3": float(_fha["res3"])},
-        )
-        self.do_set_attributes(
-            node_id=node_id,
-            package={"result_4": float(_fha["res4"])},
-        )
-        self.do_set_attributes(
+        self.do_set_attributes_many(
             node_id=node_id,
-            package={"result_5": float(_fha["res5"])},
+            package={
+                f"result_{_idx}": float(_fha[f"res{_idx}"]) for _idx in range(1, 6)
+            },
         )
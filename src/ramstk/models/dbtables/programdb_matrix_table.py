@@ -10,9 +10,6 @@
 from datetime import date
 from typing import Dict, List, Type, Union
 
-# Third Party Imports
-import pandas as pd
-
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKMatrixRecord
 from .basetable import RAMSTKBaseTable
@@ -39,6 +36,9 @@ class RAMSTKMatrixTable(RAMSTKBaseTable):
 
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None:
         """Initialize a RAMSTKMatrix table model instance."""
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         super().__init__(**kwargs)
 
         # Initialize private dictionary attributes.
@@ -70,6 +70,9 @@ class RAMSTKMatrixTable(RAMSTKBaseTable):
         :return: None
         :rtype: None
         """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         _column_dic = {_column_str: [0] * len(row_lst) for _column_str in column_lst}
         self.matrix_df = pd.DataFrame(_column_dic, index=row_lst)
 
@@ -105,6 +108,9 @@ class RAMSTKMatrixTable(RAMSTKBaseTable):
         :return: None
         :rtype: None
         """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         _new_row_df = pd.DataFrame(
             {_column_str: 0 for _column_str in self.matrix_df.columns},
             index=[row_header_str],
@@ -21,4 +21,4 @@ class RAMSTKMILHDBK217FTable(RAMSTKBaseTable):
     def do_get_new_record(
         self, attributes: Dict[str, Union[date, float, int, str]]
     ) -> RAMSTKMilHdbk217FRecord: ...
-    def _do_update_tree(self, tree: treelib.Tree) -> None: ...
+    def _do_update_tree(self, node_id: int, tree: treelib.Tree) -> None: ...
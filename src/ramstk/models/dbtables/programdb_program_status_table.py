@@ -12,7 +12,6 @@ from datetime import date
 from typing import Dict, Type, Union
 
 # Third Party Imports
-import pandas as pd
 from pubsub import pub
 
 # RAMSTK Local Imports
@@ -95,6 +94,9 @@ class RAMSTKProgramStatusTable(RAMSTKBaseTable):
             dates and the remaining time/cost.
         :rtype: :class:`pandas.DataFrame`
         """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         self._dic_status = {
             _node.data["program_status"]
             .date_status: _node.data["program_status"]
@@ -17,7 +17,7 @@ from pubsub import pub
 
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKReliabilityRecord
-from .basetable import RAMSTKBaseTable, do_clear_tree
+from .basetable import RAMSTKBaseTable
 
 
 class RAMSTKReliabilityTable(RAMSTKBaseTable):
@@ -86,32 +86,55 @@ class RAMSTKReliabilityTable(RAMSTKBaseTable):
 
         return _new_record
 
-    def _do_update_tree(self, tree: treelib.Tree) -> None:
+    def _do_update_tree(self, node_id: int, tree: treelib.Tree) -> None:
         """Update the Reliability tree for the newly added or removed Hardware.
 
         Reliability records are added by triggers in the database when a new Hardware
         item is added.  This method simply adds a new node to the Reliability tree with
-        a blank record.
+        a blank record.  The node for a deleted Hardware item is removed, as are the
+        nodes for any Hardware items below it.
 
-        :param tree: the Hardware tree with the new node.
+        :param node_id: the ID of the Hardware item just added or deleted.
+        :param tree: the updated Hardware tree with the new node or missing the node
+            just deleted.
         :return: None
         :rtype: None
         """
-        do_clear_tree(self.tree)
-        for _node in tree.all_nodes()[1:]:
+        if tree.contains(node_id):
+            if self.tree.contains(node_id):
+                # The record created by the database trigger was already loaded.
+                return
+
+            _hardware = tree.get_node(node_id).data["hardware"]
             _attributes = {
-                "revision_id": _node.data["hardware"].revision_id,
-                "hardware_id": _node.data["hardware"].hardware_id,
+                "revision_id": _hardware.revision_id,
+                "hardware_id": _hardware.hardware_id,
             }
             _record = self.do_get_new_record(_attributes)
             self.tree.create_node(
                 tag=self._tag,
-                identifier=_node.data["hardware"].hardware_id,
+                identifier=_hardware.hardware_id,
                 parent=0,
                 data={self._tag: _record},
             )
 
             pub.sendMessage(
                 f"succeed_insert_{self._tag}",
+                node_id=node_id,
+                tree=self.tree,
+            )
+        else:
+            if self.tree.contains(node_id):
+                self.tree.remove_node(node_id)
+
+            # Every Hardware item has a node, so there are nodes left over only when
+            # the Hardware items below the deleted item were deleted too.
+            if self.tree.size() > tree.size():
+                for _hardware_id in set(self.tree.nodes) - set(tree.nodes):
+                    self.tree.remove_node(_hardware_id)
+
+            pub.sendMessage(
+                f"succeed_delete_{self._tag}",
+                node_id=node_id,
                 tree=self.tree,
             )
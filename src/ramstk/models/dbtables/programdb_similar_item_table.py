@@ -8,9 +8,10 @@
 """RAMSTKSimilarItem Table Model."""
 
 # Standard Library Imports
+import gettext
 from collections import OrderedDict
 from datetime import date
-from typing import Callable, Dict, Type, Union
+from typing import Any, Callable, Dict, List, Type, Union
 
 # Third Party Imports
 import treelib
@@ -18,12 +19,13 @@ from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk.analyses import similaritem
-from ramstk.views.gtk3 import _
 
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKSimilarItemRecord
 from .basetable import RAMSTKBaseTable, do_clear_tree
 
+_ = gettext.gettext
+
 
 class RAMSTKSimilarItemTable(RAMSTKBaseTable):
     """Contain the attributes and methods of the Similar Item table model."""
@@ -72,6 +74,10 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
             self.do_calculate_similar_item,
             "request_calculate_similar_item",
         )
+        pub.subscribe(
+            self.do_calculate_similar_items,
+            "request_calculate_similar_items",
+        )
         pub.subscribe(
             self.do_roll_up_change_descriptions,
             "request_roll_up_change_descriptions",
@@ -126,15 +132,41 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
                 tree=self.tree,
             )
         except KeyError:
-            pub.sendMessage(
-                "do_log_debug_msg",
-                logger_name="DEBUG",
-                message=_(
-                    f"Failed to calculate similar item reliability for hardware ID "
-                    f"{node_id}.  Unknown similar item method ID "
-                    f"{_record.similar_item_method_id} selected."
-                ),
+            self._do_log_unknown_method(node_id, _record.similar_item_method_id)
+
+    def do_calculate_similar_items(self, node_ids: List[int]) -> None:
+        """Perform a similar item calculation for several record IDs.
+
+        The user-defined similar item analyses are calculated together, so each
+        user-defined equation is evaluated once for all the items using it.
+
+        :param node_ids: the list of node (similar item) IDs to calculate.
+        :return: None
+        :rtype: None
+        """
+        _user_defined_ids = []
+        _sias = []
+        for _node_id in node_ids:
+            _method_id = (
+                self.tree.get_node(_node_id).data[self._tag].similar_item_method_id
             )
+            if _method_id == 1:
+                self._do_calculate_topic_633(_node_id)
+            elif _method_id == 2:
+                _user_defined_ids.append(_node_id)
+                _sias.append(self._get_user_defined_sia(_node_id))
+            else:
+                self._do_log_unknown_method(_node_id, _method_id)
+
+        for _node_id, _sia in zip(
+            _user_defined_ids, similaritem.calculate_user_defined_many(_sias)
+        ):
+            self._do_set_user_defined_results(_node_id, _sia)
+
+        pub.sendMessage(
+            "succeed_calculate_similar_item",
+            tree=self.tree,
+        )
 
     def do_roll_up_change_descriptions(self, node_id: int) -> None:
         """Concatenate child change descriptions for the node ID similar item.
@@ -298,6 +330,83 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
         :return: None
         :rtype: None
         """
+        self._do_set_user_defined_results(
+            node_id,
+            similaritem.calculate_user_defined(self._get_user_defined_sia(node_id)),
+        )
+
+    def _do_log_unknown_method(self, node_id: int, method_id: int) -> None:
+        """Log the request to calculate an unknown similar item method.
+
+        :param node_id: the record ID that was to be calculated.
+        :param method_id: the unknown similar item method ID.
+        :return: None
+        :rtype: None
+        """
+        pub.sendMessage(
+            "do_log_debug_msg",
+            logger_name="DEBUG",
+            message=_(
+                f"Failed to calculate similar item reliability for hardware ID "
+                f"{node_id}.  Unknown similar item method ID {method_id} selected."
+            ),
+        )
+
+    def _do_set_user_defined_results(self, node_id: int, sia: Dict[str, Any]) -> None:
+        """Set the user-defined similar item results for a record.
+
+        :param node_id: the record ID the results belong to.
+        :param sia: the similar item assessment dict with the calculated results.
+        :return: None
+        :rtype: None
+        """
+        _attributes = self.tree.get_node(node_id).data[self._tag].get_attributes()
+        _attributes["result_1"] = float(sia["res1"])
+        _attributes["result_2"] = float(sia["res2"])
+        _attributes["result_3"] = float(sia["res3"])
+        _attributes["result_4"] = float(sia["res4"])
+        _attributes["result_5"] = float(sia["res5"])
+
+        self.do_set_attributes_all(
+            attributes=_attributes,
+        )
+
+    # pylint: disable=unused-argument
+    def _do_update_tree(self, node_id: int, tree: treelib.Tree) -> None:
+        """Update the Similar Item tree for the newly added or removed Hardware.
+
+        Similar Item records are added by triggers in the database when a new Hardware
+        item is added.  This method simply adds a new node to the Similar Item tree with
+        a blank record.
+
+        :param node_id: the ID of the Hardware item just added or deleted.
+        :param tree: the Hardware tree with the new node.
+        :return: None
+        :rtype: None
+        """
+        do_clear_tree(self.tree)
+        for _node in tree.all_nodes()[1:]:
+            if not _node.data["hardware"].part:
+                _attributes = {
+                    "revision_id": _node.data["hardware"].revision_id,
+                    "hardware_id": _node.data["hardware"].hardware_id,
+                    "parent_id": _node.data["hardware"].parent_id,
+                }
+                _record = self.do_get_new_record(_attributes)
+                self.tree.create_node(
+                    tag=self._tag,
+                    identifier=_node.data["hardware"].hardware_id,
+                    parent=_node.data["hardware"].parent_id,
+                    data={self._tag: _record},
+                )
+
+    def _get_user_defined_sia(self, node_id: int) -> Dict[str, Any]:
+        """Build the user-defined similar item assessment dict for a record.
+
+        :param node_id: the record ID to calculate similar item reliability.
+        :return: _sia; the similar item assessment dict for the record.
+        :rtype: dict
+        """
         _attributes = self.tree.get_node(node_id).data[self._tag].get_attributes()
 
         _sia: Dict[str, Union[float, int, str, None]] = OrderedDict(
@@ -402,40 +511,4 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
             ],
         )
 
-        _sia = similaritem.calculate_user_defined(_sia)
-        _attributes["result_1"] = _sia["res1"]
-        _attributes["result_2"] = _sia["res2"]
-        _attributes["result_3"] = _sia["res3"]
-        _attributes["result_4"] = _sia["res4"]
-        _attributes["result_5"] = _sia["res5"]
-
-        self.do_set_attributes_all(
-            attributes=_attributes,
-        )
-
-    def _do_update_tree(self, tree: treelib.Tree) -> None:
-        """Update the Similar Item tree for the newly added or removed Hardware.
-
-        Similar Item records are added by triggers in the database when a new Hardware
-        item is added.  This method simply adds a new node to the Similar Item tree with
-        a blank record.
-
-        :param tree: the Hardware tree with the new node.
-        :return: None
-        :rtype: None
-        """
-        do_clear_tree(self.tree)
-        for _node in tree.all_nodes()[1:]:
-            if not _node.data["hardware"].part:
-                _attributes = {
-                    "revision_id": _node.data["hardware"].revision_id,
-                    "hardware_id": _node.data["hardware"].hardware_id,
-                    "parent_id": _node.data["hardware"].parent_id,
-                }
-                _record = self.do_get_new_record(_attributes)
-                self.tree.create_node(
-                    tag=self._tag,
-                    identifier=_node.data["hardware"].hardware_id,
-                    parent=_node.data["hardware"].parent_id,
-                    data={self._tag: _record},
-                )
+        return _sia
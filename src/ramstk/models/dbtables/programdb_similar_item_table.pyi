@@ -1,18 +1,20 @@
 # Standard Library Imports
+import gettext
 from datetime import date
-from typing import Dict, List, Type, Union
+from typing import Any, Dict, List, Type, Union
 
 # Third Party Imports
 import treelib
 
 # RAMSTK Package Imports
 from ramstk.analyses import similaritem as similaritem
-from ramstk.views.gtk3 import _ as _
 
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKSimilarItemRecord as RAMSTKSimilarItemRecord
 from .basetable import RAMSTKBaseTable as RAMSTKBaseTable
 
+_ = gettext.gettext
+
 class RAMSTKSimilarItemTable(RAMSTKBaseTable):
     _db_id_colname: str
     _db_tablename: str
@@ -28,7 +30,13 @@ class RAMSTKSimilarItemTable(RAMSTKBaseTable):
         self, attributes: Dict[str, Union[date, float, int, str]]
     ) -> RAMSTKSimilarItemRecord: ...
     def do_calculate_similar_item(self, node_id: int) -> None: ...
+    def do_calculate_similar_items(self, node_ids: List[int]) -> None: ...
     def do_roll_up_change_descriptions(self, node_id: int) -> None: ...
     def _do_calculate_topic_633(self, node_id: int) -> None: ...
     def _do_calculate_user_defined(self, node_id: int) -> None: ...
+    def _do_log_unknown_method(self, node_id: int, method_id: int) -> None: ...
+    def _do_set_user_defined_results(
+        self, node_id: int, sia: Dict[str, Any]
+    ) -> None: ...
     def _on_insert_hardware(self, tree: treelib.Tree) -> None: ...
+    def _get_user_defined_sia(self, node_id: int) -> Dict[str, Any]: ...
@@ -9,16 +9,19 @@
 
 # Standard Library Imports
 from datetime import date
-from typing import Any, Dict, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Type, Union
 
 # Third Party Imports
-import pandas as pd
 from pubsub import pub
 
 # RAMSTK Local Imports
 from ..dbrecords import RAMSTKValidationRecord
 from .basetable import RAMSTKBaseTable
 
+if TYPE_CHECKING:
+    # Third Party Imports
+    import pandas as pd
+
 
 class RAMSTKValidationTable(RAMSTKBaseTable):
     """Contain the attributes and methods of the Validation table model."""
@@ -97,6 +100,9 @@ class RAMSTKValidationTable(RAMSTKBaseTable):
         :return: _planned; the pandas DataFrame() containing the planned burndown hours
             for the entire validation effort.
         """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         _dic_planned = {}  # type: ignore
         _time_ll = 0.0
         _time_mean = 0.0
@@ -217,8 +223,9 @@ class RAMSTKValidationTable(RAMSTKBaseTable):
         _node.data["validation"].calculate_task_cost()
 
         _attributes = _node.data["validation"].get_attributes()
-        self.do_set_attributes_all(
-            attributes=_attributes,
+        self.do_set_attributes_many(
+            node_id=node_id,
+            package=_attributes,
         )
 
         pub.sendMessage(
@@ -226,12 +233,15 @@ class RAMSTKValidationTable(RAMSTKBaseTable):
             attributes=_attributes,
         )
 
-    def _do_select_assessment_targets(self) -> pd.DataFrame:
+    def _do_select_assessment_targets(self) -> "pd.DataFrame":
         """Select the targets for all tasks of Reliability Assessment type.
 
         :return: _assessed; a pandas DataFrame() containing the assessment dates as the
             index and associated targets.
         """
+        # Third Party Imports
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         _dic_assessed = {
             pd.to_datetime(_node.data["validation"].date_end): [
                 _node.data["validation"].acceptable_minimum,
@@ -7,7 +7,7 @@
 """Metaclass for the database view models."""
 
 # Standard Library Imports
-from typing import Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 # Third Party Imports
 import treelib
@@ -25,13 +25,19 @@ class RAMSTKBaseView:
     RAMSTK work flow module.  This is the same for all     classes associated with the
     work flow module.
 
-    :ivar _dic_load_functions: a dict of functions to call for loading a row of data in
-    the view's RAMSTKTreeView. :ivar _dic_trees: a dict of treelib.Tree, one for each
-    database table the view is     comprised from. :ivar _lst_modules: the list of
-    RAMSTK work flow modules that comprise the view. :ivar _revision_id: the ID of the
-    Revision the view is associated with. :ivar dao: the instanace of the RAMSTK Program
-    database model. :ivar tree: the view's treelib.Tree.  This is a conblomerate of the
-    trees in     _dic_trees.
+    :ivar _dic_children: a dict of the records in each constituent module's tree keyed
+    by the ID of their parent record. :ivar _dic_insert_functions: a dict of functions
+    to call for adding a single record of a constituent module to the view's tree. :ivar
+    _dic_load_functions: a dict of functions to call for loading a row of data in the
+    view's RAMSTKTreeView. :ivar _dic_node_ids: a dict of the view's tree node ID for
+    each (module, record ID) added to the view's tree. :ivar _dic_parent_keys: a dict
+    of the name of the attribute holding the parent record ID for each child
+    constituent module. :ivar _dic_trees: a dict of treelib.Tree, one for each database
+    table the view is     comprised from. :ivar _lst_modules: the list of RAMSTK work
+    flow modules that comprise the view. :ivar _revision_id: the ID of the Revision the
+    view is associated with. :ivar _tree_loaded: whether the view's tree has been built.
+    :ivar dao: the instanace of the RAMSTK Program database model. :ivar tree: the
+    view's treelib.Tree.  This is a conblomerate of the trees in     _dic_trees.
     """
 
     # Define private dictionary class attributes.
@@ -53,7 +59,11 @@ class RAMSTKBaseView:
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None:
         """Initialize a RAMSTK view model instance."""
         # Initialize private dictionary attributes.
+        self._dic_children: Dict[str, Dict[Any, List[Any]]] = {}
+        self._dic_insert_functions: Dict[str, Callable[[Any], None]] = {}
         self._dic_load_functions: Dict[str, Callable[..., object]] = {}
+        self._dic_node_ids: Dict[Tuple[str, Any], Any] = {}
+        self._dic_parent_keys: Dict[str, str] = {}
         self._dic_trees: Dict[str, treelib.Tree] = {}
 
         # Initialize private list attributes.
@@ -61,6 +71,7 @@ class RAMSTKBaseView:
 
         # Initialize private scalar attributes.
         self._revision_id: int = 0
+        self._tree_loaded: bool = False
 
         # Initialize public dictionary attributes.
 
@@ -104,6 +115,63 @@ class RAMSTKBaseView:
         self._dic_trees[tree.get_node(0).tag] = tree
         self.on_select_all()
 
+    def on_delete_node(self, node_id: Any, tree: treelib.Tree) -> None:
+        """Remove the node for a record deleted from a constituent module.
+
+        Only the node for the deleted record, and its children, are removed from the
+        view's tree.  The view's tree is built from scratch if it hasn't been built
+        yet.
+
+        :param node_id: the ID of the record deleted from the module's tree.
+        :param tree: the calling module's treelib Tree().
+        :return: None
+        :rtype: None
+        """
+        _module = tree.get_node(0).tag
+        self._dic_trees[_module] = tree
+
+        if not self._tree_loaded or _module not in self._dic_insert_functions:
+            self.on_select_all()
+            return
+
+        self._do_remove_node(_module, node_id)
+
+        pub.sendMessage(
+            f"succeed_retrieve_{self._tag}",
+            tree=self.tree,
+        )
+
+    def on_insert_node(self, node_id: Any, tree: treelib.Tree) -> None:
+        """Add the node for a record inserted into a constituent module.
+
+        Only the node for the new record is added to the view's tree.  The view's tree
+        is built from scratch if it hasn't been built yet.
+
+        :param node_id: the ID of the record added to the module's tree.
+        :param tree: the calling module's treelib Tree().
+        :return: None
+        :rtype: None
+        """
+        _module = tree.get_node(0).tag
+        self._dic_trees[_module] = tree
+
+        if not self._tree_loaded or _module not in self._dic_insert_functions:
+            self.on_select_all()
+            return
+
+        _record = tree.get_node(node_id).data[_module]
+        if _module in self._dic_parent_keys:
+            self._dic_children.setdefault(_module, {}).setdefault(
+                getattr(_record, self._dic_parent_keys[_module]), []
+            ).append(_record)
+
+        self._dic_insert_functions[_module](_record)
+
+        pub.sendMessage(
+            f"succeed_retrieve_{self._tag}",
+            tree=self.tree,
+        )
+
     def on_select_all(self) -> None:
         """Build the usage profile treelib Tree().
 
@@ -116,6 +184,11 @@ class RAMSTKBaseView:
         for _node in self.tree.children(self.tree.root):
             self.tree.remove_node(_node.identifier)
 
+        self._dic_node_ids.clear()
+        self._tree_loaded = True
+        for _module in self._dic_parent_keys:
+            self._do_build_child_index(_module)
+
         if self._dic_trees[self._lst_modules[0]].depth() > 0:
             self._dic_load_functions[self._lst_modules[0]]()
 
@@ -123,3 +196,99 @@ class RAMSTKBaseView:
                 f"succeed_retrieve_{self._tag}",
                 tree=self.tree,
             )
+
+    def _get_children(self, module: str, parent_id: Any) -> List[Any]:
+        """Return the records in a constituent module with the passed parent ID.
+
+        :param module: the name of the constituent module to get the records from.
+        :param parent_id: the ID of the parent record.
+        :return: the list of child records; empty if there are none.
+        :rtype: list
+        """
+        return self._dic_children.get(module, {}).get(parent_id, [])
+
+    def _do_add_node(
+        self,
+        module: str,
+        record_id: Any,
+        node_id: Any,
+        parent_id: Any,
+        data: Dict[str, object],
+    ) -> bool:
+        """Add the node for a constituent module record to the view's tree.
+
+        :param module: the name of the constituent module the record belongs to.
+        :param record_id: the ID of the record in the constituent module's tree.
+        :param node_id: the ID of the new node in the view's tree.
+        :param parent_id: the ID of the parent node in the view's tree.
+        :param data: the data package for the new node.
+        :return: True if the node was added or False if the parent node does not
+            exist or the node already exists.
+        :rtype: bool
+        """
+        if self.tree.contains(node_id) or not self.tree.contains(parent_id):
+            return False
+
+        self.tree.create_node(
+            tag=module,
+            identifier=node_id,
+            parent=parent_id,
+            data=data,
+        )
+        self._dic_node_ids[(module, record_id)] = node_id
+
+        return True
+
+    def _do_build_child_index(self, module: str) -> None:
+        """Index the records in a constituent module's tree by their parent ID.
+
+        The index is built in a single pass over the module's tree so loading the
+        children of a node doesn't require scanning the entire child module tree.
+        Records keep the order they have in the module's tree.
+
+        :param module: the name of the constituent module to index.
+        :return: None
+        :rtype: None
+        """
+        _parent_key = self._dic_parent_keys[module]
+        _tree = self._dic_trees[module]
+        _children: Dict[Any, List[Any]] = {}
+
+        for _node_id, _node in _tree.nodes.items():
+            if _node_id != _tree.root:
+                _record = _node.data[module]
+                _children.setdefault(getattr(_record, _parent_key), []).append(_record)
+
+        self._dic_children[module] = _children
+
+    def _do_remove_node(self, module: str, record_id: Any) -> None:
+        """Remove the node for a constituent module record from the view's tree.
+
+        The children of the node are removed along with it.  The node ID and child
+        index entries are removed for the node and every node below it.
+
+        :param module: the name of the constituent module the record belonged to.
+        :param record_id: the ID of the record in the constituent module's tree.
+        :return: None
+        :rtype: None
+        """
+        _node_id = self._dic_node_ids.pop((module, record_id), None)
+        if _node_id is None or not self.tree.contains(_node_id):
+            return
+
+        for _descendant_id in self.tree.expand_tree(_node_id):
+            _node = self.tree.get_node(_descendant_id)
+            _record = _node.data.get(self._tag, _node.data.get(_node.tag))
+            self._dic_node_ids.pop(
+                (_node.tag, getattr(_record, f"{_node.tag}_id", None)), None
+            )
+
+            if _node.tag in self._dic_parent_keys:
+                _parent_id = getattr(_record, self._dic_parent_keys[_node.tag])
+                _siblings = self._get_children(_node.tag, _parent_id)
+                if _record in _siblings:
+                    _siblings.remove(_record)
+                if not _siblings:
+                    self._dic_children.get(_node.tag, {}).pop(_parent_id, None)
+
+        self.tree.remove_node(_node_id)
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 # Third Party Imports
 import treelib
@@ -10,13 +10,31 @@ from ramstk.db.base import BaseDatabase as BaseDatabase
 class RAMSTKBaseView:
     _root: int
     _tag: str
+    _dic_children: Dict[str, Dict[Any, List[Any]]]
+    _dic_insert_functions: Dict[str, Callable[[Any], None]]
     _dic_load_functions: Dict[str, Callable[..., object]]
+    _dic_node_ids: Dict[Tuple[str, Any], Any]
+    _dic_parent_keys: Dict[str, str]
     _dic_trees: Dict[str, treelib.Tree]
     _lst_modules: List[str]
     _revision_id: int
+    _tree_loaded: bool
     dao: BaseDatabase
     tree: treelib.Tree
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None: ...
     def do_get_tree(self) -> None: ...
     def do_set_tree(self, tree: treelib.Tree) -> None: ...
+    def on_delete_node(self, node_id: Any, tree: treelib.Tree) -> None: ...
+    def on_insert_node(self, node_id: Any, tree: treelib.Tree) -> None: ...
     def on_select_all(self) -> None: ...
+    def _get_children(self, module: str, parent_id: Any) -> List[Any]: ...
+    def _do_add_node(
+        self,
+        module: str,
+        record_id: Any,
+        node_id: Any,
+        parent_id: Any,
+        data: Dict[str, object],
+    ) -> bool: ...
+    def _do_build_child_index(self, module: str) -> None: ...
+    def _do_remove_node(self, module: str, record_id: Any) -> None: ...
@@ -14,6 +14,13 @@ from pubsub import pub
 from treelib import Tree
 
 # RAMSTK Local Imports
+from ..dbrecords import (
+    RAMSTKActionRecord,
+    RAMSTKCauseRecord,
+    RAMSTKControlRecord,
+    RAMSTKMechanismRecord,
+    RAMSTKModeRecord,
+)
 from .baseview import RAMSTKBaseView
 
 
@@ -43,6 +50,13 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         super().__init__(**kwargs)
 
         # Initialize private dictionary attributes.
+        self._dic_insert_functions = {
+            "mode": self._do_insert_mode,
+            "mechanism": self._do_insert_mechanism,
+            "cause": self._do_insert_cause,
+            "control": self._do_insert_control,
+            "action": self._do_insert_action,
+        }
         self._dic_load_functions = {
             "mode": self._do_load_modes,
             "mechanism": self._do_load_mechanisms,
@@ -50,6 +64,12 @@ class RAMSTKFMEAView(RAMSTKBaseView):
             "control": self._do_load_controls,
             "action": self._do_load_actions,
         }
+        self._dic_parent_keys = {
+            "mechanism": "mode_id",
+            "cause": "mechanism_id",
+            "control": "cause_id",
+            "action": "cause_id",
+        }
         self._dic_trees = {
             "mode": Tree(),
             "mechanism": Tree(),
@@ -76,21 +96,118 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         # Initialize public scalar attributes.
 
         # Subscribe to PyPubSub messages.
-        pub.subscribe(super().do_set_tree, "succeed_insert_mode")
-        pub.subscribe(super().do_set_tree, "succeed_insert_mechanism")
-        pub.subscribe(super().do_set_tree, "succeed_insert_cause")
-        pub.subscribe(super().do_set_tree, "succeed_insert_control")
-        pub.subscribe(super().do_set_tree, "succeed_insert_action")
+        pub.subscribe(super().on_insert_node, "succeed_insert_mode")
+        pub.subscribe(super().on_insert_node, "succeed_insert_mechanism")
+        pub.subscribe(super().on_insert_node, "succeed_insert_cause")
+        pub.subscribe(super().on_insert_node, "succeed_insert_control")
+        pub.subscribe(super().on_insert_node, "succeed_insert_action")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_mode")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_mechanism")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_cause")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_control")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_action")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mode")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mechanism")
-        pub.subscribe(super().do_set_tree, "succeed_delete_cause")
-        pub.subscribe(super().do_set_tree, "succeed_delete_control")
-        pub.subscribe(super().do_set_tree, "succeed_delete_action")
+        pub.subscribe(super().on_delete_node, "succeed_delete_mode")
+        pub.subscribe(super().on_delete_node, "succeed_delete_mechanism")
+        pub.subscribe(super().on_delete_node, "succeed_delete_cause")
+        pub.subscribe(super().on_delete_node, "succeed_delete_control")
+        pub.subscribe(super().on_delete_node, "succeed_delete_action")
+
+    def _do_insert_action(self, action: RAMSTKActionRecord) -> None:
+        """Insert an FMEA action into the tree under its failure cause.
+
+        :param action: the action record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("cause", action.cause_id))
+
+        self._do_add_node(
+            "action",
+            action.action_id,
+            f"{_parent_id}.{action.action_id}a",
+            _parent_id,
+            {self._tag: action},
+        )
+
+    def _do_insert_cause(self, cause: RAMSTKCauseRecord) -> None:
+        """Insert a failure cause and its controls and actions into the tree.
+
+        :param cause: the failure cause record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("mechanism", cause.mechanism_id))
+        _node_id = f"{_parent_id}.{cause.cause_id}"
+
+        if self._do_add_node(
+            "cause",
+            cause.cause_id,
+            _node_id,
+            _parent_id,
+            {self._tag: cause},
+        ):
+            if self._dic_trees["control"].depth() > 0:
+                self._dic_load_functions["control"](cause.cause_id)
+
+            if self._dic_trees["action"].depth() > 0:
+                self._dic_load_functions["action"](cause.cause_id)
+
+    def _do_insert_control(self, control: RAMSTKControlRecord) -> None:
+        """Insert an FMEA control into the tree under its failure cause.
+
+        :param control: the control record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("cause", control.cause_id))
+
+        self._do_add_node(
+            "control",
+            control.control_id,
+            f"{_parent_id}.{control.control_id}c",
+            _parent_id,
+            {self._tag: control},
+        )
+
+    def _do_insert_mechanism(self, mechanism: RAMSTKMechanismRecord) -> None:
+        """Insert a failure mechanism and its failure causes into the tree.
+
+        :param mechanism: the failure mechanism record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("mode", mechanism.mode_id))
+
+        if (
+            self._do_add_node(
+                "mechanism",
+                mechanism.mechanism_id,
+                f"{_parent_id}.{mechanism.mechanism_id}",
+                _parent_id,
+                {self._tag: mechanism},
+            )
+            and self._dic_trees["cause"].depth() > 0
+        ):
+            self._dic_load_functions["cause"](mechanism.mechanism_id)
+
+    def _do_insert_mode(self, mode: RAMSTKModeRecord) -> None:
+        """Insert a failure mode and its failure mechanisms into the tree.
+
+        :param mode: the failure mode record to insert.
+        :return: None
+        :rtype: None
+        """
+        if (
+            self._do_add_node(
+                "mode",
+                mode.mode_id,
+                f"{mode.mode_id}",
+                self._root,
+                {self._tag: mode},
+            )
+            and self._dic_trees["mechanism"].depth() > 0
+        ):
+            self._dic_load_functions["mechanism"](mode.mode_id)
 
     def _do_load_modes(self) -> None:
         """Load the failure modes into the tree.
@@ -99,20 +216,7 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["mode"].all_nodes()[1:]:
-            _mode = _node.data["mode"]
-            _node_id = f"{_mode.mode_id}"
-
-            self.tree.create_node(
-                tag="mode",
-                identifier=_node_id,
-                parent=self._root,
-                data={self._tag: _mode},
-            )
-
-            if self._dic_trees["mechanism"].depth() > 0:
-                self._dic_load_functions["mechanism"](
-                    _mode.mode_id,
-                )
+            self._do_insert_mode(_node.data["mode"])
 
     def _do_load_mechanisms(self, mode_id: int) -> None:
         """Load the failure mechanisms into the tree.
@@ -121,89 +225,35 @@ class RAMSTKFMEAView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["mechanism"].all_nodes()[1:]:
-            _mechanism = _node.data["mechanism"]
-            _node_id = f"{mode_id}.{_mechanism.mechanism_id}"
-
-            if _mechanism.mode_id == mode_id:
-                self.tree.create_node(
-                    tag="mechanism",
-                    identifier=_node_id,
-                    parent=f"{mode_id}",
-                    data={self._tag: _mechanism},
-                )
-
-                if self._dic_trees["cause"].depth() > 0:
-                    self._dic_load_functions["cause"](
-                        _mechanism.mechanism_id,
-                        _node_id,
-                    )
-
-    def _do_load_causes(self, mechanism_id: int, parent_id: str) -> None:
+        for _mechanism in self._get_children("mechanism", mode_id):
+            self._do_insert_mechanism(_mechanism)
+
+    def _do_load_causes(self, mechanism_id: int) -> None:
         """Load the failure causes into the tree for the passed mechanism ID.
 
-        :param mechanism_id: the failure mechanism ID to add the new operating load.
-        :param parent_id: the parent node ID.
+        :param mechanism_id: the failure mechanism ID to load the causes for.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["cause"].all_nodes()[1:]:
-            _cause = _node.data["cause"]
-
-            if _cause.mechanism_id == mechanism_id:
-                self.tree.create_node(
-                    tag="cause",
-                    identifier=f"{parent_id}.{_cause.cause_id}",
-                    parent=parent_id,
-                    data={self._tag: _cause},
-                )
-
-                if self._dic_trees["control"].depth() > 0:
-                    self._dic_load_functions["control"](
-                        _cause.cause_id,
-                        f"{parent_id}.{_cause.cause_id}",
-                    )
-
-                if self._dic_trees["action"].depth() > 0:
-                    self._dic_load_functions["action"](
-                        _cause.cause_id,
-                        f"{parent_id}.{_cause.cause_id}",
-                    )
-
-    def _do_load_controls(self, cause_id: int, parent_id: str) -> None:
+        for _cause in self._get_children("cause", mechanism_id):
+            self._do_insert_cause(_cause)
+
+    def _do_load_controls(self, cause_id: int) -> None:
         """Load the FNEA controls into the tree.
 
         :param cause_id: the ID of the parent failure cause.
-        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["control"].all_nodes()[1:]:
-            _control = _node.data["control"]
-
-            if _control.cause_id == cause_id:
-                self.tree.create_node(
-                    tag="control",
-                    identifier=f"{parent_id}.{_control.control_id}c",
-                    parent=parent_id,
-                    data={self._tag: _control},
-                )
-
-    def _do_load_actions(self, cause_id: int, parent_id: str) -> None:
+        for _control in self._get_children("control", cause_id):
+            self._do_insert_control(_control)
+
+    def _do_load_actions(self, cause_id: int) -> None:
         """Load the FMEA actions into the tree.
 
         :param cause_id: the ID of the parent failure cause.
-        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["action"].all_nodes()[1:]:
-            _action = _node.data["action"]
-
-            if _action.cause_id == cause_id:
-                self.tree.create_node(
-                    tag="action",
-                    identifier=f"{parent_id}.{_action.action_id}a",
-                    parent=parent_id,
-                    data={self._tag: _action},
-                )
+        for _action in self._get_children("action", cause_id):
+            self._do_insert_action(_action)
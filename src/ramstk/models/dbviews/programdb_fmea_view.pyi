@@ -5,17 +5,28 @@ from typing import Callable, Dict, List, Union
 import treelib
 
 # RAMSTK Local Imports
+from ..dbrecords import RAMSTKActionRecord as RAMSTKActionRecord
+from ..dbrecords import RAMSTKCauseRecord as RAMSTKCauseRecord
+from ..dbrecords import RAMSTKControlRecord as RAMSTKControlRecord
+from ..dbrecords import RAMSTKMechanismRecord as RAMSTKMechanismRecord
+from ..dbrecords import RAMSTKModeRecord as RAMSTKModeRecord
 from .baseview import RAMSTKBaseView as RAMSTKBaseView
 
 class RAMSTKFMEAView(RAMSTKBaseView):
     _root: int
     _tag: str
+    _dic_insert_functions: Dict[str, Callable[..., None]]
     _dic_load_functions: Dict[str, Callable[..., object]]
     _dic_trees: Dict[str, treelib.Tree]
     _lst_modules: List[str]
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None: ...
+    def _do_insert_action(self, action: RAMSTKActionRecord) -> None: ...
+    def _do_insert_cause(self, cause: RAMSTKCauseRecord) -> None: ...
+    def _do_insert_control(self, control: RAMSTKControlRecord) -> None: ...
+    def _do_insert_mechanism(self, mechanism: RAMSTKMechanismRecord) -> None: ...
+    def _do_insert_mode(self, mode: RAMSTKModeRecord) -> None: ...
     def _do_load_modes(self) -> None: ...
     def _do_load_mechanisms(self, mode_id: int) -> None: ...
-    def _do_load_causes(self, mechanism_id: int, parent_id: str) -> None: ...
-    def _do_load_controls(self, cause_id: int, parent_id: str) -> None: ...
-    def _do_load_actions(self, cause_id: int, parent_id: str) -> None: ...
+    def _do_load_causes(self, mechanism_id: int) -> None: ...
+    def _do_load_controls(self, cause_id: int) -> None: ...
+    def _do_load_actions(self, cause_id: int) -> None: ...
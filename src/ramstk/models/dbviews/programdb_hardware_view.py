@@ -7,13 +7,20 @@
 """Hardware BoM View Model."""
 
 # Standard Library Imports
-from typing import Dict, Union
+from math import isnan
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 # Third Party Imports
+import numpy as np
 from pubsub import pub
-from treelib import Tree
+from treelib import Node, Tree
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import milhdbk217f
+from ramstk.analyses.statistics import distributions
 
 # RAMSTK Local Imports
+from ..dbrecords import RAMSTKHardwareRecord
 from .baseview import RAMSTKBaseView
 
 
@@ -43,6 +50,14 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         super().__init__(**kwargs)
 
         # Initialize private dictionary attributes.
+        self._dic_insert_functions = {
+            "hardware": self._do_insert_hardware,
+            "design_electric": self._do_insert_design_electric,
+            "design_mechanic": self._do_insert_design_mechanic,
+            "milhdbk217f": self._do_insert_milhdbk217f,
+            "nswc": self._do_insert_nswc,
+            "reliability": self._do_insert_reliability,
+        }
         self._dic_load_functions = {
             "hardware": self._do_load_hardware,
             "design_electric": self._do_load_design_electric,
@@ -51,6 +66,8 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
             "nswc": self._do_load_nswc,
             "reliability": self._do_load_reliability,
         }
+        self._dic_hazard_rates: Dict[int, float] = {}
+        self._dic_predictions: Dict[int, Dict[str, float]] = {}
         self._dic_stress_limits: Dict[str, Dict[str, float]] = kwargs.get(
             "stress_limits",
             {  # type: ignore
@@ -86,6 +103,7 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
 
         # Initialize private scalar attributes.
         self._hr_multiplier: float = kwargs.get("hr_multiplier", 1.0)  # type: ignore
+        self._set_dirty_ids: Set[int] = set()
 
         # Initialize public dictionary attributes.
 
@@ -94,30 +112,39 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         # Initialize public scalar attributes.
 
         # Subscribe to PyPubSub messages.
-        pub.subscribe(super().do_set_tree, "succeed_insert_hardware")
-        pub.subscribe(super().do_set_tree, "succeed_insert_design_electric")
-        pub.subscribe(super().do_set_tree, "succeed_insert_design_mechanic")
-        pub.subscribe(super().do_set_tree, "succeed_insert_milhdbk217f")
-        pub.subscribe(super().do_set_tree, "succeed_insert_nswc")
-        pub.subscribe(super().do_set_tree, "succeed_insert_reliability")
+        pub.subscribe(super().on_insert_node, "succeed_insert_hardware")
+        pub.subscribe(super().on_insert_node, "succeed_insert_design_electric")
+        pub.subscribe(super().on_insert_node, "succeed_insert_design_mechanic")
+        pub.subscribe(super().on_insert_node, "succeed_insert_milhdbk217f")
+        pub.subscribe(super().on_insert_node, "succeed_insert_nswc")
+        pub.subscribe(super().on_insert_node, "succeed_insert_reliability")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_hardware")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_design_electric")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_design_mechanic")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_milhdbk217f")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_nswc")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_reliability")
-        pub.subscribe(super().do_set_tree, "succeed_delete_hardware")
-        pub.subscribe(super().do_set_tree, "succeed_delete_design_electric")
-        pub.subscribe(super().do_set_tree, "succeed_delete_design_mechanic")
-        pub.subscribe(super().do_set_tree, "succeed_delete_milhdbk217f")
-        pub.subscribe(super().do_set_tree, "succeed_delete_nswc")
-        pub.subscribe(super().do_set_tree, "succeed_delete_reliability")
+        pub.subscribe(super().on_delete_node, "succeed_delete_hardware")
+        pub.subscribe(super().on_delete_node, "succeed_delete_design_electric")
+        pub.subscribe(super().on_delete_node, "succeed_delete_design_mechanic")
+        pub.subscribe(super().on_delete_node, "succeed_delete_milhdbk217f")
+        pub.subscribe(super().on_delete_node, "succeed_delete_nswc")
+        pub.subscribe(super().on_delete_node, "succeed_delete_reliability")
         pub.subscribe(self.do_calculate_hardware, "request_calculate_hardware")
+        pub.subscribe(
+            self.do_calculate_dirty_hardware, "request_calculate_dirty_hardware"
+        )
         pub.subscribe(self.do_make_composite_ref_des, "request_make_comp_ref_des")
+        for _module in self._lst_modules:
+            pub.subscribe(self._do_set_dirty, f"mvw_editing_{_module}")
+            pub.subscribe(self._do_set_dirty, f"wvw_editing_{_module}")
 
     def do_calculate_assembly_hazard_rates(self, node_id: int) -> None:
         """Calculate the hazard rates for assemblies.
 
+        The hazard rates of the children of an assembly using the roll-up method must
+        already be calculated.
+
         :param node_id: the record ID to calculate.
         :return: None
         :rtype: None
@@ -137,15 +164,16 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
                 self._hr_multiplier,
                 _attributes,
                 time=_record.data["hardware"].mission_time,
+                hazard_rate_distribution=self._dic_hazard_rates.pop(node_id, None),
             )
         else:
             _hazard_rate_active: float = 0.0
             _hazard_rate_dormant: float = 0.0
 
-            for _node in self.tree.children(node_id):
-                self.do_calculate_hazard_rates(_node.identifier)
-                _hazard_rate_active += _node.data["reliability"].hazard_rate_active
-                _hazard_rate_dormant += _node.data["reliability"].hazard_rate_dormant
+            for _node_id in _record.successors(self.tree.identifier):
+                _reliability = self.tree.nodes[_node_id].data["reliability"]
+                _hazard_rate_active += _reliability.hazard_rate_active
+                _hazard_rate_dormant += _reliability.hazard_rate_dormant
 
             _hazard_rate_active = (
                 (_hazard_rate_active + _record.data["reliability"].add_adj_factor)
@@ -164,31 +192,112 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        _record = self.tree.get_node(node_id).data["hardware"]
-        _total_cost: float = 0.0
+        for _node in self._get_calculation_order(node_id):
+            self._do_roll_up_cost(_node)
 
-        if _record.part == 1:
-            _record.do_calculate_total_cost()
-        else:
-            for _node in self.tree.children(node_id):
-                self.do_calculate_cost(_node.identifier)
-                _total_cost += _node.data["hardware"].total_cost
+    def do_calculate_dirty_hardware(self) -> int:
+        """Calculate only the hardware items whose inputs have changed.
 
-            _total_cost *= _record.quantity
-            _record.set_attributes({"cost": _total_cost})
-            _record.set_attributes({"total_cost": _total_cost})
+        Hardware items are marked dirty when their attributes, or the attributes of
+        one of their analysis records, are edited or when they're added to the tree.
+        Only the dirty hardware items and their ancestors are calculated; the values
+        of every other hardware item are reused as they are.  Changing whether an
+        item is a part or its hazard rate method marks the item's entire subtree
+        dirty.
+
+        :return: _node_count; the number of hardware items calculated.
+        :rtype: int
+        """
+        _nodes: Dict[int, Node] = {}
+        for _node_id in self._set_dirty_ids:
+            while _node_id != self._root and _node_id not in _nodes:
+                _node = self.tree.get_node(_node_id)
+                if _node is None:
+                    break
+                _nodes[_node_id] = _node
+                _node_id = _node.predecessor(self.tree.identifier)
+
+        _order = sorted(_nodes.values(), key=lambda _node: self.tree.depth(_node))
+
+        # Walk down the tree to find the items that are calculated, i.e., those not
+        # below a part, and those that have their hazard rates calculated.
+        _calculate: Dict[int, bool] = {self._root: True}
+        _hazard_rate: Dict[int, bool] = {self._root: True}
+        for _node in _order:
+            _parent_id = _node.predecessor(self.tree.identifier)
+            if _parent_id == self._root:
+                _calculate[_node.identifier] = True
+                _hazard_rate[_node.identifier] = True
+            else:
+                _parent = _nodes[_parent_id]
+                _calculate[_node.identifier] = (
+                    _calculate[_parent_id] and _parent.data["hardware"].part != 1
+                )
+                _hazard_rate[_node.identifier] = (
+                    _calculate[_node.identifier]
+                    and _hazard_rate[_parent_id]
+                    and _parent.data["reliability"].hazard_rate_type_id == 1
+                )
+
+        self._do_predict_hazard_rates(
+            [
+                _node
+                for _node in _order
+                if _calculate[_node.identifier] and _hazard_rate[_node.identifier]
+            ]
+        )
+
+        _node_count: int = 0
+        for _node in reversed(_order):
+            if _calculate[_node.identifier]:
+                self._do_roll_up_cost(_node)
+                self._do_roll_up_part_count(_node)
+                self._do_roll_up_power_dissipation(_node)
+                if _hazard_rate[_node.identifier]:
+                    self._do_roll_up_hazard_rates(_node)
+                _node_count += 1
+
+        self._set_dirty_ids.clear()
+
+        pub.sendMessage(
+            "succeed_calculate_dirty_hardware",
+            node_count=_node_count,
+        )
+
+        return _node_count
 
     def do_calculate_hardware(self, node_id: int) -> None:
         """Calculate all metrics for the hardware associated with node ID.
 
+        The cost, part count, power dissipation, and hazard rate metrics are all
+        calculated in a single pass over the hardware items in post-order so each
+        item is calculated after its children.  The results are written straight
+        into the records and a single succeed_calculate_hardware message is sent
+        once every item has been calculated.
+
         :param node_id: the record ID to calculate.
         :return: None
         :rtype: None
         """
-        self.do_calculate_cost(node_id)
-        self.do_calculate_part_count(node_id)
-        self.do_calculate_power_dissipation(node_id)
-        self.do_calculate_hazard_rates(node_id)
+        _order = self._get_calculation_order(node_id)
+        _hazard_rate_ids = self._get_hazard_rate_ids(node_id, _order)
+        self._do_predict_hazard_rates(
+            [_node for _node in _order if _node.identifier in _hazard_rate_ids]
+        )
+
+        for _node in _order:
+            self._do_roll_up_cost(_node)
+            self._do_roll_up_part_count(_node)
+            self._do_roll_up_power_dissipation(_node)
+            if _node.identifier in _hazard_rate_ids:
+                self._do_roll_up_hazard_rates(_node)
+
+        self._set_dirty_ids.difference_update(_node.identifier for _node in _order)
+
+        # The parent's roll-up values are now out of date.
+        _parent_id = self.tree.nodes[node_id].predecessor(self.tree.identifier)
+        if _parent_id != self._root:
+            self._set_dirty_ids.add(_parent_id)
 
         for _table in ["design_electric", "milhdbk217f", "reliability"]:
             pub.sendMessage(
@@ -196,6 +305,11 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
                 node_id=node_id,
             )
 
+        pub.sendMessage(
+            "succeed_calculate_hardware",
+            tree=self._dic_trees["hardware"],
+        )
+
     def do_calculate_hazard_rates(self, node_id: int) -> None:
         """Calculate the hazard rate of a hardware item.
 
@@ -203,25 +317,16 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        _record = self.tree.get_node(node_id)
-
-        if _record.data["hardware"].part == 1:
-            self.do_calculate_part_hazard_rates(node_id)
-        else:
-            self.do_calculate_assembly_hazard_rates(node_id)
-
-        _record.data["reliability"].do_calculate_hazard_rate_logistics()
-        _record.data["reliability"].do_calculate_hazard_rate_mission(
-            _record.data["hardware"].duty_cycle
-        )
-        _record.data["reliability"].do_calculate_mtbf(
-            multiplier=self._hr_multiplier,
-        )
-        _record.data["reliability"].do_calculate_reliability(
-            _record.data["hardware"].mission_time,
-            multiplier=self._hr_multiplier,
+        _order = self._get_calculation_order(node_id)
+        _hazard_rate_ids = self._get_hazard_rate_ids(node_id, _order)
+        self._do_predict_hazard_rates(
+            [_node for _node in _order if _node.identifier in _hazard_rate_ids]
         )
 
+        for _node in _order:
+            if _node.identifier in _hazard_rate_ids:
+                self._do_roll_up_hazard_rates(_node)
+
     def do_calculate_part_count(self, node_id: int) -> None:
         """Calculate the total part count of a hardware item.
 
@@ -229,42 +334,44 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        _record = self.tree.get_node(node_id).data["hardware"]
-        _total_part_count: int = 0
-
-        if _record.part == 1:
-            _record.total_part_count = _record.quantity
-        else:
-            for _node in self.tree.children(node_id):
-                self.do_calculate_part_count(_node.identifier)
-                _total_part_count += _node.data["hardware"].total_part_count
-
-            _total_part_count *= _record.quantity
-            _record.set_attributes({"total_part_count": _total_part_count})
+        for _node in self._get_calculation_order(node_id):
+            self._do_roll_up_part_count(_node)
 
     def do_calculate_part_hazard_rates(self, node_id: int) -> None:
         """Calculate the hazard rates for parts.
 
+        The MIL-HDBK-217F prediction, if any, is written straight into the part's
+        records rather than broadcast.
+
         :param node_id: the record ID to calculate.
         :return: None
         :rtype: None
         """
         _record = self.tree.get_node(node_id)
-        _attributes = {
-            **_record.data["hardware"].get_attributes(),
-            **_record.data["design_mechanic"].get_attributes(),
-            **_record.data["design_electric"].get_attributes(),
-            **_record.data["milhdbk217f"].get_attributes(),
-            **_record.data["nswc"].get_attributes(),
-            **_record.data["reliability"].get_attributes(),
-        }
 
-        self.do_calculate_part_stress(node_id)
+        if node_id not in self._dic_predictions:
+            self._do_predict_hazard_rates([_record])
+        _prediction = self._dic_predictions.pop(node_id)
+
+        _hazard_rate_predicted: Optional[float] = None
+        if "hazard_rate_active" in _prediction:
+            _record.data["milhdbk217f"].set_attributes(
+                {
+                    _key: _value
+                    for _key, _value in _prediction.items()
+                    if _key in _record.data["milhdbk217f"].__defaults__
+                }
+            )
+            if "lambda_b" in _prediction:
+                _record.data["reliability"].lambda_b = _prediction["lambda_b"]
+            _hazard_rate_predicted = _prediction["hazard_rate_active"]
 
         _record.data["reliability"].do_calculate_hazard_rate_active(
             self._hr_multiplier,
-            _attributes,
+            self._get_part_attributes(_record),
             time=_record.data["hardware"].mission_time,
+            hazard_rate_predicted=_hazard_rate_predicted,
+            hazard_rate_distribution=self._dic_hazard_rates.pop(node_id, None),
         )
 
         _record.data["reliability"].do_calculate_hazard_rate_dormant(
@@ -302,63 +409,524 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :return: _total_power_dissipation; the total power dissipation.
         :rtype: float
         """
-        _record = self.tree.get_node(node_id)
         _total_power_dissipation: float = 0.0
 
-        if _record.data["hardware"].part == 1:
-            _total_power_dissipation = (
-                _record.data["design_electric"].power_operating
-                * _record.data["hardware"].quantity
-            )
-        else:
-            for _node_id in _record.successors(self.tree.identifier):
-                _total_power_dissipation += self.do_calculate_power_dissipation(
-                    _node_id
-                )
+        for _node in self._get_calculation_order(node_id):
+            _total_power_dissipation = self._do_roll_up_power_dissipation(_node)
 
-            _total_power_dissipation *= _record.data["hardware"].quantity
+        return _total_power_dissipation
 
-        _record.data["hardware"].set_attributes(
-            {"total_power_dissipation": _total_power_dissipation}
-        )
+    def on_select_all(self) -> None:
+        """Build the hardware BoM treelib Tree().
 
-        return _total_power_dissipation
+        Every hardware item in the rebuilt tree is marked dirty.
+
+        :return: None
+        :rtype: None
+        """
+        super().on_select_all()
+
+        self._set_dirty_ids = set(self.tree.nodes) - {self._root}
 
     def do_make_composite_ref_des(self, node_id: int = 1) -> None:
         """Make the composite reference designators.
 
+        The composite reference designators are written straight into the records
+        and a single succeed_make_comp_ref_des message is sent once every item has
+        been updated.
+
         :param node_id: the record ID to start making the composite reference
             designators.
         :return: None
         :rtype: None
         """
-        # Retrieve the parent hardware item's composite reference designator.
-        _node = self.tree.get_node(node_id)
-        _record = _node.data["hardware"]
+        # Parents are visited before their children in the reversed post-order so
+        # the parent's composite reference designator is always available.
+        for _node in reversed(self._get_post_order(node_id)):
+            _record = _node.data["hardware"]
+            _parent_id = _node.predecessor(self.tree.identifier)
+
+            if _parent_id != self._root:
+                _p_comp_ref_des = (
+                    self.tree.nodes[_parent_id].data["hardware"].comp_ref_des
+                )
+            else:
+                _p_comp_ref_des = ""
+
+            if _p_comp_ref_des != "":
+                _record.comp_ref_des = f"{_p_comp_ref_des}:{_record.ref_des}"
+                _node.tag = f"{_p_comp_ref_des}:{_record.ref_des}"
+            else:
+                _record.comp_ref_des = _record.ref_des
+                _node.tag = _record.ref_des
+
+        pub.sendMessage(
+            "succeed_make_comp_ref_des",
+            tree=self._dic_trees["hardware"],
+        )
+
+    def _do_attach_record(self, module: str, record: object) -> None:
+        """Attach a hardware analysis record to its hardware item in the tree.
+
+        :param module: the name of the module the record belongs to.
+        :param record: the analysis record to attach.
+        :return: None
+        :rtype: None
+        """
+        _node = self.tree.get_node(record.hardware_id)  # type: ignore
+        if _node is not None:
+            _node.data[module] = record
+            self._set_dirty_ids.add(_node.identifier)
+
+    def _do_calculate_distribution_hazard_rates(self, nodes: List[Node]) -> None:
+        """Calculate the failure distribution hazard rates of many items at once.
+
+        The items using a failure distribution are grouped by distribution and the
+        hazard rates of each group are calculated in one batch.  The hazard rates
+        are held until each item is calculated.
+
+        :param nodes: the list of Nodes that will have their hazard rates calculated.
+        :return: None
+        :rtype: None
+        """
+        self._dic_hazard_rates.clear()
+
+        _dic_inputs: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for _node in nodes:
+            if _node.data["reliability"].hazard_rate_type_id == 4:
+                _inputs = _node.data["reliability"].get_distribution_inputs(
+                    _node.data["hardware"].mission_time
+                )
+                _dic_inputs.setdefault(_inputs.pop("dist_type"), {})[
+                    _node.identifier
+                ] = _inputs
+
+        for _dist_type, _items in _dic_inputs.items():
+            _hazard_rates = distributions.calculate_hazard_rate(
+                **{
+                    _key: np.array([_inputs[_key] for _inputs in _items.values()])
+                    for _key in ["time", "location", "scale", "shape"]
+                },
+                dist_type=_dist_type,
+            )
+            self._dic_hazard_rates.update(
+                zip(_items, (float(_hazard_rate) for _hazard_rate in _hazard_rates))
+            )
+
+    def _do_insert_design_electric(self, design_electric: object) -> None:
+        """Insert a design electric record into the tree.
+
+        :param design_electric: the design electric record to insert.
+        :return: None
+        :rtype: None
+        """
+        self._do_attach_record("design_electric", design_electric)
+
+    def _do_insert_design_mechanic(self, design_mechanic: object) -> None:
+        """Insert a design mechanic record into the tree.
+
+        :param design_mechanic: the design mechanic record to insert.
+        :return: None
+        :rtype: None
+        """
+        self._do_attach_record("design_mechanic", design_mechanic)
+
+    def _do_insert_hardware(self, hardware: RAMSTKHardwareRecord) -> None:
+        """Insert a hardware item and its analysis records into the tree.
+
+        :param hardware: the hardware record to insert.
+        :return: None
+        :rtype: None
+        """
+        if self._do_add_node(
+            "hardware",
+            hardware.hardware_id,
+            hardware.hardware_id,
+            hardware.parent_id,
+            {"hardware": hardware},
+        ):
+            self._set_dirty_ids.add(hardware.hardware_id)
+            for _module in self._lst_modules[1:]:
+                _node = self._dic_trees[_module].get_node(hardware.hardware_id)
+                if _node is not None:
+                    self._do_attach_record(_module, _node.data[_module])
+
+    def _do_insert_milhdbk217f(self, milhdbk217f: object) -> None:
+        """Insert a MIL-HDBK-217F record into the tree.
+
+        :param milhdbk217f: the MIL-HDBK-217F record to insert.
+        :return: None
+        :rtype: None
+        """
+        self._do_attach_record("milhdbk217f", milhdbk217f)
+
+    def _do_insert_nswc(self, nswc: object) -> None:
+        """Insert an NSWC record into the tree.
+
+        :param nswc: the NSWC record to insert.
+        :return: None
+        :rtype: None
+        """
+        self._do_attach_record("nswc", nswc)
+
+    def _do_insert_reliability(self, reliability: object) -> None:
+        """Insert a reliability record into the tree.
+
+        :param reliability: the reliability record to insert.
+        :return: None
+        :rtype: None
+        """
+        self._do_attach_record("reliability", reliability)
 
-        if self.tree.parent(node_id).identifier != 0:
-            _p_comp_ref_des = self.tree.parent(node_id).data["hardware"].comp_ref_des
+    def _do_predict_failed_part(
+        self, node: Node, attributes: Dict[str, Union[float, int, str]]
+    ) -> None:
+        """Predict the hazard rate of a part the batch prediction couldn't calculate.
+
+        The single part prediction reports the failure; the part's predicted hazard
+        rate is then zero, just as if the prediction had failed on its own.
+
+        :param node: the treelib Node() of the part that couldn't be calculated.
+        :param attributes: the aggregate attribute dict of the part.
+        :return: None
+        :rtype: None
+        """
+        milhdbk217f.do_predict_active_hazard_rate(attributes, quiet=True)
+
+        self._dic_predictions[node.identifier] = {"hazard_rate_active": 0.0}
+
+    def _do_predict_hazard_rates(self, nodes: List[Node]) -> None:
+        """Predict the MIL-HDBK-217F hazard rates of many parts at once.
+
+        The stress analysis of every part is performed first.  The hazard rates of the
+        parts using the parts count method and of those using the parts stress method
+        are then each predicted in one batch.  The predictions are held until each
+        part is calculated so they can be written straight into the part's records.
+        The hazard rates of the items using a failure distribution are calculated in
+        one batch per distribution as well.
+
+        :param nodes: the list of Nodes that will have their hazard rates calculated.
+        :return: None
+        :rtype: None
+        """
+        self._dic_predictions.clear()
+        self._do_calculate_distribution_hazard_rates(nodes)
+
+        _parts = [_node for _node in nodes if _node.data["hardware"].part == 1]
+        for _node in _parts:
+            self.do_calculate_part_stress(_node.identifier)
+            self._dic_predictions[_node.identifier] = {}
+
+        _parts = [
+            _node
+            for _node in _parts
+            if _node.data["reliability"].hazard_rate_type_id == 1
+        ]
+        self._do_predict_part_count(
+            [
+                _node
+                for _node in _parts
+                if _node.data["reliability"].hazard_rate_method_id == 1
+            ]
+        )
+        self._do_predict_part_stress(
+            [
+                _node
+                for _node in _parts
+                if _node.data["reliability"].hazard_rate_method_id == 2
+            ]
+        )
+
+    def _do_predict_part_count(self, parts: List[Node]) -> None:
+        """Predict the MIL-HDBK-217F parts count hazard rates of many parts at once.
+
+        :param parts: the list of Nodes of the parts using the parts count method.
+        :return: None
+        :rtype: None
+        """
+        if not parts:
+            return
+
+        _columns = {
+            _key: [
+                getattr(
+                    _node.data[
+                        {
+                            "category_id": "hardware",
+                            "subcategory_id": "hardware",
+                            "quality_id": "reliability",
+                        }.get(_key, "design_electric")
+                    ],
+                    _key,
+                )
+                for _node in parts
+            ]
+            for _key in milhdbk217f.PART_COUNT_KEYS
+        }
+        _lambda_b, _pi_q = milhdbk217f.get_part_count_factors(_columns)
+
+        for _node, _part_lambda_b, _part_pi_q in zip(parts, _lambda_b, _pi_q):
+            if isnan(_part_lambda_b):
+                self._do_predict_failed_part(_node, self._get_part_attributes(_node))
+            else:
+                self._dic_predictions[_node.identifier] = {
+                    "lambda_b": float(_part_lambda_b),
+                    "piQ": float(_part_pi_q),
+                    "hazard_rate_active": float(_part_lambda_b * _part_pi_q),
+                }
+
+    def _do_predict_part_stress(self, parts: List[Node]) -> None:
+        """Predict the MIL-HDBK-217F parts stress hazard rates of many parts at once.
+
+        :param parts: the list of Nodes of the parts using the parts stress method.
+        :return: None
+        :rtype: None
+        """
+        if not parts:
+            return
+
+        _lst_attributes = [self._get_part_attributes(_node) for _node in parts]
+        _results = milhdbk217f.do_predict_part_stress_hazard_rates(
+            {
+                _key: [_attributes[_key] for _attributes in _lst_attributes]
+                for _key in _lst_attributes[0]
+                if all(
+                    isinstance(_attributes[_key], (int, float))
+                    for _attributes in _lst_attributes
+                )
+            }
+        )
+
+        for _index, _node in enumerate(parts):
+            if isnan(_results["hazard_rate_active"][_index]):
+                self._do_predict_failed_part(_node, _lst_attributes[_index])
+            else:
+                self._dic_predictions[_node.identifier] = {
+                    _key: float(_values[_index]) for _key, _values in _results.items()
+                }
+
+    def _do_remove_node(self, module: str, record_id: Any) -> None:
+        """Remove the node for a hardware item from the view's tree.
+
+        The parent of the hardware item removed is marked dirty.
+
+        :param module: the name of the constituent module the record belonged to.
+        :param record_id: the ID of the record in the constituent module's tree.
+        :return: None
+        :rtype: None
+        """
+        if module == "hardware" and self.tree.contains(record_id):
+            self._set_dirty_ids.add(
+                self.tree.nodes[record_id].predecessor(self.tree.identifier)
+            )
+
+        super()._do_remove_node(module, record_id)
+
+        self._set_dirty_ids = {
+            _node_id
+            for _node_id in self._set_dirty_ids
+            if _node_id != self._root and self.tree.contains(_node_id)
+        }
+
+    def _do_roll_up_cost(self, node: Node) -> None:
+        """Calculate the cost related metrics of a single hardware item.
+
+        The cost of an assembly is the sum of the total cost of its children which
+        must already be calculated.
+
+        :param node: the treelib Node() of the hardware item to calculate.
+        :return: None
+        :rtype: None
+        """
+        _record = node.data["hardware"]
+        _total_cost: float = 0.0
+
+        if _record.part == 1:
+            _record.do_calculate_total_cost()
         else:
-            _p_comp_ref_des = ""
+            for _node_id in node.successors(self.tree.identifier):
+                _total_cost += self.tree.nodes[_node_id].data["hardware"].total_cost
+
+            _total_cost *= _record.quantity
+            _record.set_attributes({"cost": _total_cost})
+            _record.set_attributes({"total_cost": _total_cost})
+
+    def _do_roll_up_hazard_rates(self, node: Node) -> None:
+        """Calculate the hazard rate metrics of a single hardware item.
 
-        if _p_comp_ref_des != "":
-            _record.comp_ref_des = f"{_p_comp_ref_des}:{_record.ref_des}"
-            _node.tag = f"{_p_comp_ref_des}:{_record.ref_des}"
+        :param node: the treelib Node() of the hardware item to calculate.
+        :return: None
+        :rtype: None
+        """
+        if node.data["hardware"].part == 1:
+            self.do_calculate_part_hazard_rates(node.identifier)
         else:
-            _record.comp_ref_des = _record.ref_des
-            _node.tag = _record.ref_des
+            self.do_calculate_assembly_hazard_rates(node.identifier)
 
-        # Now make the composite reference designator for all the child nodes.
-        for _child_node in self.tree.children(node_id):
-            self.do_make_composite_ref_des(node_id=_child_node.identifier)
+        node.data["reliability"].do_calculate_hazard_rate_logistics()
+        node.data["reliability"].do_calculate_hazard_rate_mission(
+            node.data["hardware"].duty_cycle
+        )
+        node.data["reliability"].do_calculate_mtbf(
+            multiplier=self._hr_multiplier,
+        )
+        node.data["reliability"].do_calculate_reliability(
+            node.data["hardware"].mission_time,
+            multiplier=self._hr_multiplier,
+        )
 
-        _record.set_attributes({"comp_ref_des": _record.comp_ref_des})
+    def _do_roll_up_part_count(self, node: Node) -> None:
+        """Calculate the total part count of a single hardware item.
 
-        pub.sendMessage(
-            "succeed_make_comp_ref_des",
-            comp_ref_des=_record.comp_ref_des,
+        :param node: the treelib Node() of the hardware item to calculate.
+        :return: None
+        :rtype: None
+        """
+        _record = node.data["hardware"]
+        _total_part_count: int = 0
+
+        if _record.part == 1:
+            _record.total_part_count = _record.quantity
+        else:
+            for _node_id in node.successors(self.tree.identifier):
+                _total_part_count += (
+                    self.tree.nodes[_node_id].data["hardware"].total_part_count
+                )
+
+            _total_part_count *= _record.quantity
+            _record.set_attributes({"total_part_count": _total_part_count})
+
+    def _do_roll_up_power_dissipation(self, node: Node) -> float:
+        """Calculate the total power dissipation of a single hardware item.
+
+        :param node: the treelib Node() of the hardware item to calculate.
+        :return: _total_power_dissipation; the total power dissipation.
+        :rtype: float
+        """
+        _record = node.data["hardware"]
+        _total_power_dissipation: float = 0.0
+
+        if _record.part == 1:
+            _total_power_dissipation = (
+                node.data["design_electric"].power_operating * _record.quantity
+            )
+        else:
+            for _node_id in node.successors(self.tree.identifier):
+                _total_power_dissipation += (
+                    self.tree.nodes[_node_id].data["hardware"].total_power_dissipation
+                )
+
+            _total_power_dissipation *= _record.quantity
+
+        _record.set_attributes({"total_power_dissipation": _total_power_dissipation})
+
+        return _total_power_dissipation
+
+    def _do_set_dirty(self, node_id: int, package: Dict[str, Any]) -> None:
+        """Mark the hardware item edited in a work or module view dirty.
+
+        :param node_id: the record ID of the edited hardware item.
+        :param package: the key:value pair of the attribute that was edited.
+        :return: None
+        :rtype: None
+        """
+        if not self.tree.contains(node_id):
+            return
+
+        # Changing these changes which children are rolled up into the item.
+        if {"part", "hazard_rate_type_id"} & set(package):
+            self._set_dirty_ids.update(self.tree.expand_tree(node_id))
+        else:
+            self._set_dirty_ids.add(node_id)
+
+    def _get_calculation_order(self, node_id: int) -> List[Node]:
+        """Return the hardware items to calculate in the order to calculate them.
+
+        Parts are always calculated from their own attributes so the children of a
+        part are not visited.
+
+        :param node_id: the record ID of the top hardware item to calculate.
+        :return: the list of Nodes to calculate in post-order.
+        :rtype: list
+        """
+        return self._get_post_order(
+            node_id,
+            prune=lambda _node: _node.data["hardware"].part == 1,
         )
 
+    def _get_hazard_rate_ids(self, node_id: int, order: List[Node]) -> Set[int]:
+        """Return the record IDs of the hardware items to calculate hazard rates for.
+
+        The hazard rates of the children of an assembly using one of the specified
+        hazard rate methods are ignored, so these children (and their children) are
+        not calculated.
+
+        :param node_id: the record ID of the top hardware item to calculate.
+        :param order: the list of Nodes returned by _get_calculation_order().
+        :return: the set of record IDs to calculate the hazard rates for.
+        :rtype: set
+        """
+        _hazard_rate_ids: Set[int] = {node_id}
+
+        for _node in reversed(order):
+            if (
+                _node.identifier in _hazard_rate_ids
+                and _node.data["hardware"].part != 1
+                and _node.data["reliability"].hazard_rate_type_id == 1
+            ):
+                _hazard_rate_ids.update(_node.successors(self.tree.identifier))
+
+        return _hazard_rate_ids
+
+    def _get_part_attributes(self, node: Node) -> Dict[str, Union[float, int, str]]:
+        """Retrieve the aggregate attribute dict of a part.
+
+        :param node: the treelib Node() of the part.
+        :return: the attributes of all the part's records in a single dict.
+        :rtype: dict
+        """
+        return {
+            **node.data["hardware"].get_attributes(),
+            **node.data["design_mechanic"].get_attributes(),
+            **node.data["design_electric"].get_attributes(),
+            **node.data["milhdbk217f"].get_attributes(),
+            **node.data["nswc"].get_attributes(),
+            **node.data["reliability"].get_attributes(),
+        }
+
+    def _get_post_order(
+        self,
+        node_id: int,
+        prune: Optional[Callable[[Node], bool]] = None,
+    ) -> List[Node]:
+        """Return the subtree starting at the passed node ID in post-order.
+
+        Every Node in the returned list comes after all of its children.  The tree is
+        walked with an explicit stack so the depth of the hardware BoM isn't limited by
+        Python's recursion limit.
+
+        :param node_id: the record ID of the top of the subtree.
+        :param prune: a function that returns True for the Nodes whose children should
+            not be visited.
+        :return: the list of Nodes in the subtree in post-order.
+        :rtype: list
+        """
+        _order: List[Node] = []
+        _stack: List[Tuple[Node, bool]] = [(self.tree.nodes[node_id], False)]
+
+        while _stack:
+            _node, _visited = _stack.pop()
+            if _visited or (prune is not None and prune(_node)):
+                _order.append(_node)
+            else:
+                _stack.append((_node, True))
+                _stack.extend(
+                    (self.tree.nodes[_child_id], False)
+                    for _child_id in reversed(_node.successors(self.tree.identifier))
+                )
+
+        return _order
+
     def _do_load_hardware(self) -> None:
         """Load the hardware data into the tree.
 
@@ -367,11 +935,12 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         """
         for _node in self._dic_trees["hardware"].all_nodes()[1:]:
             _hardware = _node.data["hardware"]
-            self.tree.create_node(
-                tag="hardware",
-                identifier=_hardware.hardware_id,
-                parent=_hardware.parent_id,
-                data={"hardware": _hardware},
+            self._do_add_node(
+                "hardware",
+                _hardware.hardware_id,
+                _hardware.hardware_id,
+                _hardware.parent_id,
+                {"hardware": _hardware},
             )
 
         self._dic_load_functions["design_electric"]()
@@ -387,8 +956,7 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["design_electric"].all_nodes()[1:]:
-            _par_node = self.tree.get_node(_node.data["design_electric"].hardware_id)
-            _par_node.data["design_electric"] = _node.data["design_electric"]
+            self._do_attach_record("design_electric", _node.data["design_electric"])
 
     def _do_load_design_mechanic(self) -> None:
         """Load the design_mechanic into the tree.
@@ -397,8 +965,7 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["design_mechanic"].all_nodes()[1:]:
-            _par_node = self.tree.get_node(_node.data["design_mechanic"].hardware_id)
-            _par_node.data["design_mechanic"] = _node.data["design_mechanic"]
+            self._do_attach_record("design_mechanic", _node.data["design_mechanic"])
 
     def _do_load_milhdbk217f(self) -> None:
         """Load the MIL-HDBK-217F data into the tree.
@@ -407,8 +974,7 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["milhdbk217f"].all_nodes()[1:]:
-            _par_node = self.tree.get_node(_node.data["milhdbk217f"].hardware_id)
-            _par_node.data["milhdbk217f"] = _node.data["milhdbk217f"]
+            self._do_attach_record("milhdbk217f", _node.data["milhdbk217f"])
 
     def _do_load_nswc(self) -> None:
         """Load the NSWC data into the tree.
@@ -417,8 +983,7 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["nswc"].all_nodes()[1:]:
-            _par_node = self.tree.get_node(_node.data["nswc"].hardware_id)
-            _par_node.data["nswc"] = _node.data["nswc"]
+            self._do_attach_record("nswc", _node.data["nswc"])
 
     def _do_load_reliability(self) -> None:
         """Load the reliability data into the tree.
@@ -427,5 +992,4 @@ class RAMSTKHardwareBoMView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["reliability"].all_nodes()[1:]:
-            _par_node = self.tree.get_node(_node.data["reliability"].hardware_id)
-            _par_node.data["reliability"] = _node.data["reliability"]
+            self._do_attach_record("reliability", _node.data["reliability"])
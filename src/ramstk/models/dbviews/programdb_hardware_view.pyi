@@ -1,31 +1,67 @@
 # Standard Library Imports
-from typing import Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 # Third Party Imports
 import treelib
+from treelib import Node
 
 # RAMSTK Local Imports
+from ..dbrecords import RAMSTKHardwareRecord as RAMSTKHardwareRecord
 from .baseview import RAMSTKBaseView as RAMSTKBaseView
 
 class RAMSTKHardwareBoMView(RAMSTKBaseView):
     _tag: str
+    _dic_insert_functions: Dict[str, Callable[..., None]]
     _dic_load_functions: Dict[str, Callable[..., object]]
+    _dic_hazard_rates: Dict[int, float]
+    _dic_predictions: Dict[int, Dict[str, float]]
     _dic_stress_limits: Dict[
         str, Dict[str, Dict[str, Dict[str, Dict[str, List[float]]]]]
     ]
     _dic_trees: Dict[str, treelib.Tree]
     _lst_modules: List[str]
     _hr_multiplier: float
+    _set_dirty_ids: Set[int]
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None: ...
     def do_calculate_assembly_hazard_rates(self, node_id: int) -> None: ...
     def do_calculate_cost(self, node_id: int) -> None: ...
+    def do_calculate_dirty_hardware(self) -> int: ...
     def do_calculate_hardware(self, node_id: int) -> None: ...
     def do_calculate_hazard_rates(self, node_id: int) -> None: ...
     def do_calculate_part_count(self, node_id: int) -> None: ...
     def do_calculate_part_hazard_rates(self, node_id: int) -> None: ...
     def do_calculate_part_stress(self, node_id: int) -> None: ...
     def do_calculate_power_dissipation(self, node_id: int) -> float: ...
+    def on_select_all(self) -> None: ...
     def do_make_composite_ref_des(self, node_id: int = ...) -> None: ...
+    def _do_attach_record(self, module: str, record: object) -> None: ...
+    def _do_calculate_distribution_hazard_rates(self, nodes: List[Node]) -> None: ...
+    def _do_insert_design_electric(self, design_electric: object) -> None: ...
+    def _do_insert_design_mechanic(self, design_mechanic: object) -> None: ...
+    def _do_insert_hardware(self, hardware: RAMSTKHardwareRecord) -> None: ...
+    def _do_insert_milhdbk217f(self, milhdbk217f: object) -> None: ...
+    def _do_insert_nswc(self, nswc: object) -> None: ...
+    def _do_insert_reliability(self, reliability: object) -> None: ...
+    def _do_predict_failed_part(
+        self, node: Node, attributes: Dict[str, Union[float, int, str]]
+    ) -> None: ...
+    def _do_predict_hazard_rates(self, nodes: List[Node]) -> None: ...
+    def _do_predict_part_count(self, parts: List[Node]) -> None: ...
+    def _do_predict_part_stress(self, parts: List[Node]) -> None: ...
+    def _do_remove_node(self, module: str, record_id: Any) -> None: ...
+    def _do_roll_up_cost(self, node: Node) -> None: ...
+    def _do_roll_up_hazard_rates(self, node: Node) -> None: ...
+    def _do_roll_up_part_count(self, node: Node) -> None: ...
+    def _do_roll_up_power_dissipation(self, node: Node) -> float: ...
+    def _do_set_dirty(self, node_id: int, package: Dict[str, Any]) -> None: ...
+    def _get_calculation_order(self, node_id: int) -> List[Node]: ...
+    def _get_hazard_rate_ids(self, node_id: int, order: List[Node]) -> Set[int]: ...
+    def _get_part_attributes(self, node: Node) -> Dict[str, Union[float, int, str]]: ...
+    def _get_post_order(
+        self,
+        node_id: int,
+        prune: Optional[Callable[[Node], bool]] = ...,
+    ) -> List[Node]: ...
     def _do_load_hardware(self) -> None: ...
     def _do_load_design_electric(self) -> None: ...
     def _do_load_design_mechanic(self) -> None: ...
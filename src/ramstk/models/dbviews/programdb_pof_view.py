@@ -14,6 +14,12 @@ from pubsub import pub
 from treelib import Tree
 
 # RAMSTK Local Imports
+from ..dbrecords import (
+    RAMSTKMechanismRecord,
+    RAMSTKOpLoadRecord,
+    RAMSTKOpStressRecord,
+    RAMSTKTestMethodRecord,
+)
 from .baseview import RAMSTKBaseView
 
 
@@ -42,12 +48,23 @@ class RAMSTKPoFView(RAMSTKBaseView):
         super().__init__(**kwargs)
 
         # Initialize private dictionary attributes.
+        self._dic_insert_functions = {
+            "mechanism": self._do_insert_mechanism,
+            "opload": self._do_insert_opload,
+            "opstress": self._do_insert_opstress,
+            "test_method": self._do_insert_test_method,
+        }
         self._dic_load_functions = {
             "mechanism": self._do_load_mechanisms,
             "opload": self._do_load_oploads,
             "opstress": self._do_load_opstress,
             "test_method": self._do_load_test_method,
         }
+        self._dic_parent_keys = {
+            "opload": "mechanism_id",
+            "opstress": "opload_id",
+            "test_method": "opload_id",
+        }
         self._dic_trees = {
             "mechanism": Tree(),
             "opload": Tree(),
@@ -72,18 +89,93 @@ class RAMSTKPoFView(RAMSTKBaseView):
         # Initialize public scalar attributes.
 
         # Subscribe to PyPubSub messages.
-        pub.subscribe(super().do_set_tree, "succeed_insert_mechanism")
-        pub.subscribe(super().do_set_tree, "succeed_insert_opload")
-        pub.subscribe(super().do_set_tree, "succeed_insert_opstress")
-        pub.subscribe(super().do_set_tree, "succeed_insert_test_method")
+        pub.subscribe(super().on_insert_node, "succeed_insert_mechanism")
+        pub.subscribe(super().on_insert_node, "succeed_insert_opload")
+        pub.subscribe(super().on_insert_node, "succeed_insert_opstress")
+        pub.subscribe(super().on_insert_node, "succeed_insert_test_method")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_mechanism")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_opload")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_opstress")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_test_method")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mechanism")
-        pub.subscribe(super().do_set_tree, "succeed_delete_opload")
-        pub.subscribe(super().do_set_tree, "succeed_delete_opstress")
-        pub.subscribe(super().do_set_tree, "succeed_delete_test_method")
+        pub.subscribe(super().on_delete_node, "succeed_delete_mechanism")
+        pub.subscribe(super().on_delete_node, "succeed_delete_opload")
+        pub.subscribe(super().on_delete_node, "succeed_delete_opstress")
+        pub.subscribe(super().on_delete_node, "succeed_delete_test_method")
+
+    def _do_insert_mechanism(self, mechanism: RAMSTKMechanismRecord) -> None:
+        """Insert a failure mechanism and its operating loads into the tree.
+
+        :param mechanism: the failure mechanism record to insert.
+        :return: None
+        :rtype: None
+        """
+        if (
+            self._do_add_node(
+                "mechanism",
+                mechanism.mechanism_id,
+                f"{mechanism.mechanism_id}",
+                self._root,
+                {self._tag: mechanism},
+            )
+            and self._dic_trees["opload"].depth() > 0
+        ):
+            self._dic_load_functions["opload"](mechanism.mechanism_id)
+
+    def _do_insert_opload(self, opload: RAMSTKOpLoadRecord) -> None:
+        """Insert an operating load and its stresses and methods into the tree.
+
+        :param opload: the operating load record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("mechanism", opload.mechanism_id))
+
+        if self._do_add_node(
+            "opload",
+            opload.opload_id,
+            f"{_parent_id}.{opload.opload_id}",
+            _parent_id,
+            {self._tag: opload},
+        ):
+            if self._dic_trees["opstress"].depth() > 0:
+                self._dic_load_functions["opstress"](opload.opload_id)
+
+            if self._dic_trees["test_method"].depth() > 0:
+                self._dic_load_functions["test_method"](opload.opload_id)
+
+    def _do_insert_opstress(self, opstress: RAMSTKOpStressRecord) -> None:
+        """Insert an operating stress into the tree under its operating load.
+
+        :param opstress: the operating stress record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("opload", opstress.opload_id))
+
+        self._do_add_node(
+            "opstress",
+            opstress.opstress_id,
+            f"{_parent_id}.{opstress.opstress_id}s",
+            _parent_id,
+            {self._tag: opstress},
+        )
+
+    def _do_insert_test_method(self, test_method: RAMSTKTestMethodRecord) -> None:
+        """Insert a test method into the tree under its operating load.
+
+        :param test_method: the test method record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("opload", test_method.opload_id))
+
+        self._do_add_node(
+            "test_method",
+            test_method.test_method_id,
+            f"{_parent_id}.{test_method.test_method_id}t",
+            _parent_id,
+            {self._tag: test_method},
+        )
 
     def _do_load_mechanisms(self) -> None:
         """Load the mechanisms into the tree.
@@ -92,19 +184,7 @@ class RAMSTKPoFView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["mechanism"].all_nodes()[1:]:
-            _mechanism = _node.data["mechanism"]
-
-            self.tree.create_node(
-                tag="mechanism",
-                identifier=f"{_mechanism.mechanism_id}",
-                parent=self._root,
-                data={self._tag: _mechanism},
-            )
-
-            if self._dic_trees["opload"].depth() > 0:
-                self._dic_load_functions["opload"](  # type: ignore
-                    _mechanism.mechanism_id,
-                )
+            self._do_insert_mechanism(_node.data["mechanism"])
 
     def _do_load_oploads(self, mechanism_id: int) -> None:
         """Load the operating loads into the tree for the passed mechanism ID.
@@ -113,63 +193,25 @@ class RAMSTKPoFView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["opload"].all_nodes()[1:]:
-            _opload = _node.data["opload"]
-
-            if _opload.mechanism_id == mechanism_id:
-                self.tree.create_node(
-                    tag="opload",
-                    identifier=f"{mechanism_id}.{_opload.opload_id}",
-                    parent=f"{mechanism_id}",
-                    data={self._tag: _opload},
-                )
-
-                if self._dic_trees["opstress"].depth() > 0:
-                    self._dic_load_functions["opstress"](  # type: ignore
-                        _opload.opload_id,
-                        f"{mechanism_id}.{_opload.opload_id}",
-                    )
-
-                if self._dic_trees["test_method"].depth() > 0:
-                    self._dic_load_functions["test_method"](  # type: ignore
-                        _opload.opload_id,
-                        f"{mechanism_id}.{_opload.opload_id}",
-                    )
-
-    def _do_load_opstress(self, opload_id: int, parent_id: str) -> None:
+        for _opload in self._get_children("opload", mechanism_id):
+            self._do_insert_opload(_opload)
+
+    def _do_load_opstress(self, opload_id: int) -> None:
         """Load the operating stresses into the tree for the passed load ID.
 
         :param opload_id: the operating load ID to load the operating stresses for.
-        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["opstress"].all_nodes()[1:]:
-            _opstress = _node.data["opstress"]
-
-            if _opstress.opload_id == opload_id:
-                self.tree.create_node(
-                    tag="opstress",
-                    identifier=f"{parent_id}.{_opstress.opstress_id}s",
-                    parent=parent_id,
-                    data={self._tag: _opstress},
-                )
-
-    def _do_load_test_method(self, opload_id: int, parent_id: str) -> None:
-        """Load the operating stresses into the tree for the passed load ID.
+        for _opstress in self._get_children("opstress", opload_id):
+            self._do_insert_opstress(_opstress)
 
-        :param opload_id: the operating load ID to load the operating stresses for.
-        :param parent_id: the parent node ID.
+    def _do_load_test_method(self, opload_id: int) -> None:
+        """Load the test methods into the tree for the passed load ID.
+
+        :param opload_id: the operating load ID to load the test methods for.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["test_method"].all_nodes()[1:]:
-            _test_method = _node.data["test_method"]
-
-            if _test_method.opload_id == opload_id:
-                self.tree.create_node(
-                    tag="test_method",
-                    identifier=f"{parent_id}.{_test_method.test_method_id}t",
-                    parent=parent_id,
-                    data={self._tag: _test_method},
-                )
+        for _test_method in self._get_children("test_method", opload_id):
+            self._do_insert_test_method(_test_method)
@@ -5,15 +5,24 @@ from typing import Callable, Dict, List, Union
 import treelib
 
 # RAMSTK Local Imports
+from ..dbrecords import RAMSTKMechanismRecord as RAMSTKMechanismRecord
+from ..dbrecords import RAMSTKOpLoadRecord as RAMSTKOpLoadRecord
+from ..dbrecords import RAMSTKOpStressRecord as RAMSTKOpStressRecord
+from ..dbrecords import RAMSTKTestMethodRecord as RAMSTKTestMethodRecord
 from .baseview import RAMSTKBaseView as RAMSTKBaseView
 
 class RAMSTKPoFView(RAMSTKBaseView):
     _tag: str
+    _dic_insert_functions: Dict[str, Callable[..., None]]
     _dic_load_functions: Dict[str, Callable[..., object]]
     _dic_trees: Dict[str, treelib.Tree]
     _lst_modules: List[str]
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None: ...
+    def _do_insert_mechanism(self, mechanism: RAMSTKMechanismRecord) -> None: ...
+    def _do_insert_opload(self, opload: RAMSTKOpLoadRecord) -> None: ...
+    def _do_insert_opstress(self, opstress: RAMSTKOpStressRecord) -> None: ...
+    def _do_insert_test_method(self, test_method: RAMSTKTestMethodRecord) -> None: ...
     def _do_load_mechanisms(self) -> None: ...
     def _do_load_oploads(self, mechanism_id: int) -> None: ...
-    def _do_load_opstress(self, opload_id: int, parent_id: str) -> None: ...
-    def _do_load_test_method(self, opload_id: int, parent_id: str) -> None: ...
+    def _do_load_opstress(self, opload_id: int) -> None: ...
+    def _do_load_test_method(self, opload_id: int) -> None: ...
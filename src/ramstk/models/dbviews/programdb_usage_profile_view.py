@@ -15,6 +15,11 @@ from pubsub import pub
 from treelib import Tree
 
 # RAMSTK Local Imports
+from ..dbrecords import (
+    RAMSTKEnvironmentRecord,
+    RAMSTKMissionPhaseRecord,
+    RAMSTKMissionRecord,
+)
 from .baseview import RAMSTKBaseView
 
 
@@ -43,11 +48,20 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
         super().__init__(**kwargs)
 
         # Initialize private dictionary attributes.
+        self._dic_insert_functions = {
+            "mission": self._do_insert_mission,
+            "mission_phase": self._do_insert_mission_phase,
+            "environment": self._do_insert_environment,
+        }
         self._dic_load_functions = {
             "mission": self._do_load_missions,
             "mission_phase": self._do_load_mission_phases,
             "environment": self._do_load_environments,
         }
+        self._dic_parent_keys = {
+            "mission_phase": "mission_id",
+            "environment": "mission_phase_id",
+        }
         self._dic_trees = {
             "mission": Tree(),
             "mission_phase": Tree(),
@@ -70,35 +84,88 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
         # Initialize public scalar attributes.
 
         # Subscribe to PyPubSub messages.
-        pub.subscribe(super().do_set_tree, "succeed_insert_environment")
-        pub.subscribe(super().do_set_tree, "succeed_insert_mission")
-        pub.subscribe(super().do_set_tree, "succeed_insert_mission_phase")
+        pub.subscribe(super().on_insert_node, "succeed_insert_environment")
+        pub.subscribe(super().on_insert_node, "succeed_insert_mission")
+        pub.subscribe(super().on_insert_node, "succeed_insert_mission_phase")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_environment")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_mission")
         pub.subscribe(super().do_set_tree, "succeed_retrieve_all_mission_phase")
-        pub.subscribe(super().do_set_tree, "succeed_delete_environment")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mission")
-        pub.subscribe(super().do_set_tree, "succeed_delete_mission_phase")
+        pub.subscribe(super().on_delete_node, "succeed_delete_environment")
+        pub.subscribe(super().on_delete_node, "succeed_delete_mission")
+        pub.subscribe(super().on_delete_node, "succeed_delete_mission_phase")
+
+    def _do_insert_environment(self, environment: RAMSTKEnvironmentRecord) -> None:
+        """Insert an environment into the tree under its mission phase.
+
+        :param environment: the environment record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(
+            ("mission_phase", environment.mission_phase_id)
+        )
 
-    def _do_load_environments(self, mission_phase_id: int, parent_id: str) -> None:
+        self._do_add_node(
+            "environment",
+            environment.environment_id,
+            f"{_parent_id}.{environment.environment_id}",
+            _parent_id,
+            {"usage_profile": environment},
+        )
+
+    def _do_insert_mission(self, mission: RAMSTKMissionRecord) -> None:
+        """Insert a mission and its mission phases into the tree.
+
+        :param mission: the mission record to insert.
+        :return: None
+        :rtype: None
+        """
+        if (
+            self._do_add_node(
+                "mission",
+                mission.mission_id,
+                f"{mission.mission_id}",
+                self._root,
+                {"usage_profile": mission},
+            )
+            and self._dic_trees["mission_phase"].depth() > 0
+        ):
+            self._dic_load_functions["mission_phase"](  # type: ignore
+                mission.mission_id,
+            )
+
+    def _do_insert_mission_phase(self, mission_phase: RAMSTKMissionPhaseRecord) -> None:
+        """Insert a mission phase and its environments into the tree.
+
+        :param mission_phase: the mission phase record to insert.
+        :return: None
+        :rtype: None
+        """
+        _parent_id = self._dic_node_ids.get(("mission", mission_phase.mission_id))
+
+        if (
+            self._do_add_node(
+                "mission_phase",
+                mission_phase.mission_phase_id,
+                f"{_parent_id}.{mission_phase.mission_phase_id}",
+                _parent_id,
+                {"usage_profile": mission_phase},
+            )
+            and self._dic_trees["environment"].depth() > 0
+        ):
+            self._dic_load_functions["environment"](  # type: ignore
+                mission_phase.mission_phase_id,
+            )
+
+    def _do_load_environments(self, mission_phase_id: int) -> None:
         """Load the environments into the tree for the passed phase ID.
 
         :param mission_phase_id: the mission phase ID to load the environments for.
-        :param parent_id: the parent node ID.
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["environment"].all_nodes()[1:]:
-            _environment = _node.data["environment"]
-            if _environment.mission_phase_id == mission_phase_id:
-                _node_id = f"{parent_id}.{_environment.environment_id}"
-
-                self.tree.create_node(
-                    tag="environment",
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data={"usage_profile": _environment},
-                )
+        for _environment in self._get_children("environment", mission_phase_id):
+            self._do_insert_environment(_environment)
 
     def _do_load_missions(self) -> None:
         """Load the missions into the tree for the passed mission ID.
@@ -107,20 +174,7 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
         :rtype: None
         """
         for _node in self._dic_trees["mission"].all_nodes()[1:]:
-            _mission = _node.data["mission"]
-            _node_id = f"{_mission.mission_id}"
-
-            self.tree.create_node(
-                tag="mission",
-                identifier=_node_id,
-                parent=self._root,
-                data={"usage_profile": _mission},
-            )
-
-            if self._dic_trees["mission_phase"].depth() > 0:
-                self._dic_load_functions["mission_phase"](  # type: ignore
-                    _mission.mission_id,
-                )
+            self._do_insert_mission(_node.data["mission"])
 
     def _do_load_mission_phases(self, mission_id: int) -> None:
         """Load the mission phases into the tree for the passed mission ID.
@@ -129,20 +183,5 @@ class RAMSTKUsageProfileView(RAMSTKBaseView):
         :return: None
         :rtype: None
         """
-        for _node in self._dic_trees["mission_phase"].all_nodes()[1:]:
-            _mission_phase = _node.data["mission_phase"]
-            _node_id = f"{mission_id}.{_mission_phase.mission_phase_id}"
-
-            if _mission_phase.mission_id == mission_id:
-                self.tree.create_node(
-                    tag="mission_phase",
-                    identifier=_node_id,
-                    parent=f"{mission_id}",
-                    data={"usage_profile": _mission_phase},
-                )
-
-                if self._dic_trees["environment"].depth() > 0:
-                    self._dic_load_functions["environment"](  # type: ignore
-                        _mission_phase.mission_phase_id,
-                        _node_id,
-                    )
+        for _mission_phase in self._get_children("mission_phase", mission_id):
+            self._do_insert_mission_phase(_mission_phase)
@@ -5,14 +5,23 @@ from typing import Callable, Dict, List, Union
 import treelib
 
 # RAMSTK Local Imports
+from ..dbrecords import RAMSTKEnvironmentRecord as RAMSTKEnvironmentRecord
+from ..dbrecords import RAMSTKMissionPhaseRecord as RAMSTKMissionPhaseRecord
+from ..dbrecords import RAMSTKMissionRecord as RAMSTKMissionRecord
 from .baseview import RAMSTKBaseView as RAMSTKBaseView
 
 class RAMSTKUsageProfileView(RAMSTKBaseView):
     _tag: str
+    _dic_insert_functions: Dict[str, Callable[..., None]]
     _dic_load_functions: Dict[str, Callable[..., object]]
     _dic_trees: Dict[str, treelib.Tree]
     _lst_modules: List[str]
     def __init__(self, **kwargs: Dict[str, Union[float, int, str]]) -> None: ...
-    def _do_load_environments(self, mission_phase_id: int, parent_id: str) -> None: ...
+    def _do_insert_environment(self, environment: RAMSTKEnvironmentRecord) -> None: ...
+    def _do_insert_mission(self, mission: RAMSTKMissionRecord) -> None: ...
+    def _do_insert_mission_phase(
+        self, mission_phase: RAMSTKMissionPhaseRecord
+    ) -> None: ...
+    def _do_load_environments(self, mission_phase_id: int) -> None: ...
     def _do_load_missions(self) -> None: ...
     def _do_load_mission_phases(self, mission_id: int) -> None: ...
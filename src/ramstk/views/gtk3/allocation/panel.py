@@ -820,6 +820,19 @@ class AllocationTreePanel(RAMSTKTreePanel):
         """
         return model[row][22] == self._parent_id
 
+    # pylint: disable=unused-argument
+    def on_insert_treerow(self, node_id: int, tree: treelib.Tree) -> None:
+        """Reload the allocation RAMSTKTreeView after inserting a line item.
+
+        The allocation RAMSTKTreeView is a flat list of the hardware tree so the
+        whole list is reloaded rather than inserting the new row under its parent.
+
+        :param node_id: the ID of the node inserted into the tree.
+        :param tree: the treelib Tree() containing the allocation data.
+        :return: None
+        """
+        self.do_load_panel(tree)
+
     def _do_set_columns_visible(self) -> None:
         """Set editable columns based on the Allocation method selected.
 
@@ -958,7 +971,9 @@ class AllocationTreePanel(RAMSTKTreePanel):
             ]
 
             try:
-                self.tvwTreeView.unfilt_model.append(row, _attributes)
+                self.tvwTreeView.dic_row_index[node.identifier] = (
+                    self.tvwTreeView.unfilt_model.append(row, _attributes)
+                )
                 pub.sendMessage("request_get_hardware_tree")
                 pub.sendMessage("request_get_reliability_tree")
             except (AttributeError, TypeError, ValueError):
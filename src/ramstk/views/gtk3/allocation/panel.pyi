@@ -46,6 +46,7 @@ class AllocationTreePanel(RAMSTKTreePanel):
     _on_edit_message: str
     dic_attribute_widget_map: Dict[str, List[Any]]
     def __init__(self) -> None: ...
+    def on_insert_treerow(self, node_id: int, tree: treelib.Tree) -> None: ...
     def _do_set_columns_visible(self) -> None: ...
     def _do_set_hardware_attributes(self, tree: treelib.Tree) -> None: ...
     def _do_set_reliability_attributes(self, tree: treelib.Tree) -> None: ...
@@ -167,6 +167,8 @@ class ImportProject(Gtk.Assistant):
             _file_type = "text"
         elif _extension in [".xls", ".xlsx", ".xlsm"]:
             _file_type = "excel"
+        elif _extension == ".parquet":
+            _file_type = "parquet"
 
         if _file is not None:
             pub.sendMessage(
@@ -247,6 +249,11 @@ class ImportProject(Gtk.Assistant):
         _filefilter.set_name(_("Excel Files"))
         _filefilter.add_pattern("*.xls*")
         self._filechooser.add_filter(_filefilter)
+
+        _filefilter = Gtk.FileFilter()
+        _filefilter.set_name(_("Parquet Files"))
+        _filefilter.add_pattern("*.parquet")
+        self._filechooser.add_filter(_filefilter)
         self._filechooser.set_current_folder(
             self.RAMSTK_USER_CONFIGURATION.RAMSTK_PROG_DIR
         )
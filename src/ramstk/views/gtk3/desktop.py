@@ -145,6 +145,8 @@ class RAMSTKDesktop(Gtk.Window):
                 "request_open_program": self._on_request_open,
                 "request_set_title": self._on_select,
                 "request_set_status": self._do_set_status,
+                "succeed_update_program": self._on_save_project,
+                "fail_update_program": self._on_save_project_fail,
                 "do_log_critical_msg": self._do_raise_message_dialog,
                 "do_log_debug_msg": self._do_raise_message_dialog,
                 "do_log_error_msg": self._do_raise_message_dialog,
@@ -344,6 +346,37 @@ class RAMSTKDesktop(Gtk.Window):
         self.statusbar.push(1, _message)
         self.set_title(_message)
 
+    def _on_save_project(self, changed: Dict[str, int]) -> None:
+        """Set the status bar after the open RAMSTK Program is saved.
+
+        :param changed: the number of changed records written to each database
+            table.
+        :return: None
+        :rtype: None
+        """
+        _message = _("Saved Program Database {0:s}: {1:d} records changed").format(
+            self.RAMSTK_USER_CONFIGURATION.RAMSTK_PROG_INFO["database"],
+            sum(changed.values()),
+        )
+        self.statusbar.pop(2)
+        # noinspection PyDeepBugsSwappedArgs
+        self.statusbar.push(1, _message)
+
+    def _on_save_project_fail(self, error_message: str) -> None:
+        """Set the status bar when the open RAMSTK Program fails to save.
+
+        :param error_message: the error message broadcast with the fail message.
+        :return: None
+        :rtype: None
+        """
+        _message = _("Failed to save Program Database {0:s}: {1:s}").format(
+            self.RAMSTK_USER_CONFIGURATION.RAMSTK_PROG_INFO["database"],
+            error_message,
+        )
+        self.statusbar.pop(2)
+        # noinspection PyDeepBugsSwappedArgs
+        self.statusbar.push(2, _message)
+
     def _on_select(self, title: str) -> None:
         """Respond to load the Work View Gtk.Notebook() widgets.
 
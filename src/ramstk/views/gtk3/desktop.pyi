@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import List, TypeVar
+from typing import Dict, List, TypeVar
 
 # RAMSTK Package Imports
 from ramstk.configuration import RAMSTKSiteConfiguration as RAMSTKSiteConfiguration
@@ -66,6 +66,8 @@ class RAMSTKDesktop(Gtk.Window):
     def _do_set_status_icon(self, connected: bool = ...) -> None: ...
     def _on_button_press(self, __book: object, event: Gdk.EventButton) -> None: ...
     def _on_request_open(self) -> None: ...
+    def _on_save_project(self, changed: Dict[str, int]) -> None: ...
+    def _on_save_project_fail(self, error_message: str) -> None: ...
     def _on_select(self, title: str) -> None: ...
     @staticmethod
     def _on_window_state_event(
@@ -445,6 +445,7 @@ class FMEATreePanel(RAMSTKTreePanel):
 
         # Initialize private scalar attributes.
         self._filtered_tree = True
+        self._lazy_tree_threshold = 5000
         self._on_edit_message: str = f"wvw_editing_{self._tag}"
 
         # Initialize public dictionary attributes.
@@ -63,6 +63,7 @@ class HardwareTreePanel(RAMSTKTreePanel):
 
         # Initialize private scalar class attributes.
         self._category_id: int = 0
+        self._lazy_tree_threshold = 5000
 
         # Initialize public dictionary class attributes.
         self.dic_attribute_widget_map: Dict[str, List[Any]] = {
@@ -1172,17 +1173,20 @@ class HardwareGeneralDataPanel(RAMSTKFixedPanel):
             _subcategory = [[_subcategories[_key]][0] for _key in _subcategories]
             self.cmbSubcategory.do_load_combo(entries=_subcategory, signal="changed")
 
-    def _do_set_comp_ref_des(self, comp_ref_des: str) -> None:
+    def _do_set_comp_ref_des(self, tree: treelib.Tree) -> None:
         """Set the value in the composite reference designator RAMSTKEntry().
 
-        :param comp_ref_des: the composite reference designator value.
+        :param tree: the hardware treelib Tree() with the new composite reference
+            designators.
         :return: None
         :rtype: None
         """
-        self.txtCompRefDes.do_update(
-            comp_ref_des,
-            signal="changed",
-        )
+        _node = tree.get_node(self._record_id)
+        if _node is not None and _node.data is not None:
+            self.txtCompRefDes.do_update(
+                _node.data["hardware"].comp_ref_des,
+                signal="changed",
+            )
 
     def _request_load_component(self, combo: RAMSTKComboBox) -> None:
         """Request to load the component widgets.
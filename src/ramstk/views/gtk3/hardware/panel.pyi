@@ -53,7 +53,7 @@ class HardwareGeneralDataPanel(RAMSTKFixedPanel):
     def __init__(self) -> None: ...
     def do_load_categories(self, category: Dict[int, str]) -> None: ...
     def _do_load_subcategories(self, category_id: int) -> None: ...
-    def _do_set_comp_ref_des(self, comp_ref_des: str) -> None: ...
+    def _do_set_comp_ref_des(self, tree: treelib.Tree) -> None: ...
     def _request_load_component(self, combo: RAMSTKComboBox) -> None: ...
     def _request_load_subcategories(self, combo: RAMSTKComboBox) -> None: ...
 
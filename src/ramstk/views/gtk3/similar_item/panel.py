@@ -1333,6 +1333,19 @@ class SimilarItemTreePanel(RAMSTKTreePanel):
         _model.set_value(row, self.tvwTreeView.position["function_4"], function[3])
         _model.set_value(row, self.tvwTreeView.position["function_5"], function[4])
 
+    # pylint: disable=unused-argument
+    def on_insert_treerow(self, node_id: int, tree: treelib.Tree) -> None:
+        """Reload the similar item RAMSTKTreeView after inserting a line item.
+
+        The similar item RAMSTKTreeView is a flat list of the hardware tree so the
+        whole list is reloaded rather than inserting the new row under its parent.
+
+        :param node_id: the ID of the node inserted into the tree.
+        :param tree: the treelib Tree() containing the similar item data.
+        :return: None
+        """
+        self.do_load_panel(tree)
+
     def _do_set_hardware_attributes(self, tree: treelib.Tree) -> None:
         """Set the attributes when the hardware tree is retrieved.
 
@@ -1488,7 +1501,9 @@ class SimilarItemTreePanel(RAMSTKTreePanel):
             ]
 
             try:
-                self.tvwTreeView.unfilt_model.append(row, _attributes)
+                self.tvwTreeView.dic_row_index[node.identifier] = (
+                    self.tvwTreeView.unfilt_model.append(row, _attributes)
+                )
                 pub.sendMessage("request_get_hardware_tree")
                 pub.sendMessage("request_get_reliability_tree")
             except (AttributeError, TypeError, ValueError):
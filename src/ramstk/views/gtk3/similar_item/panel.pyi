@@ -41,6 +41,7 @@ class SimilarItemTreePanel(RAMSTKTreePanel):
     def __init__(self) -> None: ...
     def do_load_combobox(self) -> None: ...
     def do_refresh_functions(self, row: Gtk.TreeIter, function: List[str]) -> None: ...
+    def on_insert_treerow(self, node_id: int, tree: treelib.Tree) -> None: ...
     def _do_set_hardware_attributes(self, tree: treelib.Tree) -> None: ...
     def _do_set_reliability_attributes(self, tree: treelib.Tree) -> None: ...
     def _on_method_changed(self, method_id: int) -> None: ...
@@ -143,16 +143,15 @@ class SimilarItemWorkView(RAMSTKWorkView):
         _model = self._pnlPanel.tvwTreeView.get_model()
         _row = _model.get_iter_first()
 
-        # Iterate through the assemblies and calculate the Similar Item hazard
-        # intensities.
+        # Collect the assemblies and calculate their Similar Item hazard intensities
+        # together.
         super().do_set_cursor_busy()
         _node_ids = []
         while _row is not None:
             _node_ids.append(_model.get_value(_row, 1))
             _row = _model.iter_next(_row)
 
-        for _node_id in _node_ids:
-            pub.sendMessage("request_calculate_similar_item", node_id=_node_id)
+        pub.sendMessage("request_calculate_similar_items", node_ids=_node_ids)
 
     def _do_request_edit_function(self, __button: Gtk.ToolButton) -> None:
         """Request to edit the Similar Item analysis user-defined functions.
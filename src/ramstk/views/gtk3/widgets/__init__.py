@@ -39,5 +39,6 @@ from .panel import (
 )
 from .plot import RAMSTKPlot
 from .scrolledwindow import RAMSTKScrolledWindow
+from .treemodel import RAMSTKLazyTreeModel
 from .treeview import RAMSTKTreeView
 from .widget import RAMSTKWidget
@@ -178,10 +178,12 @@ class RAMSTKBaseView(Gtk.HBox):
                 f"succeed_update_{self._tag}": self.do_set_cursor_active,
                 f"succeed_calculate_{self._tag}": self.do_set_cursor_active,
                 f"succeed_update_all_{self._tag}": self.do_set_cursor_active,
+                "succeed_update_program": self.do_set_cursor_active_on_save,
                 f"fail_calculate_{self._tag}": self.do_set_cursor_active_on_fail,
                 f"fail_delete_{self._tag}": self.do_set_cursor_active_on_fail,
                 f"fail_insert_{self._tag}": self.do_set_cursor_active_on_fail,
                 f"fail_update_{self._tag}": self.do_set_cursor_active_on_fail,
+                "fail_update_program": self.do_set_cursor_active_on_fail,
                 "selected_revision": self.on_select_revision,
             }
         )
@@ -518,6 +520,19 @@ class RAMSTKBaseView(Gtk.HBox):
 
         self.RAMSTK_LOGGER.do_log_debug(__name__, error_message)
 
+    # pylint: disable=unused-argument
+    # noinspection PyUnusedLocal
+    def do_set_cursor_active_on_save(self, changed: Dict[str, int]) -> None:
+        """Set active cursor for the Module, List, and Work Book Gdk.Window().
+
+        :param changed: the number of changed records written to each database
+            table passed in the PyPubSub message.  Only needed when this method is a
+            PyPubSub subscriber.
+        :return: None
+        :rtype: None
+        """
+        self.do_set_cursor(Gdk.CursorType.LEFT_PTR)
+
     def do_set_cursor_busy(self) -> None:
         """Set busy cursor for the Module, List, and Work Book Gdk.Window().
 
@@ -60,6 +60,7 @@ class RAMSTKBaseView(Gtk.HBox):
     def do_set_cursor(self, cursor: Gdk.CursorType) -> None: ...
     def do_set_cursor_active(self, tree: treelib.Tree = ...) -> None: ...
     def do_set_cursor_active_on_fail(self, error_message: str = ...) -> None: ...
+    def do_set_cursor_active_on_save(self, changed: Dict[str, int]) -> None: ...
     def do_set_cursor_busy(self) -> None: ...
     def make_tab_label(self, **kwargs: Dict[str, Any]) -> None: ...
     def make_toolbuttons(self, **kwargs: Dict[str, Any]) -> None: ...
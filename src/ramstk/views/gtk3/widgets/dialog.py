@@ -401,6 +401,10 @@ class RAMSTKFileChooser(Gtk.FileChooserDialog):
         _filter.add_pattern("*.txt")
         self.add_filter(_filter)
         _filter = Gtk.FileFilter()
+        _filter.set_name(_("Parquet Files"))
+        _filter.add_pattern("*.parquet")
+        self.add_filter(_filter)
+        _filter = Gtk.FileFilter()
         _filter.set_name("All files")
         _filter.add_pattern("*")
         self.add_filter(_filter)
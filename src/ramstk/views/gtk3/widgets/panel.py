@@ -860,6 +860,11 @@ class RAMSTKTreePanel(RAMSTKPanel):
     :ivar tvwTreeView: a RAMSTKTreeView() for the panels that embed a treeview.
     :ivar _filtered_tree: boolean indicating whether to display the filtered
         RAMSTKTreeView() or the full RAMSTKTreeView().
+    :ivar _lazy_tree: boolean indicating whether the RAMSTKTreeView() is loaded with
+        a lazy model that only retrieves the rows being displayed.
+    :ivar _lazy_tree_threshold: the number of nodes in a tree at or above which the
+        RAMSTKTreeView() is loaded with a lazy model.  Zero (the default) never uses
+        the lazy model.
     """
 
     # Define private dict class attributes.
@@ -891,6 +896,8 @@ class RAMSTKTreePanel(RAMSTKPanel):
 
         # Initialize private scalar instance attributes.
         self._filtered_tree: bool = False
+        self._lazy_tree: bool = False
+        self._lazy_tree_threshold: int = 0
 
         # Initialize public dict instance attributes.
 
@@ -901,10 +908,11 @@ class RAMSTKTreePanel(RAMSTKPanel):
 
         # Subscribe to PyPubSub messages.
         pub.subscribe(self.do_clear_panel, "request_clear_views")
-        pub.subscribe(self.do_load_panel, f"succeed_insert_{self._tag}")
+        pub.subscribe(self.on_insert_treerow, f"succeed_insert_{self._tag}")
         pub.subscribe(self.do_refresh_tree, f"mvw_editing_{self._tag}")
         pub.subscribe(self.do_refresh_tree, f"wvw_editing_{self._tag}")
         pub.subscribe(self.on_delete_treerow, f"succeed_delete_{self._tag}")
+        pub.subscribe(self.on_update_treerow, f"succeed_update_{self._tag}")
         if self._select_msg is not None:
             pub.subscribe(self.do_load_panel, self._select_msg)
 
@@ -918,6 +926,7 @@ class RAMSTKTreePanel(RAMSTKPanel):
             self.tvwTreeView.get_model().clear()
         except AttributeError:
             self.tvwTreeView.get_model().get_model().clear()
+        self.tvwTreeView.dic_row_index.clear()
 
     def do_load_panel(self, tree: treelib.Tree) -> None:
         """Load data into the RAMSTKTreeView on a tree type panel.
@@ -927,9 +936,14 @@ class RAMSTKTreePanel(RAMSTKPanel):
         """
         with contextlib.suppress(AttributeError):
             self.tvwTreeView.unfilt_model.clear()
+        self.tvwTreeView.dic_row_index.clear()
+        self._lazy_tree = 0 < self._lazy_tree_threshold <= len(tree)
         try:
-            self.tvwTreeView.do_load_tree(tree, None)
-            self.tvwTreeView.expand_all()
+            if self._lazy_tree:
+                self._do_load_lazy_tree(tree)
+            else:
+                self.tvwTreeView.do_load_tree(tree, None)
+                self.tvwTreeView.expand_all()
             _row = self.tvwTreeView.unfilt_model.get_iter_first()
             if _row is not None:
                 self.tvwTreeView.selection.select_iter(_row)
@@ -1316,28 +1330,92 @@ class RAMSTKTreePanel(RAMSTKPanel):
             )
 
     # pylint: disable=unused-argument
-    # noinspection PyUnusedLocal
-    def on_delete_treerow(self, tree: treelib.Tree) -> None:
+    def on_delete_treerow(self, node_id: int, tree: treelib.Tree) -> None:
         """Update the RAMSTKTreeView after deleting a line item.
 
+        Only the rows whose node is no longer in the tree are removed so the
+        remaining rows keep their expanded and selected state.  A lazy model only
+        removes the deleted node's row.
+
+        :param node_id: the ID of the node deleted from the tree.
         :param tree: the treelib Tree() containing the workflow module data.
         :return: None
         """
-        _model, _row = self.tvwTreeView.selection.get_selected()
+        if self._lazy_tree:
+            if tree is not self.tvwTreeView.unfilt_model.tree:
+                self.do_load_panel(tree)
+                return
+            self.tvwTreeView.unfilt_model.do_remove_node(node_id)
+        else:
+            _index = self.tvwTreeView.dic_row_index
+            _rows: Dict[Tuple[int, ...], Gtk.TreeIter] = {}
+            for _node_id in [_key for _key in _index if not tree.contains(_key)]:
+                _row = _index.pop(_node_id)
+                _path = self.tvwTreeView.unfilt_model.get_path(_row)
+                _rows[tuple(_path.get_indices())] = _row
+
+            # Removing a row removes its children too, so only remove the rows that
+            # aren't descendants of another row being removed.
+            for _path, _row in _rows.items():
+                if not any(_path[:_idx] in _rows for _idx in range(1, len(_path))):
+                    self.tvwTreeView.unfilt_model.remove(_row)
 
         if self._filtered_tree:
-            _row = self.tvwTreeView.filt_model.convert_iter_to_child_iter(_row)
-            self.tvwTreeView.unfilt_model.remove(_row)
             self.tvwTreeView.filt_model.refilter()
-        else:
-            self.tvwTreeView.unfilt_model.remove(_row)
-            _row = _model.get_iter_first()
+        elif self.tvwTreeView.selection.get_selected()[1] is None:
+            _row = self.tvwTreeView.unfilt_model.get_iter_first()
             if _row is not None:
                 self.tvwTreeView.selection.select_iter(_row)
                 self.show_all()
 
         pub.sendMessage("request_set_cursor_active")
 
+    def on_insert_treerow(self, node_id: int, tree: treelib.Tree) -> None:
+        """Update the RAMSTKTreeView after inserting a line item.
+
+        Only the rows for the inserted node and the nodes below it are loaded, under
+        the row of the node's parent, so the existing rows keep their expanded and
+        selected state.  The RAMSTKTreeView is reloaded if the parent's row isn't in
+        the RAMSTKTreeView.
+
+        :param node_id: the ID of the node inserted into the tree.
+        :param tree: the treelib Tree() containing the workflow module data.
+        :return: None
+        """
+        if self._lazy_tree:
+            self._do_insert_lazy_treerow(node_id, tree)
+            return
+
+        _index = self.tvwTreeView.dic_row_index
+        _parent = tree.parent(node_id)
+        _parent_row = None
+        if _parent is not None and _parent.data is not None:
+            _parent_row = _index.get(_parent.identifier)
+            if _parent_row is None:
+                self.do_load_panel(tree)
+                return
+
+        # Push the children in reverse so they're popped, and appended, in the same
+        # order they appear in the treelib Tree.
+        _stack = [(node_id, _parent_row)]
+        while _stack:
+            _node_id, _row = _stack.pop()
+            _node = tree.get_node(_node_id)
+            if _node.data is not None and _node_id not in _index:
+                _row = self.tvwTreeView.dic_row_loader[_node.tag](_node, _row)
+                if _row is not None:
+                    _index[_node_id] = _row
+                    self._do_expand_to_row(_row)
+            _stack.extend(
+                (_child_id, _index.get(_node_id, _row))
+                for _child_id in reversed(tree.is_branch(_node_id))
+            )
+
+        if self._filtered_tree:
+            self.tvwTreeView.filt_model.refilter()
+
+        pub.sendMessage("request_set_cursor_active")
+
     def on_row_change(self, selection: Gtk.TreeSelection) -> Dict[str, Any]:
         """Get the attributes for the newly selected row.
 
@@ -1366,6 +1444,109 @@ class RAMSTKTreePanel(RAMSTKPanel):
 
         return _attributes
 
+    def on_update_treerow(self, tree: treelib.Tree) -> None:
+        """Update the RAMSTKTreeView row for the line item that was just saved.
+
+        :param tree: the treelib Tree() containing the workflow module data.
+        :return: None
+        """
+        if self._lazy_tree:
+            self.tvwTreeView.unfilt_model.do_invalidate(self._record_id)
+            return
+
+        _row = self.tvwTreeView.dic_row_index.get(self._record_id)
+        _node = tree.get_node(self._record_id)
+        if _row is None or _node is None or _node.data is None:
+            return
+
+        _attributes: Dict[str, Any] = {}
+        for _entity in _node.data.values():
+            with contextlib.suppress(AttributeError):
+                _attributes.update(_entity.get_attributes())
+
+        try:
+            for _key, _position in self.tvwTreeView.position.items():
+                if _key in _attributes:
+                    self.tvwTreeView.unfilt_model.set_value(
+                        _row, _position, _attributes[_key]
+                    )
+        except (TypeError, ValueError):
+            pub.sendMessage(
+                "do_log_debug_msg",
+                logger_name="DEBUG",
+                message=_(
+                    f"An error occurred while refreshing {self._tag} data for record "
+                    f"ID {self._record_id} in the view.  One or more values was the "
+                    f"wrong type for the column it was loaded into."
+                ),
+            )
+
+    def _do_expand_to_row(self, row: Gtk.TreeIter) -> None:
+        """Expand the RAMSTKTreeView so the passed row is visible.
+
+        :param row: the Gtk.TreeIter() in the unfiltered model to make visible.
+        :return: None
+        :rtype: None
+        """
+        _path = self.tvwTreeView.unfilt_model.get_path(row)
+        if self._filtered_tree:
+            _path = self.tvwTreeView.filt_model.convert_child_path_to_path(_path)
+        if _path is not None:
+            self.tvwTreeView.expand_to_path(_path)
+
+    def _do_insert_lazy_treerow(self, node_id: int, tree: treelib.Tree) -> None:
+        """Add the row for a newly inserted node to the lazy model.
+
+        The new row is made visible by expanding its parent row, which also loads
+        the row if the parent's children hadn't been retrieved yet.
+
+        :param node_id: the ID of the node inserted into the tree.
+        :param tree: the treelib Tree() containing the workflow module data.
+        :return: None
+        :rtype: None
+        """
+        _model = self.tvwTreeView.unfilt_model
+        if tree is not _model.tree:
+            self.do_load_panel(tree)
+            return
+
+        _model.do_insert_node(node_id)
+
+        _row = _model.get_node_iter(node_id)
+        if _row is None and tree.parent(node_id) is not None:
+            _row = _model.get_node_iter(tree.parent(node_id).identifier)
+        if _row is not None:
+            self._do_expand_to_row(_row)
+
+        if self._filtered_tree:
+            self.tvwTreeView.filt_model.refilter()
+
+        pub.sendMessage("request_set_cursor_active")
+
+    def _do_load_lazy_tree(self, tree: treelib.Tree) -> None:
+        """Load the RAMSTKTreeView with a lazy model of the tree.
+
+        Only the top level rows are expanded so the rows of collapsed branches are
+        never retrieved.
+
+        :param tree: the treelib Tree containing the module to load.
+        :return: None
+        :rtype: None
+        """
+        self.tvwTreeView.do_load_lazy_tree(tree)
+
+        if self._filtered_tree:
+            self.tvwTreeView.filt_model = self.tvwTreeView.unfilt_model.filter_new()
+            self.tvwTreeView.filt_model.set_visible_func(self.do_filter_tree)
+            self.tvwTreeView.set_model(self.tvwTreeView.filt_model)
+
+        _row = self.tvwTreeView.get_model().get_iter_first()
+        while _row is not None:
+            self.tvwTreeView.expand_row(
+                self.tvwTreeView.get_model().get_path(_row), False
+            )
+            _row = self.tvwTreeView.get_model().iter_next(_row)
+
     def _do_set_attributes(self, node_id, package) -> None:
         """Set the attributes of the record associated with node ID.
 
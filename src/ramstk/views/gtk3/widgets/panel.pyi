@@ -108,6 +108,8 @@ class RAMSTKPlotPanel(RAMSTKPanel):
 class RAMSTKTreePanel(RAMSTKPanel):
     _dic_row_loader: Dict[str, Callable]
     _filtered_tree: bool
+    _lazy_tree: bool
+    _lazy_tree_threshold: int
     tvwTreeView: RAMSTKTreeView
     def __init__(self) -> None: ...
     def do_clear_panel(self) -> None: ...
@@ -133,9 +135,14 @@ class RAMSTKTreePanel(RAMSTKPanel):
     def on_cell_toggled(
         self, cell: Gtk.CellRenderer, path: str, position: int, message: str
     ) -> None: ...
-    def on_delete_treerow(self, tree: treelib.Tree) -> None: ...
+    def on_delete_treerow(self, node_id: int, tree: treelib.Tree) -> None: ...
     def on_insert(self, data: Any) -> None: ...
+    def on_insert_treerow(self, node_id: int, tree: treelib.Tree) -> None: ...
     def on_row_change(self, selection: Gtk.TreeSelection) -> Dict[str, Any]: ...
+    def on_update_treerow(self, tree: treelib.Tree) -> None: ...
+    def _do_expand_to_row(self, row: Gtk.TreeIter) -> None: ...
+    def _do_insert_lazy_treerow(self, node_id: int, tree: treelib.Tree) -> None: ...
+    def _do_load_lazy_tree(self, tree: treelib.Tree) -> None: ...
     def _do_load_row(self, node: treelib.Node, row: Gtk.TreeIter) -> Gtk.TreeIter: ...
     def _do_load_treerow(
         self, node: treelib.Node, row: Gtk.TreeIter
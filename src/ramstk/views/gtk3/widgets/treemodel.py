@@ -0,0 +1,318 @@
+# pylint: disable=non-parent-init-called
+# -*- coding: utf-8 -*-
+#
+#       ramstk.views.gtk3.widgets.treemodel.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""RAMSTKLazyTreeModel Module."""
+
+# Standard Library Imports
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Third Party Imports
+import treelib
+
+# RAMSTK Package Imports
+from ramstk.views.gtk3 import GObject, Gtk
+from ramstk.views.lazytree import RAMSTKLazyTreeIndex
+
+
+class RAMSTKLazyTreeModel(GObject.GObject, Gtk.TreeModel):
+    """A Gtk.TreeModel() backed directly by a treelib Tree().
+
+    Nothing is copied out of the treelib Tree() when the model is created.  The
+    children of a node are only looked up when the RAMSTKTreeView() asks for them
+    (e.g., when the node's row is expanded) and the values in a row are only
+    retrieved when the RAMSTKTreeView() asks for them (e.g., when the row is drawn).
+    The row handles and the cache of recently used rows are kept in a
+    RAMSTKLazyTreeIndex().
+
+    The values in a row are retrieved with the same row loaders used to fill a
+    Gtk.TreeStore(); the loader for the node's tag appends its row to this model
+    and append() keeps the values for the row being retrieved.
+
+    The attributes of a RAMSTKLazyTreeModel are:
+
+    :ivar index: the RAMSTKLazyTreeIndex() with the row handles and cached rows.
+    """
+
+    def __init__(
+        self,
+        tree: treelib.Tree,
+        types: List[Any],
+        row_loaders: Dict[str, Callable[[treelib.Node, Any], Any]],
+        cache_size: int = 256,
+    ) -> None:
+        """Initialize an instance of the RAMSTKLazyTreeModel.
+
+        :param tree: the treelib Tree() whose nodes are the rows in the model.
+        :param types: the list of GObject types for each column in the model.
+        :param row_loaders: the row loader for each node tag.  Each loader is passed
+            the treelib Node() and the parent row and appends the node's row.
+        :param cache_size: the maximum number of rows to keep in the cache.
+        :return: None
+        :rtype: None
+        """
+        GObject.GObject.__init__(self)
+
+        # Initialize private dictionary instance attributes.
+        self._dic_row_loaders: Dict[str, Callable[[treelib.Node, Any], Any]] = (
+            row_loaders
+        )
+
+        # Initialize private list instance attributes.
+        _defaults = Gtk.ListStore(*types)
+        self._lst_defaults: List[Any] = list(_defaults[_defaults.append()])
+        self._lst_row: List[Any] = []
+        self._lst_types: List[Any] = types
+
+        # Initialize private scalar instance attributes.
+        self._stamp: int = id(self) & 0x7FFFFFFF
+
+        # Initialize public scalar instance attributes.
+        self.index: RAMSTKLazyTreeIndex = RAMSTKLazyTreeIndex(
+            tree, self._do_load_row, cache_size=cache_size
+        )
+
+    @property
+    def tree(self) -> treelib.Tree:
+        """Return the treelib Tree() whose nodes are the rows in the model."""
+        return self.index.tree
+
+    def append(self, parent: Optional[Gtk.TreeIter], row: List[Any]) -> Gtk.TreeIter:
+        """Keep the values a row loader appends for the row being retrieved.
+
+        :param parent: the parent row passed to the row loader; unused.
+        :param row: the list of values for the row.
+        :return: a Gtk.TreeIter() for the row; it can't be used to add children.
+        :rtype: :class:`Gtk.TreeIter`
+        """
+        # pylint: disable=unused-argument
+        if len(row) != len(self._lst_types):
+            raise ValueError(
+                f"Row has {len(row)} values but the model has "
+                f"{len(self._lst_types)} columns."
+            )
+        self._lst_row = list(row)
+
+        return self._do_make_iter(0)
+
+    def clear(self) -> None:
+        """Remove all the rows from the model.
+
+        :return: None
+        :rtype: None
+        """
+        _top = self.index.get_children(None)
+        while _top:
+            _top.pop()
+            self.row_deleted(Gtk.TreePath.new_from_indices([len(_top)]))
+
+        self.index.clear()
+
+    def do_insert_node(self, node_id: Any) -> None:
+        """Add the row for a node that was just added to the tree.
+
+        :param node_id: the ID of the treelib Node() added to the tree.
+        :return: None
+        :rtype: None
+        """
+        _handle = self.index.do_insert_node(node_id)
+        if _handle is not None:
+            _iter = self._do_make_iter(_handle)
+            self.row_inserted(self.do_get_path(_iter), _iter)
+            _parent = self.index.get_parent(_handle)
+        else:
+            _parent_node = self.tree.parent(node_id)
+            _parent = (
+                None
+                if _parent_node is None
+                else self.index.get_node_handle(_parent_node.identifier)
+            )
+
+        if _parent is not None:
+            _iter = self._do_make_iter(_parent)
+            self.row_has_child_toggled(self.do_get_path(_iter), _iter)
+
+    def do_invalidate(self, node_id: Any) -> None:
+        """Discard the cached values for a node's row and redraw it.
+
+        :param node_id: the ID of the treelib Node() whose row has changed.
+        :return: None
+        :rtype: None
+        """
+        _handle = self.index.do_invalidate(node_id)
+        if _handle is not None:
+            _iter = self._do_make_iter(_handle)
+            self.row_changed(self.do_get_path(_iter), _iter)
+
+    def do_remove_node(self, node_id: Any) -> None:
+        """Remove the row for a node that was just removed from the tree.
+
+        :param node_id: the ID of the treelib Node() removed from the tree.
+        :return: None
+        :rtype: None
+        """
+        _handle = self.index.get_node_handle(node_id)
+        if _handle is None:
+            return
+
+        _path = Gtk.TreePath.new_from_indices(self.index.get_path(_handle))
+        _parent = self.index.do_remove_node(node_id)
+        self.row_deleted(_path)
+
+        if _parent is not None and not self.index.get_children(_parent):
+            _iter = self._do_make_iter(_parent)
+            self.row_has_child_toggled(self.do_get_path(_iter), _iter)
+
+    def get_cache_info(self) -> Tuple[int, int]:
+        """Return the number of rows in the cache and the size of the cache.
+
+        :return: the number of rows currently cached and the maximum number of rows.
+        :rtype: tuple
+        """
+        return self.index.get_cache_info()
+
+    def get_node_iter(self, node_id: Any) -> Optional[Gtk.TreeIter]:
+        """Return the row for a node.
+
+        :param node_id: the ID of the treelib Node().
+        :return: the Gtk.TreeIter() for the node's row or None if the node's row
+            hasn't been retrieved.
+        :rtype: :class:`Gtk.TreeIter`
+        """
+        _handle = self.index.get_node_handle(node_id)
+        if _handle is None:
+            return None
+
+        return self._do_make_iter(_handle)
+
+    def set_value(self, row: Gtk.TreeIter, column: int, value: Any) -> None:
+        """Set the value of a column in the row.
+
+        The value is kept in the row's cache entry; the record the row was
+        retrieved from is not changed.
+
+        :param row: the Gtk.TreeIter() of the row to change.
+        :param column: the index of the column to change.
+        :param value: the new value for the column.
+        :return: None
+        :rtype: None
+        """
+        self.index.set_value(row.user_data, column, value)
+        self.row_changed(self.do_get_path(row), row)
+
+    def do_get_column_type(self, index: int) -> Any:
+        """Return the type of a column (Gtk.TreeModel virtual method)."""
+        return self._lst_types[index]
+
+    def do_get_flags(self) -> Gtk.TreeModelFlags:
+        """Return the model flags (Gtk.TreeModel virtual method)."""
+        return Gtk.TreeModelFlags.ITERS_PERSIST
+
+    def do_get_iter(self, path: Gtk.TreePath) -> Tuple[bool, Optional[Gtk.TreeIter]]:
+        """Return the row at the path (Gtk.TreeModel virtual method)."""
+        _handle = self.index.get_handle(path.get_indices())
+        if _handle is None:
+            return False, None
+
+        return True, self._do_make_iter(_handle)
+
+    def do_get_n_columns(self) -> int:
+        """Return the number of columns (Gtk.TreeModel virtual method)."""
+        return len(self._lst_types)
+
+    def do_get_path(self, row: Gtk.TreeIter) -> Gtk.TreePath:
+        """Return the path to the row (Gtk.TreeModel virtual method)."""
+        return Gtk.TreePath.new_from_indices(self.index.get_path(row.user_data))
+
+    def do_get_value(self, row: Gtk.TreeIter, column: int) -> Any:
+        """Return the value in a column of the row (Gtk.TreeModel virtual method)."""
+        return self.index.get_row(row.user_data)[column]
+
+    def do_iter_children(
+        self, parent: Optional[Gtk.TreeIter]
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]:
+        """Return the first child of the row (Gtk.TreeModel virtual method)."""
+        return self.do_iter_nth_child(parent, 0)
+
+    def do_iter_has_child(self, row: Gtk.TreeIter) -> bool:
+        """Return whether the row has children (Gtk.TreeModel virtual method)."""
+        return self.index.has_children(row.user_data)
+
+    def do_iter_n_children(self, row: Optional[Gtk.TreeIter]) -> int:
+        """Return the number of children of the row (Gtk.TreeModel virtual method)."""
+        return len(self.index.get_children(None if row is None else row.user_data))
+
+    def do_iter_next(self, row: Gtk.TreeIter) -> bool:
+        """Move the row to its next sibling (Gtk.TreeModel virtual method)."""
+        return self._do_move_iter(row, 1)
+
+    def do_iter_nth_child(
+        self, parent: Optional[Gtk.TreeIter], n: int
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]:
+        """Return the nth child of the row (Gtk.TreeModel virtual method)."""
+        _children = self.index.get_children(
+            None if parent is None else parent.user_data
+        )
+        if 0 <= n < len(_children):
+            return True, self._do_make_iter(_children[n])
+
+        return False, None
+
+    def do_iter_parent(
+        self, child: Gtk.TreeIter
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]:
+        """Return the parent of the row (Gtk.TreeModel virtual method)."""
+        _handle = self.index.get_parent(child.user_data)
+        if _handle is None:
+            return False, None
+
+        return True, self._do_make_iter(_handle)
+
+    def do_iter_previous(self, row: Gtk.TreeIter) -> bool:
+        """Move the row to its previous sibling (Gtk.TreeModel virtual method)."""
+        return self._do_move_iter(row, -1)
+
+    def _do_load_row(self, node: treelib.Node) -> List[Any]:
+        """Retrieve the values for a node's row with the node's row loader.
+
+        A row of default values is returned if the row loader doesn't append a row.
+
+        :param node: the treelib Node() whose row values are to be retrieved.
+        :return: the list of values for the row.
+        :rtype: list
+        """
+        self._lst_row = list(self._lst_defaults)
+        self._dic_row_loaders[node.tag](node, None)
+
+        return self._lst_row
+
+    def _do_make_iter(self, handle: int) -> Gtk.TreeIter:
+        """Create a Gtk.TreeIter() pointing to the row with the passed handle.
+
+        :param handle: the handle of the row.
+        :return: the Gtk.TreeIter() for the row.
+        :rtype: :class:`Gtk.TreeIter`
+        """
+        _iter = Gtk.TreeIter()
+        _iter.stamp = self._stamp
+        _iter.user_data = handle
+
+        return _iter
+
+    def _do_move_iter(self, row: Gtk.TreeIter, offset: int) -> bool:
+        """Move the row to a sibling.
+
+        :param row: the Gtk.TreeIter() to move.
+        :param offset: the number of siblings to move the row by.
+        :return: True if the sibling exists or False if it does not.
+        :rtype: bool
+        """
+        _handle = self.index.get_sibling(row.user_data, offset)
+        if _handle is None:
+            return False
+
+        row.user_data = _handle
+        return True
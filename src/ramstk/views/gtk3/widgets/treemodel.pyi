@@ -0,0 +1,61 @@
+# Standard Library Imports
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Third Party Imports
+import treelib
+
+# RAMSTK Package Imports
+from ramstk.views.gtk3 import GObject as GObject
+from ramstk.views.gtk3 import Gtk as Gtk
+from ramstk.views.lazytree import RAMSTKLazyTreeIndex as RAMSTKLazyTreeIndex
+
+class RAMSTKLazyTreeModel(GObject.GObject, Gtk.TreeModel):
+    _dic_row_loaders: Dict[str, Callable[[treelib.Node, Any], Any]]
+    _lst_defaults: List[Any]
+    _lst_row: List[Any]
+    _lst_types: List[Any]
+    _stamp: int
+    index: RAMSTKLazyTreeIndex
+    def __init__(
+        self,
+        tree: treelib.Tree,
+        types: List[Any],
+        row_loaders: Dict[str, Callable[[treelib.Node, Any], Any]],
+        cache_size: int = ...,
+    ) -> None: ...
+    @property
+    def tree(self) -> treelib.Tree: ...
+    def append(
+        self, parent: Optional[Gtk.TreeIter], row: List[Any]
+    ) -> Gtk.TreeIter: ...
+    def clear(self) -> None: ...
+    def do_insert_node(self, node_id: Any) -> None: ...
+    def do_invalidate(self, node_id: Any) -> None: ...
+    def do_remove_node(self, node_id: Any) -> None: ...
+    def get_cache_info(self) -> Tuple[int, int]: ...
+    def get_node_iter(self, node_id: Any) -> Optional[Gtk.TreeIter]: ...
+    def set_value(self, row: Gtk.TreeIter, column: int, value: Any) -> None: ...
+    def do_get_column_type(self, index: int) -> Any: ...
+    def do_get_flags(self) -> Gtk.TreeModelFlags: ...
+    def do_get_iter(
+        self, path: Gtk.TreePath
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]: ...
+    def do_get_n_columns(self) -> int: ...
+    def do_get_path(self, row: Gtk.TreeIter) -> Gtk.TreePath: ...
+    def do_get_value(self, row: Gtk.TreeIter, column: int) -> Any: ...
+    def do_iter_children(
+        self, parent: Optional[Gtk.TreeIter]
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]: ...
+    def do_iter_has_child(self, row: Gtk.TreeIter) -> bool: ...
+    def do_iter_n_children(self, row: Optional[Gtk.TreeIter]) -> int: ...
+    def do_iter_next(self, row: Gtk.TreeIter) -> bool: ...
+    def do_iter_nth_child(
+        self, parent: Optional[Gtk.TreeIter], n: int
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]: ...
+    def do_iter_parent(
+        self, child: Gtk.TreeIter
+    ) -> Tuple[bool, Optional[Gtk.TreeIter]]: ...
+    def do_iter_previous(self, row: Gtk.TreeIter) -> bool: ...
+    def _do_load_row(self, node: treelib.Node) -> List[Any]: ...
+    def _do_make_iter(self, handle: int) -> Gtk.TreeIter: ...
+    def _do_move_iter(self, row: Gtk.TreeIter, offset: int) -> bool: ...
@@ -22,6 +22,7 @@ from ramstk.views.gtk3 import Gdk, GdkPixbuf, GObject, Gtk, Pango
 
 # RAMSTK Local Imports
 from .label import RAMSTKLabel
+from .treemodel import RAMSTKLazyTreeModel
 from .widget import RAMSTKWidget
 
 
@@ -130,6 +131,7 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
         # Initialize public dictionary instance attributes.
         self.cellprops: Dict[str, Any] = {}
         self.datatypes: Dict[str, str] = {}
+        self.dic_row_index: Dict[Any, Gtk.TreeIter] = {}
         self.editable: Dict[str, bool] = {}
         self.headings: Dict[str, str] = {}
         self.position: Dict[str, int] = {}
@@ -234,11 +236,19 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
     def do_get_row_by_value(self, search_col: int, value: Any) -> Gtk.TreeIter:
         """Find the row in the RAMSTKTreeView() containing the passed value.
 
+        The row index is checked first since the value searched for is nearly always
+        the ID of the node the row was loaded from.  The top level rows are only
+        searched if the indexed row doesn't contain the value.
+
         :param search_col: the column number to search for the desired value.
         :param value: the value to match.
         :return: _iter; the Gtk.TreeIter() for the matching row.
         :rtype: :class:`Gtk.TreeIter`
         """
+        _row = self.dic_row_index.get(value)
+        if _row is not None and self.unfilt_model.get_value(_row, search_col) == value:
+            return _row
+
         _row = self.unfilt_model.get_iter_first()
 
         while (
@@ -280,16 +290,63 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
         for _item in items:
             _model.append([str(_item)])
 
+    def do_load_lazy_tree(self, tree: treelib.Tree, cache_size: int = 256) -> None:
+        """Load the RAMSTKTreeView with a lazy model of the contents of the tree.
+
+        No rows are loaded up front.  The RAMSTKLazyTreeModel retrieves the values for
+        a row only when the row is drawn, using the same row loaders do_load_tree()
+        uses, and keeps the last cache_size rows retrieved.  Nodes are not added to
+        the row index.
+
+        :param tree: the treelib Tree() whose contents are to be loaded.
+        :param cache_size: the maximum number of rows the model keeps cached.
+        :return: None
+        :rtype: None
+        """
+        self.unfilt_model = RAMSTKLazyTreeModel(
+            tree,
+            self._get_column_types(),
+            self.dic_row_loader,
+            cache_size=cache_size,
+        )
+        self.set_model(self.unfilt_model)
+
     def do_load_tree(self, tree: treelib.Tree, row: Gtk.TreeIter = None) -> None:
-        """Load the RAMSTKTreeView with the contents of the tree."""
-        _row = None
-        _node = tree.get_node(tree.root)
+        """Load the RAMSTKTreeView with the contents of the tree.
 
-        if _node.data is not None:
-            _row = self.dic_row_loader[_node.tag](_node, row)
+        The tree is walked once, depth first, so every row is appended in the same
+        order as the treelib Tree without copying any subtrees.  The data model is
+        detached from the RAMSTKTreeView() while loading so the view isn't updated
+        for each row appended.  Each row loaded is added to the row index.
 
-        for _n in tree.children(_node.identifier):
-            self.do_load_tree(tree.subtree(_n.identifier), _row)
+        :param tree: the treelib Tree() whose contents are to be loaded.
+        :param row: the parent row of the tree's root node.
+        :return: None
+        :rtype: None
+        """
+        _model = self.get_model()
+        self.set_model(None)
+
+        try:
+            _stack = [(tree.root, row)]
+            while _stack:
+                _node_id, _parent_row = _stack.pop()
+                _node = tree.get_node(_node_id)
+
+                _row = None
+                if _node.data is not None:
+                    _row = self.dic_row_loader[_node.tag](_node, _parent_row)
+                if _row is not None:
+                    self.dic_row_index[_node_id] = _row
+
+                # Push the children in reverse so they're popped, and appended, in
+                # the same order they appear in the treelib Tree.
+                _stack.extend(
+                    (_child_id, _row)
+                    for _child_id in reversed(tree.is_branch(_node_id))
+                )
+        finally:
+            self.set_model(_model)
 
     def do_make_columns(self) -> None:
         """Make the columns for the RAMSTKTreeView().
@@ -340,15 +397,7 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
         :return: None
         :rtype: None
         """
-        _types = [
-            GObject.type_from_name(_datatype)
-            for __, _datatype in self.datatypes.items()
-        ]
-
-        if self._has_pixbuf:
-            _types.append(GdkPixbuf.Pixbuf)
-
-        self.unfilt_model = Gtk.TreeStore(*_types)
+        self.unfilt_model = Gtk.TreeStore(*self._get_column_types())
         self.set_model(self.unfilt_model)
 
     # noinspection PyTypeChecker
@@ -534,6 +583,22 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
         if self.position[key] > 0:
             column.set_reorderable(True)
 
+    def _get_column_types(self) -> List[Any]:
+        """Return the GObject types for the columns in the RAMSTKTreeView().
+
+        :return: the list of column types.
+        :rtype: list
+        """
+        _types = [
+            GObject.type_from_name(_datatype)
+            for __, _datatype in self.datatypes.items()
+        ]
+
+        if self._has_pixbuf:
+            _types.append(GdkPixbuf.Pixbuf)
+
+        return _types
+
     @staticmethod
     def _resize_wrap(
         column: Gtk.TreeViewColumn, __param, cell: Gtk.CellRenderer
@@ -1,6 +1,9 @@
 # Standard Library Imports
 from typing import Any, Callable, Dict, List, Tuple
 
+# Third Party Imports
+import treelib
+
 # RAMSTK Package Imports
 from ramstk.utilities import deprecated as deprecated
 from ramstk.utilities import string_to_boolean as string_to_boolean
@@ -12,6 +15,7 @@ from ramstk.views.gtk3 import Pango as Pango
 
 # RAMSTK Local Imports
 from .label import RAMSTKLabel as RAMSTKLabel
+from .treemodel import RAMSTKLazyTreeModel as RAMSTKLazyTreeModel
 from .widget import RAMSTKWidget as RAMSTKWidget
 
 def do_make_column(
@@ -24,6 +28,7 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
     dic_row_loader: Dict[str, Callable]
     cellprops: Dict[str, Any]
     datatypes: Dict[str, str]
+    dic_row_index: Dict[Any, Gtk.TreeIter]
     editable: Dict[str, bool]
     headings: Dict[str, str]
     position: Dict[str, int]
@@ -40,6 +45,7 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
     def do_get_row_by_value(self, search_col: int, value: Any) -> Gtk.TreeIter: ...
     def do_insert_row(self, data: Dict[str, Any], prow: Gtk.TreeIter = ...) -> None: ...
     def do_load_combo_cell(self, index: int, items: List[str]) -> None: ...
+    def do_load_lazy_tree(self, tree: treelib.Tree, cache_size: int = ...) -> None: ...
     def do_make_columns(self) -> None: ...
     def do_make_model(self) -> None: ...
     def do_parse_format(self, fmt_file: str) -> None: ...
@@ -59,6 +65,7 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
     def _do_set_column_properties(
         self, key: str, column: Gtk.TreeViewColumn
     ) -> None: ...
+    def _get_column_types(self) -> List[Any]: ...
     @staticmethod
     def _resize_wrap(
         column: Gtk.TreeViewColumn, __param, cell: Gtk.CellRenderer
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.views.lazytree.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""RAMSTKLazyTreeIndex Module."""
+
+# Standard Library Imports
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Third Party Imports
+import treelib
+
+
+class RAMSTKLazyTreeIndex:
+    """The row handles and row cache for a lazily loaded view of a treelib Tree().
+
+    Each row is identified by an integer handle that is handed out the first time
+    the row's parent is asked for its children; handles are never reused.  The
+    values in a row are retrieved with the row getter the first time they're asked
+    for and the most recently used rows are kept in a least recently used cache.
+    Nothing here depends on a GUI toolkit; the toolkit's tree model translates its
+    iterators and paths to and from handles.
+
+    The attributes of a RAMSTKLazyTreeIndex are:
+
+    :ivar tree: the treelib Tree() whose nodes are the rows.
+    """
+
+    def __init__(
+        self,
+        tree: treelib.Tree,
+        row_getter: Callable[[treelib.Node], List[Any]],
+        cache_size: int = 256,
+    ) -> None:
+        """Initialize an instance of the RAMSTKLazyTreeIndex.
+
+        :param tree: the treelib Tree() whose nodes are the rows.
+        :param row_getter: the function that returns the list of values for the row
+            of the treelib Node() passed to it.
+        :param cache_size: the maximum number of rows to keep in the cache.
+        :return: None
+        :rtype: None
+        """
+        # Initialize private dictionary instance attributes.
+        self._dic_cache: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._dic_children: Dict[Optional[int], List[int]] = {}
+        self._dic_handles: Dict[Any, int] = {}
+
+        # Initialize private list instance attributes.
+        self._lst_node_ids: List[Any] = []
+        self._lst_parents: List[Optional[int]] = []
+        self._lst_positions: List[int] = []
+
+        # Initialize private scalar instance attributes.
+        self._cache_size: int = cache_size
+        self._row_getter: Callable[[treelib.Node], List[Any]] = row_getter
+
+        # Initialize public scalar instance attributes.
+        self.tree: treelib.Tree = tree
+
+    def clear(self) -> None:
+        """Remove all the rows and replace the tree with an empty one.
+
+        :return: None
+        :rtype: None
+        """
+        self.tree = treelib.Tree()
+        self._dic_cache.clear()
+        self._dic_children.clear()
+        self._dic_handles.clear()
+        self._lst_node_ids.clear()
+        self._lst_parents.clear()
+        self._lst_positions.clear()
+
+    def do_insert_node(self, node_id: Any) -> Optional[int]:
+        """Add the row for a node that was just added to the tree.
+
+        The row is only added if its parent's children have already been handed
+        out; otherwise it's picked up the first time they are.
+
+        :param node_id: the ID of the treelib Node() added to the tree.
+        :return: the handle of the new row or None if no row was added.
+        :rtype: int
+        """
+        _parent = self.tree.parent(node_id)
+        _parent_handle = self._get_parent_handle(
+            None if _parent is None else _parent.identifier
+        )
+        if _parent_handle is False or _parent_handle not in self._dic_children:
+            return None
+
+        _children = self._dic_children[_parent_handle]
+        _handle = self._do_add_handle(node_id, _parent_handle, len(_children))
+        _children.append(_handle)
+
+        return _handle
+
+    def do_invalidate(self, node_id: Any) -> Optional[int]:
+        """Discard the cached values for a node's row.
+
+        :param node_id: the ID of the treelib Node() whose row has changed.
+        :return: the handle of the node's row or None if it has no row.
+        :rtype: int
+        """
+        _handle = self._dic_handles.get(node_id)
+        if _handle is not None:
+            self._dic_cache.pop(_handle, None)
+
+        return _handle
+
+    def do_remove_node(self, node_id: Any) -> Optional[int]:
+        """Remove the row for a node and all the rows below it.
+
+        The siblings after the row move up one position.  The path of the row must
+        be retrieved before it is removed.
+
+        :param node_id: the ID of the treelib Node() removed from the tree.
+        :return: the handle of the parent row; None for a top level row or if the
+            node had no row.
+        :rtype: int
+        """
+        _handle = self._dic_handles.get(node_id)
+        if _handle is None:
+            return None
+
+        _parent = self._lst_parents[_handle - 1]
+        _siblings = self._dic_children[_parent]
+        _position = self._lst_positions[_handle - 1]
+        del _siblings[_position]
+        for _sibling in _siblings[_position:]:
+            self._lst_positions[_sibling - 1] -= 1
+
+        _handles = [_handle]
+        while _handles:
+            _handle = _handles.pop()
+            _handles.extend(self._dic_children.pop(_handle, []))
+            self._dic_cache.pop(_handle, None)
+            self._dic_handles.pop(self._lst_node_ids[_handle - 1], None)
+            self._lst_node_ids[_handle - 1] = None
+
+        return _parent
+
+    def get_cache_info(self) -> Tuple[int, int]:
+        """Return the number of rows in the cache and the size of the cache.
+
+        :return: the number of rows currently cached and the maximum number of rows.
+        :rtype: tuple
+        """
+        return len(self._dic_cache), self._cache_size
+
+    def get_children(self, handle: Optional[int]) -> List[int]:
+        """Return the handles of the children of the row with the passed handle.
+
+        The children of a row are given handles the first time they're asked for.
+        The top level rows are the children of the tree's root node, unless the
+        root node carries data itself.
+
+        :param handle: the handle of the parent row or None for the top level rows.
+        :return: the list of handles for the child rows.
+        :rtype: list
+        """
+        if handle in self._dic_children:
+            return self._dic_children[handle]
+
+        if handle is not None:
+            _node_ids = self.tree.is_branch(self._lst_node_ids[handle - 1])
+        elif self.tree.root is None:
+            _node_ids = []
+        elif self.tree.get_node(self.tree.root).data is not None:
+            _node_ids = [self.tree.root]
+        else:
+            _node_ids = self.tree.is_branch(self.tree.root)
+
+        self._dic_children[handle] = [
+            self._do_add_handle(_node_id, handle, _position)
+            for _position, _node_id in enumerate(_node_ids)
+        ]
+
+        return self._dic_children[handle]
+
+    def get_handle(self, path: Sequence[int]) -> Optional[int]:
+        """Return the handle of the row at the path.
+
+        :param path: the position of the row and each of its ancestors, starting
+            with the top level.
+        :return: the handle of the row or None if there is no row at the path.
+        :rtype: int
+        """
+        _handle = None
+        for _index in path:
+            _children = self.get_children(_handle)
+            if not 0 <= _index < len(_children):
+                return None
+            _handle = _children[_index]
+
+        return _handle
+
+    def get_node_handle(self, node_id: Any) -> Optional[int]:
+        """Return the handle of the row for a treelib Node().
+
+        :param node_id: the ID of the treelib Node().
+        :return: the handle of the node's row or None if it hasn't been given one.
+        :rtype: int
+        """
+        return self._dic_handles.get(node_id)
+
+    def get_node_id(self, handle: int) -> Any:
+        """Return the ID of the treelib Node() for the row with the passed handle.
+
+        :param handle: the handle of the row.
+        :return: the ID of the node or None if the row was removed.
+        """
+        return self._lst_node_ids[handle - 1]
+
+    def get_parent(self, handle: int) -> Optional[int]:
+        """Return the handle of the parent of the row with the passed handle.
+
+        :param handle: the handle of the row.
+        :return: the handle of the parent row or None for a top level row.
+        :rtype: int
+        """
+        return self._lst_parents[handle - 1]
+
+    def get_path(self, handle: int) -> List[int]:
+        """Return the path to the row with the passed handle.
+
+        :param handle: the handle of the row.
+        :return: the position of the row and each of its ancestors, starting with
+            the top level.
+        :rtype: list
+        """
+        _path: List[int] = []
+        _handle: Optional[int] = handle
+        while _handle is not None:
+            _path.append(self._lst_positions[_handle - 1])
+            _handle = self._lst_parents[_handle - 1]
+
+        return _path[::-1]
+
+    def get_row(self, handle: int) -> List[Any]:
+        """Return the values in the row with the passed handle.
+
+        :param handle: the handle of the row.
+        :return: the list of values in the row.
+        :rtype: list
+        """
+        if handle in self._dic_cache:
+            self._dic_cache.move_to_end(handle)
+        else:
+            self._dic_cache[handle] = list(
+                self._row_getter(self.tree.get_node(self._lst_node_ids[handle - 1]))
+            )
+            if len(self._dic_cache) > self._cache_size:
+                self._dic_cache.popitem(last=False)
+
+        return self._dic_cache[handle]
+
+    def get_sibling(self, handle: int, offset: int) -> Optional[int]:
+        """Return the handle of a sibling of the row with the passed handle.
+
+        :param handle: the handle of the row.
+        :param offset: the number of positions to move from the row.
+        :return: the handle of the sibling or None if there is no sibling there.
+        :rtype: int
+        """
+        _siblings = self._dic_children[self._lst_parents[handle - 1]]
+        _position = self._lst_positions[handle - 1] + offset
+        if 0 <= _position < len(_siblings):
+            return _siblings[_position]
+
+        return None
+
+    def has_children(self, handle: Optional[int]) -> bool:
+        """Return whether the row with the passed handle has children.
+
+        The children of the row are not given handles by this check.
+
+        :param handle: the handle of the row or None for the top level.
+        :return: True if the row has at least one child.
+        :rtype: bool
+        """
+        if handle in self._dic_children or handle is None:
+            return bool(self.get_children(handle))
+
+        return bool(
+            self.tree.get_node(self._lst_node_ids[handle - 1]).successors(
+                self.tree.identifier
+            )
+        )
+
+    def set_value(self, handle: int, column: int, value: Any) -> None:
+        """Set the value of a column in the row with the passed handle.
+
+        The value is kept in the row's cache entry; the record the row was
+        retrieved from is not changed.
+
+        :param handle: the handle of the row.
+        :param column: the index of the column to change.
+        :param value: the new value for the column.
+        :return: None
+        :rtype: None
+        """
+        self.get_row(handle)[column] = value
+
+    def _do_add_handle(self, node_id: Any, parent: Optional[int], position: int) -> int:
+        """Hand out a new handle for a node's row.
+
+        :param node_id: the ID of the treelib Node() for the row.
+        :param parent: the handle of the parent row or None for the top level.
+        :param position: the position of the row among its siblings.
+        :return: the new handle.
+        :rtype: int
+        """
+        self._lst_node_ids.append(node_id)
+        self._lst_parents.append(parent)
+        self._lst_positions.append(position)
+        self._dic_handles[node_id] = len(self._lst_node_ids)
+
+        return len(self._lst_node_ids)
+
+    def _get_parent_handle(self, parent_id: Any) -> Any:
+        """Return the handle of the row for a parent node.
+
+        :param parent_id: the ID of the parent treelib Node() or None.
+        :return: the handle of the parent row, None if the node's row is a top level
+            row, or False if the parent has no row.
+        """
+        if parent_id is None or (
+            parent_id == self.tree.root
+            and self.tree.get_node(self.tree.root).data is None
+        ):
+            return None
+
+        return self._dic_handles.get(parent_id, False)
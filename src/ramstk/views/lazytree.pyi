@@ -0,0 +1,42 @@
+# Standard Library Imports
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Third Party Imports
+import treelib
+
+class RAMSTKLazyTreeIndex:
+    _dic_cache: OrderedDict[int, List[Any]]
+    _dic_children: Dict[Optional[int], List[int]]
+    _dic_handles: Dict[Any, int]
+    _lst_node_ids: List[Any]
+    _lst_parents: List[Optional[int]]
+    _lst_positions: List[int]
+    _cache_size: int
+    _row_getter: Callable[[treelib.Node], List[Any]]
+    tree: treelib.Tree
+    def __init__(
+        self,
+        tree: treelib.Tree,
+        row_getter: Callable[[treelib.Node], List[Any]],
+        cache_size: int = ...,
+    ) -> None: ...
+    def clear(self) -> None: ...
+    def do_insert_node(self, node_id: Any) -> Optional[int]: ...
+    def do_invalidate(self, node_id: Any) -> Optional[int]: ...
+    def do_remove_node(self, node_id: Any) -> Optional[int]: ...
+    def get_cache_info(self) -> Tuple[int, int]: ...
+    def get_children(self, handle: Optional[int]) -> List[int]: ...
+    def get_handle(self, path: Sequence[int]) -> Optional[int]: ...
+    def get_node_handle(self, node_id: Any) -> Optional[int]: ...
+    def get_node_id(self, handle: int) -> Any: ...
+    def get_parent(self, handle: int) -> Optional[int]: ...
+    def get_path(self, handle: int) -> List[int]: ...
+    def get_row(self, handle: int) -> List[Any]: ...
+    def get_sibling(self, handle: int, offset: int) -> Optional[int]: ...
+    def has_children(self, handle: Optional[int]) -> bool: ...
+    def set_value(self, handle: int, column: int, value: Any) -> None: ...
+    def _do_add_handle(
+        self, node_id: Any, parent: Optional[int], position: int
+    ) -> int: ...
+    def _get_parent_handle(self, parent_id: Any) -> Any: ...
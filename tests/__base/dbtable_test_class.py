@@ -104,6 +104,36 @@ class UnitTestInsertMethods:
             self._record,
         )
 
+    @pytest.mark.unit
+    def test_do_insert_bad_attributes(
+        self, monkeypatch, test_attributes, unit_test_table_model
+    ):
+        """Should release the reserved ID when the new record can't be created."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+
+        _released = []
+        monkeypatch.setattr(
+            unit_test_table_model.dao,
+            "do_release_ids",
+            lambda *args, **kwargs: _released.append(args),
+        )
+        test_attributes.pop(unit_test_table_model._lst_id_columns[0])
+
+        with pytest.raises(KeyError):
+            unit_test_table_model.do_insert(attributes=test_attributes)
+
+        assert _released == [
+            (
+                unit_test_table_model._db_tablename,
+                unit_test_table_model._db_id_colname,
+                unit_test_table_model.last_id,
+            )
+        ]
+        assert (
+            unit_test_table_model.tree.get_node(unit_test_table_model.last_id + 1)
+            is None
+        )
+
 
 @pytest.mark.usefixtures("test_attributes", "unit_test_table_model")
 class UnitTestDeleteMethods:
@@ -117,15 +147,14 @@ class UnitTestDeleteMethods:
 
     @pytest.mark.unit
     def test_do_delete(self, test_attributes, unit_test_table_model):
-        """Should remove a record from the record tree and update last_id."""
+        """Should remove a record from the record tree and not reuse its ID."""
         unit_test_table_model.do_select_all(attributes=test_attributes)
 
         _last_id = unit_test_table_model.last_id
-        self._next_id = unit_test_table_model.last_id - 1
 
         unit_test_table_model.do_delete(unit_test_table_model.last_id)
 
-        assert unit_test_table_model.last_id == self._next_id
+        assert unit_test_table_model.last_id == _last_id
         assert unit_test_table_model.tree.get_node(_last_id) is None
 
 
@@ -167,8 +196,9 @@ class SystemTestInsertMethods:
     _record = None
     _tag = ""
 
-    def on_succeed_insert_sibling(self, tree):
+    def on_succeed_insert_sibling(self, node_id, tree):
         """Listen for succeed_insert messages."""
+        assert node_id == self._next_id
         assert isinstance(tree, Tree)
         assert isinstance(tree.get_node(self._next_id).data[self._tag], self._record)
         print(
@@ -176,8 +206,9 @@ class SystemTestInsertMethods:
             f"sibling."
         )
 
-    def on_succeed_insert_child(self, tree):
+    def on_succeed_insert_child(self, node_id, tree):
         """Listen for succeed_insert messages."""
+        assert node_id == self._next_id
         assert isinstance(tree, Tree)
         assert isinstance(tree.get_node(self._next_id).data[self._tag], self._record)
         print(
@@ -273,8 +304,9 @@ class SystemTestDeleteMethods:
     _record = None
     _tag = ""
 
-    def on_succeed_delete(self, tree):
+    def on_succeed_delete(self, node_id, tree):
         """Listen for succeed_delete messages."""
+        assert node_id == self._delete_id
         assert isinstance(tree, Tree)
         assert tree.get_node(self._delete_id) is None
         print(
@@ -282,8 +314,9 @@ class SystemTestDeleteMethods:
             f"with no child."
         )
 
-    def on_succeed_delete_with_child(self, tree):
+    def on_succeed_delete_with_child(self, node_id, tree):
         """Listen for succeed_delete messages."""
+        assert node_id == self._delete_id
         assert isinstance(tree, Tree)
         assert tree.get_node(1) is None
         assert tree.get_node(2) is None
@@ -67,6 +67,35 @@ class MockDAO:
         """
         pass
 
+    def do_release_ids(
+        self, table: str, field: str, last_id: int, count: int = 1
+    ) -> None:
+        """Mock the do_release_ids() method.
+
+        :param table: the name of the table the IDs were reserved in.
+        :param field: the name of the field the IDs were reserved for.
+        :param last_id: the value returned by do_reserve_ids().
+        :param count: the number of IDs reserved.
+        """
+        pass
+
+    def do_reserve_ids(self, table: str, field: str, count: int = 1):
+        """Mock the do_reserve_ids() method.
+
+        :param table: the name of the table to reserve IDs in.
+        :param field: the name of the field to reserve IDs for.
+        :param count: the number of IDs to reserve.
+        """
+        return self.last_id
+
+    def get_last_allocated_id(self, table: str, field: str):
+        """Mock the get_last_allocated_id() method.
+
+        :param table: the name of the table to get the last allocated ID for.
+        :param field: the name of the field containing the last ID.
+        """
+        return self.last_id
+
     def get_last_id(self, table: str, field: str):
         """Mock the get_last_id() method.
 
@@ -9,6 +9,7 @@
 """Test class for the milhdbk217f class."""
 
 # Third Party Imports
+import numpy as np
 import pytest
 
 # RAMSTK Package Imports
@@ -1044,3 +1045,286 @@ def test_do_calculate_part_stress_miscellaneous(
     assert _attributes["hazard_rate_active"] == pytest.approx(
         {1: 0.01427067, 2: 0.0638, 3: 0.01, 4: 1.82547348}[subcategory_id]
     )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("category_id", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+@pytest.mark.usefixtures("test_attributes")
+def test_do_predict_part_count_hazard_rates(
+    category_id,
+    test_attributes,
+):
+    """Returns the same hazard rates as the single part parts count prediction."""
+    _lst_attributes = []
+    for _subcategory_id in range(1, 16):
+        for _environment_active_id in range(1, 15):
+            for _quality_id in range(0, 4):
+                for _type_id in [1, 2]:
+                    _attributes = {
+                        **test_attributes,
+                        "package_id": 1,
+                        "rated_temperature_max": 130.0,
+                        "rated_voltage": 0.0,
+                        "temperature_case": 45.0,
+                        "temperature_junction": 0.0,
+                        "years_in_production": 2.0,
+                    }
+                    _attributes["category_id"] = category_id
+                    _attributes["subcategory_id"] = _subcategory_id
+                    _attributes["environment_active_id"] = _environment_active_id
+                    _attributes["quality_id"] = _quality_id
+                    _attributes["type_id"] = _type_id
+                    _attributes["hazard_rate_method_id"] = 1
+                    _lst_attributes.append(_attributes)
+
+    _hazard_rates = milhdbk217f.do_predict_part_count_hazard_rates(
+        {
+            _key: [_attributes[_key] for _attributes in _lst_attributes]
+            for _key in milhdbk217f.PART_COUNT_KEYS
+        }
+    )
+
+    _expected = []
+    for _attributes in _lst_attributes:
+        try:
+            _attributes = milhdbk217f._set_default_values(_attributes)
+            _expected.append(
+                milhdbk217f._do_calculate_part_count(_attributes)["hazard_rate_active"]
+            )
+        except (IndexError, KeyError, TypeError, ValueError):
+            _expected.append(np.nan)
+
+    assert isinstance(_hazard_rates, np.ndarray)
+    assert not np.isnan(_hazard_rates).all()
+    np.testing.assert_array_equal(_hazard_rates, np.array(_expected))
+
+
+@pytest.mark.unit
+def test_get_part_count_factors_missing_columns():
+    """Treats missing columns as zeros and returns NaN for invalid parts."""
+    _lambda_b, _pi_q = milhdbk217f.get_part_count_factors(
+        {
+            "category_id": [3, 3, 42],
+            "subcategory_id": [1, 1, 1],
+            "environment_active_id": [1, 2, 1],
+            "quality_id": [1, 1, 1],
+        }
+    )
+
+    assert _lambda_b[0] == pytest.approx(0.0005)
+    assert _pi_q[0] == pytest.approx(0.030)
+    assert np.isnan(_lambda_b[2])
+    assert np.isnan(_pi_q[2])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("category_id", [3, 4, 5])
+@pytest.mark.usefixtures("test_attributes")
+def test_do_predict_part_stress_hazard_rates(
+    category_id,
+    test_attributes,
+):
+    """Returns the same attributes as the single part parts stress prediction."""
+    _lst_attributes = []
+    for _subcategory_id in range(1, 20):
+        for _environment_active_id in range(1, 15):
+            for _quality_id in [1, 3]:
+                for _specification_id, _temperature_active, _value in [
+                    (1, 25.0, 0.0),
+                    (2, 45.0, 1.2e-6),
+                    (3, 70.0, 3.3e3),
+                    (2, 105.0, 4.7e5),
+                ]:
+                    _attributes = {
+                        **test_attributes,
+                        "rated_temperature_max": 130.0,
+                        "piC": 0.0,
+                        "piR": 0.0,
+                        "piT": 0.0,
+                        "piTAPS": 0.0,
+                        "piV": 0.0,
+                        "temperature_hot_spot": 0.0,
+                    }
+                    _attributes["category_id"] = category_id
+                    _attributes["subcategory_id"] = _subcategory_id
+                    _attributes["environment_active_id"] = _environment_active_id
+                    _attributes["quality_id"] = _quality_id
+                    _attributes["specification_id"] = _specification_id
+                    _attributes["temperature_active"] = _temperature_active
+                    _attributes["capacitance"] = _value
+                    _attributes["resistance"] = _value
+                    _lst_attributes.append(_attributes)
+
+    _results = milhdbk217f.do_predict_part_stress_hazard_rates(
+        {
+            _key: [_attributes[_key] for _attributes in _lst_attributes]
+            for _key in _lst_attributes[0]
+        }
+    )
+
+    _expected = {}
+    for _row, _attributes in enumerate(_lst_attributes):
+        _attributes["hazard_rate_method_id"] = 2
+        _original = dict(_attributes)
+        try:
+            _attributes = milhdbk217f._do_calculate_part_stress(
+                milhdbk217f._set_default_values(_attributes)
+            )
+        except (IndexError, KeyError, TypeError, ValueError, ZeroDivisionError):
+            _attributes = {**_original, "hazard_rate_active": np.nan}
+        for _key, _value in _attributes.items():
+            if isinstance(_value, (int, float)):
+                _expected.setdefault(_key, np.full(len(_lst_attributes), np.nan))[
+                    _row
+                ] = _value
+
+    assert not np.isnan(_results["hazard_rate_active"]).all()
+    for _key, _values in _expected.items():
+        np.testing.assert_allclose(_results[_key], _values, rtol=1e-12, err_msg=_key)
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("test_attributes")
+def test_do_predict_part_stress_hazard_rates_invalid_part(test_attributes):
+    """Returns NaN for a part that can't be calculated without affecting others."""
+    _results = milhdbk217f.do_predict_part_stress_hazard_rates(
+        {
+            _key: [_value, _value, _value]
+            for _key, _value in {
+                **test_attributes,
+                "category_id": 3,
+                "subcategory_id": 1,
+            }.items()
+        }
+        | {"environment_active_id": [1, 42, 2]}
+    )
+
+    assert _results["hazard_rate_active"][0] > 0.0
+    assert np.isnan(_results["hazard_rate_active"][1])
+    assert _results["hazard_rate_active"][2] > _results["hazard_rate_active"][0]
+    assert _results["piE"][0] == pytest.approx(1.0)
+    assert _results["piE"][2] == pytest.approx(3.0)
+
+
+def _do_check_part_stress_array(lst_attributes):
+    """Check the array prediction against the single part prediction of each part."""
+    _results = milhdbk217f._do_calculate_part_stress_array(
+        {
+            _key: np.array([_attributes[_key] for _attributes in lst_attributes])
+            for _key in lst_attributes[0]
+        }
+    )
+
+    _n_predicted = 0
+    for _row, _attributes in enumerate(lst_attributes):
+        try:
+            _attributes = milhdbk217f._do_calculate_part_stress(
+                milhdbk217f._set_default_values(dict(_attributes))
+            )
+        except (IndexError, KeyError, TypeError, ValueError, ZeroDivisionError):
+            assert not np.isfinite(_results["hazard_rate_active"][_row])
+            continue
+
+        _n_predicted += 1
+        for _key, _value in _attributes.items():
+            if isinstance(_value, (int, float)):
+                assert _results[_key][_row] == pytest.approx(_value, rel=1e-12), _key
+
+    assert _n_predicted > 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("subcategory_id", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+@pytest.mark.usefixtures("test_attributes")
+def test_do_calculate_part_stress_array_integrated_circuit(
+    subcategory_id,
+    test_attributes,
+):
+    """Returns the same attributes as the single part prediction of each part."""
+    test_attributes["category_id"] = 1
+    test_attributes["subcategory_id"] = subcategory_id
+    test_attributes["hazard_rate_method_id"] = 2
+    test_attributes["manufacturing_id"] = 1
+    test_attributes["temperature_junction"] = 0.0
+    test_attributes["voltage_esd"] = 2000.0
+
+    _lst_attributes = [
+        {
+            **test_attributes,
+            "application_id": _application_id,
+            "construction_id": _construction_id,
+            "environment_active_id": _environment_active_id,
+            "family_id": _family_id,
+            "n_cycles": _n_cycles,
+            "n_elements": _n_elements,
+            "package_id": _package_id,
+            "technology_id": _technology_id,
+            "type_id": _type_id,
+        }
+        for _application_id, _construction_id, _environment_active_id in [
+            (1, 1, 1),
+            (2, 2, 7),
+            (3, 3, 42),
+        ]
+        for _family_id, _type_id in [(1, 1), (2, 2), (9, 3), (20, 4)]
+        for _n_cycles, _n_elements in [(32, 16), (350000, 1000), (500000, 64000)]
+        for _package_id, _technology_id in [(0, 1), (4, 2), (7, 11)]
+    ]
+
+    _do_check_part_stress_array(_lst_attributes)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("subcategory_id", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13])
+@pytest.mark.usefixtures("test_attributes")
+def test_do_calculate_part_stress_array_semiconductor(
+    subcategory_id,
+    test_attributes,
+):
+    """Returns the same attributes as the single part prediction of each part."""
+    test_attributes["category_id"] = 2
+    test_attributes["subcategory_id"] = subcategory_id
+    test_attributes["hazard_rate_method_id"] = 2
+
+    _lst_attributes = [
+        {
+            **test_attributes,
+            "application_id": _application_id,
+            "construction_id": _construction_id,
+            "current_rated": _current_rated,
+            "duty_cycle": _duty_cycle,
+            "environment_active_id": _environment_active_id,
+            "frequency_operating": _frequency_operating,
+            "matching_id": _matching_id,
+            "power_operating": _power_operating,
+            "power_rated": _power_rated,
+            "quality_id": _quality_id,
+            "temperature_case": _temperature_case,
+            "theta_jc": _theta_jc,
+            "type_id": _type_id,
+            "voltage_ratio": _voltage_ratio,
+        }
+        for _type_id in [0, 1, 2, 4, 5, 6]
+        for _application_id, _duty_cycle, _matching_id in [
+            (0, 0.0, 1),
+            (1, 50.0, 2),
+            (2, 100.0, 3),
+        ]
+        for _construction_id, _current_rated, _voltage_ratio in [
+            (0, 0.0, 0.0),
+            (1, 0.5, 0.2),
+            (2, 1.5, 0.54),
+        ]
+        for _power_rated, _power_operating, _frequency_operating in [
+            (0.0, 0.05, 5.0),
+            (0.05, 0.5, 1.5),
+            (0.75, 0.5, 12.0),
+        ]
+        for _environment_active_id, _quality_id, _temperature_case, _theta_jc in [
+            (1, 1, 0.0, 0.0),
+            (5, 2, 38.2, 12.0),
+            (42, 3, 0.0, 12.0),
+        ]
+    ]
+
+    _do_check_part_stress_array(_lst_attributes)
@@ -7,10 +7,12 @@
 #
 # All rights reserved.
 # Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
-"""Test class for the Exponential distribution module."""
+"""Test class for the distribution module."""
 
 # Third Party Imports
+import numpy as np
 import pytest
+from scipy.stats import expon, lognorm, norm, weibull_min
 
 # RAMSTK Package Imports
 from ramstk.analyses.statistics import distributions
@@ -35,3 +37,156 @@ def test_calculate_survival_invalid_distribution():
     """Should raise a ValueError when an unsupported distribution type is provided."""
     with pytest.raises(ValueError):
         distributions.calculate_survival(time=1000.0, dist_type="unsupported")
+
+
+# Grids of times and parameters, including invalid and out of support values.
+TEST_TIMES = np.array([0.0, 1e-6, 0.5, 4.0, 18.5, 85.0, 105.0, 1000.0, 10000.0])
+TEST_PARAMETERS = {
+    "exponential": [(None, 0.0, 10000.0), (None, 56.0, 1000.0), (None, 0.0, 0.0)],
+    "lognormal": [
+        (0.9663, 0.0, 33.65),
+        (0.9663, 1.85, 33.65),
+        (1e-9, 0.0, 33.65),
+        (0.0, 0.0, 33.65),
+        (0.9663, 0.0, -1.0),
+    ],
+    "normal": [(None, 100.0, 10.0), (None, 0.0, 10.0), (None, 100.0, 0.0)],
+    "weibull": [
+        (0.8, 0.0, 525.0),
+        (1.0, 18.5, 525.0),
+        (2.5, 18.5, 525.0),
+        (0.0, 0.0, 525.0),
+        (2.5, 0.0, -525.0),
+    ],
+}
+SCIPY_DISTRIBUTIONS = {
+    "exponential": lambda shape, location, scale: expon(loc=location, scale=scale),
+    "lognormal": lambda shape, location, scale: lognorm(
+        shape, loc=location, scale=scale
+    ),
+    "normal": lambda shape, location, scale: norm(loc=location, scale=scale),
+    "weibull": lambda shape, location, scale: weibull_min(
+        shape, loc=location, scale=scale
+    ),
+}
+
+
+def _get_scipy_hazard_rate(dist_type, shape, location, scale, time):
+    """Return the hazard rate the way it was calculated using scipy.stats."""
+    _dist = SCIPY_DISTRIBUTIONS[dist_type](shape, location, scale)
+    with np.errstate(all="ignore"):
+        if dist_type == "exponential":
+            _hazard_rate = np.full_like(time, 1.0 / _dist.mean())
+        elif dist_type == "normal":
+            _hazard_rate = _dist.pdf(time) / _dist.sf(time)
+        else:
+            _hazard_rate = _dist.pdf(time) / _dist.cdf(time)
+
+    return np.where(time <= 0.0, 0.0, _hazard_rate)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize(
+    "dist_type, parameters",
+    [
+        (_dist_type, _parameters)
+        for _dist_type, _lst_parameters in TEST_PARAMETERS.items()
+        for _parameters in _lst_parameters
+    ],
+)
+def test_distributions_match_scipy(dist_type, parameters):
+    """Should return the same hazard rate, MTBF, and survival as scipy.stats."""
+    _shape, _location, _scale = parameters
+    _dist = SCIPY_DISTRIBUTIONS[dist_type](_shape, _location, _scale)
+    with np.errstate(all="ignore"):
+        _survival = _dist.sf(TEST_TIMES)
+        _mtbf = _dist.mean()
+
+    np.testing.assert_allclose(
+        distributions.calculate_hazard_rate(
+            TEST_TIMES,
+            location=_location,
+            scale=_scale,
+            shape=_shape,
+            dist_type=dist_type,
+        ),
+        _get_scipy_hazard_rate(dist_type, _shape, _location, _scale, TEST_TIMES),
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(
+        distributions.calculate_survival(
+            shape=_shape,
+            time=TEST_TIMES,
+            location=_location,
+            scale=_scale,
+            dist_type=dist_type,
+        ),
+        _survival,
+        rtol=1e-9,
+    )
+    np.testing.assert_allclose(
+        distributions.calculate_mtbf(
+            shape=_shape,
+            location=_location,
+            scale=_scale,
+            dist_type=dist_type,
+        ),
+        _mtbf,
+        rtol=1e-9,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("dist_type", ["exponential", "lognormal", "normal", "weibull"])
+def test_distributions_arrays(dist_type):
+    """Should return an array of values when passed arrays of parameters."""
+    _shape, _location, _scale = np.array(
+        [
+            (1.0 if _shape is None else _shape, _location, _scale)
+            for _shape, _location, _scale in TEST_PARAMETERS[dist_type]
+        ]
+    ).T
+    _time = np.full(_scale.shape, 85.0)
+
+    _hazard_rate = distributions.calculate_hazard_rate(
+        _time, location=_location, scale=_scale, shape=_shape, dist_type=dist_type
+    )
+    _mtbf = distributions.calculate_mtbf(
+        shape=_shape, location=_location, scale=_scale, dist_type=dist_type
+    )
+
+    assert isinstance(_hazard_rate, np.ndarray)
+    assert _hazard_rate.shape == _scale.shape
+    for _idx, _value in enumerate(_hazard_rate):
+        np.testing.assert_allclose(
+            _value,
+            distributions.calculate_hazard_rate(
+                85.0,
+                location=_location[_idx],
+                scale=_scale[_idx],
+                shape=_shape[_idx],
+                dist_type=dist_type,
+            ),
+        )
+        np.testing.assert_allclose(
+            _mtbf[_idx],
+            distributions.calculate_mtbf(
+                shape=_shape[_idx],
+                location=_location[_idx],
+                scale=_scale[_idx],
+                dist_type=dist_type,
+            ),
+        )
+
+
+@pytest.mark.unit
+def test_calculate_hazard_rate_scalar():
+    """Should return a float when passed scalar values."""
+    assert isinstance(
+        distributions.calculate_hazard_rate(
+            105.0, scale=525.0, shape=2.5, dist_type="weibull"
+        ),
+        float,
+    )
@@ -0,0 +1,119 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.test_equation.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the user-defined equation module."""
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses import equation
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_evaluate():
+    """evaluate() should return the value of the equation on success."""
+    assert equation.evaluate("uf1*uf2 + ui1", {"uf1": 3.4, "uf2": 7.8, "ui1": 2}) == (
+        pytest.approx(28.52)
+    )
+    assert equation.evaluate("hr^2", {"hr": 0.5}) == pytest.approx(0.25)
+    assert equation.evaluate("-sqrt(hr)*exp(0)", {"hr": 4.0}) == pytest.approx(-2.0)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_evaluate_empty_equation():
+    """evaluate() should return zero for an empty equation."""
+    assert equation.evaluate("  ", {"hr": 0.5}) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_evaluate_arrays():
+    """evaluate() should return an array when passed arrays of values."""
+    _result = equation.evaluate(
+        "pi1*pi2*hr",
+        {"hr": 0.000617, "pi1": np.array([0.85, 1.1]), "pi2": np.array([1.2, 0.9])},
+    )
+
+    np.testing.assert_allclose(_result, [0.00062934, 0.00061083])
+
+
+@pytest.mark.unit
+def test_get_compiled_equation_cached():
+    """get_compiled_equation() should only compile an equation the first time."""
+    _variables = frozenset(["hr", "pi1"])
+    _function = equation.get_compiled_equation("hr*pi1*3.0", _variables)
+    _hits = equation.get_compiled_equation.cache_info().hits
+
+    assert equation.get_compiled_equation("hr*pi1*3.0", _variables) is _function
+    assert equation.get_compiled_equation.cache_info().hits == _hits + 1
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_evaluate_sympy_names():
+    """evaluate() should use sympy for functions and constants that aren't
+    whitelisted."""
+    assert equation.evaluate("log10(hr)", {"hr": 100.0}) == pytest.approx(2.0)
+    assert equation.evaluate("atan(hr)*4", {"hr": 1.0}) == pytest.approx(np.pi)
+    assert equation.evaluate("2*pi*hr", {"hr": 0.5}) == pytest.approx(np.pi)
+    assert equation.evaluate("E^hr", {"hr": 2.0}) == pytest.approx(np.exp(2.0))
+    np.testing.assert_allclose(
+        equation.evaluate(
+            "Max(pi1, pi2) + Min(pi1, 1)",
+            {"pi1": np.array([0.5, 3.0]), "pi2": np.array([2.0, 1.0])},
+        ),
+        [2.5, 4.0],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I*hr",
+        "oo",
+        "pi(hr)",
+        "Symbol(hr)",
+        "sympify(hr)",
+        "hr*(pi1",
+        "hr*pi6",
+        "hr.real",
+        "__import__('os')",
+        "open('file')",
+        "sqrt(x=hr)",
+        "[hr, pi1]",
+        "hr if pi1 else 0",
+        "'hr'",
+        "True",
+    ],
+)
+def test_get_compiled_equation_invalid(text):
+    """get_compiled_equation() should raise a ValueError for an invalid equation."""
+    with pytest.raises(ValueError):
+        equation.get_compiled_equation(text, frozenset(["hr", "pi1"]))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize(
+    "text, values",
+    [
+        ("9**9**9**9", {}),
+        ("ui1^ui1^ui1^ui1", {"ui1": 9}),
+        ("hr*10^400", {"hr": 2}),
+        ("9**9**9**9*atan(1)", {}),
+    ],
+)
+def test_evaluate_overflow(text, values):
+    """evaluate() should return inf rather than hang when a result overflows."""
+    with np.errstate(over="ignore"):
+        assert equation.evaluate(text, values) == np.inf
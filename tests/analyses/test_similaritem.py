@@ -374,3 +374,46 @@ def test_calculate_user_defined_empty_equation():
 
     updated_sia = similaritem.calculate_user_defined(TEST_SIA)
     assert updated_sia["equation1"] == "0.0"
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_user_defined_many():
+    """calculate_user_defined_many() should return the same results as calculating
+    each similar item assessment dict by itself."""
+    _sias = []
+    for _factor in [0.5, 1.0, 1.5, 2.0]:
+        _sia = OrderedDict(TEST_SIA)
+        _sia = similaritem.set_user_defined_change_factors(
+            _sia, [_factor, 3.4, 5.6, 7.8, 9.10]
+        )
+        _sia = similaritem.set_user_defined_floats(_sia, [1.5, 2.5, _factor])
+        _sia = similaritem.set_user_defined_ints(_sia, [3, 7])
+        _sia = similaritem.set_user_defined_functions(
+            _sia, test_user_functions if _factor < 2.0 else ["pi1*uf3", "res1*2"]
+        )
+        _sias.append(_sia)
+    _expected = [
+        dict(similaritem.calculate_user_defined(OrderedDict(_sia))) for _sia in _sias
+    ]
+
+    _sias = similaritem.calculate_user_defined_many(_sias)
+
+    for _sia, _result in zip(_sias, _expected):
+        for _idx in range(1, 6):
+            assert isinstance(_sia[f"res{_idx}"], float)
+            assert _sia[f"res{_idx}"] == pytest.approx(_result[f"res{_idx}"])
+    assert _sias[3]["res1"] == pytest.approx(4.0)
+    assert _sias[3]["res2"] == pytest.approx(8.0)
+    assert _sias[0]["res2"] == pytest.approx(10.0)
+
+
+@pytest.mark.unit
+def test_calculate_user_defined_invalid_equation():
+    """calculate_user_defined() should raise a ValueError for an invalid equation."""
+    _sia = similaritem.set_user_defined_functions(
+        OrderedDict(TEST_SIA), ["hr*pi11", "", "", "", ""]
+    )
+
+    with pytest.raises(ValueError):
+        similaritem.calculate_user_defined(_sia)
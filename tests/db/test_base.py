@@ -17,13 +17,17 @@ from pubsub import pub
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm.exc import UnmappedInstanceError
+from sqlalchemy.sql import text
 
 # RAMSTK Package Imports
 from ramstk.exceptions import DataAccessError
 from ramstk.models.db import BaseDatabase
+from ramstk.models.db.basedatabase import _get_copy_line
 from ramstk.models.dbrecords import (
     RAMSTKFunctionRecord,
+    RAMSTKHardwareRecord,
     RAMSTKManufacturerRecord,
+    RAMSTKReliabilityRecord,
     RAMSTKRevisionRecord,
     RAMSTKSiteInfoRecord,
 )
@@ -293,6 +297,231 @@ class TestInsertMethods:
 
         DUT.do_disconnect()
 
+    @pytest.mark.integration
+    def test_do_insert_many_chunked(
+        self, test_program_dao, test_toml_user_configuration
+    ):
+        """Should insert all the records when flushing them in chunks."""
+        test_toml_user_configuration.get_user_configuration()
+        test_toml_user_configuration.RAMSTK_PROG_INFO["dialect"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["user"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["password"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["host"] = "localhost"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["port"] = "5432"
+        test_toml_user_configuration.RAMSTK_PROG_INFO[
+            "database"
+        ] = test_program_dao.cxnargs["database"]
+        DUT = BaseDatabase()
+        DUT.do_connect(test_toml_user_configuration.RAMSTK_PROG_INFO)
+
+        _revisions = []
+        for _revision_id in [8, 9, 10]:
+            _revision = RAMSTKRevisionRecord()
+            _revision.revision_id = _revision_id
+            _revisions.append(_revision)
+
+        assert DUT.do_insert_many(_revisions, chunk_size=2) is None
+        assert (
+            DUT.get_last_id(RAMSTKRevisionRecord.__tablename__, "revision_id") == 10
+        )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_insert_many_duplicate_pk(
+        self, test_program_dao, test_toml_user_configuration
+    ):
+        """Should roll back every record and identify the bad one on a key error."""
+        test_toml_user_configuration.get_user_configuration()
+        test_toml_user_configuration.RAMSTK_PROG_INFO["dialect"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["user"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["password"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["host"] = "localhost"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["port"] = "5432"
+        test_toml_user_configuration.RAMSTK_PROG_INFO[
+            "database"
+        ] = test_program_dao.cxnargs["database"]
+        DUT = BaseDatabase()
+        DUT.do_connect(test_toml_user_configuration.RAMSTK_PROG_INFO)
+
+        _revisions = []
+        for _revision_id in [11, 12, 1]:
+            _revision = RAMSTKRevisionRecord()
+            _revision.revision_id = _revision_id
+            _revisions.append(_revision)
+
+        with pytest.raises(DataAccessError) as _error:
+            DUT.do_insert_many(_revisions)
+
+        assert "record 2 (ramstk_revision ID 1)" in _error.value.msg
+        assert (
+            DUT.get_last_id(RAMSTKRevisionRecord.__tablename__, "revision_id") == 10
+        )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_insert_batches(self, test_program_dao, test_toml_user_configuration):
+        """Should insert every record in every batch."""
+        test_toml_user_configuration.get_user_configuration()
+        test_toml_user_configuration.RAMSTK_PROG_INFO["dialect"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["user"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["password"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["host"] = "localhost"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["port"] = "5432"
+        test_toml_user_configuration.RAMSTK_PROG_INFO[
+            "database"
+        ] = test_program_dao.cxnargs["database"]
+        DUT = BaseDatabase()
+        DUT.do_connect(test_toml_user_configuration.RAMSTK_PROG_INFO)
+
+        _batches = (
+            [(RAMSTKRevisionRecord, [{"revision_id": _id} for _id in _ids])]
+            for _ids in [[20, 21], [22]]
+        )
+
+        assert DUT.do_insert_batches(_batches) is None
+        assert (
+            DUT.get_last_id(RAMSTKRevisionRecord.__tablename__, "revision_id") == 22
+        )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_insert_batches_duplicate_pk(
+        self, test_program_dao, test_toml_user_configuration
+    ):
+        """Should roll back every batch when any record is rejected."""
+        test_toml_user_configuration.get_user_configuration()
+        test_toml_user_configuration.RAMSTK_PROG_INFO["dialect"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["user"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["password"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["host"] = "localhost"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["port"] = "5432"
+        test_toml_user_configuration.RAMSTK_PROG_INFO[
+            "database"
+        ] = test_program_dao.cxnargs["database"]
+        DUT = BaseDatabase()
+        DUT.do_connect(test_toml_user_configuration.RAMSTK_PROG_INFO)
+
+        _batches = (
+            [(RAMSTKRevisionRecord, [{"revision_id": _id} for _id in _ids])]
+            for _ids in [[23, 24], [1]]
+        )
+
+        with pytest.raises(DataAccessError) as _error:
+            DUT.do_insert_batches(_batches)
+
+        assert "record batch 2" in _error.value.msg
+        assert (
+            DUT.get_last_id(RAMSTKRevisionRecord.__tablename__, "revision_id") == 22
+        )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_get_copy_line(self):
+        """Should escape each value and write None as NULL."""
+        assert _get_copy_line([1, 0.5, None, "a\tb\\c\r\n", True]) == (
+            "1\t0.5\t\\N\ta\\tb\\\\c\\r\\n\tTrue\n"
+        )
+
+    @pytest.mark.integration
+    def test_do_copy_batches(self, test_program_dao, test_toml_user_configuration):
+        """Should copy every record in every batch and update the rows created by the
+        insert triggers."""
+        test_toml_user_configuration.get_user_configuration()
+        test_toml_user_configuration.RAMSTK_PROG_INFO["dialect"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["user"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["password"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["host"] = "localhost"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["port"] = "5432"
+        test_toml_user_configuration.RAMSTK_PROG_INFO[
+            "database"
+        ] = test_program_dao.cxnargs["database"]
+        DUT = BaseDatabase()
+        DUT.do_connect(test_toml_user_configuration.RAMSTK_PROG_INFO)
+
+        _last_id = DUT.do_reserve_ids(RAMSTKHardwareRecord.__tablename__, "hardware_id")
+        _batches = (
+            [
+                (
+                    RAMSTKHardwareRecord,
+                    [
+                        {
+                            "revision_id": 1,
+                            "hardware_id": _id,
+                            "name": f"Copied\tpart\n{_id}",
+                            "parent_id": 0,
+                        }
+                        for _id in _ids
+                    ],
+                ),
+                (
+                    RAMSTKReliabilityRecord,
+                    [
+                        {
+                            "revision_id": 1,
+                            "hardware_id": _id,
+                            "hazard_rate_specified": 0.005,
+                        }
+                        for _id in _ids
+                    ],
+                ),
+            ]
+            for _ids in [[900, 901], [902]]
+        )
+
+        assert DUT.do_copy_batches(_batches) is None
+
+        _hardware = DUT.do_select_all(
+            RAMSTKHardwareRecord, key=["hardware_id"], value=[902], _all=False
+        )
+        _reliability = DUT.do_select_all(
+            RAMSTKReliabilityRecord, key=["hardware_id"], value=[902], _all=False
+        )
+        assert _hardware.name == "Copied\tpart\n902"
+        assert _reliability.hazard_rate_specified == 0.005
+        assert (
+            DUT.do_reserve_ids(RAMSTKHardwareRecord.__tablename__, "hardware_id")
+            == 902
+        )
+        assert _last_id < 900
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_copy_batches_duplicate_pk(
+        self, test_program_dao, test_toml_user_configuration
+    ):
+        """Should roll back every batch when any record is rejected."""
+        test_toml_user_configuration.get_user_configuration()
+        test_toml_user_configuration.RAMSTK_PROG_INFO["dialect"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["user"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["password"] = "postgres"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["host"] = "localhost"
+        test_toml_user_configuration.RAMSTK_PROG_INFO["port"] = "5432"
+        test_toml_user_configuration.RAMSTK_PROG_INFO[
+            "database"
+        ] = test_program_dao.cxnargs["database"]
+        DUT = BaseDatabase()
+        DUT.do_connect(test_toml_user_configuration.RAMSTK_PROG_INFO)
+
+        _batches = (
+            [(RAMSTKRevisionRecord, [{"revision_id": _id} for _id in _ids])]
+            for _ids in [[25, 26], [1]]
+        )
+
+        with pytest.raises(DataAccessError) as _error:
+            DUT.do_copy_batches(_batches)
+
+        assert "record batch 2" in _error.value.msg
+        assert (
+            DUT.get_last_id(RAMSTKRevisionRecord.__tablename__, "revision_id") == 22
+        )
+
+        DUT.do_disconnect()
+
 
 @pytest.mark.usefixtures("test_common_dao", "test_program_dao")
 class TestDeleteMethods:
@@ -584,6 +813,152 @@ class TestSelectMethods:
             )
         DUT.do_disconnect()
 
+    @pytest.mark.integration
+    def test_do_reserve_ids(self, test_common_dao):
+        """do_reserve_ids() should hand out blocks of IDs no other client is given."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["database"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+        OTHER = BaseDatabase()
+        OTHER.do_connect(config)
+
+        _table = RAMSTKSiteInfoRecord.__tablename__
+        _max_id = DUT.get_last_id(_table, "site_id")
+        assert DUT.get_last_allocated_id(_table, "site_id") == _max_id
+
+        _last_id = DUT.do_reserve_ids(_table, "fld_site_id", count=5)
+        assert _last_id >= _max_id
+        assert DUT.get_last_allocated_id(_table, "fld_site_id") == _last_id + 5
+        assert OTHER.do_reserve_ids(_table, "site_id") >= (
+            _last_id + DUT._id_block_size
+        )
+        assert DUT.do_reserve_ids(_table, "site_id") == _last_id + 5
+        assert DUT.get_last_id(_table, "site_id") == _max_id
+
+        # Once the block is used up, the next block comes after the other client's.
+        DUT.do_reserve_ids(_table, "site_id", count=DUT._id_block_size - 6)
+        assert DUT.do_reserve_ids(_table, "site_id") >= (
+            OTHER._dic_id_blocks[(_table, "fld_site_id")]
+        )
+
+        OTHER.do_disconnect()
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_reserve_ids_no_sequence(self, test_common_dao):
+        """do_reserve_ids() should create a missing ID sequence past the last ID."""
+        DUT = BaseDatabase()
+        DUT.do_connect(
+            {
+                "dialect": "postgres",
+                "user": "postgres",
+                "password": "postgres",
+                "host": "localhost",
+                "port": "5432",
+                "database": test_common_dao.cxnargs["database"],
+            }
+        )
+
+        _table = RAMSTKSiteInfoRecord.__tablename__
+        _sequence = f"{_table}_fld_site_id_seq"
+        with DUT.engine.begin() as _connection:
+            _connection.execute(text(f"DROP SEQUENCE IF EXISTS {_sequence}"))
+        _max_id = DUT.get_last_id(_table, "site_id")
+
+        assert DUT.do_reserve_ids(_table, "site_id") == _max_id
+        with DUT.engine.begin() as _connection:
+            assert (
+                _connection.execute(
+                    text("SELECT to_regclass(:sequence)"), {"sequence": _sequence}
+                ).scalar()
+                is not None
+            )
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_do_release_ids(self, test_common_dao):
+        """do_release_ids() should only return the most recently reserved block."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["database"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _table = RAMSTKSiteInfoRecord.__tablename__
+        _last_id = DUT.do_reserve_ids(_table, "site_id", count=2)
+        DUT.do_release_ids(_table, "site_id", _last_id, count=2)
+
+        assert DUT.do_reserve_ids(_table, "site_id") == _last_id
+
+        DUT.do_reserve_ids(_table, "site_id")
+        DUT.do_release_ids(_table, "site_id", _last_id)
+
+        assert DUT.do_reserve_ids(_table, "site_id") == _last_id + 2
+
+        DUT.do_disconnect()
+
+    @pytest.mark.integration
+    def test_get_checksum(self, test_common_dao):
+        """get_checksum() should return a checksum that only changes when the contents
+        of the tables change."""
+        config = {
+            "dialect": "postgres",
+            "user": "postgres",
+            "password": "postgres",
+            "host": "localhost",
+            "port": "5432",
+            "database": test_common_dao.cxnargs["database"],
+        }
+
+        DUT = BaseDatabase()
+        DUT.do_connect(config)
+
+        _checksum = DUT.get_checksum(["ramstk_category", "ramstk_site_info"])
+
+        assert len(_checksum) == 32
+        assert DUT.get_checksum(["ramstk_category", "ramstk_site_info"]) == _checksum
+
+        _record = RAMSTKSiteInfoRecord()
+        _record.site_id = 31
+        DUT.do_insert(_record)
+
+        assert DUT.get_checksum(["ramstk_category", "ramstk_site_info"]) != _checksum
+        assert DUT.get_checksum(["ramstk_category"]) != _checksum
+
+        DUT.do_disconnect()
+
+    @pytest.mark.unit
+    def test_get_checksum_sqlite(self, tmp_path):
+        """get_checksum() should use the size and modification time of SQLite
+        database files."""
+        _database = tmp_path / "test.ramstk"
+        _database.write_bytes(b"12345")
+
+        DUT = BaseDatabase()
+        DUT.cxnargs["dialect"] = "sqlite"
+        DUT.cxnargs["database"] = str(_database)
+
+        assert DUT.get_checksum(["ramstk_category"]).startswith("5:")
+
+        DUT.cxnargs["database"] = str(tmp_path / "missing.ramstk")
+
+        assert DUT.get_checksum(["ramstk_category"]) == ""
+
     @pytest.mark.integration
     def test_get_database_list(self):
         """Should return a list of database names available on the server."""
@@ -13,7 +13,9 @@ import pandas as pd
 
 # noinspection PyPackageRequirements
 import pytest
+from openpyxl import load_workbook
 from pubsub import pub
+from treelib import Tree
 
 # RAMSTK Package Imports
 from ramstk.exim import Export
@@ -29,6 +31,11 @@ from ramstk.models.dbviews import RAMSTKHardwareBoMView
 class TestExport:
     """Test class for export methods."""
 
+    def on_succeed_export_chunk(self, module, n_rows):
+        assert module == "function"
+        assert n_rows in [2, 3]
+        print("\033[36m\nsucceed_export_chunk topic was broadcast.")
+
     @pytest.mark.integration
     def test_do_load_output_function(self, test_program_dao):
         """Should create a dict of Function attributes for export."""
@@ -41,7 +48,7 @@ class TestExport:
         pub.sendMessage("request_get_function_tree")
 
         assert isinstance(dut._dic_output_data, dict)
-        assert isinstance(dut._dic_output_data["function"], dict)
+        assert isinstance(dut._dic_output_data["function"], Tree)
 
     @pytest.mark.integration
     def test_do_load_output_requirement(self, test_program_dao):
@@ -55,7 +62,7 @@ class TestExport:
         pub.sendMessage("request_get_requirement_tree")
 
         assert isinstance(dut._dic_output_data, dict)
-        assert isinstance(dut._dic_output_data["requirement"], dict)
+        assert isinstance(dut._dic_output_data["requirement"], Tree)
 
     @pytest.mark.integration
     def test_do_load_output_hardware(self, test_program_dao):
@@ -67,7 +74,7 @@ class TestExport:
         pub.sendMessage("request_get_hardware_bom_tree")
 
         assert isinstance(dut._dic_output_data, dict)
-        assert isinstance(dut._dic_output_data["hardware_bom"], dict)
+        assert isinstance(dut._dic_output_data["hardware_bom"], Tree)
 
     @pytest.mark.integration
     def test_do_load_output_validation(self, test_program_dao):
@@ -81,7 +88,7 @@ class TestExport:
         pub.sendMessage("request_get_validation_tree")
 
         assert isinstance(dut._dic_output_data, dict)
-        assert isinstance(dut._dic_output_data["validation"], dict)
+        assert isinstance(dut._dic_output_data["validation"], Tree)
 
     @pytest.mark.integration
     def test_do_export_to_csv(self, test_program_dao, test_export_dir):
@@ -208,3 +215,119 @@ class TestExport:
         )
 
         assert isinstance(dut._df_output_data, pd.core.frame.DataFrame)
+        _workbook = load_workbook(_test_multi, read_only=True)
+        assert _workbook.sheetnames == ["requirement", "function"]
+        _rows = list(_workbook["function"].values)
+        assert list(_rows[0][1:]) == list(dut._dic_output_data["function"].nodes)[1:]
+        assert "function_id" in [_row[0] for _row in _rows[1:]]
+        _workbook.close()
+
+    @pytest.mark.integration
+    def test_do_export_multi_sheet_row_per_record(
+        self, test_program_dao, test_export_dir
+    ):
+        """Should write one row for each record to each worksheet when requested."""
+        _function = RAMSTKFunctionTable()
+        _function.do_connect(test_program_dao)
+        _function.do_select_all(attributes={"revision_id": 1})
+
+        _requirement = RAMSTKRequirementTable()
+        _requirement.do_connect(test_program_dao)
+        _requirement.do_select_all(attributes={"revision_id": 1})
+
+        dut = Export()
+        dut.row_per_record = True
+
+        pub.sendMessage("request_get_function_tree")
+        pub.sendMessage("request_get_requirement_tree")
+
+        _test_multi = test_export_dir + "test_export_multi_rows.xlsx"
+        dut._do_export(
+            {"requirement": True, "function": True, "hardware_bom": False},
+            _test_multi,
+        )
+
+        _workbook = load_workbook(_test_multi, read_only=True)
+        assert _workbook.sheetnames == ["requirement", "function"]
+        _rows = list(_workbook["function"].values)
+        assert _rows[0][0] is None
+        assert "function_id" in _rows[0]
+        assert [_row[0] for _row in _rows[1:]] == list(
+            dut._dic_output_data["function"].nodes
+        )[1:]
+        _workbook.close()
+
+    @pytest.mark.integration
+    def test_do_export_to_csv_columns(self, test_program_dao, test_export_dir):
+        """Should write one column for each record by default."""
+        _function = RAMSTKFunctionTable()
+        _function.do_connect(test_program_dao)
+        _function.do_select_all(attributes={"revision_id": 1})
+
+        dut = Export()
+
+        pub.sendMessage("request_get_function_tree")
+
+        _test_csv = test_export_dir + "test_export_columns.csv"
+        dut._do_export({"function": True}, _test_csv)
+
+        _df = pd.read_csv(
+            test_export_dir + "test_export_columns/function.csv", sep=";", index_col=0
+        )
+        assert [int(_column) for _column in _df.columns] == list(
+            dut._dic_output_data["function"].nodes
+        )[1:]
+        assert "function_id" in _df.index
+
+    @pytest.mark.integration
+    def test_do_export_to_csv_rows(self, test_program_dao, test_export_dir):
+        """Should write one row for each record plus a header row when requested."""
+        pub.subscribe(self.on_succeed_export_chunk, "succeed_export_chunk")
+
+        _function = RAMSTKFunctionTable()
+        _function.do_connect(test_program_dao)
+        _function.do_select_all(attributes={"revision_id": 1})
+
+        dut = Export()
+        dut.chunk_size = 2
+        dut.row_per_record = True
+
+        pub.sendMessage("request_get_function_tree")
+
+        _test_csv = test_export_dir + "test_export_rows.csv"
+        dut._do_export({"function": True}, _test_csv)
+
+        _df = pd.read_csv(
+            test_export_dir + "test_export_rows/function.csv", sep=";", index_col=0
+        )
+        assert list(_df.index) == list(dut._dic_output_data["function"].nodes)[1:]
+        assert list(_df["function_id"]) == list(_df.index)
+
+        pub.unsubscribe(self.on_succeed_export_chunk, "succeed_export_chunk")
+
+    @pytest.mark.integration
+    def test_do_export_to_parquet(self, test_program_dao, test_export_dir):
+        """Should write each type of record to its own Parquet file with column types
+        from the record defaults."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        _validation = RAMSTKValidationTable()
+        _validation.do_connect(test_program_dao)
+        _validation.do_select_all(attributes={"revision_id": 1})
+
+        dut = Export()
+        dut.chunk_size = 1
+
+        pub.sendMessage("request_get_validation_tree")
+
+        _test_parquet = test_export_dir + "test_export_parquet.parquet"
+        assert dut._do_export({"validation": True}, _test_parquet) is None
+
+        _table = pq.read_table(
+            test_export_dir + "test_export_parquet/validation.parquet"
+        )
+        assert _table.num_rows == len(dut._dic_output_data["validation"].nodes) - 1
+        assert str(_table.schema.field("validation_id").type) == "int64"
+        assert str(_table.schema.field("cost_average").type) == "double"
+        assert str(_table.schema.field("date_start").type) == "date32[day]"
+        assert str(_table.schema.field("name").type) == "string"
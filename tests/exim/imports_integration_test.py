@@ -56,6 +56,17 @@ class TestImport:
         )
         print("\033[35m\nfail_import_module topic was broadcast.")
 
+    def on_fail_import_key_violations(self, error_message):
+        assert error_message == (
+            "_do_import: Found 3 key violation(s) in the Function import file; no "
+            "records were imported.\n"
+            "Row 3: Function ID 20 is used more than once in the import file.\n"
+            "Row 4: Function ID 1 already exists in the database.\n"
+            "Row 5: Parent 99 is not a Function ID in the import file or the "
+            "database."
+        )
+        print("\033[35m\nfail_import_module topic was broadcast.")
+
     def on_succeed_import_requirement(self, module):
         assert module == "Requirement"
         print("\033[36m\nsucceed_import_module topic was broadcast.")
@@ -97,6 +108,34 @@ class TestImport:
 
         pub.unsubscribe(self.on_fail_import_function, "fail_import_module")
 
+    @pytest.mark.integration
+    def test_fail_insert_key_violations(self, test_program_dao, tmp_path):
+        """_do_import() should report every row with a bad ID or parent ID and import
+        nothing."""
+        pub.subscribe(self.on_fail_import_key_violations, "fail_import_module")
+
+        _test_file = tmp_path / "test_inputs_bad_keys.csv"
+        pd.DataFrame(
+            {
+                "Revision ID": [1, 1, 1, 1, 1],
+                "Function ID": [20, 20, 1, 21, 22],
+                "Parent": [0, 0, 0, 99, 20],
+            }
+        ).to_csv(_test_file, sep=";", index=False)
+
+        DUT = Import()
+        pub.sendMessage("succeed_connect_program_database", dao=test_program_dao)
+
+        DUT._do_read_file("csv", str(_test_file))
+        for _key in ["Revision ID", "Function ID", "Parent"]:
+            DUT._do_map_to_field("Function", _key, _key)
+
+        pub.sendMessage("request_import", module="Function")
+
+        assert test_program_dao.get_last_id("ramstk_function", "function_id") < 20
+
+        pub.unsubscribe(self.on_fail_import_key_violations, "fail_import_module")
+
     @pytest.mark.integration
     def test_do_insert_requirement(self, test_program_dao, test_csv_file_requirement):
         """do_insert() should return a zero error code on success and create a new
@@ -151,6 +190,9 @@ class TestImport:
 
         pub.sendMessage("request_import", module="Hardware")
 
+        assert test_program_dao.get_last_id("ramstk_hardware", "hardware_id") == 10
+        assert test_program_dao.get_last_id("ramstk_reliability", "hardware_id") == 10
+
         pub.unsubscribe(self.on_succeed_import_hardware, "succeed_import_module")
 
     @pytest.mark.skip
@@ -12,6 +12,7 @@
 # Standard Library Imports
 import math
 from collections import OrderedDict
+from datetime import date
 
 # Third Party Imports
 import numpy as np
@@ -20,7 +21,7 @@ import pytest
 from pubsub import pub
 
 # RAMSTK Package Imports
-from ramstk.exim import Import, _do_replace_nan, _get_input_value
+from ramstk.exim import Import, _do_replace_nan, _get_input_column, _get_input_value
 from ramstk.models.db import BaseDatabase
 
 
@@ -28,6 +29,11 @@ from ramstk.models.db import BaseDatabase
 class TestImport:
     """Test class for import methods."""
 
+    def on_succeed_import_chunk(self, module, n_rows):
+        assert module == "Function"
+        assert n_rows in [1, 2]
+        print("\033[36m\nsucceed_import_chunk topic was broadcast.")
+
     @pytest.mark.unit
     def test_create_import(self):
         """__init__() should return an instance of the Import data model."""
@@ -37,6 +43,9 @@ class TestImport:
         assert isinstance(DUT._dic_field_map, dict)
         assert isinstance(DUT._dao, BaseDatabase)
         assert isinstance(DUT._df_input_data, pd.DataFrame)
+        assert DUT._file_name == ""
+        assert DUT._file_type == ""
+        assert DUT.chunk_size == 5000
         assert pub.isSubscribed(DUT._do_connect, "succeed_connect_program_database")
         assert pub.isSubscribed(DUT._do_map_to_field, "request_map_to_field")
         assert pub.isSubscribed(DUT._do_read_db_fields, "request_db_fields")
@@ -546,3 +555,129 @@ class TestImport:
             )
             == "C2"
         )
+
+    @pytest.mark.unit
+    def test__get_input_column(self):
+        """_get_input_column() should return the values in the input column converted
+        to the type of the default value."""
+        _chunk = pd.DataFrame(
+            {
+                "ID": [1, np.nan, 3],
+                "Cost": ["1.5", "two", np.nan],
+                "Name": ["Part", np.nan, 12],
+                "Date": ["2019-08-20", np.nan, "not a date"],
+            }
+        )
+        _map = {"Hardware ID": "ID", "Cost": "Cost", "Name": "Name", "Date": "Date"}
+
+        _ids = _get_input_column(_map, _chunk, "Hardware ID", 1)
+        assert _ids == [1, 1, 3]
+        assert all(isinstance(_id, int) for _id in _ids)
+        assert _get_input_column(_map, _chunk, "Cost", 0.0) == [1.5, 0.0, 0.0]
+        assert _get_input_column(_map, _chunk, "Name", "") == ["Part", "", "12"]
+        assert _get_input_column(_map, _chunk, "Date", date(2000, 1, 1)) == [
+            date(2019, 8, 20),
+            date(2000, 1, 1),
+            date(2000, 1, 1),
+        ]
+
+    @pytest.mark.unit
+    def test__get_input_column_key_error(self):
+        """_get_input_column() should return the default value for every row when the
+        field is not mapped to an input column."""
+        _chunk = pd.DataFrame({"ID": [1, 2]})
+
+        assert _get_input_column({"Hardware ID": ""}, _chunk, "Hardware ID", 4) == [
+            4,
+            4,
+        ]
+        assert _get_input_column({}, _chunk, "Hardware ID", 4) == [4, 4]
+
+    @pytest.mark.unit
+    def test_do_read_chunks(self, test_csv_file_function):
+        """_do_read_chunks() should read the input file chunk_size rows at a time."""
+        DUT = Import()
+        DUT.chunk_size = 1
+
+        DUT._do_read_file("csv", test_csv_file_function)
+        _chunks = list(DUT._do_read_chunks())
+
+        assert len(DUT._df_input_data) == 1
+        assert len(_chunks) == 2
+        assert list(_chunks[0]["Function ID"]) == [5]
+        assert list(_chunks[1]["Function ID"]) == [6]
+
+    @pytest.mark.unit
+    def test_do_read_chunks_excel(self, test_excel_file):
+        """_do_read_chunks() should slice an Excel worksheet into chunks."""
+        DUT = Import()
+        DUT.chunk_size = 1
+
+        DUT._do_read_file("excel", test_excel_file)
+        _chunks = list(DUT._do_read_chunks())
+
+        assert len(_chunks) == 2
+        assert list(_chunks[1]["Function ID"]) == [6]
+
+    @pytest.mark.unit
+    def test_do_make_batches(self, test_csv_file_function):
+        """_do_make_batches() should return one batch of record attributes for each
+        chunk of the input file."""
+        pub.subscribe(self.on_succeed_import_chunk, "succeed_import_chunk")
+
+        DUT = Import()
+        DUT.chunk_size = 1
+
+        DUT._do_read_file("csv", test_csv_file_function)
+        for _idx, _key in enumerate(DUT._dic_field_map["Function"]):
+            DUT._do_map_to_field("Function", list(DUT._df_input_data)[_idx], _key)
+        _batches = list(DUT._do_make_batches("Function"))
+
+        assert len(_batches) == 2
+        assert _batches[0][0][0].__tablename__ == "ramstk_function"
+        assert _batches[0][0][1] == [
+            {
+                "revision_id": 1,
+                "function_id": 5,
+                "function_code": "PRESS-001",
+                "level": 1,
+                "name": "Maintain system pressure.",
+                "parent_id": 0,
+                "remarks": "This is a function that is about system pressure.  This "
+                "remarks box also needs to be larger.",
+                "safety_critical": 1,
+                "type_id": 0,
+            }
+        ]
+        assert _batches[1][0][1][0]["function_id"] == 6
+
+        pub.unsubscribe(self.on_succeed_import_chunk, "succeed_import_chunk")
+
+    @pytest.mark.unit
+    def test_do_validate_keys_unsupported(self):
+        """_do_validate_keys() should return an empty list for a module without
+        keys to check."""
+        DUT = Import()
+
+        assert DUT._do_validate_keys("Shibboly") == []
+
+    @pytest.mark.unit
+    def test_do_read_file_parquet(self, tmp_path):
+        """_do_read_file() should read the first chunk of a Parquet file and
+        _do_read_chunks() should read the rest."""
+        pytest.importorskip("pyarrow")
+
+        _test_file = str(tmp_path / "test_inputs_functions.parquet")
+        pd.DataFrame({"Revision ID": [1, 1, 1], "Function ID": [5, 6, 7]}).to_parquet(
+            _test_file
+        )
+
+        DUT = Import()
+        DUT.chunk_size = 2
+
+        DUT._do_read_file("parquet", _test_file)
+        _chunks = list(DUT._do_read_chunks())
+
+        assert list(DUT._df_input_data) == ["Revision ID", "Function ID"]
+        assert list(DUT._df_input_data["Function ID"]) == [5, 6]
+        assert [list(_chunk["Function ID"]) for _chunk in _chunks] == [[5, 6], [7]]
@@ -35,6 +35,7 @@ def test_datamanager():
         dut._do_create_database,
         "request_create_common",
     )
+    pub.unsubscribe(dut.do_save_site, "request_save_project")
 
     # Delete the device under test.
     del dut
@@ -86,6 +87,10 @@ class TestCommonManager:
             test_datamanager._do_create_database,
             "request_create_common",
         )
+        assert pub.isSubscribed(
+            test_datamanager.do_save_site,
+            "request_save_project",
+        )
 
     @pytest.mark.integration
     @patch(
@@ -23,21 +23,21 @@ def test_view_model(test_program_dao):
     yield dut
 
     # Unsubscribe from pypubsub topics.
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_mode")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_cause")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_control")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_action")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_mode")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_mechanism")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_cause")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_control")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_action")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_mode")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_mechanism")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_cause")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_control")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_action")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mode")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_cause")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_control")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_action")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_mode")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_mechanism")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_cause")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_control")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_action")
 
     # Delete the device under test.
     del dut
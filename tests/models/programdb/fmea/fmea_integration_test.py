@@ -241,6 +241,42 @@ class TestSelectFMEA:
         assert test_view_model.on_select_all() is None
         assert test_view_model.tree.depth() == 0
 
+    @pytest.mark.integration
+    def test_on_select_all_child_index(
+        self,
+        test_view_model,
+        test_mode_table_model,
+        test_mechanism_table_model,
+        test_cause_table_model,
+        test_control_table_model,
+        test_action_table_model,
+    ):
+        """Should index the child records by their parent ID."""
+        test_mode_table_model.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1}
+        )
+        test_mechanism_table_model.do_select_all(
+            attributes={"revision_id": 1, "hardware_id": 1, "mode_id": 6}
+        )
+        test_cause_table_model.do_select_all(
+            attributes={
+                "revision_id": 1,
+                "hardware_id": 1,
+                "mode_id": 6,
+                "mechanism_id": 3,
+            }
+        )
+
+        _causes = test_view_model._get_children("cause", 3)
+        assert _causes
+        assert all(_cause.mechanism_id == 3 for _cause in _causes)
+        assert [_cause.cause_id for _cause in _causes] == [
+            _node.data["cause"].cause_id
+            for _node in test_cause_table_model.tree.all_nodes()[1:]
+            if _node.data["cause"].mechanism_id == 3
+        ]
+        assert test_view_model._get_children("cause", 999) == []
+
 
 @pytest.mark.usefixtures(
     "test_view_model",
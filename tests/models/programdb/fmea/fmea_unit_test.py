@@ -18,6 +18,11 @@ from treelib import Tree
 
 # RAMSTK Package Imports
 from ramstk.models.db import BaseDatabase
+from ramstk.models.dbrecords import (
+    RAMSTKCauseRecord,
+    RAMSTKMechanismRecord,
+    RAMSTKModeRecord,
+)
 from ramstk.models.dbviews import RAMSTKFMEAView
 
 
@@ -34,11 +39,15 @@ class TestCreateModel:
         assert test_view_model._tag == "fmeca"
         assert test_view_model._root == 0
         assert test_view_model._revision_id == 0
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_mode")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_mechanism")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_cause")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_control")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_action")
+        assert pub.isSubscribed(test_view_model.on_insert_node, "succeed_insert_mode")
+        assert pub.isSubscribed(
+            test_view_model.on_insert_node, "succeed_insert_mechanism"
+        )
+        assert pub.isSubscribed(test_view_model.on_insert_node, "succeed_insert_cause")
+        assert pub.isSubscribed(
+            test_view_model.on_insert_node, "succeed_insert_control"
+        )
+        assert pub.isSubscribed(test_view_model.on_insert_node, "succeed_insert_action")
         assert pub.isSubscribed(
             test_view_model.do_set_tree, "succeed_retrieve_all_mode"
         )
@@ -54,8 +63,48 @@ class TestCreateModel:
         assert pub.isSubscribed(
             test_view_model.do_set_tree, "succeed_retrieve_all_action"
         )
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_mode")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_mechanism")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_cause")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_control")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_action")
+        assert pub.isSubscribed(test_view_model.on_delete_node, "succeed_delete_mode")
+        assert pub.isSubscribed(
+            test_view_model.on_delete_node, "succeed_delete_mechanism"
+        )
+        assert pub.isSubscribed(test_view_model.on_delete_node, "succeed_delete_cause")
+        assert pub.isSubscribed(
+            test_view_model.on_delete_node, "succeed_delete_control"
+        )
+        assert pub.isSubscribed(test_view_model.on_delete_node, "succeed_delete_action")
+
+
+@pytest.mark.usefixtures("test_view_model")
+class TestDeleteMethods:
+    """Class for unit testing FMEA view delete methods."""
+
+    @pytest.mark.unit
+    def test_do_remove_node_descendants(self, test_view_model):
+        """_do_remove_node() should remove the node ID and child index entries for
+        the removed node and every node below it."""
+        _mode = RAMSTKModeRecord()
+        _mode.mode_id = 1
+        _mechanism = RAMSTKMechanismRecord()
+        _mechanism.mode_id = 1
+        _mechanism.mechanism_id = 2
+        _cause = RAMSTKCauseRecord()
+        _cause.mechanism_id = 2
+        _cause.cause_id = 3
+        _other_mode = RAMSTKModeRecord()
+        _other_mode.mode_id = 4
+
+        test_view_model._do_add_node("mode", 1, "1", 0, {"fmeca": _mode})
+        test_view_model._do_add_node("mode", 4, "4", 0, {"fmeca": _other_mode})
+        test_view_model._do_add_node("mechanism", 2, "1.2", "1", {"fmeca": _mechanism})
+        test_view_model._do_add_node("cause", 3, "1.2.3", "1.2", {"fmeca": _cause})
+        test_view_model._dic_children = {
+            "mechanism": {1: [_mechanism]},
+            "cause": {2: [_cause]},
+        }
+
+        test_view_model._do_remove_node("mode", 1)
+
+        assert test_view_model._dic_node_ids == {("mode", 4): "4"}
+        assert test_view_model._dic_children == {"mechanism": {}, "cause": {}}
+        assert test_view_model.tree.contains("4")
+        assert not test_view_model.tree.contains("1.2.3")
@@ -282,6 +282,7 @@ def test_milhdbk217f(test_program_dao):
     pub.unsubscribe(dut.do_select_all, "selected_revision")
     pub.unsubscribe(dut.do_delete, "request_delete_milhdbk217f")
     pub.unsubscribe(dut.do_insert, "request_insert_milhdbk217f")
+    pub.unsubscribe(dut.do_set_attributes_all, "request_set_all_milhdbk217f_attributes")
 
     # Delete the device under test.
     del dut
@@ -332,6 +333,7 @@ def test_reliability(test_program_dao):
     pub.unsubscribe(dut.do_select_all, "selected_revision")
     pub.unsubscribe(dut.do_delete, "request_delete_reliability")
     pub.unsubscribe(dut.do_insert, "request_insert_reliability")
+    pub.unsubscribe(dut.do_set_attributes_all, "request_set_all_reliability_attributes")
 
     # Delete the device under test.
     del dut
@@ -884,6 +884,47 @@ class TestHardwareBoMAnalyses:
         _attributes = test_reliability.do_select(5).get_attributes()
         assert _attributes["hazard_rate_active"] == 0.0007829
 
+    @pytest.mark.integration
+    def test_do_predict_hazard_rate_active_assembly_distribution(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+    ):
+        """Predict the active hazard of an assembly with a failure distribution."""
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(attributes={"revision_id": 1})
+        test_design_mechanic.do_select_all(attributes={"revision_id": 1})
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1})
+
+        _hardware = test_tablemodel.do_select(5)
+        _hardware.quantity = 1
+        _hardware.part = 0
+        _hardware.duty_cycle = 100.0
+        _hardware.mission_time = 105.0
+
+        _reliability = test_reliability.do_select(5)
+        _reliability.hazard_rate_type_id = 4
+        _reliability.failure_distribution_id = 7
+        _reliability.shape_parameter = 2.5
+        _reliability.scale_parameter = 525.0
+        _reliability.location_parameter = 18.5
+        _reliability.add_adj_factor = 0.0
+        _reliability.mult_adj_factor = 1.0
+
+        test_viewmodel.do_calculate_hardware(5)
+
+        _attributes = test_reliability.do_select(5).get_attributes()
+        assert _attributes["hazard_rate_active"] == pytest.approx(0.02874279)
+        assert test_viewmodel._dic_hazard_rates == {}
+
     @pytest.mark.integration
     def test_do_predict_hazard_rate_active_assembly_specified_mtbf(
         self,
@@ -979,3 +1020,119 @@ class TestHardwareBoMAnalyses:
         assert _attributes["mtbf_mission"] == pytest.approx(687072.7266481)
         assert _attributes["reliability_logistics"] == pytest.approx(0.9999985)
         assert _attributes["reliability_mission"] == pytest.approx(0.9998545)
+
+    @pytest.mark.integration
+    def test_do_calculate_hardware_quiet(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+        test_stress_limits,
+    ):
+        """Write predictions into the records and send one summary message."""
+        _messages = []
+
+        def on_message(attributes, topic=pub.AUTO_TOPIC):
+            _messages.append(topic.getName())
+
+        def on_succeed_calculate(tree, topic=pub.AUTO_TOPIC):
+            _messages.append(topic.getName())
+
+        pub.subscribe(on_message, "succeed_predict_reliability")
+        pub.subscribe(on_message, "request_set_all_milhdbk217f_attributes")
+        pub.subscribe(on_message, "request_set_all_reliability_attributes")
+        pub.subscribe(on_succeed_calculate, "succeed_calculate_hardware")
+
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(attributes={"revision_id": 1})
+        test_design_mechanic.do_select_all(attributes={"revision_id": 1})
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1})
+
+        _hardware = test_tablemodel.do_select(8)
+        _hardware.category_id = 3
+        _hardware.subcategory_id = 1
+        _hardware.part = 1
+
+        _hardware = test_design_electric.do_select(8)
+        _hardware.environment_active_id = 9
+
+        _hardware = test_reliability.do_select(8)
+        _hardware.hazard_rate_type_id = 1
+        _hardware.hazard_rate_method_id = 2
+        _hardware.quality_id = 3
+
+        test_viewmodel._dic_stress_limits = test_stress_limits
+        test_viewmodel.do_calculate_hardware(8)
+
+        assert _messages == ["succeed_calculate_hardware"]
+        assert test_milhdbk217f.do_select(8).piE == pytest.approx(11.0)
+        assert test_milhdbk217f.do_select(8).piQ == pytest.approx(0.3)
+        assert test_reliability.do_select(8).lambda_b > 0.0
+        assert test_reliability.do_select(8).hazard_rate_active > 0.0
+
+        pub.unsubscribe(on_message, "succeed_predict_reliability")
+        pub.unsubscribe(on_message, "request_set_all_milhdbk217f_attributes")
+        pub.unsubscribe(on_message, "request_set_all_reliability_attributes")
+        pub.unsubscribe(on_succeed_calculate, "succeed_calculate_hardware")
+
+    @pytest.mark.integration
+    def test_do_calculate_dirty_hardware(
+        self,
+        test_attributes,
+        test_tablemodel,
+        test_viewmodel,
+        test_design_electric,
+        test_design_mechanic,
+        test_milhdbk217f,
+        test_nswc,
+        test_reliability,
+        test_stress_limits,
+    ):
+        """Should calculate only the edited hardware item and its ancestors."""
+        test_tablemodel.do_select_all(attributes={"revision_id": 1})
+        test_design_electric.do_select_all(attributes={"revision_id": 1})
+        test_design_mechanic.do_select_all(attributes={"revision_id": 1})
+        test_milhdbk217f.do_select_all(attributes={"revision_id": 1})
+        test_nswc.do_select_all(attributes={"revision_id": 1})
+        test_reliability.do_select_all(attributes={"revision_id": 1})
+
+        test_viewmodel._dic_stress_limits = test_stress_limits
+
+        _hardware = test_tablemodel.do_select(8)
+        _hardware.category_id = 3
+        _hardware.part = 1
+        _hardware.quantity = 2
+        _hardware.subcategory_id = 1
+
+        _hardware = test_design_electric.do_select(8)
+        _hardware.environment_active_id = 9
+        _hardware.environment_dormant_id = 1
+
+        _hardware = test_reliability.do_select(8)
+        _hardware.hazard_rate_type_id = 1
+        _hardware.hazard_rate_method_id = 1
+        _hardware.quality_id = 3
+
+        test_viewmodel.do_calculate_hardware(8)
+        test_viewmodel._set_dirty_ids.clear()
+
+        pub.sendMessage(
+            "mvw_editing_design_electric",
+            node_id=8,
+            package={"power_operating": 0.00295},
+        )
+
+        # Hardware ID 8 and its ancestors, hardware IDs 7, 2, and 1.
+        assert test_viewmodel.do_calculate_dirty_hardware() == 4
+        assert test_viewmodel._set_dirty_ids == set()
+
+        _attributes = test_tablemodel.do_select(8).get_attributes()
+        assert _attributes["total_power_dissipation"] == 0.0059
+        assert test_viewmodel.do_calculate_dirty_hardware() == 0
@@ -16,7 +16,14 @@ from treelib import Tree
 
 # RAMSTK Package Imports
 from ramstk.models.db import BaseDatabase
-from ramstk.models.dbrecords import RAMSTKHardwareRecord
+from ramstk.models.dbrecords import (
+    RAMSTKDesignElectricRecord,
+    RAMSTKDesignMechanicRecord,
+    RAMSTKHardwareRecord,
+    RAMSTKMilHdbk217FRecord,
+    RAMSTKNSWCRecord,
+    RAMSTKReliabilityRecord,
+)
 from ramstk.models.dbtables import RAMSTKHardwareTable
 from ramstk.models.dbviews import RAMSTKHardwareBoMView
 from tests import (
@@ -37,24 +44,24 @@ def test_viewmodel():
     yield dut
 
     # Unsubscribe from pypubsub topics.
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_hardware")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_design_electric")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_design_mechanic")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_milhdbk217f")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_nswc")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_reliability")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_hardware")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_design_electric")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_design_mechanic")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_milhdbk217f")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_nswc")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_reliability")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_hardware")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_design_electric")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_design_mechanic")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_milhdbk217f")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_nswc")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_reliability")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_hardware")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_design_electric")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_design_mechanic")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_milhdbk217f")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_nswc")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_reliability")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_hardware")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_design_electric")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_design_mechanic")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_milhdbk217f")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_nswc")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_reliability")
     pub.unsubscribe(dut.do_calculate_hardware, "request_calculate_hardware")
     pub.unsubscribe(dut.do_make_composite_ref_des, "request_make_comp_ref_des")
 
@@ -167,19 +174,21 @@ class TestCreateHardwareModels:
             "nswc",
             "reliability",
         ]
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_insert_hardware")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_insert_design_electric"
+            test_viewmodel.on_insert_node, "succeed_insert_hardware"
+        )
+        assert pub.isSubscribed(
+            test_viewmodel.on_insert_node, "succeed_insert_design_electric"
         )
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_insert_design_mechanic"
+            test_viewmodel.on_insert_node, "succeed_insert_design_mechanic"
         )
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_insert_milhdbk217f"
+            test_viewmodel.on_insert_node, "succeed_insert_milhdbk217f"
         )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_insert_nswc")
+        assert pub.isSubscribed(test_viewmodel.on_insert_node, "succeed_insert_nswc")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_insert_reliability"
+            test_viewmodel.on_insert_node, "succeed_insert_reliability"
         )
         assert pub.isSubscribed(
             test_viewmodel.do_set_tree, "succeed_retrieve_all_hardware"
@@ -197,19 +206,21 @@ class TestCreateHardwareModels:
         assert pub.isSubscribed(
             test_viewmodel.do_set_tree, "succeed_retrieve_all_reliability"
         )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_hardware")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_design_electric"
+            test_viewmodel.on_delete_node, "succeed_delete_hardware"
+        )
+        assert pub.isSubscribed(
+            test_viewmodel.on_delete_node, "succeed_delete_design_electric"
         )
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_design_mechanic"
+            test_viewmodel.on_delete_node, "succeed_delete_design_mechanic"
         )
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_milhdbk217f"
+            test_viewmodel.on_delete_node, "succeed_delete_milhdbk217f"
         )
-        assert pub.isSubscribed(test_viewmodel.do_set_tree, "succeed_delete_nswc")
+        assert pub.isSubscribed(test_viewmodel.on_delete_node, "succeed_delete_nswc")
         assert pub.isSubscribed(
-            test_viewmodel.do_set_tree, "succeed_delete_reliability"
+            test_viewmodel.on_delete_node, "succeed_delete_reliability"
         )
         assert pub.isSubscribed(
             test_viewmodel.do_make_composite_ref_des, "request_make_comp_ref_des"
@@ -249,10 +260,21 @@ class TestInsertHardware(UnitTestInsertMethods):
         _hardware = unit_test_table_model.do_select(2)
         _hardware.ref_des = "A9"
 
+        _trees = []
+
+        def on_succeed_make_comp_ref_des(tree):
+            _trees.append(tree)
+
+        pub.subscribe(on_succeed_make_comp_ref_des, "succeed_make_comp_ref_des")
+
         test_viewmodel.do_make_composite_ref_des(1)
 
+        pub.unsubscribe(on_succeed_make_comp_ref_des, "succeed_make_comp_ref_des")
+
         assert unit_test_table_model.do_select(1).comp_ref_des == "SS8"
         assert unit_test_table_model.do_select(2).comp_ref_des == "SS8:A9"
+        assert len(_trees) == 1
+        assert _trees[0].get_node(2).data["hardware"].comp_ref_des == "SS8:A9"
 
 
 @pytest.mark.usefixtures("test_attributes", "unit_test_table_model")
@@ -428,3 +450,59 @@ class TestHardwareAnalysisMethods:
         _attributes = unit_test_table_model.do_select(1).get_attributes()
 
         assert _attributes["total_part_count"] == 6
+
+    @pytest.mark.unit
+    def test_do_calculate_part_count_deep_bom(self, test_viewmodel):
+        """Should calculate the part count of a BoM deeper than the recursion limit."""
+        for _hardware_id in range(1, 3002):
+            _hardware = RAMSTKHardwareRecord()
+            _hardware.hardware_id = _hardware_id
+            _hardware.part = 1 if _hardware_id == 3001 else 0
+            _hardware.quantity = 1
+            test_viewmodel.tree.create_node(
+                tag="hardware",
+                identifier=_hardware_id,
+                parent=_hardware_id - 1,
+                data={"hardware": _hardware},
+            )
+
+        test_viewmodel.do_calculate_part_count(1)
+
+        assert test_viewmodel.tree.get_node(1).data["hardware"].total_part_count == 1
+
+    @pytest.mark.unit
+    def test_do_calculate_hardware_deep_bom(self, test_viewmodel):
+        """Should roll up the metrics of a BoM deeper than the recursion limit."""
+        for _hardware_id in range(1, 3002):
+            _data = {}
+            for _module, _record_class in [
+                ("hardware", RAMSTKHardwareRecord),
+                ("design_electric", RAMSTKDesignElectricRecord),
+                ("design_mechanic", RAMSTKDesignMechanicRecord),
+                ("milhdbk217f", RAMSTKMilHdbk217FRecord),
+                ("nswc", RAMSTKNSWCRecord),
+                ("reliability", RAMSTKReliabilityRecord),
+            ]:
+                _data[_module] = _record_class()
+                _data[_module].set_attributes(dict(_record_class.__defaults__))
+            _data["hardware"].hardware_id = _hardware_id
+            _data["hardware"].category_id = 9
+            _data["hardware"].cost = 2.5
+            _data["hardware"].cost_type_id = 1
+            _data["hardware"].part = 1 if _hardware_id == 3001 else 0
+            _data["hardware"].quantity = 1
+            _data["reliability"].hazard_rate_specified = 0.005
+            _data["reliability"].hazard_rate_type_id = 2 if _hardware_id == 3001 else 1
+            test_viewmodel.tree.create_node(
+                tag="hardware",
+                identifier=_hardware_id,
+                parent=_hardware_id - 1,
+                data=_data,
+            )
+
+        test_viewmodel.do_calculate_hardware(1)
+
+        _node = test_viewmodel.tree.get_node(1)
+        assert _node.data["hardware"].total_cost == 2.5
+        assert _node.data["hardware"].total_part_count == 1
+        assert _node.data["reliability"].hazard_rate_active == pytest.approx(0.005)
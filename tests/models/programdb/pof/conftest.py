@@ -23,18 +23,18 @@ def test_view_model(test_program_dao):
     yield dut
 
     # Unsubscribe from pypubsub topics.
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_opload")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_opstress")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_test_method")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_mechanism")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_opload")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_opstress")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_test_method")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_mechanism")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_opload")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_opstress")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_test_method")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mechanism")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_opload")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_opstress")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_test_method")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_mechanism")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_opload")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_opstress")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_test_method")
 
     # Delete the device under test.
     del dut
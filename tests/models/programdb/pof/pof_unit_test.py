@@ -31,11 +31,15 @@ class TestCreateModel:
         assert test_view_model._tag == "pof"
         assert test_view_model._root == 0
         assert test_view_model._revision_id == 0
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_mechanism")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_opload")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_opstress")
         assert pub.isSubscribed(
-            test_view_model.do_set_tree, "succeed_insert_test_method"
+            test_view_model.on_insert_node, "succeed_insert_mechanism"
+        )
+        assert pub.isSubscribed(test_view_model.on_insert_node, "succeed_insert_opload")
+        assert pub.isSubscribed(
+            test_view_model.on_insert_node, "succeed_insert_opstress"
+        )
+        assert pub.isSubscribed(
+            test_view_model.on_insert_node, "succeed_insert_test_method"
         )
         assert pub.isSubscribed(
             test_view_model.do_set_tree, "succeed_retrieve_all_mechanism"
@@ -49,9 +53,13 @@ class TestCreateModel:
         assert pub.isSubscribed(
             test_view_model.do_set_tree, "succeed_retrieve_all_test_method"
         )
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_mechanism")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_opload")
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_opstress")
         assert pub.isSubscribed(
-            test_view_model.do_set_tree, "succeed_delete_test_method"
+            test_view_model.on_delete_node, "succeed_delete_mechanism"
+        )
+        assert pub.isSubscribed(test_view_model.on_delete_node, "succeed_delete_opload")
+        assert pub.isSubscribed(
+            test_view_model.on_delete_node, "succeed_delete_opstress"
+        )
+        assert pub.isSubscribed(
+            test_view_model.on_delete_node, "succeed_delete_test_method"
         )
@@ -228,6 +228,9 @@ def test_table_model():
     pub.unsubscribe(dut.do_select_all, "selected_revision")
     pub.unsubscribe(dut.do_delete, "request_delete_reliability")
     pub.unsubscribe(dut.do_insert, "request_insert_reliability")
+    pub.unsubscribe(dut._do_update_tree, "succeed_delete_hardware")
+    pub.unsubscribe(dut._do_update_tree, "succeed_insert_hardware")
+    pub.unsubscribe(dut.do_set_attributes_all, "request_set_all_reliability_attributes")
 
     # Delete the device under test.
     del dut
@@ -15,7 +15,7 @@ from pubsub import pub
 from treelib import Tree
 
 # RAMSTK Package Imports
-from ramstk.models.dbrecords import RAMSTKReliabilityRecord
+from ramstk.models.dbrecords import RAMSTKHardwareRecord, RAMSTKReliabilityRecord
 from ramstk.models.dbtables import RAMSTKReliabilityTable
 from tests import (
     MockDAO,
@@ -172,6 +172,79 @@ class TestDeleteReliability(UnitTestDeleteMethods):
     _tag = "reliability"
 
 
+@pytest.mark.usefixtures("test_attributes", "unit_test_table_model")
+class TestUpdateTreeReliability:
+    """Class for unit testing Reliability table _do_update_tree() method."""
+
+    @staticmethod
+    def _do_add_hardware(tree, hardware_id, parent_id):
+        """Add a Hardware item to the Hardware tree."""
+        _hardware = RAMSTKHardwareRecord()
+        _hardware.revision_id = 1
+        _hardware.hardware_id = hardware_id
+        _hardware.parent_id = parent_id
+        tree.create_node(
+            tag="hardware",
+            identifier=hardware_id,
+            parent=parent_id,
+            data={"hardware": _hardware},
+        )
+
+    @pytest.mark.unit
+    def test_do_update_tree_insert(self, test_attributes, unit_test_table_model):
+        """Should add a node for only the Hardware item just added, once."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+        _tree = Tree()
+        _tree.create_node(tag="hardware", identifier=0)
+        self._do_add_hardware(_tree, 1, 0)
+        self._do_add_hardware(_tree, 4, 1)
+        _record = unit_test_table_model.do_select(1)
+
+        unit_test_table_model._do_update_tree(4, _tree)
+
+        assert isinstance(unit_test_table_model.do_select(4), RAMSTKReliabilityRecord)
+        assert unit_test_table_model.do_select(4).hardware_id == 4
+        assert unit_test_table_model.do_select(1) is _record
+
+        _record = unit_test_table_model.do_select(4)
+        unit_test_table_model._do_update_tree(4, _tree)
+
+        assert unit_test_table_model.do_select(4) is _record
+
+    def on_succeed_delete(self, node_id, tree):
+        """Listen for succeed_delete messages."""
+        assert node_id == 4
+        assert isinstance(tree, Tree)
+        assert not tree.contains(5)
+        print("\033[32m\n\tsucceed_delete_reliability topic was broadcast.")
+
+    @pytest.mark.unit
+    def test_do_update_tree_delete(self, test_attributes, unit_test_table_model):
+        """Should remove the nodes for the Hardware item deleted and its children."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+        _tree = Tree()
+        _tree.create_node(tag="hardware", identifier=0)
+        self._do_add_hardware(_tree, 1, 0)
+        for _hardware_id, _parent_id in [(4, 1), (5, 4), (6, 1)]:
+            self._do_add_hardware(_tree, _hardware_id, _parent_id)
+            unit_test_table_model._do_update_tree(_hardware_id, _tree)
+
+        _tree.remove_node(6)
+        unit_test_table_model._do_update_tree(6, _tree)
+
+        assert unit_test_table_model.tree.contains(4)
+        assert not unit_test_table_model.tree.contains(6)
+
+        _tree.remove_node(4)
+        pub.subscribe(self.on_succeed_delete, "succeed_delete_reliability")
+        unit_test_table_model._do_update_tree(4, _tree)
+        pub.unsubscribe(self.on_succeed_delete, "succeed_delete_reliability")
+
+        assert unit_test_table_model.tree.contains(1)
+        assert not unit_test_table_model.tree.contains(4)
+        assert not unit_test_table_model.tree.contains(5)
+
+
 @pytest.mark.usefixtures("test_attributes", "test_record_model")
 class TestGetterSetterReliability(UnitTestGetterSetterMethods):
     """Class for unit testing Reliability table methods that get or set."""
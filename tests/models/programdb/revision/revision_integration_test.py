@@ -59,8 +59,8 @@ class TestInsertRevision(SystemTestInsertMethods):
         """Listen for do_log_debug messages."""
         assert logger_name == "DEBUG"
         assert message == (
-            "Database error while adding a record. Error details: : 'NoneType' object "
-            "has no attribute 'add'"
+            "Error retrieving last ID from ramstk_revision: : 'NoneType' object has "
+            "no attribute 'execute'"
         )
         print(
             f"\033[35m\n\tfail_insert_{self._tag} topic was broadcast on no "
@@ -144,6 +144,89 @@ class TestDeleteRevision(UnitTestDeleteMethods):
     _tag = "revision"
 
 
+@pytest.mark.usefixtures("test_attributes", "unit_test_table_model")
+class TestSetAttributesRevision:
+    """Class for unit testing Revision table do_set_attributes_many() method."""
+
+    def on_succeed_set_attributes_many(self, node_id, keys):
+        """Listen for succeed_set_attributes messages."""
+        assert node_id == 1
+        assert keys == ["name", "mtbf_mission"]
+        print("\033[36m\n\tsucceed_set_revision_attributes topic was broadcast")
+
+    def on_fail_set_attributes_unknown_key(self, logger_name, message):
+        """Listen for do_log_debug messages."""
+        assert logger_name == "DEBUG"
+        assert (
+            message
+            == "Unknown attribute(s) not_an_attribute not set for revision ID 1."
+        )
+        print("\033[35m\n\tdo_log_debug_msg topic was broadcast on unknown key.")
+
+    def on_fail_set_attributes_non_existent_id(self, logger_name, message):
+        """Listen for do_log_debug messages."""
+        assert logger_name == "DEBUG"
+        assert message in [
+            "No data package for node ID 100 in module revision.",
+            "Attempted to set attributes of non-existent revision with revision ID 100.",
+        ]
+        print("\033[35m\n\tdo_log_debug_msg topic was broadcast on non-existent ID.")
+
+    @pytest.mark.unit
+    def test_do_set_attributes_many(self, test_attributes, unit_test_table_model):
+        """Should set all the attributes and send one succeed_set_attributes message."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+        pub.subscribe(
+            self.on_succeed_set_attributes_many, "succeed_set_revision_attributes"
+        )
+
+        unit_test_table_model.do_set_attributes_many(
+            node_id=1,
+            package={"revision_id": 4, "name": "New name", "mtbf_mission": 12.5},
+        )
+
+        _attributes = unit_test_table_model.do_select(1).get_attributes()
+        assert _attributes["revision_id"] == 1
+        assert _attributes["name"] == "New name"
+        assert _attributes["mtbf_mission"] == 12.5
+
+        pub.unsubscribe(
+            self.on_succeed_set_attributes_many, "succeed_set_revision_attributes"
+        )
+
+    @pytest.mark.unit
+    def test_do_set_attributes_many_unknown_key(
+        self, test_attributes, unit_test_table_model
+    ):
+        """Should report the unknown key and still set the known attributes."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+        pub.subscribe(self.on_fail_set_attributes_unknown_key, "do_log_debug_msg")
+
+        unit_test_table_model.do_set_attributes_many(
+            node_id=1,
+            package={"name": "New name", "not_an_attribute": 1},
+        )
+
+        assert unit_test_table_model.do_select(1).name == "New name"
+
+        pub.unsubscribe(self.on_fail_set_attributes_unknown_key, "do_log_debug_msg")
+
+    @pytest.mark.unit
+    def test_do_set_attributes_many_non_existent_id(
+        self, test_attributes, unit_test_table_model
+    ):
+        """Should report the non-existent node ID."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+        pub.subscribe(self.on_fail_set_attributes_non_existent_id, "do_log_debug_msg")
+
+        unit_test_table_model.do_set_attributes_many(
+            node_id=100,
+            package={"name": "New name"},
+        )
+
+        pub.unsubscribe(self.on_fail_set_attributes_non_existent_id, "do_log_debug_msg")
+
+
 @pytest.mark.usefixtures("test_attributes", "test_record_model")
 class TestGetterSetterRevision(UnitTestGetterSetterMethods):
     """Class for unit testing Revision table methods that get or set."""
@@ -281,6 +281,7 @@ def test_table_model():
     pub.unsubscribe(dut.do_delete, "request_delete_similar_item")
     pub.unsubscribe(dut.do_insert, "request_insert_similar_item")
     pub.unsubscribe(dut.do_calculate_similar_item, "request_calculate_similar_item")
+    pub.unsubscribe(dut.do_calculate_similar_items, "request_calculate_similar_items")
     pub.unsubscribe(
         dut.do_roll_up_change_descriptions, "request_roll_up_change_descriptions"
     )
@@ -357,3 +357,40 @@ class TestSimilarItemAnalysisMethods:
         assert _record.change_factor_1 == 0.85
         assert _record.change_factor_2 == 1.2
         assert _record.result_1 == pytest.approx(0.00062934)
+
+    @pytest.mark.unit
+    def test_do_calculate_similar_items(self, test_attributes, unit_test_table_model):
+        """Should calculate each similar item using its own method."""
+        unit_test_table_model.do_select_all(attributes=test_attributes)
+        unit_test_table_model._node_hazard_rate = 0.000617
+
+        _record_1 = unit_test_table_model.do_select(1)
+        _record_1.similar_item_method_id = 2
+        _record_1.change_factor_1 = 0.85
+        _record_1.change_factor_2 = 1.2
+        _record_1.function_1 = "pi1*pi2*hr"
+        _record_1.function_2 = "res1/hr"
+
+        _record_2 = unit_test_table_model.do_select(2)
+        _record_2.similar_item_method_id = 2
+        _record_2.change_factor_1 = 1.1
+        _record_2.change_factor_2 = 0.9
+        _record_2.function_1 = "pi1*pi2*hr"
+        _record_2.function_2 = "res1/hr"
+
+        _record_3 = unit_test_table_model.do_select(3)
+        _record_3.similar_item_method_id = 1
+        _record_3.environment_from_id = 2
+        _record_3.environment_to_id = 3
+        _record_3.quality_from_id = 1
+        _record_3.quality_to_id = 2
+        _record_3.temperature_from = 55.0
+        _record_3.temperature_to = 65.0
+
+        unit_test_table_model.do_calculate_similar_items([1, 2, 3])
+
+        assert _record_1.result_1 == pytest.approx(0.00062934)
+        assert _record_1.result_2 == pytest.approx(1.02)
+        assert _record_2.result_1 == pytest.approx(0.00061083)
+        assert _record_2.result_2 == pytest.approx(0.99)
+        assert _record_3.result_1 == pytest.approx(0.0005508929)
@@ -18,6 +18,7 @@ from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk.models.db import BaseDatabase, RAMSTKProgramDB
+from ramstk.models.dbrecords import RAMSTKRevisionRecord
 
 
 @pytest.fixture(scope="class")
@@ -33,6 +34,7 @@ def test_datamanager():
     pub.unsubscribe(dut.do_open_program, "request_open_program")
     pub.unsubscribe(dut.do_close_program, "request_close_program")
     pub.unsubscribe(dut.do_save_program, "request_update_program")
+    pub.unsubscribe(dut.do_save_program, "request_save_project")
 
     # Delete the device under test.
     del dut
@@ -104,29 +106,22 @@ class TestProgramManager:
         )
         print("\033[35m\n\tfail_disconnect_program_database topic was broadcast")
 
-    def on_request_update_revision(self):
-        """Listen for request_update_all messages."""
-        print("\033[32m\n\trequest_update_all_revision topic was broadcast")
+    def on_succeed_save_program(self, changed):
+        """Listen for succeed_update_program messages."""
+        assert changed == {"ramstk_revision": 1}
+        print("\033[32m\n\tsucceed_update_program topic was broadcast")
 
-    def on_request_update_function(self):
-        """Listen for request_update_all messages."""
-        print("\033[32m\n\trequest_update_all_function topic was broadcast")
+    def on_succeed_save_program_no_changes(self, changed):
+        """Listen for succeed_update_program messages."""
+        assert changed == {}
+        print("\033[32m\n\tsucceed_update_program topic was broadcast with no changes")
 
-    def on_request_update_requirement(self):
-        """Listen for request_update_all messages."""
-        print("\033[32m\n\trequest_update_all_requirement topic was broadcast")
-
-    def on_request_update_stakeholder(self):
-        """Listen for request_update_all messages."""
-        print("\033[32m\n\trequest_update_all_stakeholder topic was broadcast")
-
-    def on_request_update_hardware(self):
-        """Listen for request_update_all messages."""
-        print("\033[32m\n\trequest_update_all_hardware topic was broadcast")
-
-    def on_request_update_validation(self):
-        """Listen for request_update_all messages."""
-        print("\033[32m\n\trequest_update_all_validation topic was broadcast")
+    def on_fail_save_program(self, error_message):
+        """Listen for fail_update_program messages."""
+        assert error_message == (
+            "Not currently connected to a database.  Nothing to save."
+        )
+        print("\033[35m\n\tfail_update_program topic was broadcast")
 
     def on_succeed_create_postgres_program(
         self,
@@ -194,6 +189,9 @@ class TestProgramManager:
         assert pub.isSubscribed(
             test_datamanager.do_save_program, "request_update_program"
         )
+        assert pub.isSubscribed(
+            test_datamanager.do_save_program, "request_save_project"
+        )
 
     @pytest.mark.integration
     def test_do_open_program(self, test_datamanager, test_program_dao):
@@ -338,23 +336,11 @@ class TestProgramManager:
         pub.unsubscribe(dut.do_open_program, "request_open_program")
         pub.unsubscribe(dut.do_close_program, "request_close_program")
         pub.unsubscribe(dut.do_save_program, "request_update_program")
+        pub.unsubscribe(dut.do_save_program, "request_save_project")
 
     @pytest.mark.integration
     def test_save_program(self, test_datamanager, test_program_dao):
-        """Should cause all workstream modules to execute their save_all() method."""
-        pub.subscribe(self.on_request_update_revision, "request_update_all_revision")
-        pub.subscribe(self.on_request_update_function, "request_update_all_function")
-        pub.subscribe(
-            self.on_request_update_requirement, "request_update_all_requirement"
-        )
-        pub.subscribe(
-            self.on_request_update_stakeholder, "request_update_all_stakeholder"
-        )
-        pub.subscribe(self.on_request_update_hardware, "request_update_all_hardware")
-        pub.subscribe(
-            self.on_request_update_validation, "request_update_all_validation"
-        )
-
+        """Should write only the changed records and send one success message."""
         test_program_db = {
             "dialect": "postgres",
             "user": "postgres",
@@ -364,23 +350,48 @@ class TestProgramManager:
             "database": test_program_dao.cxnargs["database"],
         }
         test_datamanager.do_open_program(test_program_db)
-        test_datamanager.do_save_program()
 
-        pub.unsubscribe(self.on_request_update_revision, "request_update_all_revision")
-        pub.unsubscribe(self.on_request_update_function, "request_update_all_function")
-        pub.unsubscribe(
-            self.on_request_update_requirement, "request_update_all_requirement"
-        )
-        pub.unsubscribe(
-            self.on_request_update_stakeholder, "request_update_all_stakeholder"
+        _revision = (
+            test_datamanager.session.query(RAMSTKRevisionRecord)
+            .filter(RAMSTKRevisionRecord.revision_id == 1)
+            .first()
         )
-        pub.unsubscribe(self.on_request_update_hardware, "request_update_all_hardware")
+        _revision.name = "Saved by do_save_program()"
+
+        pub.subscribe(self.on_succeed_save_program, "succeed_update_program")
+
+        pub.sendMessage("request_save_project")
+
+        pub.unsubscribe(self.on_succeed_save_program, "succeed_update_program")
+
+        assert not test_datamanager.session.dirty
+
+        # Saving again should not write anything.
+        pub.subscribe(self.on_succeed_save_program_no_changes, "succeed_update_program")
+
+        test_datamanager.do_save_program()
+
         pub.unsubscribe(
-            self.on_request_update_validation, "request_update_all_validation"
+            self.on_succeed_save_program_no_changes, "succeed_update_program"
         )
 
         test_datamanager.do_close_program()
 
+    @pytest.mark.integration
+    def test_save_program_none_open(self):
+        """Broadcast fail message on attempts to save when not connected."""
+        pub.subscribe(self.on_fail_save_program, "fail_update_program")
+
+        dut = RAMSTKProgramDB()
+        dut.do_save_program()
+
+        pub.unsubscribe(self.on_fail_save_program, "fail_update_program")
+        pub.unsubscribe(dut._do_create_database, "request_create_program")
+        pub.unsubscribe(dut.do_open_program, "request_open_program")
+        pub.unsubscribe(dut.do_close_program, "request_close_program")
+        pub.unsubscribe(dut.do_save_program, "request_update_program")
+        pub.unsubscribe(dut.do_save_program, "request_save_project")
+
     @pytest.mark.integration
     def test_do_create_postgres_program(
         self, test_datamanager, test_toml_user_configuration
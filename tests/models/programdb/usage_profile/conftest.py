@@ -23,15 +23,15 @@ def test_view_model():
     yield dut
 
     # Unsubscribe from pypubsub topics.
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_environment")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_mission")
-    pub.unsubscribe(dut.do_set_tree, "succeed_insert_mission_phase")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_environment")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_mission")
+    pub.unsubscribe(dut.on_insert_node, "succeed_insert_mission_phase")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_environment")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_mission")
     pub.unsubscribe(dut.do_set_tree, "succeed_retrieve_all_mission_phase")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_environment")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mission")
-    pub.unsubscribe(dut.do_set_tree, "succeed_delete_mission_phase")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_environment")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_mission")
+    pub.unsubscribe(dut.on_delete_node, "succeed_delete_mission_phase")
 
     # Delete the device under test.
     del dut
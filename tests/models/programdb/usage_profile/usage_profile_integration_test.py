@@ -305,6 +305,41 @@ class TestInsertUsageProfile:
             self.on_succeed_insert_environment, "succeed_retrieve_usage_profile"
         )
 
+    @pytest.mark.integration
+    def test_do_insert_keeps_existing_nodes(
+        self,
+        test_view_model,
+        test_mission_table_model,
+        test_mission_phase_table_model,
+        test_environment_table_model,
+    ):
+        """Should add the new node without rebuilding the rest of the records tree."""
+        test_mission_table_model.do_select_all(attributes={"revision_id": 1})
+        test_mission_phase_table_model.do_select_all(
+            attributes={"revision_id": 1, "mission_id": 1}
+        )
+        test_environment_table_model.do_select_all(
+            attributes={"revision_id": 1, "mission_id": 1, "mission_phase_id": 1}
+        )
+
+        _node = test_view_model.tree.get_node("1.1")
+
+        pub.sendMessage(
+            "request_insert_mission_phase",
+            attributes={
+                "revision_id": 1,
+                "mission_id": 1,
+                "mission_phase_id": 1,
+            },
+        )
+
+        assert test_view_model.tree.contains("1.4")
+        assert test_view_model.tree.get_node("1.1") is _node
+        _mission_phase_id = test_mission_phase_table_model.last_id
+        assert test_view_model.tree.contains(f"1.{_mission_phase_id}")
+        _children = test_view_model._get_children("mission_phase", 1)
+        assert _children[-1].mission_phase_id == _mission_phase_id
+
 
 @pytest.mark.usefixtures(
     "test_view_model",
@@ -407,6 +442,12 @@ class TestDeleteUsageProfile:
 
         pub.sendMessage("request_delete_mission_phase", node_id=2)
 
+        assert ("mission_phase", 2) not in test_view_model._dic_node_ids
+        assert not any(
+            _mission_phase.mission_phase_id == 2
+            for _mission_phase in test_view_model._get_children("mission_phase", 2)
+        )
+
         pub.unsubscribe(
             self.on_succeed_delete_mission_phase, "succeed_retrieve_usage_profile"
         )
@@ -47,11 +47,13 @@ class TestCreateModel:
             "environment",
         ]
         assert pub.isSubscribed(
-            test_view_model.do_set_tree, "succeed_insert_environment"
+            test_view_model.on_insert_node, "succeed_insert_environment"
         )
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_insert_mission")
         assert pub.isSubscribed(
-            test_view_model.do_set_tree, "succeed_insert_mission_phase"
+            test_view_model.on_insert_node, "succeed_insert_mission"
+        )
+        assert pub.isSubscribed(
+            test_view_model.on_insert_node, "succeed_insert_mission_phase"
         )
         assert pub.isSubscribed(
             test_view_model.do_set_tree, "succeed_retrieve_all_environment"
@@ -64,9 +66,11 @@ class TestCreateModel:
             "succeed_retrieve_all_mission_phase",
         )
         assert pub.isSubscribed(
-            test_view_model.do_set_tree, "succeed_delete_environment"
+            test_view_model.on_delete_node, "succeed_delete_environment"
+        )
+        assert pub.isSubscribed(
+            test_view_model.on_delete_node, "succeed_delete_mission"
         )
-        assert pub.isSubscribed(test_view_model.do_set_tree, "succeed_delete_mission")
         assert pub.isSubscribed(
-            test_view_model.do_set_tree, "succeed_delete_mission_phase"
+            test_view_model.on_delete_node, "succeed_delete_mission_phase"
         )
@@ -0,0 +1,119 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_batch.py is part of The RAMSTK Project
+#
+# All rights reserved.
+"""Class for testing the RAMSTK headless batch calculation program."""
+
+# Third Party Imports
+import pytest
+from sqlalchemy import text
+
+# RAMSTK Package Imports
+from ramstk import batch
+from ramstk.analyses import fha
+from ramstk.exceptions import DataAccessError
+from ramstk.models.db import RAMSTKProgramDB
+from ramstk.models.dbtables import RAMSTKHardwareTable, RAMSTKHazardTable
+from ramstk.models.dbviews import RAMSTKHardwareBoMView
+
+
+@pytest.mark.unit
+def test_get_parser():
+    """get_parser() should return a parser with every analysis selected by default."""
+    _args = batch.get_parser().parse_args(["db_one", "db_two", "-j", "2"])
+
+    assert _args.databases == ["db_one", "db_two"]
+    assert _args.analyses == batch.ANALYSES
+    assert _args.revision == 1
+    assert _args.jobs == 2
+    assert _args.host is None
+
+
+@pytest.mark.unit
+def test_get_parser_analyses():
+    """get_parser() should only accept the known analyses."""
+    _args = batch.get_parser().parse_args(["db_one", "-a", "hazards", "hardware"])
+
+    assert _args.analyses == ["hazards", "hardware"]
+    with pytest.raises(SystemExit):
+        batch.get_parser().parse_args(["db_one", "-a", "fmea"])
+
+
+@pytest.mark.unit
+def test_get_batch_summary():
+    """get_batch_summary() should return the stage times and number of records."""
+    _summary = batch.get_batch_summary(
+        "test_db",
+        {
+            "load": 0.5,
+            "hardware": 1.25,
+            "changed": {"ramstk_hardware": 7, "ramstk_reliability": 3},
+            "save": 0.125,
+        },
+    )
+
+    assert _summary == (
+        "test_db: load 0.50 s, hardware 1.25 s, save 0.12 s (10 records written)"
+    )
+
+
+@pytest.mark.unit
+def test_do_initialize_program_db():
+    """do_initialize_program_db() should only create the tables the analyses need."""
+    _program_db = batch.do_initialize_program_db(["hazards"])
+
+    assert isinstance(_program_db, RAMSTKProgramDB)
+    assert isinstance(_program_db.tables["hazards"], RAMSTKHazardTable)
+    assert _program_db.tables["hardware"] is object
+    assert _program_db.dic_views["hardwarebom"] is object
+
+
+@pytest.mark.unit
+def test_do_initialize_program_db_hardware():
+    """do_initialize_program_db() should create the hardware BoM view for hardware."""
+    _program_db = batch.do_initialize_program_db(["hardware"], hr_multiplier=1000.0)
+
+    assert isinstance(_program_db.tables["hardware"], RAMSTKHardwareTable)
+    assert isinstance(_program_db.dic_views["hardwarebom"], RAMSTKHardwareBoMView)
+    assert _program_db.dic_views["hardwarebom"]._hr_multiplier == 1000.0
+
+
+@pytest.mark.usefixtures("test_program_dao")
+class TestBatch:
+    """Class for testing batch calculations of program databases."""
+
+    @pytest.mark.integration
+    def test_do_run_batches(self, test_program_dao):
+        """do_run_batches() should calculate each database and write the results."""
+        test_program_dao.session.execute(
+            text(
+                "UPDATE ramstk_hazard_analysis SET fld_system_hri = 0 "
+                "WHERE fld_hazard_id = 4"
+            )
+        )
+        test_program_dao.session.commit()
+
+        _results = batch.do_run_batches(
+            [
+                test_program_dao.cxnargs,
+                {**test_program_dao.cxnargs, "database": "no_such_ramstk_db"},
+            ],
+            batch.ANALYSES,
+            jobs=2,
+        )
+
+        _results_db = _results[test_program_dao.cxnargs["database"]]
+        assert list(_results_db) == ["load"] + batch.ANALYSES + ["changed", "save"]
+        assert _results_db["changed"]["ramstk_hazard_analysis"] > 0
+        assert isinstance(_results["no_such_ramstk_db"], DataAccessError)
+
+        _row = test_program_dao.session.execute(
+            text(
+                "SELECT fld_system_hri, fld_system_probability, fld_system_severity "
+                "FROM ramstk_hazard_analysis WHERE fld_hazard_id = 4"
+            )
+        ).one()
+        assert _row[0] == fha.calculate_hri(_row[1], _row[2])
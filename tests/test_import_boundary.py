@@ -0,0 +1,82 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_import_boundary.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the models don't depend on the GTK views."""
+
+# Standard Library Imports
+import ast
+import glob
+import os
+
+# Third Party Imports
+import pytest
+
+# RAMSTK Package Imports
+import ramstk
+
+# The packages and modules that must run on machines without GTK.
+HEADLESS_PACKAGES = ["analyses", "exim", "models"]
+HEADLESS_MODULES = ["batch"]
+
+# The modules the headless packages must not import.
+GUI_MODULES = ["gi", "ramstk.views"]
+
+
+def _get_imported_modules(file_name):
+    """Return the names of the modules imported by a source file."""
+    with open(file_name, encoding="utf-8") as _source:
+        _tree = ast.parse(_source.read(), filename=file_name)
+
+    _modules = []
+    for _node in ast.walk(_tree):
+        if isinstance(_node, ast.Import):
+            _modules.extend(_alias.name for _alias in _node.names)
+        elif isinstance(_node, ast.ImportFrom) and _node.level == 0:
+            _modules.append(_node.module)
+
+    return _modules
+
+
+def _get_source_files():
+    """Return the source and stub files in the headless packages and modules."""
+    _root = os.path.dirname(ramstk.__file__)
+
+    return sorted(
+        [
+            _file
+            for _package in HEADLESS_PACKAGES
+            for _extension in ["py", "pyi"]
+            for _file in glob.glob(
+                f"{_root}/{_package}/**/*.{_extension}", recursive=True
+            )
+        ]
+        + [
+            f"{_root}/{_module}.{_extension}"
+            for _module in HEADLESS_MODULES
+            for _extension in ["py", "pyi"]
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_headless_packages_have_sources():
+    """The headless packages should be found where the test looks for them."""
+    assert len(_get_source_files()) > 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("file_name", _get_source_files())
+def test_headless_package_skips_gui(file_name):
+    """The headless packages should not import the GTK views or PyGObject."""
+    assert [
+        _module
+        for _module in _get_imported_modules(file_name)
+        if any(
+            _module == _gui or _module.startswith(f"{_gui}.") for _gui in GUI_MODULES
+        )
+    ] == []
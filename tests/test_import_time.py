@@ -0,0 +1,80 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_import_time.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright since 2007 Doyle "weibullguy" Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the time it takes to import the RAMSTK models."""
+
+# Standard Library Imports
+import json
+import subprocess
+import sys
+
+# Third Party Imports
+import pytest
+
+# The maximum number of seconds importing the models and analyses may take.
+IMPORT_BUDGET = 1.5
+
+# The packages that are only imported when a calculation or export needs them.
+LAZY_PACKAGES = [
+    "matplotlib",
+    "numdifftools",
+    "openpyxl",
+    "pandas",
+    "scipy.stats",
+    "sympy",
+]
+
+# Block gi so the import fails if anything reaches for the GTK views.
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+sys.modules["gi"] = None
+
+_start = time.perf_counter()
+import ramstk.analyses
+import ramstk.models.db
+import ramstk.models.dbrecords
+import ramstk.models.dbtables
+import ramstk.models.dbviews
+_elapsed = time.perf_counter() - _start
+
+print(json.dumps({"elapsed": _elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _do_import_models():
+    """Import the models in a fresh interpreter and return the results."""
+    _output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return json.loads(_output.stdout.splitlines()[-1])
+
+
+@pytest.mark.unit
+def test_import_models_skips_lazy_packages():
+    """Importing the models should not import the heavy scientific packages."""
+    _results = _do_import_models()
+
+    assert [
+        _package for _package in LAZY_PACKAGES if _package in _results["modules"]
+    ] == []
+
+
+@pytest.mark.unit
+def test_import_models_within_budget():
+    """Importing the models should take less than the import budget."""
+    # Take the best of three so a busy machine doesn't fail the test.
+    _elapsed = min(_do_import_models()["elapsed"] for _ in range(3))
+
+    assert _elapsed < IMPORT_BUDGET
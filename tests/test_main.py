@@ -7,17 +7,21 @@
 # All rights reserved.
 """Class for testing RAMSTK main."""
 
+# Standard Library Imports
+import json
+import os
+
 # Third Party Imports
 import pytest
 from pubsub import pub
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 # RAMSTK Package Imports
 from ramstk import __main__
 from ramstk.configuration import RAMSTKSiteConfiguration, RAMSTKUserConfiguration
 from ramstk.logger import RAMSTKLogManager
 from ramstk.models.db import BaseDatabase, RAMSTKCommonDB
-from ramstk.models.dbrecords import RAMSTKCategoryRecord
+from ramstk.models.dbrecords import RAMSTKCategoryRecord, RAMSTKSubCategoryRecord
 from ramstk.models.dbtables import RAMSTKActionTable, RAMSTKSiteInfoTable
 from ramstk.models.dbviews import RAMSTKFMEAView
 
@@ -154,3 +158,164 @@ class TestMain:
             42: ("TEST", "Test", 1),
             43: ("VANDV", "Verification & Validation", 1),
         }
+
+    @pytest.mark.unit
+    def test_get_site_fields(self):
+        """get_site_fields() should return the fields used from each site table."""
+        _site_fields = __main__.get_site_fields()
+
+        assert _site_fields["ramstk_category"][0] == RAMSTKCategoryRecord
+        assert _site_fields["ramstk_category"][1][:5] == [
+            "category_type",
+            "category_id",
+            "name",
+            "description",
+            "value",
+        ]
+        assert "harsh_ir_limit" in _site_fields["ramstk_category"][1]
+        assert _site_fields["ramstk_failure_mode"][1] == [
+            "category_id",
+            "subcategory_id",
+            "mode_id",
+            "description",
+            "mode_ratio",
+            "source",
+        ]
+
+    @pytest.mark.integration
+    def test_do_load_site_lists(self, test_common_dao, tmp_path):
+        """do_load_site_lists() should load the same lists as loading them one at a
+        time and save the site records to the snapshot file."""
+        _snapshot_file = str(tmp_path / "site_lists.json")
+        _configuration = RAMSTKUserConfiguration()
+        _expected = RAMSTKUserConfiguration()
+
+        __main__.do_load_site_lists(_configuration, test_common_dao, _snapshot_file)
+
+        for _name, _record, _filter, _key, _fields in __main__.SITE_LISTS:
+            _query = select(_record)
+            for _field, _value in _filter.items():
+                _query = _query.where(getattr(_record, _field) == _value)
+            __main__.do_load_configuration_list(
+                getattr(_expected, _name), test_common_dao, _query, _key, _fields
+            )
+            assert getattr(_configuration, _name) == getattr(_expected, _name)
+        for _category_id in _expected.RAMSTK_CATEGORIES:
+            _subcategories = {}
+            __main__.do_load_configuration_list(
+                _subcategories,
+                test_common_dao,
+                select(RAMSTKSubCategoryRecord).where(
+                    RAMSTKSubCategoryRecord.category_id == _category_id
+                ),
+                "subcategory_id",
+                ["description"],
+            )
+            assert _configuration.RAMSTK_SUBCATEGORIES[_category_id] == _subcategories
+            for _subcategory_id in _subcategories:
+                assert _configuration.RAMSTK_FAILURE_MODES[_category_id][
+                    _subcategory_id
+                ] == __main__.do_load_failure_modes(
+                    test_common_dao, _category_id, _subcategory_id
+                )
+        assert _configuration.RAMSTK_FAILURE_MODES[3][24] == {
+            3: ["Parameter Change", 0.2, "FMD-97"]
+        }
+        assert os.path.isfile(_snapshot_file)
+
+    @pytest.mark.integration
+    def test_do_load_site_lists_snapshot(self, test_common_dao, tmp_path):
+        """do_load_site_lists() should load the lists from the snapshot file until
+        the site database changes."""
+        _snapshot_file = str(tmp_path / "site_lists.json")
+        __main__.do_load_site_lists(
+            RAMSTKUserConfiguration(), test_common_dao, _snapshot_file
+        )
+
+        with open(_snapshot_file, "r", encoding="utf-8") as _file:
+            _snapshot = json.load(_file)
+        for _row in _snapshot["tables"]["ramstk_stakeholders"]:
+            _row["stakeholder"] = "From the snapshot"
+        with open(_snapshot_file, "w", encoding="utf-8") as _file:
+            json.dump(_snapshot, _file)
+
+        _configuration = RAMSTKUserConfiguration()
+        __main__.do_load_site_lists(_configuration, test_common_dao, _snapshot_file)
+
+        assert set(_configuration.RAMSTK_STAKEHOLDERS.values()) == {
+            ("From the snapshot",)
+        }
+
+        test_common_dao.session.execute(
+            text("UPDATE ramstk_stakeholders SET fld_stakeholder='Changed'")
+        )
+        test_common_dao.session.commit()
+
+        _configuration = RAMSTKUserConfiguration()
+        __main__.do_load_site_lists(_configuration, test_common_dao, _snapshot_file)
+
+        assert set(_configuration.RAMSTK_STAKEHOLDERS.values()) == {("Changed",)}
+
+    @pytest.mark.integration
+    def test_do_load_site_lists_snapshot_missing_field(self, test_common_dao, tmp_path):
+        """do_load_site_lists() should load the lists from the site database when the
+        snapshot file is missing a field."""
+        _snapshot_file = str(tmp_path / "site_lists.json")
+        __main__.do_load_site_lists(
+            RAMSTKUserConfiguration(), test_common_dao, _snapshot_file
+        )
+        _expected = RAMSTKUserConfiguration()
+        __main__.do_load_site_lists(_expected, test_common_dao, _snapshot_file)
+
+        with open(_snapshot_file, "r", encoding="utf-8") as _file:
+            _snapshot = json.load(_file)
+        for _row in _snapshot["tables"]["ramstk_failure_mode"]:
+            _row.pop("source")
+        with open(_snapshot_file, "w", encoding="utf-8") as _file:
+            json.dump(_snapshot, _file)
+
+        _configuration = RAMSTKUserConfiguration()
+        __main__.do_load_site_lists(_configuration, test_common_dao, _snapshot_file)
+
+        assert _configuration.RAMSTK_FAILURE_MODES == _expected.RAMSTK_FAILURE_MODES
+        assert _configuration.RAMSTK_STAKEHOLDERS == _expected.RAMSTK_STAKEHOLDERS
+
+    @pytest.mark.unit
+    def test_do_read_site_snapshot_bad_file(self, tmp_path):
+        """do_read_site_snapshot() should return None when the snapshot file can't be
+        used."""
+        _snapshot_file = tmp_path / "site_lists.json"
+        _snapshot_file.write_text("{not json")
+
+        assert __main__.do_read_site_snapshot(str(_snapshot_file), "", "1", {}) is None
+        assert (
+            __main__.do_read_site_snapshot(str(tmp_path / "missing.json"), "", "1", {})
+            is None
+        )
+
+    @pytest.mark.unit
+    def test_do_read_site_snapshot_changed_fields(self, tmp_path):
+        """do_read_site_snapshot() should return None when the snapshot was saved
+        with different site database fields."""
+        _snapshot_file = str(tmp_path / "site_lists.json")
+        _fields = {"ramstk_failure_mode": ["category_id", "mode_id"]}
+        __main__.do_write_site_snapshot(
+            _snapshot_file,
+            "sqlite://:/site",
+            "1",
+            _fields,
+            {"ramstk_failure_mode": []},
+        )
+
+        assert __main__.do_read_site_snapshot(
+            _snapshot_file, "sqlite://:/site", "1", _fields
+        ) == {"ramstk_failure_mode": []}
+        assert (
+            __main__.do_read_site_snapshot(
+                _snapshot_file,
+                "sqlite://:/site",
+                "1",
+                {"ramstk_failure_mode": ["category_id", "mode_id", "source"]},
+            )
+            is None
+        )
@@ -0,0 +1,137 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.views.gtk3.widgets.test_treemodel.py is part of The RAMSTK Project
+#
+# All rights reserved.
+"""Test class for the GTK3 lazy tree model module algorithms and models."""
+
+# Third Party Imports
+import pytest
+import treelib
+
+# RAMSTK Package Imports
+from ramstk.views.gtk3 import GObject, Gtk
+from ramstk.views.gtk3.widgets import RAMSTKLazyTreeModel
+
+
+@pytest.fixture
+def test_tree():
+    """Create a treelib Tree() to back the lazy model."""
+    _tree = treelib.Tree()
+    _tree.create_node(tag="test", identifier=0)
+    _tree.create_node(tag="test", identifier=1, parent=0, data={"test": 1})
+    _tree.create_node(tag="test", identifier=2, parent=1, data={"test": 2})
+    _tree.create_node(tag="test", identifier=3, parent=1, data={"test": 3})
+    _tree.create_node(tag="test", identifier=4, parent=0, data={"test": 4})
+
+    yield _tree
+
+
+class TestRAMSTKLazyTreeModel:
+    """Test class for the RAMSTKLazyTreeModel."""
+
+    @pytest.mark.gui
+    def test_create_lazy_tree_model(self, test_tree):
+        """__init__() should create a RAMSTKLazyTreeModel without reading any rows."""
+        _rows = []
+        DUT = RAMSTKLazyTreeModel(
+            test_tree,
+            [GObject.TYPE_INT],
+            {
+                "test": lambda node, row: _rows.append(node.identifier)
+                or DUT.append(row, [node.identifier])
+            },
+        )
+
+        assert isinstance(DUT, Gtk.TreeModel)
+        assert DUT.get_n_columns() == 1
+        assert DUT.tree is test_tree
+        assert _rows == []
+
+    @pytest.mark.gui
+    def test_navigate_lazy_tree_model(self, test_tree):
+        """The RAMSTKLazyTreeModel should present the rows in tree order."""
+        DUT = RAMSTKLazyTreeModel(
+            test_tree,
+            [GObject.TYPE_INT],
+            {"test": lambda node, row: DUT.append(row, [node.identifier])},
+        )
+
+        _row = DUT.get_iter_first()
+        assert DUT.get_value(_row, 0) == 1
+        assert DUT.iter_n_children(_row) == 2
+        _child = DUT.iter_nth_child(_row, 1)
+        assert DUT.get_value(_child, 0) == 3
+        assert DUT.get_path(_child).get_indices() == [0, 1]
+        assert DUT.get_value(DUT.iter_parent(_child), 0) == 1
+        _row = DUT.iter_next(_row)
+        assert DUT.get_value(_row, 0) == 4
+        assert not DUT.iter_has_child(_row)
+        assert DUT.iter_next(_row) is None
+        assert (
+            DUT.get_value(DUT.get_iter(Gtk.TreePath.new_from_indices([0, 0])), 0) == 2
+        )
+
+    @pytest.mark.gui
+    def test_lazy_tree_model_cache(self, test_tree):
+        """The RAMSTKLazyTreeModel should only keep the most recently used rows."""
+        _rows = []
+        DUT = RAMSTKLazyTreeModel(
+            test_tree,
+            [GObject.TYPE_INT],
+            {
+                "test": lambda node, row: _rows.append(node.identifier)
+                or DUT.append(row, [node.identifier])
+            },
+            cache_size=1,
+        )
+
+        _row = DUT.get_iter_first()
+        DUT.get_value(_row, 0)
+        DUT.get_value(_row, 0)
+        assert _rows == [1]
+
+        DUT.get_value(DUT.iter_next(DUT.get_iter_first()), 0)
+        DUT.get_value(_row, 0)
+        assert _rows == [1, 4, 1]
+        assert DUT.get_cache_info() == (1, 1)
+
+    @pytest.mark.gui
+    def test_lazy_tree_model_loader_fails(self, test_tree):
+        """The RAMSTKLazyTreeModel should use default values if no row is appended."""
+        DUT = RAMSTKLazyTreeModel(
+            test_tree,
+            [GObject.TYPE_INT, GObject.TYPE_STRING],
+            {"test": lambda node, row: None},
+        )
+
+        assert DUT.get_value(DUT.get_iter_first(), 0) == 0
+
+    @pytest.mark.gui
+    def test_lazy_tree_model_insert_remove(self, test_tree):
+        """do_insert_node() and do_remove_node() should signal the changed rows."""
+        DUT = RAMSTKLazyTreeModel(
+            test_tree,
+            [GObject.TYPE_INT],
+            {"test": lambda node, row: DUT.append(row, [node.identifier])},
+        )
+        _inserted = []
+        _deleted = []
+        DUT.connect(
+            "row-inserted", lambda model, path, row: _inserted.append(str(path))
+        )
+        DUT.connect("row-deleted", lambda model, path: _deleted.append(str(path)))
+        DUT.iter_n_children(DUT.get_iter_first())
+
+        test_tree.create_node(tag="test", identifier=5, parent=1, data={"test": 5})
+        DUT.do_insert_node(5)
+        assert _inserted == ["0:2"]
+        assert DUT.get_value(DUT.get_node_iter(5), 0) == 5
+
+        test_tree.remove_node(2)
+        DUT.do_remove_node(2)
+        assert _deleted == ["0:0"]
+        assert DUT.get_path(DUT.get_node_iter(5)).get_indices() == [0, 1]
+        assert DUT.get_node_iter(2) is None
@@ -9,8 +9,10 @@
 
 # Third Party Imports
 import pytest
+import treelib
 
 # RAMSTK Package Imports
+from ramstk.views.gtk3 import Gtk
 from ramstk.views.gtk3.widgets import RAMSTKTreeView
 
 
@@ -31,3 +33,53 @@ class TestRAMSTKTreeView:
         assert DUT.position == {}
         assert DUT.visible == {}
         assert DUT.widgets == {}
+
+    @pytest.mark.gui
+    def test_do_load_tree(self):
+        """do_load_tree() should load every node in the same order as the tree."""
+        _tree = treelib.Tree()
+        _tree.create_node(tag="test", identifier=0)
+        _tree.create_node(tag="test", identifier=1, parent=0, data={"test": 1})
+        _tree.create_node(tag="test", identifier=2, parent=1, data={"test": 2})
+        _tree.create_node(tag="test", identifier=3, parent=1, data={"test": 3})
+        _tree.create_node(tag="test", identifier=4, parent=0, data={"test": 4})
+
+        DUT = RAMSTKTreeView()
+        DUT.unfilt_model = Gtk.TreeStore(int)
+        DUT.set_model(DUT.unfilt_model)
+        DUT.dic_row_loader = {
+            "test": lambda node, row: DUT.unfilt_model.append(row, [node.identifier])
+        }
+
+        DUT.do_load_tree(_tree)
+
+        assert DUT.get_model() == DUT.unfilt_model
+        _row = DUT.unfilt_model.get_iter_first()
+        assert DUT.unfilt_model.get_value(_row, 0) == 1
+        assert [
+            DUT.unfilt_model.get_value(DUT.unfilt_model.iter_nth_child(_row, _idx), 0)
+            for _idx in range(DUT.unfilt_model.iter_n_children(_row))
+        ] == [2, 3]
+        _row = DUT.unfilt_model.iter_next(_row)
+        assert DUT.unfilt_model.get_value(_row, 0) == 4
+        assert DUT.unfilt_model.iter_next(_row) is None
+
+    @pytest.mark.gui
+    def test_do_get_row_by_value(self):
+        """do_get_row_by_value() should return the indexed row for a node ID."""
+        _tree = treelib.Tree()
+        _tree.create_node(tag="test", identifier=0)
+        _tree.create_node(tag="test", identifier=1, parent=0, data={"test": 1})
+        _tree.create_node(tag="test", identifier=2, parent=1, data={"test": 2})
+
+        DUT = RAMSTKTreeView()
+        DUT.unfilt_model = Gtk.TreeStore(int)
+        DUT.set_model(DUT.unfilt_model)
+        DUT.dic_row_loader = {
+            "test": lambda node, row: DUT.unfilt_model.append(row, [node.identifier])
+        }
+        DUT.do_load_tree(_tree)
+
+        assert list(DUT.dic_row_index) == [1, 2]
+        assert DUT.unfilt_model.get_value(DUT.do_get_row_by_value(0, 2), 0) == 2
+        assert DUT.do_get_row_by_value(0, 3) is None
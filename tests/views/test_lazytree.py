@@ -0,0 +1,220 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.views.test_lazytree.py is part of The RAMSTK Project
+#
+# All rights reserved.
+"""Test class for the lazy tree index module."""
+
+# Third Party Imports
+import pytest
+import treelib
+
+# RAMSTK Package Imports
+from ramstk.views.lazytree import RAMSTKLazyTreeIndex
+
+
+@pytest.fixture
+def test_tree():
+    """Create a treelib Tree() to back the lazy index."""
+    _tree = treelib.Tree()
+    _tree.create_node(tag="test", identifier=0)
+    _tree.create_node(tag="test", identifier=1, parent=0, data={"test": 1})
+    _tree.create_node(tag="test", identifier=2, parent=1, data={"test": 2})
+    _tree.create_node(tag="test", identifier=3, parent=1, data={"test": 3})
+    _tree.create_node(tag="test", identifier=4, parent=0, data={"test": 4})
+
+    yield _tree
+
+
+@pytest.mark.unit
+def test_create_lazy_tree_index(test_tree):
+    """__init__() should create a RAMSTKLazyTreeIndex without reading any rows."""
+    _rows = []
+    DUT = RAMSTKLazyTreeIndex(
+        test_tree, lambda node: _rows.append(node.identifier) or [node.identifier]
+    )
+
+    assert DUT.tree is test_tree
+    assert DUT.get_cache_info() == (0, 256)
+    assert _rows == []
+
+
+@pytest.mark.unit
+def test_get_children(test_tree):
+    """get_children() should only hand out handles for the rows asked for."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+
+    _top = DUT.get_children(None)
+    assert [DUT.get_node_id(_handle) for _handle in _top] == [1, 4]
+    assert DUT.get_node_handle(2) is None
+    assert DUT.has_children(_top[0])
+    assert not DUT.has_children(_top[1])
+    assert DUT.get_node_handle(2) is None
+
+    _children = DUT.get_children(_top[0])
+    assert [DUT.get_node_id(_handle) for _handle in _children] == [2, 3]
+    assert DUT.get_children(_top[0]) is _children
+    assert DUT.get_parent(_children[1]) == _top[0]
+    assert DUT.get_path(_children[1]) == [0, 1]
+    assert DUT.get_handle([0, 1]) == _children[1]
+    assert DUT.get_handle([0, 2]) is None
+    assert DUT.get_sibling(_top[0], 1) == _top[1]
+    assert DUT.get_sibling(_top[1], 1) is None
+    assert DUT.get_sibling(_children[0], -1) is None
+
+
+@pytest.mark.unit
+def test_get_children_root_with_data(test_tree):
+    """get_children() should make the root node the top row when it has data."""
+    test_tree.get_node(0).data = {"test": 0}
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+
+    _top = DUT.get_children(None)
+    assert [DUT.get_node_id(_handle) for _handle in _top] == [0]
+    assert DUT.get_path(DUT.get_children(_top[0])[1]) == [0, 1]
+
+
+@pytest.mark.unit
+def test_get_row_cache(test_tree):
+    """get_row() should only keep the most recently used rows."""
+    _rows = []
+    DUT = RAMSTKLazyTreeIndex(
+        test_tree,
+        lambda node: _rows.append(node.identifier) or [node.identifier],
+        cache_size=1,
+    )
+    _first, _last = DUT.get_children(None)
+
+    assert DUT.get_row(_first) == [1]
+    assert DUT.get_row(_first) == [1]
+    assert _rows == [1]
+
+    assert DUT.get_row(_last) == [4]
+    assert DUT.get_row(_first) == [1]
+    assert _rows == [1, 4, 1]
+    assert DUT.get_cache_info() == (1, 1)
+
+
+@pytest.mark.unit
+def test_get_row_lru_order(test_tree):
+    """get_row() should discard the least recently used row, not the oldest."""
+    _rows = []
+    DUT = RAMSTKLazyTreeIndex(
+        test_tree,
+        lambda node: _rows.append(node.identifier) or [node.identifier],
+        cache_size=2,
+    )
+    _first, _last = DUT.get_children(None)
+    _child = DUT.get_children(_first)[0]
+
+    DUT.get_row(_first)
+    DUT.get_row(_last)
+    DUT.get_row(_first)
+    DUT.get_row(_child)
+    DUT.get_row(_first)
+    assert _rows == [1, 4, 2]
+
+    DUT.get_row(_last)
+    assert _rows == [1, 4, 2, 4]
+
+
+@pytest.mark.unit
+def test_set_value_and_invalidate(test_tree):
+    """set_value() should change the cached row and do_invalidate() discard it."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier, "name"])
+    _first = DUT.get_children(None)[0]
+
+    DUT.set_value(_first, 1, "new name")
+    assert DUT.get_row(_first) == [1, "new name"]
+
+    assert DUT.do_invalidate(1) == _first
+    assert DUT.get_row(_first) == [1, "name"]
+    assert DUT.do_invalidate(3) is None
+
+
+@pytest.mark.unit
+def test_do_insert_node(test_tree):
+    """do_insert_node() should add a row after the parent's other children."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+    _first, _last = DUT.get_children(None)
+    DUT.get_children(_first)
+
+    test_tree.create_node(tag="test", identifier=5, parent=1, data={"test": 5})
+    _handle = DUT.do_insert_node(5)
+    assert DUT.get_node_handle(5) == _handle
+    assert DUT.get_path(_handle) == [0, 2]
+    assert DUT.get_row(_handle) == [5]
+
+    test_tree.create_node(tag="test", identifier=6, parent=0, data={"test": 6})
+    assert DUT.get_path(DUT.do_insert_node(6)) == [2]
+
+
+@pytest.mark.unit
+def test_do_insert_node_unloaded_parent(test_tree):
+    """do_insert_node() should leave the row for later when the parent's children
+    haven't been handed out."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+    _first, _last = DUT.get_children(None)
+
+    test_tree.create_node(tag="test", identifier=5, parent=4, data={"test": 5})
+    assert DUT.do_insert_node(5) is None
+    assert DUT.has_children(_last)
+    assert [DUT.get_node_id(_handle) for _handle in DUT.get_children(_last)] == [5]
+
+    test_tree.create_node(tag="test", identifier=6, parent=2, data={"test": 6})
+    assert DUT.do_insert_node(6) is None
+    assert DUT.get_node_handle(6) is None
+
+
+@pytest.mark.unit
+def test_do_remove_node(test_tree):
+    """do_remove_node() should remove the row and every row below it."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+    _first, _last = DUT.get_children(None)
+    _child = DUT.get_children(_first)[0]
+    DUT.get_row(_child)
+
+    test_tree.remove_node(1)
+    assert DUT.do_remove_node(1) is None
+    assert DUT.get_children(None) == [_last]
+    assert DUT.get_path(_last) == [0]
+    assert DUT.get_sibling(_last, -1) is None
+    for _node_id in [1, 2, 3]:
+        assert DUT.get_node_handle(_node_id) is None
+    assert DUT.get_cache_info() == (0, 256)
+
+    # A node ID that is used again gets a new row handle.
+    test_tree.create_node(tag="test", identifier=2, parent=0, data={"test": 2})
+    _handle = DUT.do_insert_node(2)
+    assert _handle not in [_first, _child]
+    assert DUT.get_path(_handle) == [1]
+
+
+@pytest.mark.unit
+def test_do_remove_node_child(test_tree):
+    """do_remove_node() should return the parent's handle and renumber siblings."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+    _first = DUT.get_children(None)[0]
+    _children = DUT.get_children(_first)
+
+    test_tree.remove_node(2)
+    assert DUT.do_remove_node(2) == _first
+    assert DUT.get_path(_children[0]) == [0, 0]
+    assert DUT.get_node_id(_children[0]) == 3
+    assert DUT.do_remove_node(2) is None
+
+
+@pytest.mark.unit
+def test_clear(test_tree):
+    """clear() should remove every row and replace the tree."""
+    DUT = RAMSTKLazyTreeIndex(test_tree, lambda node: [node.identifier])
+    DUT.get_row(DUT.get_children(None)[0])
+
+    DUT.clear()
+
+    assert DUT.tree is not test_tree
+    assert DUT.get_children(None) == []
+    assert DUT.get_node_handle(1) is None
+    assert DUT.get_cache_info() == (0, 256)